@@ -0,0 +1,216 @@
+"""
+Offline end-to-end benchmark of the translation pipeline.
+
+Google runs against a local stand-in server (`benchmarks.fake_google`) with
+injected latency and errors, and Argos against a stub model
+(`benchmarks.stub_argos`), so no network access or installed model is needed.
+Every scenario (engine x text size x keyword count x concurrency) reports
+throughput and p50/p95/p99 request latency. The translation memory is
+disabled so every request reaches the engine.
+
+Results can be saved as a baseline and later runs compared against it; the
+exit status is 1 when a scenario regresses past the tolerance. Baselines are
+machine specific, so record them on the machine that runs the comparison.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--quick] [--save-baseline] [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional
+
+from benchmarks.fake_google import FakeGoogleServer, LocalGoogleClient
+from benchmarks.stub_argos import install_stub_pair, uninstall_stub_pair
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+WORDS = (
+    "the village cat discovered a hidden path leading into an enchanted forest where talking "
+    "animals magical plants and a wise old owl shared ancient secrets about friendship bravery "
+    "and the wonders of nature before he returned home forever changed"
+).split()
+
+
+def make_text(sentences: int, keywords: List[str], rng: random.Random) -> str:
+    """Builds a deterministic text of `sentences` sentences mentioning the keywords."""
+    result = []
+    for idx in range(sentences):
+        words = rng.choices(WORDS, k=rng.randint(8, 20))
+        if keywords:
+            words.insert(rng.randrange(len(words)), keywords[idx % len(keywords)])
+        result.append(" ".join(words).capitalize() + ".")
+    return " ".join(result)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def make_translator(engine: str, server: Optional[FakeGoogleServer], rate_limit: float = 0.0):
+    """Creates a translator wired to the offline stand-ins."""
+    if engine == "google":
+        from translator.googletrans.translator import GoogleTranslator
+        from translator.utils.rate_limiter import AdaptiveRateLimiter
+
+        return GoogleTranslator(use_memory=False, client_factory=lambda: LocalGoogleClient(server.url),
+                                rate_limiter=AdaptiveRateLimiter(rate=rate_limit))
+    from translator.argos.translator import ArgosTranslator
+
+    return ArgosTranslator(use_memory=False)
+
+
+def run_scenario(engine: str, sentences: int, keyword_count: int, concurrency: int,
+                 requests: int, server: Optional[FakeGoogleServer], seed: int,
+                 rate_limit: float = 0.0) -> Dict[str, float]:
+    """Runs one scenario and returns its throughput and latency percentiles."""
+    rng = random.Random(seed)
+    keywords = [f"Product{idx}X" for idx in range(keyword_count)]
+    texts = [make_text(sentences, keywords, rng) for _ in range(requests)]
+
+    translator = make_translator(engine, server, rate_limit)
+    translator.set_keywords(keywords)
+
+    def one_request(text: str):
+        start = time.perf_counter()
+        try:
+            translator.translate(text, "en", "pt")
+            ok = True
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    # Warm-up (connections, thread pools, compiled keyword matcher)
+    one_request(texts[0])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(one_request, texts))
+    elapsed = time.perf_counter() - start
+    if hasattr(translator, "close"):
+        translator.close()
+
+    latencies = sorted(latency for latency, _ in outcomes)
+    characters = sum(len(text) for text in texts)
+    return {
+        "throughput_rps": requests / elapsed,
+        "throughput_kchars": characters / 1000 / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "errors": sum(1 for _, ok in outcomes if not ok),
+    }
+
+
+def compare(results: Dict[str, dict], baselines: Dict[str, dict], tolerance: float) -> List[str]:
+    """Returns a description of every scenario that regressed past the tolerance."""
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result["throughput_rps"] < baseline["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {result['throughput_rps']:.1f} req/s "
+                f"< baseline {baseline['throughput_rps']:.1f} req/s"
+            )
+        if result["p95_ms"] > baseline["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']:.1f} ms > baseline {baseline['p95_ms']:.1f} ms"
+            )
+    return regressions
+
+
+def parse_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--engines", default="google,argos", help="comma-separated engines")
+    parser.add_argument("--sizes", default="1,16,64", help="sentences per request")
+    parser.add_argument("--keywords", default="0,50", help="keyword counts")
+    parser.add_argument("--concurrency", default="1,8", help="concurrent client threads")
+    parser.add_argument("--requests", type=int, default=30, help="requests per scenario")
+    parser.add_argument("--latency", type=float, default=0.01, help="stand-in latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.002, help="stand-in latency jitter in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="stand-in failure rate (0..1)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="stand-in HTTP 429 rate (0..1)")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="Google client rate limit in req/s (0 disables it)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--quick", action="store_true", help="small matrix for smoke runs")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.sizes, args.keywords, args.concurrency, args.requests = "1,16", "0,20", "1,4", 10
+
+    engines = [engine for engine in args.engines.split(",") if engine]
+    scenarios = list(product(engines, parse_list(args.sizes), parse_list(args.keywords),
+                             parse_list(args.concurrency)))
+
+    server = None
+    if "google" in engines:
+        server = FakeGoogleServer(latency=args.latency, jitter=args.jitter,
+                                  error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                                  seed=args.seed).start()
+    if "argos" in engines:
+        install_stub_pair("en", "pt")
+
+    results = {}
+    try:
+        print(f"{'scenario':<44}{'req/s':>9}{'kchar/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}")
+        for engine, sentences, keyword_count, concurrency in scenarios:
+            name = f"{engine}/sentences={sentences}/keywords={keyword_count}/concurrency={concurrency}"
+            result = run_scenario(engine, sentences, keyword_count, concurrency,
+                                  args.requests, server, args.seed, args.rate_limit)
+            results[name] = result
+            print(f"{name:<44}{result['throughput_rps']:>9.1f}{result['throughput_kchars']:>10.1f}"
+                  f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}{result['errors']:>8}")
+    finally:
+        if server is not None:
+            server.stop()
+        if "argos" in engines:
+            uninstall_stub_pair("en", "pt")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"[INFO] Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"[INFO] No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        regressions = compare(results, json.load(file), args.tolerance)
+    for regression in regressions:
+        print(f"[ERROR] Regression: {regression}")
+    if not regressions:
+        print(f"[INFO] No regression beyond {args.tolerance:.0%} of the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
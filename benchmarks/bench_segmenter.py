@@ -0,0 +1,41 @@
+"""
+Benchmark of the sentence segmenters on large inputs.
+
+Compares the built-in rule-based segmenter with TextBlob (if installed).
+
+Usage:
+    python -m benchmarks.bench_segmenter [sentences ...]
+"""
+
+import sys
+import time
+
+from translator.utils.handletext import segment_text
+
+PARAGRAPH = (
+    "In a small village nestled between rolling hills, Mr. Whiskers embarked on an unexpected adventure. "
+    "One sunny morning, he discovered a hidden path leading to an enchanted forest! "
+    "Did he know what was waiting for him, e.g. talking animals and magical plants? "
+    "By the time he returned home, he was forever changed.\n\n"
+)
+
+
+def run(sentences: int) -> None:
+    """Times both backends on a text with roughly `sentences` sentences."""
+    text = PARAGRAPH * (sentences // 4)
+    print(f"--- {sentences} sentences ({len(text) / 1024:.0f} KiB)")
+    for backend in ("rules", "textblob"):
+        try:
+            start = time.perf_counter()
+            count = len(segment_text(text, backend=backend))
+            elapsed = time.perf_counter() - start
+        except ImportError:
+            print(f"{backend:>9}: not installed")
+            continue
+        print(f"{backend:>9}: {elapsed:.3f} s ({count / elapsed:,.0f} sentences/s)")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    for size in sizes:
+        run(size)
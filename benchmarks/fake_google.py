@@ -0,0 +1,223 @@
+"""
+Local stand-in for the Google Translate web endpoint, for offline benchmarks.
+
+`FakeGoogleServer` answers `GET /translate_a/single` (the "gtx" endpoint used
+by googletrans' fallback client) with the same JSON layout, after an injected
+latency, and fails (HTTP 500) or throttles (HTTP 429) a configurable share of
+requests. `LocalGoogleClient` exposes the googletrans `Translator` interface
+(`translate()` / `detect()`) on top of it, so it can be passed to
+`GoogleTranslator(client_factory=...)`.
+
+The "translation" is the upper-cased input, which keeps keyword placeholders
+(`__1__`) intact, so the whole pipeline can be checked end to end.
+"""
+
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+class FakeGoogleServer:
+    """Threaded HTTP server mimicking the googletrans "gtx" endpoint."""
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        latency_per_kchar: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Creates the server (call `start()` or use it as a context manager).
+
+        Args:
+            latency (float): Base response time in seconds.
+            latency_per_kchar (float): Extra seconds per 1000 characters of input.
+            jitter (float): Uniform random variation (+/- seconds) added to the latency.
+            error_rate (float): Share of requests answered with HTTP 500 (0..1).
+            throttle_rate (float): Share of requests answered with HTTP 429 (0..1).
+            seed (int): Seed of the latency/error generator, for reproducible runs.
+            host (str): Address to bind.
+            port (int): Port to listen on (0 picks a free port).
+        """
+        self.latency = latency
+        self.latency_per_kchar = latency_per_kchar
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeGoogleServer":
+        """Starts serving from a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-google", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and releases the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGoogleServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _plan(self, text: str):
+        """Draws the (delay, status) outcome of one request."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self.latency_per_kchar * len(text) / 1000
+            if self.jitter:
+                delay += self._random.uniform(-self.jitter, self.jitter)
+            draw = self._random.random()
+            status = 200
+            if draw < self.error_rate:
+                status = 500
+                self.errors += 1
+            elif draw < self.error_rate + self.throttle_rate:
+                status = 429
+                self.throttled += 1
+        return max(0.0, delay), status
+
+    def _make_handler(self):
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/translate_a/single":
+                    self._reply(404, b"not found", "text/plain")
+                    return
+                params = parse_qs(url.query)
+                text = params.get("q", [""])[0]
+                source = params.get("sl", ["auto"])[0]
+                delay, status = server._plan(text)
+                time.sleep(delay)
+                if status == 500:
+                    self._reply(500, b"injected failure", "text/plain")
+                    return
+                if status == 429:
+                    self._reply(429, b"Too Many Requests", "text/plain")
+                    return
+                detected = "en" if source == "auto" else source
+                body = [[[text.upper(), text, None, None, 10]], None, detected]
+                self._reply(200, json.dumps(body).encode("utf-8"), "application/json; charset=utf-8")
+
+            def _reply(self, status, body, content_type):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _Handler
+
+
+class HTTPStatusError(RuntimeError):
+    """Non-200 answer of the stand-in; `response.status_code` lets the rate
+    limiter recognise throttling (429) like it does for httpx errors."""
+
+    def __init__(self, status: int, body: str, headers: Optional[dict] = None):
+        super().__init__(f"HTTP {status}: {body}")
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+class Translated:
+    """Result object with the attributes GoogleTranslator reads from googletrans."""
+
+    def __init__(self, text: str, src: str, dest: str, origin: str):
+        self.text = text
+        self.src = src
+        self.dest = dest
+        self.origin = origin
+
+
+class Detected:
+    """Detection result with the googletrans `lang` attribute."""
+
+    def __init__(self, lang: str, confidence: float = 1.0):
+        self.lang = lang
+        self.confidence = confidence
+
+
+class LocalGoogleClient:
+    """googletrans-compatible client talking to a `FakeGoogleServer` over keep-alive HTTP."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        """
+        Args:
+            base_url (str): Base URL of the stand-in server (e.g., `FakeGoogleServer.url`).
+            timeout (float): Socket timeout in seconds.
+        """
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def translate(self, text: str, dest: str = "en", src: str = "auto") -> Translated:
+        """Translates `text` like `googletrans.Translator.translate()`."""
+        data = self._get(text, src, dest)
+        translated = "".join(part[0] for part in data[0] if part and part[0])
+        return Translated(translated, data[2], dest, text)
+
+    def detect(self, text: str) -> Detected:
+        """Detects the language of `text` like `googletrans.Translator.detect()`."""
+        return Detected(self._get(text, "auto", "en")[2])
+
+    def _get(self, text: str, src: str, dest: str) -> list:
+        query = urlencode({"client": "gtx", "sl": src, "tl": dest, "dt": "t", "q": text})
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self._conn.request("GET", f"/translate_a/single?{query}")
+                response = self._conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                # Stale keep-alive connection: reconnect once
+                self._conn.close()
+                self._conn = None
+                if attempt:
+                    raise
+                continue
+            if response.status != 200:
+                raise HTTPStatusError(response.status, body.decode("utf-8", "replace"), dict(response.getheaders()))
+            return json.loads(body)
+        raise RuntimeError("unreachable")
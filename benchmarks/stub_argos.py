@@ -0,0 +1,51 @@
+"""
+Stub Argos model for offline benchmarks.
+
+`StubArgosTranslation` stands in for an installed package: it "translates"
+by upper-casing (placeholders survive) after a simulated decode time that
+grows with the input length. `install_stub_pair()` registers it in the shared
+language pair registry, so `ArgosTranslator` uses it like a real model.
+"""
+
+import time
+
+from translator.argos.registry import get_language_registry
+
+
+class StubArgosTranslation:
+    """Translation object exposing the `translate(text)` method used by the decoder fallback."""
+
+    def __init__(self, base_seconds: float = 0.0005, seconds_per_char: float = 0.00002):
+        """
+        Args:
+            base_seconds (float): Fixed simulated decode time per segment.
+            seconds_per_char (float): Additional simulated decode time per character.
+        """
+        self.base_seconds = base_seconds
+        self.seconds_per_char = seconds_per_char
+
+    def translate(self, text: str) -> str:
+        time.sleep(self.base_seconds + self.seconds_per_char * len(text))
+        return text.upper()
+
+
+def install_stub_pair(from_code: str = "en", to_code: str = "pt", **kwargs) -> StubArgosTranslation:
+    """
+    Registers a stub translation for a language pair.
+
+    Args:
+        from_code (str): The source language code.
+        to_code (str): The target language code.
+        **kwargs: Passed to `StubArgosTranslation`.
+
+    Returns:
+        StubArgosTranslation: The registered stub.
+    """
+    translation = StubArgosTranslation(**kwargs)
+    get_language_registry().register(from_code, to_code, translation)
+    return translation
+
+
+def uninstall_stub_pair(from_code: str = "en", to_code: str = "pt") -> None:
+    """Removes a stub registered with `install_stub_pair()`."""
+    get_language_registry().unregister(from_code, to_code)
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from translator.argos.translator import ArgosTranslator
 
@@ -5,7 +6,7 @@ from translator.argos.translator import ArgosTranslator
 class TestArgosTranslator(unittest.TestCase):
     def setUp(self):
         """Set up the ArgosTranslator instance before each test."""
-        self.translator = ArgosTranslator()
+        self.translator = ArgosTranslator(use_memory=False)
 
     def test_translate_valid_languages(self):
         """Test translation with valid source and target languages."""
@@ -24,6 +25,14 @@ class TestArgosTranslator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.translator.translate(text, source_lang, target_lang)
 
+    def test_async_translation(self):
+        """Test that atranslate decodes the text itself (no translation memory)."""
+        translator = ArgosTranslator(use_memory=False)
+        source_lang = translator.TypeLanguage.ENGLISH
+        target_lang = translator.TypeLanguage.SPANISH
+        result = asyncio.run(translator.atranslate("Hello", source_lang, target_lang))
+        self.assertEqual(result.strip(" .!").lower(), "hola")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from types import SimpleNamespace
+from translator.argos.decoder import translate_batch
+
+
+class _Tokenizer:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " " + " ".join(tokens)
+
+
+class _Model:
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, batch, **kwargs):
+        self.calls.append(batch)
+        return [SimpleNamespace(hypotheses=[[token.upper() for token in tokens]]) for tokens in batch]
+
+
+class TestArgosDecoder(unittest.TestCase):
+    def setUp(self):
+        self.model = _Model()
+        package_translation = SimpleNamespace(
+            pkg=SimpleNamespace(tokenizer=_Tokenizer(), target_prefix=""),
+            translator=self.model,
+        )
+        self.translation = SimpleNamespace(underlying=package_translation)
+
+    def test_results_keep_original_order(self):
+        segments = ["a much longer sentence here", "short", "", "mid size one"]
+        result = translate_batch(self.translation, segments, max_batch_size=32)
+        self.assertEqual(result, ["A MUCH LONGER SENTENCE HERE", "SHORT", "", "MID SIZE ONE"])
+
+    def test_segments_are_batched_by_length(self):
+        segments = ["one two three", "one", "one two", "one two three four"]
+        translate_batch(self.translation, segments, max_batch_size=2)
+        self.assertEqual(len(self.model.calls), 2)
+        self.assertEqual(self.model.calls[0], [["one"], ["one", "two"]])
+
+    def test_falls_back_without_tokenizer(self):
+        translation = SimpleNamespace(translate=lambda segment: segment[::-1])
+        self.assertEqual(translate_batch(translation, ["abc", "de"]), ["cba", "ed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
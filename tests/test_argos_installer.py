@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from translator.utils import argos_installer
+
+
+def _make_model(path, from_code, to_code, version="1.0", pkg_type="translate"):
+    folder = f"{pkg_type}-{from_code}_{to_code}"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(f"{folder}/metadata.json", json.dumps({
+            "type": pkg_type, "from_code": from_code, "to_code": to_code, "package_version": version,
+        }))
+        archive.writestr(f"{folder}/model.bin", os.urandom(4096))
+
+
+class _Installed:
+    def __init__(self, from_code, to_code, pkg_type="translate"):
+        self.from_code, self.to_code, self.type = from_code, to_code, pkg_type
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """Serves one payload, honouring `Range: bytes=N-`."""
+
+    payload = b""
+    ranges = []
+
+    def do_GET(self):
+        header = self.headers.get("Range")
+        type(self).ranges.append(header)
+        body, status = self.payload, 200
+        if header:
+            start = int(header.split("=")[1].rstrip("-"))
+            body, status = self.payload[start:], 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestArgosInstaller(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = self.tmpdir.name
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_index_keeps_newest_version_per_pair(self):
+        index_path = os.path.join(self.dir, "index.json")
+        with open(index_path, "w") as file:
+            json.dump([
+                {"type": "translate", "from_code": "en", "to_code": "pt", "package_version": "1.0"},
+                {"type": "translate", "from_code": "en", "to_code": "pt", "package_version": "1.10"},
+                {"type": "translate", "from_code": "pt", "to_code": "en", "package_version": "1.2"},
+                {"type": "sbd", "from_code": "en", "package_version": "1.0"},
+            ], file)
+        with mock.patch.object(argos_installer.settings, "local_package_index", index_path):
+            index = argos_installer.load_package_index(update=False)
+        self.assertEqual(index[("en", "pt")]["package_version"], "1.10")
+        self.assertIn(("sbd", "en"), index)
+
+    def test_plan_only_includes_missing_available_pairs(self):
+        index = {("en", "pt"): {"from_code": "en", "to_code": "pt"},
+                 ("pt", "en"): {"from_code": "pt", "to_code": "en"},
+                 ("en", "es"): {"from_code": "en", "to_code": "es"}}
+        plan = argos_installer.plan_installation(["en", "pt", "es"], index, installed={("en", "pt")})
+        self.assertEqual({(pkg["from_code"], pkg["to_code"]) for pkg in plan}, {("pt", "en"), ("en", "es")})
+
+    def test_verify_model_detects_corruption_and_checksum_mismatch(self):
+        path = os.path.join(self.dir, "model.argosmodel")
+        _make_model(path, "en", "pt")
+        with open(path, "rb") as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+        argos_installer.verify_model(path, digest)
+        with self.assertRaises(ValueError):
+            argos_installer.verify_model(path, "0" * 64)
+
+        with open(path, "r+b") as file:
+            file.seek(200)
+            file.write(b"\x00" * 64)
+        with self.assertRaises(ValueError):
+            argos_installer.verify_model(path)
+
+    def test_download_resumes_partial_file(self):
+        source = os.path.join(self.dir, "source.argosmodel")
+        _make_model(source, "en", "pt")
+        with open(source, "rb") as file:
+            payload = file.read()
+        metadata = {"type": "translate", "from_code": "en", "to_code": "pt",
+                    "sha256": hashlib.sha256(payload).hexdigest()}
+
+        downloads = os.path.join(self.dir, "downloads")
+        os.makedirs(downloads)
+        with open(os.path.join(downloads, "translate-en_pt.argosmodel.part"), "wb") as file:
+            file.write(payload[:1000])
+
+        _RangeHandler.payload, _RangeHandler.ranges = payload, []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            metadata["links"] = [f"http://127.0.0.1:{server.server_address[1]}/model"]
+            path = argos_installer.download_model(metadata, downloads)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(_RangeHandler.ranges, ["bytes=1000-"])
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), payload)
+
+    def test_install_from_directory_skips_installed_pairs(self):
+        for from_code, to_code in (("en", "pt"), ("pt", "en"), ("en", "de")):
+            _make_model(os.path.join(self.dir, f"translate-{from_code}_{to_code}.argosmodel"), from_code, to_code)
+
+        with mock.patch.object(argos_installer, "package") as package, \
+                mock.patch.object(argos_installer, "_refresh_language_registry") as refresh:
+            package.get_installed_packages.return_value = [_Installed("en", "pt")]
+            count = argos_installer.install_from_directory(self.dir, languages=["en", "pt"], workers=2)
+
+        self.assertEqual(count, 1)
+        installed = [os.path.basename(call.args[0]) for call in package.install_from_path.call_args_list]
+        self.assertEqual(installed, ["translate-pt_en.argosmodel"])
+        refresh.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
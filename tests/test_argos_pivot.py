@@ -0,0 +1,112 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from translator.argos import registry as registry_module
+from translator.argos.registry import LanguagePairRegistry
+from translator.argos.translator import ArgosTranslator
+
+
+class _Translation:
+    """Direct model tagging its output with the target language."""
+
+    def __init__(self, to_code):
+        self.to_lang = SimpleNamespace(code=to_code)
+
+    def translate(self, text):
+        return f"{text}>{self.to_lang.code}"
+
+
+class _Composite:
+    """Stands in for Argos' own CompositeTranslation (must be ignored)."""
+
+    def __init__(self, to_code):
+        self.to_lang = SimpleNamespace(code=to_code)
+        self.t1 = self.t2 = None
+
+
+def _language(code, translations):
+    return SimpleNamespace(code=code, translations_from=translations)
+
+
+class TestArgosPivotRouting(unittest.TestCase):
+    def setUp(self):
+        self.es_en = _Translation("en")
+        self.en_pt = _Translation("pt")
+        languages = [
+            _language("es", [self.es_en, _Composite("pt"), _Translation("es")]),
+            _language("en", [self.en_pt, _Translation("fr")]),
+            _language("fr", [_Translation("pt")]),
+            _language("pt", []),
+        ]
+        patcher = mock.patch.object(registry_module.translate, "get_installed_languages",
+                                    return_value=languages)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = LanguagePairRegistry()
+
+    def test_composite_and_identity_translations_are_not_direct_pairs(self):
+        self.assertIsNone(self.registry.get_translation("es", "pt"))
+        self.assertNotIn(("es", "es"), self.registry.pairs())
+
+    def test_routes_through_pivot(self):
+        self.assertEqual(self.registry.route("es", "pt"), (("es", "en"), ("en", "pt")))
+        self.assertEqual(self.registry.route("en", "pt"), (("en", "pt"),))
+        self.assertEqual(self.registry.route("pt", "pt"), ())
+        self.assertIsNone(self.registry.route("pt", "es"))
+
+    def test_routes_are_cached_until_invalidated(self):
+        with mock.patch.object(self.registry, "_shortest_route", wraps=self.registry._shortest_route) as search:
+            self.registry.route("es", "pt")
+            self.registry.route("es", "pt")
+            self.assertEqual(search.call_count, 1)
+            self.registry.register("es", "pt", _Translation("pt"))
+            self.assertEqual(self.registry.route("es", "pt"), (("es", "pt"),))
+            self.assertEqual(search.call_count, 2)
+
+    def test_translator_decodes_one_batch_per_hop(self):
+        with mock.patch("translator.argos.translator.get_language_registry", return_value=self.registry), \
+                mock.patch("translator.argos.translator.translate_batch",
+                           side_effect=lambda translation, segments: [translation.translate(s) for s in segments]
+                           ) as batch:
+            translator = ArgosTranslator(use_memory=False)
+            result = translator._translate_segments(["a", "b"], "es", "pt")
+        self.assertEqual(result, ["a>en>pt", "b>en>pt"])
+        self.assertEqual(batch.call_count, 2)
+
+    def test_translate_to_many_decodes_shared_pivot_hop_once(self):
+        with mock.patch("translator.argos.translator.get_language_registry", return_value=self.registry), \
+                mock.patch("translator.argos.translator.translate_batch",
+                           side_effect=lambda translation, segments: [translation.translate(s) for s in segments]
+                           ) as batch:
+            translator = ArgosTranslator(use_memory=False)
+            result = translator.translate_to_many("Hola amigos.", "es", ["en", "pt", "fr", "es"])
+        self.assertEqual(result, {
+            "en": "Hola amigos.>en",
+            "pt": "Hola amigos.>en>pt",
+            "fr": "Hola amigos.>en>fr",
+            "es": "Hola amigos.",
+        })
+        # es→en once, then en→pt and en→fr
+        self.assertEqual(batch.call_count, 3)
+
+    def test_micro_batching_translator_routes_through_scheduler(self):
+        with mock.patch("translator.argos.translator.get_language_registry", return_value=self.registry), \
+                mock.patch("translator.argos.translator.translate_batch",
+                           side_effect=lambda translation, segments: [translation.translate(s) for s in segments]):
+            translator = ArgosTranslator(use_memory=False, micro_batching=True, micro_batch_max_wait=0.01)
+            self.addCleanup(translator.close)
+            self.assertEqual(translator._translate_segments(["a"], "es", "pt"), ["a>en>pt"])
+            self.assertEqual(translator._get_scheduler().stats()["requests"], 1)
+            with self.assertRaises(ValueError):
+                translator._translate_segments(["a"], "pt", "es")
+
+    def test_translator_rejects_unreachable_pair(self):
+        with mock.patch("translator.argos.translator.get_language_registry", return_value=self.registry):
+            translator = ArgosTranslator(use_memory=False)
+            with self.assertRaises(ValueError):
+                translator._translate_segments(["a"], "pt", "es")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+from translator.argos import pool as pool_module
+from translator.argos import registry as registry_module
+from translator.argos.pool import ArgosProcessPool, get_process_pool
+from translator.argos.registry import LanguagePairRegistry
+from translator.argos.translator import ArgosTranslator
+
+
+class _Translation:
+    """Direct model tagging its output with the target language."""
+
+    def __init__(self, to_code):
+        self.to_lang = SimpleNamespace(code=to_code)
+
+    def translate(self, text):
+        return f"{text}>{self.to_lang.code}"
+
+
+class _ThreadPool(ArgosProcessPool):
+    """Runs the worker functions on threads of the test process."""
+
+    def __init__(self, workers=2, pairs=None, inter_threads=1, intra_threads=0, chunk_size=1):
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.pairs = set(pairs or ())
+        self._pairs_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+
+def _translate_batch(translation, segments):
+    return [translation.translate(segment) for segment in segments]
+
+
+class TestArgosProcessPool(unittest.TestCase):
+    def setUp(self):
+        languages = [
+            SimpleNamespace(code="es", translations_from=[_Translation("en")]),
+            SimpleNamespace(code="en", translations_from=[_Translation("pt")]),
+            SimpleNamespace(code="pt", translations_from=[]),
+        ]
+        patchers = [
+            mock.patch.object(registry_module.translate, "get_installed_languages", return_value=languages),
+            mock.patch("translator.argos.translator.translate_batch", side_effect=_translate_batch),
+            mock.patch("translator.argos.decoder.translate_batch", side_effect=_translate_batch),
+            mock.patch.dict(pool_module._pools, clear=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.registry = LanguagePairRegistry()
+        patcher = mock.patch("translator.argos.registry.get_language_registry", return_value=self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pool_route_matches_in_process_route(self):
+        segments = ["a", "b", "a", "c"]
+        with mock.patch("translator.argos.translator.get_language_registry", return_value=self.registry):
+            in_process = ArgosTranslator(use_memory=False)
+            pooled = ArgosTranslator(use_memory=False, workers=2)
+            route = in_process._get_route("es", "pt")
+            expected = in_process._translate_route(segments, route)
+
+            thread_pool = _ThreadPool()
+            self.addCleanup(thread_pool.shutdown)
+            with mock.patch("translator.argos.translator.get_process_pool", return_value=thread_pool) as get_pool:
+                result = pooled._translate_route(segments, route)
+
+        self.assertEqual(expected, ["a>en>pt", "b>en>pt", "a>en>pt", "c>en>pt"])
+        self.assertEqual(result, expected)
+        get_pool.assert_called_once_with(2, route, pooled.worker_inter_threads, pooled.worker_intra_threads)
+
+    def test_shared_pool_warms_pairs_requested_later(self):
+        with mock.patch.object(pool_module, "ArgosProcessPool", _ThreadPool):
+            first = get_process_pool(2, [("es", "en")])
+            self.addCleanup(first.shutdown)
+            with mock.patch.object(first._executor, "submit") as submit:
+                second = get_process_pool(2, [("es", "en"), ("en", "pt")])
+                get_process_pool(2, [("en", "pt")])
+
+        self.assertIs(first, second)
+        self.assertEqual(first.pairs, {("es", "en"), ("en", "pt")})
+        # One warm-up task per worker, for the new pair only, and only once
+        self.assertEqual(submit.call_count, 2)
+        submit.assert_called_with(pool_module._load_pairs, (("en", "pt"),))
+
+    def test_chunks_finishing_out_of_order_stream_back_in_order(self):
+        def slow_batch(translation, segments):
+            # Later chunks finish first
+            time.sleep(0.01 * (10 - int(segments[0])))
+            return _translate_batch(translation, segments)
+
+        thread_pool = _ThreadPool(workers=4, chunk_size=2)
+        self.addCleanup(thread_pool.shutdown)
+        segments = [str(idx) for idx in range(10)]
+        with mock.patch("translator.argos.decoder.translate_batch", side_effect=slow_batch):
+            result = thread_pool.translate_segments(segments, "en", "pt")
+        self.assertEqual(result, [f"{idx}>pt" for idx in range(10)])
+
+    def test_unsupported_pair_fails_the_caller(self):
+        thread_pool = _ThreadPool()
+        self.addCleanup(thread_pool.shutdown)
+        with self.assertRaises(ValueError):
+            thread_pool.translate_segments(["a", "b"], "pt", "es")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from translator.argos import registry as registry_module
+from translator.argos.registry import LanguagePairRegistry, get_language_registry, invalidate_language_registry
+from translator.argos.translator import ArgosTranslator
+
+
+class _Translation:
+    def __init__(self, to_code):
+        self.to_lang = SimpleNamespace(code=to_code)
+
+    def translate(self, text):
+        return f"{text}>{self.to_lang.code}"
+
+
+def _language(code, translations):
+    return SimpleNamespace(code=code, translations_from=translations)
+
+
+class TestLanguagePairRegistry(unittest.TestCase):
+    def setUp(self):
+        self.en_pt = _Translation("pt")
+        self.languages = [_language("en", [self.en_pt]), _language("pt", [])]
+        patcher = mock.patch.object(registry_module.translate, "get_installed_languages",
+                                    side_effect=lambda: self.languages)
+        self.scan = patcher.start()
+        self.addCleanup(patcher.stop)
+        registry_patcher = mock.patch.object(registry_module, "_registry", LanguagePairRegistry())
+        registry_patcher.start()
+        self.addCleanup(registry_patcher.stop)
+
+    def test_translators_share_one_scan_and_the_same_models(self):
+        first, second = ArgosTranslator(use_memory=False), ArgosTranslator(use_memory=False)
+        self.assertIs(first.registry, second.registry)
+        self.assertIs(first.registry.get_translation("en", "pt"), self.en_pt)
+        self.assertIs(second.registry.get_translation("en", "pt"), self.en_pt)
+        self.assertEqual(self.scan.call_count, 1)
+
+    def test_concurrent_first_use_scans_once(self):
+        registry = get_language_registry()
+        threads = [threading.Thread(target=registry.pairs) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.scan.call_count, 1)
+
+    def test_invalidate_reloads_installed_models(self):
+        registry = get_language_registry()
+        self.assertIsNone(registry.get_translation("en", "es"))
+        self.assertIsNone(registry.route("en", "es"))
+
+        en_es = _Translation("es")
+        self.languages = [_language("en", [self.en_pt, en_es]), _language("pt", []), _language("es", [])]
+        # Still served from the index until it is invalidated
+        self.assertIsNone(registry.get_translation("en", "es"))
+
+        invalidate_language_registry()
+        self.assertIs(registry.get_translation("en", "es"), en_es)
+        self.assertEqual(registry.route("en", "es"), (("en", "es"),))
+        self.assertEqual(self.scan.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import threading
+import unittest
+from translator.argos.scheduler import MicroBatchScheduler
+
+
+class _Decoder:
+    """Records every decode call and upper-cases segments."""
+
+    def __init__(self, fail_pair=None):
+        self.calls = []
+        self.fail_pair = fail_pair
+
+    def __call__(self, segments, source_lang, target_lang):
+        self.calls.append((source_lang, target_lang, list(segments)))
+        if (source_lang, target_lang) == self.fail_pair:
+            raise ValueError("pair not installed")
+        return [f"{target_lang}:{segment.upper()}" for segment in segments]
+
+
+class TestMicroBatchScheduler(unittest.TestCase):
+    def _run_concurrently(self, scheduler, jobs):
+        results = [None] * len(jobs)
+        barrier = threading.Barrier(len(jobs))
+
+        def caller(index, segments, source_lang, target_lang):
+            barrier.wait()
+            try:
+                results[index] = scheduler.translate(segments, source_lang, target_lang)
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=caller, args=(index, *job)) for index, job in enumerate(jobs)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_callers_share_one_decode_per_pair(self):
+        decoder = _Decoder()
+        scheduler = MicroBatchScheduler(decoder, max_wait=0.2, max_batch_tokens=1000)
+        self.addCleanup(scheduler.close)
+        jobs = [([f"sentence {index}", "shared"], "en", "pt") for index in range(6)] + [(["hola"], "es", "en")]
+        results = self._run_concurrently(scheduler, jobs)
+
+        self.assertEqual(results[0], ["pt:SENTENCE 0", "pt:SHARED"])
+        self.assertEqual(results[6], ["en:HOLA"])
+        pairs = [(source, target) for source, target, _ in decoder.calls]
+        self.assertEqual(sorted(set(pairs)), [("en", "pt"), ("es", "en")])
+        self.assertLess(len(decoder.calls), len(jobs))
+        # Duplicate segments are decoded once per batch
+        for _, _, segments in decoder.calls:
+            self.assertEqual(len(segments), len(set(segments)))
+
+    def test_token_budget_closes_batches_early(self):
+        decoder = _Decoder()
+        scheduler = MicroBatchScheduler(decoder, max_wait=0.2, max_batch_tokens=2)
+        self.addCleanup(scheduler.close)
+        results = self._run_concurrently(scheduler, [(["one two"], "en", "pt")] * 2 + [(["three four"], "en", "pt")])
+        self.assertEqual(results[2], ["pt:THREE FOUR"])
+        self.assertTrue(all(len(segments) == 1 for _, _, segments in decoder.calls))
+
+    def test_errors_reach_every_caller_of_the_failed_pair(self):
+        decoder = _Decoder(fail_pair=("xx", "pt"))
+        scheduler = MicroBatchScheduler(decoder, max_wait=0.1)
+        self.addCleanup(scheduler.close)
+        results = self._run_concurrently(scheduler, [(["a"], "xx", "pt"), (["b"], "en", "pt")])
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1], ["pt:B"])
+
+    def test_short_decoder_output_fails_callers_without_killing_the_thread(self):
+        outputs = iter([["only one"], ["A", "B"]])
+        scheduler = MicroBatchScheduler(lambda segments, src, tgt: next(outputs), max_wait=0)
+        self.addCleanup(scheduler.close)
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(["a", "b"], "en", "pt").result(timeout=5)
+        self.assertEqual(scheduler.submit(["a", "b"], "en", "pt").result(timeout=5), ["A", "B"])
+
+    def test_cancelled_request_does_not_stop_the_scheduler(self):
+        release = threading.Event()
+
+        def decode(segments, source_lang, target_lang):
+            release.wait(5)
+            return [segment.upper() for segment in segments]
+
+        scheduler = MicroBatchScheduler(decode, max_wait=0)
+        self.addCleanup(scheduler.close)
+        first = scheduler.submit(["a"], "en", "pt")
+        cancelled = scheduler.submit(["b"], "en", "pt")
+        self.assertTrue(cancelled.cancel())
+        release.set()
+        self.assertEqual(first.result(timeout=5), ["A"])
+        self.assertEqual(scheduler.submit(["c"], "en", "pt").result(timeout=5), ["C"])
+
+    def test_closed_scheduler_rejects_requests(self):
+        scheduler = MicroBatchScheduler(_Decoder(), max_wait=0.01)
+        self.assertEqual(scheduler.translate(["a"], "en", "pt"), ["pt:A"])
+        scheduler.close()
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(["a"], "en", "pt")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from benchmarks.bench_pipeline import compare, percentile
+from benchmarks.fake_google import FakeGoogleServer, LocalGoogleClient
+from translator.googletrans.translator import GoogleTranslator
+
+
+class TestOfflineBenchmarkHarness(unittest.TestCase):
+    def test_google_translator_against_local_stand_in(self):
+        with FakeGoogleServer(latency=0.0) as server:
+            translator = GoogleTranslator(use_memory=False, max_concurrency=2,
+                                          client_factory=lambda: LocalGoogleClient(server.url))
+            translator.set_keywords(["Whiskers"])
+            result = translator.translate("Whiskers found a path. He was happy.", "en", "pt")
+            translator.close()
+            self.assertEqual(result, "Whiskers FOUND A PATH. HE WAS HAPPY.")
+            self.assertEqual(server.requests, 2)
+
+    def test_error_injection(self):
+        with FakeGoogleServer(latency=0.0, error_rate=1.0) as server:
+            with self.assertRaises(RuntimeError):
+                LocalGoogleClient(server.url).translate("Hello.", "pt", "en")
+            self.assertEqual(server.errors, 1)
+
+    def test_percentile_and_regression_check(self):
+        self.assertAlmostEqual(percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50), 3.0)
+        baseline = {"s": {"throughput_rps": 100.0, "p95_ms": 10.0}}
+        self.assertEqual(compare({"s": {"throughput_rps": 90.0, "p95_ms": 11.0}}, baseline, 0.2), [])
+        self.assertEqual(len(compare({"s": {"throughput_rps": 50.0, "p95_ms": 30.0}}, baseline, 0.2)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from translator.googletrans.translator import GoogleTranslator
+
+
+class _SlowEndpoint:
+    """Stands in for `private_translate`: later segments answer first, peak concurrency is recorded."""
+
+    def __init__(self, count):
+        self.count = count
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, segment, source_lang, target_lang):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            index = int(segment.split()[1].rstrip("."))
+            time.sleep(0.005 * (self.count - index))
+            return SimpleNamespace(text=segment.upper())
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class TestGoogleConcurrentDispatch(unittest.TestCase):
+    def setUp(self):
+        self.texts = [f"segment {idx}." for idx in range(12)]
+        self.endpoint = _SlowEndpoint(len(self.texts))
+        self.translator = GoogleTranslator(use_memory=False, max_concurrency=3)
+        self.translator.private_translate = self.endpoint
+        self.addCleanup(self.translator._get_executor().shutdown)
+
+    def test_results_keep_input_order(self):
+        result = self.translator.translate_batch(self.texts, "en", "pt")
+        self.assertEqual(result, [text.upper() for text in self.texts])
+        self.assertEqual(self.translator.translate(" ".join(self.texts), "en", "pt"),
+                         " ".join(text.upper() for text in self.texts))
+
+    def test_concurrency_is_bounded(self):
+        self.translator.translate_batch(self.texts, "en", "pt")
+        self.assertGreater(self.endpoint.peak, 1)
+        self.assertLessEqual(self.endpoint.peak, 3)
+
+    def test_async_dispatch_keeps_order_and_bound(self):
+        result = asyncio.run(self.translator.atranslate(" ".join(self.texts), "en", "pt"))
+        self.assertEqual(result, " ".join(text.upper() for text in self.texts))
+        self.assertLessEqual(self.endpoint.peak, 3)
+
+    def test_single_concurrency_is_sequential(self):
+        translator = GoogleTranslator(use_memory=False, max_concurrency=1)
+        translator.private_translate = self.endpoint
+        self.assertEqual(translator.translate_batch(self.texts, "en", "pt"), [text.upper() for text in self.texts])
+        self.assertEqual(self.endpoint.peak, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
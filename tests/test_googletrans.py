@@ -1,10 +1,11 @@
+import asyncio
 import unittest
 from translator.googletrans.translator import GoogleTranslator
 
 
 class TestGoogleTranslator(unittest.TestCase):
     def setUp(self):
-        self.translator = GoogleTranslator()
+        self.translator = GoogleTranslator(use_memory=False)
         self.translator.source_lang = "pt"
         self.translator.target_lang = "en"
 
@@ -40,6 +41,11 @@ class TestGoogleTranslator(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertNotIn("Olá", result)
 
+    def test_async_translation(self):
+        result = asyncio.run(self.translator.atranslate("Olá mundo", "pt", "en"))
+        self.assertIsInstance(result, str)
+        self.assertNotEqual(result.lower(), "olá mundo")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from translator.utils.handletext import protect_keywords, restore_keywords
+from translator.utils.handletext import protect_keywords, restore_keywords, segment_text
+from translator.utils.segmenter import iter_sentences
 
 
 class TestHandleText(unittest.TestCase):
@@ -22,6 +23,50 @@ class TestHandleText(unittest.TestCase):
         self.assertNotIn("__1__", restored)
         self.assertNotIn("__2__", restored)
 
+    def test_segment_text_does_not_truncate(self):
+        text = " ".join(f"Sentence number {idx}." for idx in range(250))
+        self.assertEqual(len(segment_text(text)), 250)
+
+    def test_segment_text_skips_abbreviations(self):
+        sentences = segment_text("Mr. Smith met Dr. Jones. They talked.", lang="en")
+        self.assertEqual(sentences, ["Mr. Smith met Dr. Jones.", "They talked."])
+        sentences = segment_text("O Sr. Silva chegou. Depois saiu.", lang="pt")
+        self.assertEqual(sentences, ["O Sr. Silva chegou.", "Depois saiu."])
+
+    def test_common_words_and_single_letters_end_sentences(self):
+        self.assertEqual(list(iter_sentences("I said no. Then he left.")), ["I said no.", "Then he left."])
+        self.assertEqual(list(iter_sentences("Take vitamin C. It helps.")), ["Take vitamin C.", "It helps."])
+        self.assertEqual(list(iter_sentences("Ele chegou em mar. Depois saiu.", lang="pt")),
+                         ["Ele chegou em mar.", "Depois saiu."])
+
+    def test_ambiguous_abbreviations_and_initials_in_context(self):
+        self.assertEqual(list(iter_sentences("See No. 5 for details. Done.")), ["See No. 5 for details.", "Done."])
+        self.assertEqual(list(iter_sentences("Em 3 de set. de 2020 saiu. Fim.", lang="pt")),
+                         ["Em 3 de set. de 2020 saiu.", "Fim."])
+        self.assertEqual(list(iter_sentences("John F. Kennedy spoke. J. K. Rowling wrote.")),
+                         ["John F. Kennedy spoke.", "J. K. Rowling wrote."])
+
+    def test_iter_sentences_is_lazy(self):
+        sentences = iter_sentences("First one. Second one! Third one?")
+        self.assertEqual(next(sentences), "First one.")
+        self.assertEqual(list(sentences), ["Second one!", "Third one?"])
+
+    def test_overlapping_keywords_use_longest_match(self):
+        keywords = ["admin", "admin panel"]
+        protected = protect_keywords("Open the admin panel as admin.", keywords)
+        self.assertEqual(protected, "Open the __2__ as __1__.")
+        self.assertEqual(restore_keywords(protected, keywords), "Open the admin panel as admin.")
+
+    def test_large_glossary_round_trip(self):
+        keywords = [f"Product{idx}" for idx in range(5000)]
+        text = "Buy Product42 and Product4999 today."
+        protected = protect_keywords(text, keywords)
+        self.assertEqual(protected, "Buy __43__ and __5000__ today.")
+        self.assertEqual(restore_keywords(protected, keywords), text)
+
+    def test_restore_leaves_unknown_placeholders(self):
+        self.assertEqual(restore_keywords("__1__ __3__", self.keywords), "admin __3__")
+
 
 if __name__ == "__main__":
     unittest.main()
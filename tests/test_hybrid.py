@@ -0,0 +1,112 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+from tests.test_translate_json import _UpperTranslator
+from translator.hybrid import CircuitBreaker, HybridTranslator
+from translator.utils.rate_limiter import MalformedResponseError
+
+
+class _FailingTranslator(_UpperTranslator):
+    """Online stand-in that fails while `down` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+        self.calls = 0
+
+    def translate(self, text, source_lang, target_lang):
+        self.calls += 1
+        if self.down:
+            raise MalformedResponseError("Translation failed: Empty or malformed response.")
+        return "online:" + text
+
+
+class _OfflineTranslator(_UpperTranslator):
+    def translate(self, text, source_lang, target_lang):
+        return "offline:" + text
+
+
+class _UnsupportedPairTranslator(_UpperTranslator):
+    """Online stand-in rejecting every pair, as for an unsupported language."""
+
+    def translate(self, text, source_lang, target_lang):
+        raise ValueError(f"Unsupported language pair: {source_lang}->{target_lang}")
+
+    async def atranslate(self, text, source_lang, target_lang):
+        return self.translate(text, source_lang, target_lang)
+
+
+class TestHybridTranslator(unittest.TestCase):
+    def setUp(self):
+        self.online = _FailingTranslator()
+        self.offline = _OfflineTranslator()
+        self.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0)
+        self.translator = HybridTranslator(
+            online=self.online, offline=self.offline, breaker=self.breaker
+        )
+
+    def test_prefers_online_when_healthy(self):
+        self.assertEqual(self.translator.translate("hi", "en", "pt"), "online:hi")
+
+    def test_fails_over_per_request(self):
+        self.online.down = True
+        self.assertEqual(self.translator.translate("hi", "en", "pt"), "offline:hi")
+
+    def test_breaker_trips_and_recovers_with_probe(self):
+        self.breaker.recovery_timeout = 3600
+        self.online.down = True
+        for _ in range(2):
+            self.translator.translate("hi", "en", "pt")
+        self.assertEqual(self.breaker.state, CircuitBreaker.State.OPEN)
+
+        calls = self.online.calls
+        self.assertEqual(self.translator.translate("hi", "en", "pt"), "offline:hi")
+        self.assertEqual(self.online.calls, calls)  # open breaker skips online
+
+        self.breaker.recovery_timeout = 0
+        self.online.down = False
+        self.assertEqual(self.translator.translate("hi", "en", "pt"), "online:hi")
+        self.assertEqual(self.breaker.state, CircuitBreaker.State.CLOSED)
+
+    def test_caller_errors_do_not_trip_the_breaker(self):
+        translator = HybridTranslator(
+            online=_UnsupportedPairTranslator(), offline=self.offline, breaker=self.breaker
+        )
+        for _ in range(3):
+            self.assertEqual(translator.translate("hi", "en", "xx"), "offline:hi")
+            self.assertEqual(asyncio.run(translator.atranslate("hi", "en", "xx")), "offline:hi")
+        self.assertEqual(self.breaker.state, CircuitBreaker.State.CLOSED)
+        self.assertEqual(translator.engine_stats["online"].error_rate, 0.0)
+
+    def test_async_engine_creation_does_not_block_the_loop(self):
+        def slow_engine(*args, **kwargs):
+            time.sleep(0.3)
+            return _OfflineTranslator()
+
+        translator = HybridTranslator(online=self.online, offline=None, breaker=self.breaker)
+        translator.breaker.trip()
+        translator.breaker.recovery_timeout = 3600
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            result = await translator.atranslate("hi", "en", "pt")
+            task.cancel()
+            return result, ticks
+
+        with mock.patch("translator.argos.translator.ArgosTranslator", slow_engine):
+            result, ticks = asyncio.run(main())
+        self.assertEqual(result, "offline:hi")
+        self.assertGreaterEqual(ticks, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
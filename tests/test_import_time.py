@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only be loaded once a translator that needs them is created
+HEAVY_MODULES = ("googletrans", "httpx", "argostranslate", "ctranslate2", "textblob", "nltk", "requests")
+
+# Generous budget (cumulative `-X importtime` of the package) so slow CI machines don't flake
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run(code):
+    """Runs `code` in a fresh interpreter and returns (stdout, stderr)."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, env=env, check=True,
+    )
+    return result.stdout, result.stderr
+
+
+def _loaded_heavy_modules(statement):
+    code = (
+        f"import json, sys\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    stdout, _ = _run(code)
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def _cumulative_import_seconds(stderr, module):
+    """Extracts the cumulative import time of `module` from `-X importtime` output."""
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1_000_000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_package_import_does_not_load_backends(self):
+        self.assertEqual(_loaded_heavy_modules("import translator"), [])
+
+    def test_factory_import_does_not_load_backends(self):
+        self.assertEqual(_loaded_heavy_modules("from translator import get_translator"), [])
+
+    def test_utils_import_does_not_load_backends(self):
+        self.assertEqual(_loaded_heavy_modules("import translator.utils"), [])
+
+    def test_package_import_within_budget(self):
+        _, stderr = _run("import translator")
+        self.assertLess(_cumulative_import_seconds(stderr, "translator"), IMPORT_BUDGET_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
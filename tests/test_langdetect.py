@@ -0,0 +1,196 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from translator.BaseTranslator import BaseTranslator
+from translator.googletrans.translator import GoogleTranslator
+from translator.utils.rate_limiter import AdaptiveRateLimiter
+from translator.utils.langdetect import UNDETERMINED, LanguageDetector
+
+
+class _RecordingTranslator(BaseTranslator):
+    """Engine tagging segments with their source language and recording each dispatch.
+
+    Its own language detection answers from a fixed table ("und" otherwise).
+    """
+
+    def __init__(self, languages=None):
+        super().__init__("auto", "pt", use_memory=False)
+        self.languages = languages or {}
+        self.batches = []
+        self.detected = []
+
+    def translate(self, text, source_lang, target_lang):
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def _translate_segments(self, segments, source_lang, target_lang):
+        self.batches.append((source_lang, list(segments)))
+        return [f"[{source_lang}] {segment}" for segment in segments]
+
+    def detect_language(self, text):
+        self.detected.append(text)
+        return self.languages.get(text, UNDETERMINED)
+
+    def set_keywords(self, keywords):
+        self.keywords = keywords
+
+
+class _SlowDetectClient:
+    """googletrans-like client whose detection is a slow blocking round trip."""
+
+    def detect(self, text):
+        time.sleep(0.3)
+        return SimpleNamespace(lang="en")
+
+    def translate(self, text, dest="en", src="auto"):
+        return SimpleNamespace(text=f"[{src}] {text}")
+
+
+# Short UI strings per language: each is either detected correctly or reported
+# as undetermined, never confidently misclassified
+UI_STRINGS = {
+    "en": ["Save", "Cancel", "Delete account", "Settings", "Open file", "Sign in", "Log out",
+           "Are you sure?", "Search", "Help", "Password", "Forgot your password?", "Download",
+           "Edit profile", "Your changes have been saved.", "The file could not be opened."],
+    "es": ["Guardar", "Cancelar", "Eliminar cuenta", "Configuración", "Abrir archivo", "Iniciar sesión",
+           "Cerrar sesión", "¿Estás seguro?", "Buscar", "Ayuda", "Contraseña", "Descargar", "Editar perfil",
+           "Hola mundo", "El archivo no se pudo abrir."],
+    "fr": ["Enregistrer", "Annuler", "Supprimer le compte", "Paramètres", "Ouvrir le fichier", "Se connecter",
+           "Déconnexion", "Êtes-vous sûr ?", "Rechercher", "Aide", "Mot de passe", "Télécharger",
+           "Modifier le profil", "Le fichier n'a pas pu être ouvert."],
+    "pt": ["Salvar", "Cancelar", "Excluir conta", "Configurações", "Abrir arquivo", "Entrar", "Sair",
+           "Tem certeza?", "Pesquisar", "Ajuda", "Senha", "Baixar", "Editar perfil",
+           "O arquivo não pôde ser aberto."],
+}
+
+
+class TestLanguageDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = LanguageDetector(cache_size=2)
+
+    def test_detects_supported_languages(self):
+        samples = {
+            "Where is the nearest hospital?": "en",
+            "¿Dónde está el hospital más cercano?": "es",
+            "Où est l'hôpital le plus proche?": "fr",
+            "Onde fica o hospital mais próximo?": "pt",
+            "Please check the following information before you submit the form.": "en",
+            "Por favor, revise la siguiente información antes de enviar el formulario.": "es",
+            "Veuillez vérifier les informations suivantes avant d'envoyer le formulaire.": "fr",
+            "Por favor, verifique as seguintes informações antes de enviar o formulário.": "pt",
+        }
+        for text, expected in samples.items():
+            self.assertEqual(self.detector.detect(text), expected, text)
+
+    def test_text_without_letters_is_undetermined(self):
+        self.assertEqual(self.detector.detect("12345 !!"), UNDETERMINED)
+        self.assertEqual(self.detector.classify("12345 !!"), (self.detector.default, 0.0))
+
+    def test_short_ui_strings_are_never_confidently_wrong(self):
+        for expected, texts in UI_STRINGS.items():
+            for text in texts:
+                self.assertIn(self.detector.detect(text), (expected, UNDETERMINED), text)
+
+    def test_ambiguous_strings_are_undetermined(self):
+        for text in ["Save", "Cancel", "Delete account", "Are you sure?", "Enregistrer", "Paramètres",
+                     "Cancelar", "Sair", "El archivo no se pudo abrir."]:
+            lang, margin = self.detector.classify(text)
+            self.assertFalse(self.detector.is_confident(text, margin), f"{text} -> {lang} ({margin:.2f})")
+            self.assertEqual(self.detector.detect(text), UNDETERMINED, text)
+
+    def test_distinctive_short_strings_are_detected(self):
+        samples = {"Settings": "en", "Configuración": "es", "Déconnexion": "fr", "Senha": "pt"}
+        for text, expected in samples.items():
+            self.assertEqual(self.detector.detect(text), expected, text)
+
+    def test_margin_is_normalized_by_length(self):
+        _, margin = self.detector.classify("Where is the nearest hospital?")
+        _, repeated = self.detector.classify(" ".join(["Where is the nearest hospital?"] * 10))
+        self.assertAlmostEqual(margin, repeated, places=6)
+
+    def test_batch_scores_each_distinct_text_once_and_caches(self):
+        calls = []
+        classify = self.detector._classify
+        self.detector._classify = lambda text: calls.append(text) or classify(text)
+        first, second = "Bonjour tout le monde, comment allez-vous aujourd'hui?", "Hello world"
+        result = self.detector.detect_many([first, second, first])
+        self.assertEqual(result, ["fr", "en", "fr"])
+        self.detector.detect_many([second])
+        self.assertEqual(calls, [first, second])
+
+
+class TestAutoSourceLanguage(unittest.TestCase):
+    def setUp(self):
+        self.translator = _RecordingTranslator()
+
+    def test_batch_is_grouped_by_detected_language(self):
+        texts = [
+            "Please check the following information before you submit the form.",
+            "Por favor, revise la siguiente información antes de enviar el formulario.",
+            "The file could not be opened.",
+            "Por favor, verifique as seguintes informações antes de enviar o formulário.",
+        ]
+        result = self.translator.translate_batch(texts, "auto", "pt")
+        self.assertEqual(sorted(lang for lang, _ in self.translator.batches), ["en", "es"])
+        self.assertEqual(result[0], f"[en] {texts[0]}")
+        self.assertEqual(result[1], f"[es] {texts[1]}")
+        # Confidently detected as the target language
+        self.assertEqual(result[3], texts[3])
+        self.assertEqual(self.translator.detected, [])
+
+    def test_translate_json_accepts_auto(self):
+        data = {"greeting": "Hello world, how are you today?",
+                "farewell": "Merci pour votre aide, nous l'apprécions vraiment."}
+        result = self.translator.translate_json(data)
+        self.assertEqual(result["greeting"], "[en] Hello world, how are you today?")
+        self.assertEqual(result["farewell"], "[fr] Merci pour votre aide, nous l'apprécions vraiment.")
+
+    def test_low_confidence_text_is_never_skipped(self):
+        # "Delete account" scored as French with the old seed corpora
+        texts = ["Delete account", "Enregistrer", "Save"]
+        result = self.translator.translate_batch(texts, "auto", "fr")
+        self.assertEqual(sorted(self.translator.detected), sorted(texts))
+        self.assertTrue(all(text.startswith("[") for text in result), result)
+
+    def test_low_confidence_text_falls_back_to_engine_detection(self):
+        translator = _RecordingTranslator({"Save": "en", "Enregistrer": "fr", "Cancel": "en"})
+        sentence = "Le fichier n'a pas pu être ouvert."
+        result = translator.translate_batch(["Save", "Enregistrer", "Cancel", sentence], "auto", "fr")
+        self.assertEqual(result, ["[en] Save", "Enregistrer", "[en] Cancel", sentence])
+        # Confident detections do not reach the engine
+        self.assertNotIn(sentence, translator.detected)
+        self.assertEqual(translator.batches, [("en", ["Save", "Cancel"])])
+
+    def test_translate_to_many_keeps_low_confidence_source_as_target(self):
+        result = self.translator.translate_to_many("Paramètres", "auto", ["pt", "en", "fr"])
+        self.assertTrue(all(text.startswith("[") for text in result.values()), result)
+
+
+class TestAsyncAutoSourceLanguage(unittest.TestCase):
+    def test_engine_detection_does_not_block_the_event_loop(self):
+        translator = GoogleTranslator(use_memory=False, max_concurrency=1, client_factory=_SlowDetectClient,
+                                      rate_limiter=AdaptiveRateLimiter(rate=0))
+        self.addCleanup(translator.close)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.ensure_future(ticker())
+            result = await translator.atranslate("Save", "auto", "pt")
+            task.cancel()
+            return result, ticks
+
+        result, ticks = asyncio.run(run())
+        self.assertEqual(result, "[en] Save")
+        # The loop kept running while "Save" (too short to trust) was sent to the engine
+        self.assertGreaterEqual(ticks, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import unittest
+
+from translator.utils.handletext import log_translation
+from translator.utils.log_sink import TranslationLogSink, get_log_sink
+
+
+class TestTranslationLogSink(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "translation_log.txt")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _read(self, path=None):
+        with open(path or self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def test_text_format_matches_legacy_log(self):
+        sink = TranslationLogSink(self.path)
+        sink.write("Hello", "Olá")
+        self.assertTrue(sink.flush(timeout=5))
+        self.assertEqual(self._read(), "Original:\nHello\nTranslated:\nOlá\n" + "-" * 40 + "\n")
+        sink.close()
+
+    def test_json_lines_keep_order_and_fields(self):
+        sink = TranslationLogSink(self.path, json_lines=True, batch_size=4)
+        for idx in range(10):
+            sink.write(f"text {idx}", f"texto {idx}", engine="google")
+        sink.close()
+        records = [json.loads(line) for line in self._read().splitlines()]
+        self.assertEqual([record["original"] for record in records], [f"text {idx}" for idx in range(10)])
+        self.assertTrue(all(record["engine"] == "google" for record in records))
+
+    def test_rotates_by_size(self):
+        sink = TranslationLogSink(self.path, max_bytes=200, backup_count=2, batch_size=1)
+        for idx in range(20):
+            sink.write(f"text {idx}", f"texto {idx}")
+        sink.close()
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertTrue(os.path.exists(self.path + ".2"))
+        self.assertFalse(os.path.exists(self.path + ".3"))
+        self.assertLessEqual(os.path.getsize(self.path), 200)
+        self.assertIn("text 19", self._read())
+
+    def test_rotation_counts_bytes_not_characters(self):
+        sink = TranslationLogSink(self.path, max_bytes=260, backup_count=1, batch_size=1)
+        for _ in range(2):
+            # 96 characters, but 156 bytes once encoded
+            sink.write("テスト" * 10, "ok")
+            self.assertTrue(sink.flush(timeout=5))
+        sink.close()
+        self.assertTrue(os.path.exists(self.path + ".1"))
+        self.assertLessEqual(os.path.getsize(self.path), 260)
+
+    def test_log_translation_uses_shared_sink(self):
+        log_translation("Good morning", "Bom dia", log_path=self.path)
+        sink = get_log_sink(self.path)
+        self.assertTrue(sink.flush(timeout=5))
+        self.assertIn("Good morning", self._read())
+        sink.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import urllib.request
+
+from translator.utils.metrics import CACHE_LOOKUPS, STAGE_SECONDS, MetricsRegistry, get_metrics, start_metrics_server
+from translator.utils.translation_memory import TranslationMemory
+from tests.test_translate_json import _UpperTranslator
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry(buckets=(0.1, 1.0), enabled=True)
+
+    def test_stage_records_latency_and_errors(self):
+        with self.registry.stage("engine", "google", "en", "pt"):
+            pass
+        with self.assertRaises(RuntimeError):
+            with self.registry.stage("engine", "google", "en", "pt"):
+                raise RuntimeError("boom")
+
+        text = self.registry.render_prometheus()
+        labels = 'engine="google",source_lang="en",stage="engine",target_lang="pt"'
+        self.assertIn(f"hybridtrans_stage_seconds_count{{{labels}}} 2", text)
+        self.assertIn(f'hybridtrans_stage_seconds_bucket{{{labels},le="+Inf"}} 2', text)
+        self.assertIn(f"hybridtrans_stage_errors_total{{{labels}}} 1", text)
+        self.assertIn("# TYPE hybridtrans_stage_seconds histogram", text)
+
+    def test_cache_hit_rate(self):
+        self.assertIsNone(self.registry.cache_hit_rate())
+        self.registry.record_cache("argos", "en", "pt", hits=3, misses=1)
+        self.registry.record_cache("google", "en", "pt", hits=0, misses=4)
+        self.assertEqual(self.registry.cache_hit_rate("argos"), 0.75)
+        self.assertEqual(self.registry.cache_hit_rate(), 3 / 8)
+
+    def test_hooks_receive_values(self):
+        events = []
+
+        def hook(kind, name, value, labels):
+            events.append((kind, name, labels.get("result")))
+
+        self.registry.add_hook(hook)
+        self.registry.record_cache("argos", "en", "pt", hits=1, misses=0)
+        self.registry.remove_hook(hook)
+        self.registry.record_cache("argos", "en", "pt", hits=1, misses=0)
+        self.assertEqual(events, [("counter", CACHE_LOOKUPS, "hit")])
+
+    def test_disabled_registry_records_nothing(self):
+        registry = MetricsRegistry(enabled=False)
+        with registry.stage("engine", "google"):
+            pass
+        self.assertEqual(registry.render_prometheus(), "\n")
+
+    def test_http_endpoint(self):
+        with self.registry.stage("restore", "argos", "en", "pt"):
+            pass
+        server = start_metrics_server(port=0, registry=self.registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn(STAGE_SECONDS, body)
+
+
+class TestPipelineInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.metrics = get_metrics()
+        self.metrics.reset()
+
+    def tearDown(self):
+        self.metrics.reset()
+
+    def test_translate_json_records_every_stage(self):
+        translator = _UpperTranslator()
+        translator.translate_json({"title": "Hello world. Bye.", "tags": ["one"]})
+        stages = {
+            entry["labels"]["stage"]
+            for entry in self.metrics.snapshot()["histograms"].get(STAGE_SECONDS, [])
+            if entry["labels"]["engine"] == "base"
+        }
+        self.assertEqual(stages, {"protection", "segmentation", "engine", "restore", "json_traversal"})
+
+    def test_memory_lookups_are_counted(self):
+        translator = _UpperTranslator()
+        translator.memory = TranslationMemory(":memory:")
+        translator.translate_batch(["Hello.", "Hello."], "en", "pt")
+        translator.translate_batch(["Hello."], "en", "pt")
+        self.assertEqual(self.metrics.cache_hit_rate("base"), 0.5)
+        translator.memory.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import time
+import unittest
+from unittest import mock
+from translator.utils.network import ConnectivityProbe
+
+
+class TestConnectivityProbe(unittest.TestCase):
+    def test_result_is_cached_within_ttl(self):
+        probe = ConnectivityProbe(ttl=60)
+        with mock.patch("translator.utils.network.is_connected", return_value=True) as check:
+            self.assertTrue(probe.is_connected())
+            self.assertTrue(probe.is_connected())
+        self.assertEqual(check.call_count, 1)
+
+    def test_stale_result_is_refreshed_in_background(self):
+        probe = ConnectivityProbe(ttl=0)
+        with mock.patch("translator.utils.network.is_connected", return_value=True):
+            probe.is_connected()
+        with mock.patch("translator.utils.network.is_connected", return_value=False) as check:
+            # The stale value is returned immediately while the refresh runs
+            self.assertTrue(probe.is_connected())
+            for _ in range(100):
+                if check.called and not probe._refreshing:
+                    break
+                time.sleep(0.01)
+        self.assertFalse(probe._result)
+
+    def test_failed_background_refresh_does_not_block_later_refreshes(self):
+        probe = ConnectivityProbe(ttl=0)
+        with mock.patch("translator.utils.network.is_connected", return_value=True):
+            probe.is_connected()
+        with mock.patch("translator.utils.network.is_connected", side_effect=OSError("boom")) as check, \
+                mock.patch("threading.excepthook"):
+            self.assertTrue(probe.is_connected())
+            for _ in range(100):
+                if check.called and not probe._refreshing:
+                    break
+                time.sleep(0.01)
+        self.assertFalse(probe._refreshing)
+        self.assertTrue(probe._result)
+        with mock.patch("translator.utils.network.is_connected", return_value=False) as check:
+            probe.is_connected()
+            for _ in range(100):
+                if check.called and not probe._refreshing:
+                    break
+                time.sleep(0.01)
+        self.assertFalse(probe._result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from translator.googletrans.translator import GoogleTranslator
+from translator.utils.rate_limiter import AdaptiveRateLimiter, MalformedResponseError, is_throttling_error
+
+
+class _HTTPError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.response = mock.Mock(status_code=status_code, headers=headers or {})
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def _limiter(self, **kwargs):
+        settings = dict(rate=20, burst=1, min_rate=1, max_rate=100, backoff_base=0.001, backoff_max=0.002)
+        settings.update(kwargs)
+        return AdaptiveRateLimiter(**settings)
+
+    def test_token_bucket_paces_requests(self):
+        limiter = self._limiter()
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_async_acquire_shares_the_bucket(self):
+        limiter = self._limiter()
+
+        async def run():
+            await asyncio.gather(*(limiter.aacquire() for _ in range(6)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_aimd(self):
+        limiter = self._limiter(rate=10, increase=5)
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 5)
+        # A second signal right away belongs to the same congestion event
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 5)
+        limiter.on_success()
+        self.assertEqual(limiter.rate, 6)
+
+    def test_retries_throttled_calls(self):
+        limiter = self._limiter(max_retries=3)
+        outcomes = iter([_HTTPError(429), MalformedResponseError("malformed"), "ok"])
+
+        def request():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual(limiter.call(request), "ok")
+        self.assertEqual(limiter.stats()["retries"], 2)
+
+    def test_gives_up_and_passes_other_errors_through(self):
+        limiter = self._limiter(max_retries=1)
+        calls = []
+
+        def throttled():
+            calls.append(1)
+            raise _HTTPError(429)
+
+        with self.assertRaises(_HTTPError):
+            limiter.call(throttled)
+        self.assertEqual(len(calls), 2)
+
+        with self.assertRaises(PermissionError):
+            limiter.call(lambda: (_ for _ in ()).throw(PermissionError("denied")))
+
+    def test_disabled_limiter_still_retries(self):
+        limiter = self._limiter(rate=0, max_retries=1)
+        outcomes = iter([_HTTPError(503), "ok"])
+
+        def request():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        self.assertEqual(limiter.call(request), "ok")
+
+    def test_throttling_classification(self):
+        self.assertTrue(is_throttling_error(_HTTPError(429)))
+        self.assertTrue(is_throttling_error(Exception('Unexpected status code "429" from [...]')))
+        self.assertTrue(is_throttling_error(_HTTPError(403, {"Retry-After": "5"})))
+        self.assertTrue(is_throttling_error(MalformedResponseError("empty response")))
+        self.assertTrue(is_throttling_error(TimeoutError("read timed out")))
+        self.assertFalse(is_throttling_error(_HTTPError(404)))
+        self.assertFalse(is_throttling_error(PermissionError("denied")))
+        # Caller and programming errors are not throttling
+        self.assertFalse(is_throttling_error(ValueError("invalid destination language")))
+        self.assertFalse(is_throttling_error(IndexError("list index out of range")))
+        self.assertFalse(is_throttling_error(KeyError("text")))
+
+
+class _FlakyClient:
+    """googletrans-like client returning an empty response once."""
+
+    calls = 0
+
+    def translate(self, text, dest="en", src="auto"):
+        type(self).calls += 1
+        if type(self).calls == 1:
+            return None
+        return mock.Mock(text=text.upper())
+
+
+class _StrictClient:
+    """googletrans-like client validating languages before any request."""
+
+    def translate(self, text, dest="en", src="auto"):
+        if dest == "xx":
+            raise ValueError("invalid destination language")
+        return mock.Mock(text=text.upper())
+
+
+class TestGoogleTranslatorRetries(unittest.TestCase):
+    def test_invalid_language_fails_fast_without_rate_cut(self):
+        limiter = AdaptiveRateLimiter(rate=10, backoff_base=1, backoff_max=2)
+        translator = GoogleTranslator(use_memory=False, max_concurrency=1,
+                                      client_factory=_StrictClient, rate_limiter=limiter)
+        start = time.monotonic()
+        with self.assertRaises(ValueError):
+            translator.translate("Hello", "en", "xx")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(limiter.rate, 10)
+        self.assertEqual(limiter.stats(), {"rate": 10, "throttled": 0, "retries": 0})
+
+    def test_real_client_429_lowers_rate_and_retries(self):
+        from googletrans import Translator
+
+        limiter = AdaptiveRateLimiter(rate=10, max_retries=1, backoff_base=0.001, backoff_max=0.002)
+        translator = GoogleTranslator(use_memory=False, max_concurrency=1,
+                                      client_factory=Translator, rate_limiter=limiter)
+        client = translator._client()
+        throttled = mock.Mock(status_code=429, text="")
+        with mock.patch.object(client.client, "post", return_value=throttled) as post:
+            with self.assertRaisesRegex(Exception, "429"):
+                translator.private_translate("Hello", "en", "pt")
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(limiter.stats()["retries"], 1)
+        self.assertGreaterEqual(limiter.stats()["throttled"], 1)
+        self.assertLess(limiter.rate, 10)
+
+    def test_malformed_response_is_retried(self):
+        limiter = AdaptiveRateLimiter(rate=0, backoff_base=0.001)
+        translator = GoogleTranslator(use_memory=False, max_concurrency=1,
+                                      client_factory=_FlakyClient, rate_limiter=limiter)
+        self.assertEqual(translator.translate("Hello.", "en", "pt"), "HELLO.")
+        self.assertEqual(limiter.stats()["throttled"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+import unittest
+from aiohttp.test_utils import AioHTTPTestCase
+from translator.BaseTranslator import BaseTranslator
+from translator.server import create_app
+
+
+class _UpperTranslator(BaseTranslator):
+    """Engine upper-casing segments; "boom" fails, "busy" times out and "wait" blocks until released."""
+
+    def __init__(self):
+        super().__init__("en", "pt", use_memory=False)
+        self.release = threading.Event()
+
+    def translate(self, text, source_lang, target_lang):
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def _translate_segments(self, segments, source_lang, target_lang):
+        if any("boom" in segment for segment in segments):
+            raise RuntimeError("engine failure")
+        if any("busy" in segment for segment in segments):
+            raise TimeoutError("upstream timed out")
+        if any("wait" in segment for segment in segments):
+            self.release.wait(5)
+        return [segment.upper() for segment in segments]
+
+    def detect_language(self, text):
+        return "fr" if "bonjour" in text.lower() else "en"
+
+    def set_keywords(self, keywords):
+        self.keywords = keywords
+
+
+class TestTranslationServer(AioHTTPTestCase):
+    async def get_application(self):
+        self.translator = _UpperTranslator()
+        return create_app(self.translator, max_concurrency=1, max_queue=0, queue_timeout=1)
+
+    async def test_translate(self):
+        response = await self.client.post("/translate", json={"text": "hello", "source_lang": "en",
+                                                              "target_lang": "pt"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(await response.json(), {"translation": "HELLO"})
+
+    async def test_translate_to_many_targets(self):
+        response = await self.client.post("/translate", json={"text": "hello", "source_lang": "en",
+                                                              "targets": ["pt", "en"]})
+        self.assertEqual((await response.json())["translations"], {"pt": "HELLO", "en": "hello"})
+
+    async def test_batch_reports_item_errors(self):
+        response = await self.client.post("/batch", json={"texts": ["a", "boom", "a"], "source_lang": "en",
+                                                          "target_lang": "pt"})
+        body = await response.json()
+        self.assertEqual(body["translations"], ["A", None, "A"])
+        self.assertEqual(list(body["errors"]), ["1"])
+
+    async def test_json_and_detect(self):
+        response = await self.client.post("/json", json={"data": {"title": "menu", "id": "x1"},
+                                                         "source_lang": "en", "target_lang": "pt",
+                                                         "exclude_paths": ["id"]})
+        self.assertEqual((await response.json())["data"], {"title": "MENU", "id": "x1"})
+        response = await self.client.post("/detect", json={"texts": ["Bonjour", "Hello"]})
+        self.assertEqual((await response.json())["languages"], ["fr", "en"])
+
+    async def test_invalid_request_is_rejected(self):
+        response = await self.client.post("/translate", json={"text": "hello"})
+        self.assertEqual(response.status, 400)
+        response = await self.client.post("/batch", data="not json")
+        self.assertEqual(response.status, 400)
+
+    async def test_unsupported_language_is_rejected(self):
+        response = await self.client.post("/translate", json={"text": "hello", "source_lang": "en",
+                                                              "target_lang": "xx"})
+        self.assertEqual(response.status, 400)
+        self.assertIn("target_lang", (await response.json())["error"])
+        response = await self.client.post("/translate", json={"text": "hello", "source_lang": "en",
+                                                              "targets": ["pt", "xx"]})
+        self.assertEqual(response.status, 400)
+        response = await self.client.post("/batch", json={"texts": ["a"], "source_lang": "xx",
+                                                          "target_lang": "pt"})
+        self.assertEqual(response.status, 400)
+
+    async def test_json_paths_must_be_lists_of_strings(self):
+        for paths in ("title", ["title", 3]):
+            response = await self.client.post("/json", json={"data": {"title": "menu"}, "source_lang": "en",
+                                                             "target_lang": "pt", "include_paths": paths})
+            self.assertEqual(response.status, 400)
+        response = await self.client.post("/json", json={"data": {"title": "menu"}, "source_lang": "en",
+                                                         "target_lang": "pt", "exclude_paths": "id"})
+        self.assertEqual(response.status, 400)
+
+    async def test_engine_failures_are_not_client_errors(self):
+        response = await self.client.post("/translate", json={"text": "boom", "source_lang": "en",
+                                                              "target_lang": "pt"})
+        self.assertEqual(response.status, 502)
+        response = await self.client.post("/translate", json={"text": "busy", "source_lang": "en",
+                                                              "targets": ["pt", "fr"]})
+        self.assertEqual(response.status, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+    async def test_back_pressure_and_health(self):
+        slow = asyncio.ensure_future(self.client.post(
+            "/translate", json={"text": "wait", "source_lang": "en", "target_lang": "pt"}))
+        for _ in range(100):
+            health = await (await self.client.get("/health")).json()
+            if health["in_flight"]:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(health["status"], "ok")
+        self.assertEqual(health["in_flight"], 1)
+
+        response = await self.client.post("/translate", json={"text": "hello", "source_lang": "en",
+                                                              "target_lang": "pt"})
+        self.assertEqual(response.status, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+
+        self.translator.release.set()
+        self.assertEqual((await (await slow).json())["translation"], "WAIT")
+
+    async def test_metrics_endpoint(self):
+        response = await self.client.get("/metrics")
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+
+
+if __name__ == "__main__":
+    unittest.main()
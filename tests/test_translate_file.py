@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from tests.test_translate_json import _UpperTranslator
+from translator.utils.handletext import iter_paragraphs
+
+
+class _FlakyTranslator(_UpperTranslator):
+    """Fails once on the given dispatch to simulate an interrupted job."""
+
+    def __init__(self, fail_on_batch):
+        super().__init__()
+        self.fail_on_batch = fail_on_batch
+
+    def _translate_segments(self, segments, source_lang, target_lang):
+        if len(self.batches) + 1 == self.fail_on_batch:
+            self.fail_on_batch = None
+            raise RuntimeError("connection lost")
+        return super()._translate_segments(segments, source_lang, target_lang)
+
+
+class TestTranslateFile(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tmpdir.name, "input.txt")
+        self.output_path = os.path.join(self.tmpdir.name, "output.txt")
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("\n\n".join(f"Paragraph {idx}." for idx in range(10)) + "\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _read_output(self):
+        with open(self.output_path, "r", encoding="utf-8") as file:
+            return file.read()
+
+    def test_translates_whole_file(self):
+        count = _UpperTranslator().translate_file(self.input_path, self.output_path, chunk_paragraphs=3)
+        self.assertEqual(count, 10)
+        expected = "\n\n".join(f"PARAGRAPH {idx}." for idx in range(10))
+        self.assertEqual(self._read_output(), expected)
+        self.assertFalse(os.path.exists(self.output_path + ".checkpoint"))
+
+    def test_resumes_from_checkpoint(self):
+        translator = _FlakyTranslator(fail_on_batch=3)
+        with self.assertRaises(RuntimeError):
+            translator.translate_file(self.input_path, self.output_path, chunk_paragraphs=3)
+        self.assertTrue(os.path.exists(self.output_path + ".checkpoint"))
+
+        translator.translate_file(self.input_path, self.output_path, chunk_paragraphs=3)
+        # Only the chunks after the checkpoint are translated again
+        self.assertEqual(len(translator.batches), 4)
+        expected = "\n\n".join(f"PARAGRAPH {idx}." for idx in range(10))
+        self.assertEqual(self._read_output(), expected)
+
+    def _write_input(self, text):
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_split_paragraphs_keep_their_line_breaks(self):
+        text = "First line.\nOther line.\nThird line.\n\nParagraph.\n"
+        self._write_input(text)
+        with mock.patch("translator.BaseTranslator.iter_paragraphs",
+                        lambda source, lang: iter_paragraphs(source, max_chars=12, lang=lang)):
+            count = _UpperTranslator().translate_file(self.input_path, self.output_path, chunk_paragraphs=2)
+        self.assertEqual(count, 4)
+        self.assertEqual(self._read_output(), text.upper().rstrip("\n"))
+
+    def test_long_lines_are_split_at_sentence_boundaries(self):
+        line = " ".join(f"Sentence number {idx} is here." for idx in range(6))
+        self._write_input(line + "\n\nTail.\n")
+        with open(self.input_path, "r", encoding="utf-8") as file:
+            pieces = list(iter_paragraphs(file, max_chars=60))
+        self.assertTrue(all(len(piece) <= 60 for piece, _ in pieces))
+        self.assertTrue(all(piece.endswith(".") for piece, _ in pieces))
+        self.assertEqual([separator for _, separator in pieces], [" ", " ", "\n\n", "\n\n"])
+
+        with mock.patch("translator.BaseTranslator.iter_paragraphs",
+                        lambda source, lang: iter_paragraphs(source, max_chars=60, lang=lang)):
+            translator = _FlakyTranslator(fail_on_batch=2)
+            with self.assertRaises(RuntimeError):
+                translator.translate_file(self.input_path, self.output_path, chunk_paragraphs=2)
+            translator.translate_file(self.input_path, self.output_path, chunk_paragraphs=2)
+        self.assertEqual(self._read_output(), (line + "\n\nTail.").upper())
+
+
+if __name__ == "__main__":
+    unittest.main()
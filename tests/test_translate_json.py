@@ -0,0 +1,60 @@
+import unittest
+from translator.BaseTranslator import BaseTranslator
+
+
+class _UpperTranslator(BaseTranslator):
+    """Minimal engine that upper-cases segments and records each dispatch."""
+
+    def __init__(self):
+        super().__init__("en", "pt", use_memory=False)
+        self.batches = []
+
+    def translate(self, text, source_lang, target_lang):
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def _translate_segments(self, segments, source_lang, target_lang):
+        self.batches.append(list(segments))
+        return [segment.upper() for segment in segments]
+
+    def detect_language(self, text):
+        return "en"
+
+    def set_keywords(self, keywords):
+        self.keywords = keywords
+
+
+class TestTranslateJson(unittest.TestCase):
+    def setUp(self):
+        self.translator = _UpperTranslator()
+
+    def test_nested_structure(self):
+        data = {"menu": {"items": [{"label": "open"}, {"label": "close"}]}, "count": 2}
+        result = self.translator.translate_json(data)
+        self.assertEqual(result["menu"]["items"][0]["label"], "OPEN")
+        self.assertEqual(result["menu"]["items"][1]["label"], "CLOSE")
+        self.assertEqual(result["count"], 2)
+
+    def test_duplicates_translated_once_in_one_batch(self):
+        data = {"a": "save", "b": ["save", "cancel"], "c": {"d": "save"}}
+        self.translator.translate_json(data)
+        self.assertEqual(len(self.translator.batches), 1)
+        self.assertEqual(sorted(self.translator.batches[0]), ["cancel", "save"])
+
+    def test_untouched_subtrees_are_not_copied(self):
+        ids = {"id": "abc-123", "url": "https://example.com"}
+        data = {"ids": ids, "title": "hello"}
+        result = self.translator.translate_json(data, exclude_paths=["ids"])
+        self.assertIs(result["ids"], ids)
+        self.assertEqual(result["title"], "HELLO")
+
+    def test_include_and_exclude_paths(self):
+        data = {"items": [{"id": "x1", "title": "one"}, {"id": "x2", "title": "two"}], "note": "skip"}
+        result = self.translator.translate_json(
+            data, include_paths=["items"], exclude_paths=["*.id"]
+        )
+        self.assertEqual(result["items"][0], {"id": "x1", "title": "ONE"})
+        self.assertEqual(result["note"], "skip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import time
+import unittest
+from unittest import mock
+from translator.BaseTranslator import BaseTranslator
+from translator.googletrans.translator import GoogleTranslator
+
+
+class _FlakyTranslator(BaseTranslator):
+    """Upper-cases segments, fails on segments containing "boom" and records dispatches."""
+
+    def __init__(self):
+        super().__init__("en", "pt", use_memory=False)
+        self.batches = []
+
+    def translate(self, text, source_lang, target_lang):
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def _translate_segments(self, segments, source_lang, target_lang):
+        self.batches.append(list(segments))
+        if any("boom" in segment for segment in segments):
+            raise RuntimeError("engine failure")
+        return [segment.upper() for segment in segments]
+
+    def detect_language(self, text):
+        return "en"
+
+    def set_keywords(self, keywords):
+        self.keywords = keywords
+
+
+class TestTranslateMany(unittest.TestCase):
+    def setUp(self):
+        self.translator = _FlakyTranslator()
+
+    def test_duplicates_are_sent_once_in_one_batch(self):
+        result = self.translator.translate_many(["save", "cancel", "save", ""], "en", "pt")
+        self.assertTrue(result.ok)
+        self.assertEqual(list(result), ["SAVE", "CANCEL", "SAVE", ""])
+        self.assertEqual(self.translator.batches, [["save", "cancel"]])
+
+    def test_failures_are_reported_per_item(self):
+        texts = ["open", "boom", "close", "boom"]
+        result = self.translator.translate_many(texts, "en", "pt")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.translations, ["OPEN", None, "CLOSE", None])
+        self.assertEqual(sorted(result.errors), [1, 3])
+        self.assertIsInstance(result.errors[1], RuntimeError)
+
+    def test_retries_only_what_the_dispatch_did_not_translate(self):
+        calls = []
+
+        def translate_one(segment, source_lang, target_lang, timeout=None):
+            calls.append(segment)
+            if segment == "boom" or (segment == "flaky" and calls.count("flaky") == 1):
+                raise RuntimeError("request failed")
+            return segment.upper()
+
+        translator = GoogleTranslator(use_memory=False, max_concurrency=4)
+        with mock.patch.object(translator, "_translate_one", side_effect=translate_one):
+            result = translator.translate_many(["open", "flaky", "boom", "close"], "en", "pt")
+        self.assertEqual(result.translations, ["OPEN", "FLAKY", None, "CLOSE"])
+        self.assertEqual(sorted(result.errors), [2])
+        # The successful segments are not sent again
+        self.assertEqual(calls.count("open"), 1)
+        self.assertEqual(calls.count("close"), 1)
+        self.assertEqual(calls.count("flaky"), 2)
+
+    def test_retries_run_concurrently(self):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        class _SlowFlaky(_FlakyTranslator):
+            def _translate_segments(self, segments, source_lang, target_lang):
+                if len(segments) > 1:
+                    raise RuntimeError("engine failure")
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with lock:
+                    running[0] -= 1
+                return [segment.upper() for segment in segments]
+
+        result = _SlowFlaky().translate_many(["a", "b", "c", "d"], "en", "pt")
+        self.assertEqual(list(result), ["A", "B", "C", "D"])
+        self.assertGreater(peak[0], 1)
+
+    def test_missing_language_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.translator.translate_many(["open"], None, "pt")
+
+
+class TestTranslateToMany(unittest.TestCase):
+    def setUp(self):
+        self.translator = _FlakyTranslator()
+        self.translator.set_keywords(["HybridTrans"])
+
+    def test_preprocesses_once_and_dispatches_every_target(self):
+        calls = []
+        segment = self.translator._protect_and_segment
+        self.translator._protect_and_segment = lambda *args: calls.append(args) or segment(*args)
+        result = self.translator.translate_to_many("Use HybridTrans. It works.", "en", ["pt", "es", "en"])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(list(result), ["pt", "es", "en"])
+        self.assertEqual(result["pt"], "USE HybridTrans. IT WORKS.")
+        self.assertEqual(result["en"], "Use HybridTrans. It works.")
+        self.assertEqual(len(self.translator.batches), 2)
+
+    def test_defaults_to_supported_languages(self):
+        result = self.translator.translate_to_many("open", "en")
+        self.assertEqual(result["en"], "open")
+        self.assertEqual(result["fr"], "OPEN")
+
+
+if __name__ == "__main__":
+    unittest.main()
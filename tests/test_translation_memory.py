@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from translator.utils.translation_memory import TranslationMemory
+
+
+class TestTranslationMemory(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "tm.sqlite3")
+        self.memory = TranslationMemory(self.path, max_entries=10)
+
+    def tearDown(self):
+        self.memory.close()
+        self.tmpdir.cleanup()
+
+    def test_hit_and_miss_counters(self):
+        self.assertIsNone(self.memory.get("google", "en", "pt", "Hello"))
+        self.memory.set("google", "en", "pt", "Hello", "Olá")
+        self.assertEqual(self.memory.get("google", "en", "pt", "Hello"), "Olá")
+        stats = self.memory.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_key_includes_engine_and_languages(self):
+        self.memory.set("google", "en", "pt", "Hello", "Olá")
+        self.assertIsNone(self.memory.get("argos", "en", "pt", "Hello"))
+        self.assertIsNone(self.memory.get("google", "en", "es", "Hello"))
+
+    def test_persists_across_instances(self):
+        self.memory.set("argos", "en", "es", "Hello", "Hola")
+        self.memory.close()
+        self.memory = TranslationMemory(self.path, max_entries=10)
+        self.assertEqual(self.memory.get("argos", "en", "es", "Hello"), "Hola")
+
+    def test_eviction_keeps_size_bounded(self):
+        for idx in range(25):
+            self.memory.set("google", "en", "pt", f"segment {idx}", f"segmento {idx}")
+        self.assertLessEqual(len(self.memory), 10)
+        self.assertEqual(self.memory.get("google", "en", "pt", "segment 24"), "segmento 24")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest import mock
+
+from translator.translator_factory import Typetranslator, clear_translator_pool, get_translator
+
+
+class TestTranslatorPool(unittest.TestCase):
+    def setUp(self):
+        clear_translator_pool()
+        self.addCleanup(clear_translator_pool)
+
+    def test_pooled_translators_do_not_share_keywords(self):
+        first = get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False)
+        second = get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False)
+        first.keywords = ["Acme"]
+        second.keywords = ["Globex"]
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.keywords, ["Acme"])
+        self.assertEqual(second.keywords, ["Globex"])
+        self.assertEqual(get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False).keywords, [])
+
+    def test_pooled_translators_share_the_backend(self):
+        first = get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False)
+        second = get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False)
+        self.assertIs(first._get_executor(), second._get_executor())
+
+    def test_private_translator_has_its_own_backend(self):
+        pooled = get_translator(Typetranslator.ONLINE, pool_size=1, use_memory=False)
+        private = get_translator(Typetranslator.ONLINE, reuse=False, use_memory=False)
+        self.assertIsNot(pooled._shared_resources, private._shared_resources)
+        private.close()
+
+    def test_unhashable_settings_skip_the_pool(self):
+        class _Engine:
+            def __init__(self, **settings):
+                self.settings = settings
+
+            def spawn(self):
+                return self
+
+        with mock.patch("translator.translator_factory._load_engine", return_value=_Engine):
+            first = get_translator(Typetranslator.ONLINE, proxies=["http://a", "http://b"])
+            second = get_translator(Typetranslator.ONLINE, proxies=["http://a", "http://b"])
+        self.assertEqual(first.settings, {"proxies": ["http://a", "http://b"]})
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
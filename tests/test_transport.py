@@ -0,0 +1,85 @@
+import unittest
+import warnings
+from unittest import mock
+
+import httpx
+
+from translator.googletrans.transport import SharedTransport, _pool_limits, get_request_timeout, request_timeout
+from translator.googletrans.translator import GoogleTranslator
+
+
+class _FakeGoogletransClient:
+    """Stands in for googletrans.Translator: owns a client and a token acquirer."""
+
+    def __init__(self):
+        self.client = httpx.Client()
+        self.token_acquirer = mock.Mock(client=self.client)
+
+    def translate(self, text, dest="en", src="auto"):
+        return mock.Mock(text=text.upper())
+
+
+class TestSharedTransport(unittest.TestCase):
+    def setUp(self):
+        self.transport = SharedTransport(http2=False)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_pool_limits_use_current_keywords(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            kwargs = _pool_limits(max_connections=10, max_keepalive=5, keepalive_expiry=30.0)
+        ((name, limits),) = kwargs.items()
+        if name == "limits":
+            self.assertEqual(limits.max_keepalive_connections, 5)
+        else:
+            self.assertEqual(limits.max_keepalive, 5)
+        self.assertEqual(limits.max_connections, 10)
+
+    def test_attach_replaces_private_client(self):
+        client = _FakeGoogletransClient()
+        own = client.client
+        self.transport.attach(client)
+        self.assertIsNot(client.client, own)
+        self.assertIs(client.token_acquirer.client, client.client)
+
+    def test_clients_shared_across_translators(self):
+        first = GoogleTranslator(use_memory=False, client_factory=_FakeGoogletransClient, transport=self.transport)
+        second = GoogleTranslator(use_memory=False, client_factory=_FakeGoogletransClient, transport=self.transport)
+        self.assertIs(first._client().client, second._client().client)
+
+    def test_proxies_rotate_over_pools(self):
+        transport = SharedTransport(http2=False, proxies=["http://proxy-a:3128", "http://proxy-b:3128"])
+        self.assertIsNot(transport.client(), transport.client())
+        transport.close()
+
+    def test_request_timeout_context(self):
+        self.assertIsNone(get_request_timeout())
+        client = self.transport.client()
+        with mock.patch.object(httpx.Client, "request") as request:
+            with request_timeout(1.5):
+                self.assertEqual(get_request_timeout(), 1.5)
+                client.request("GET", "https://translate.google.com")
+            client.request("GET", "https://translate.google.com")
+        self.assertEqual(request.call_args_list[0].kwargs["timeout"], 1.5)
+        self.assertNotIn("timeout", request.call_args_list[1].kwargs)
+        self.assertIsNone(get_request_timeout())
+
+    def test_translator_timeout_reaches_pool_threads(self):
+        seen = []
+
+        class _Recorder(_FakeGoogletransClient):
+            def translate(self, text, dest="en", src="auto"):
+                seen.append(get_request_timeout())
+                return mock.Mock(text=text)
+
+        translator = GoogleTranslator(use_memory=False, max_concurrency=4, client_factory=_Recorder,
+                                      transport=self.transport, request_timeout=2.0)
+        translator.translate("One. Two. Three. Four.", "en", "pt")
+        translator.close()
+        self.assertEqual(seen, [2.0] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
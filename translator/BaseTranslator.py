@@ -6,19 +6,68 @@ class for all translation services. It provides a common interface for
 translating text, detecting languages, and handling keywords.
 """
 
+import asyncio
+import copy
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
-from typing import List, Union
+from fnmatch import fnmatchcase
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from translator.config import FILE_CHUNK_PARAGRAPHS, SUPPORTED_LANGUAGES, TRANSLATE_FANOUT_WORKERS
 from translator.utils.handletext import (
     extract_keywords,
+    iter_paragraphs,
     protect_keywords,
     restore_keywords,
+    segment_text,
 )
+from translator.utils.langdetect import UNDETERMINED, get_language_detector
+from translator.utils.metrics import SEGMENTS, get_metrics
+from translator.utils.translation_memory import get_translation_memory
+
+
+class BatchResult:
+    """Outcome of `BaseTranslator.translate_many()`.
+
+    Behaves like the list of translations (failed items are None); `errors`
+    maps the index of every failed input to its exception.
+    """
+
+    def __init__(self, translations: List[Optional[str]], errors: Dict[int, Exception]):
+        self.translations = translations
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        """True if every input was translated."""
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.translations)
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self.translations)
+
+    def __getitem__(self, index):
+        return self.translations[index]
+
+    def __repr__(self) -> str:
+        return f"BatchResult(translated={len(self) - len(self.errors)}, failed={len(self.errors)})"
 
 
 class BaseTranslator(ABC):
     """Base class for translation services."""
 
+    ENGINE_NAME = "base"
+    # Source language value asking for offline detection of each input
+    AUTO_LANGUAGE = "auto"
+    # Returned by the engines' translate()/atranslate() when the translation fails
+    FAILED_TRANSLATION = "[ERROR] Translation failed."
+
     class TypeLanguage(StrEnum):
         """Enum for language types.
 
@@ -44,6 +93,7 @@ class BaseTranslator(ABC):
         target_lang: TypeLanguage,
         text: str = "",
         keywords: List[str] = None,
+        use_memory: bool = True,
     ):
         """
         Initialize the BaseTranslator with source language, target language, text, and keywords.
@@ -53,12 +103,51 @@ class BaseTranslator(ABC):
             target_lang (TypeLanguage): The target language code (e.g., 'PORTUGUESE').
             text (str): The text to translate (default is an empty string).
             keywords (List[str]): A list of keywords to protect (default is None).
+            use_memory (bool): Whether to use the shared persistent translation memory.
         """
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.text = text
         self.translated_text = ""
         self.keywords = keywords or []
+        self.memory = get_translation_memory() if use_memory else None
+        self._initial_langs = (source_lang, target_lang)
+        # Backend resources created on first use, shared with every spawn() of this instance
+        self._shared_resources: Dict[str, Any] = {}
+        self._shared_lock = threading.Lock()
+
+    def spawn(self) -> "BaseTranslator":
+        """Returns a lightweight instance sharing this one's backend resources.
+
+        Clients, worker pools, loaded models, the translation memory and the
+        settings are shared; per-call state (keywords, the last text and its
+        languages) starts fresh, so callers never see each other's state.
+
+        Returns:
+            BaseTranslator: The new instance.
+        """
+        clone = copy.copy(self)
+        clone.keywords = []
+        clone.text = ""
+        clone.translated_text = ""
+        clone.source_lang, clone.target_lang = self._initial_langs
+        return clone
+
+    def _shared_resource(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Returns the backend resource called `name`, creating it on first use.
+
+        The resource is visible to this instance and to every `spawn()` of it.
+        """
+        with self._shared_lock:
+            resource = self._shared_resources.get(name)
+            if resource is None:
+                resource = self._shared_resources[name] = factory()
+            return resource
+
+    def _pop_shared_resource(self, name: str) -> Any:
+        """Removes and returns a shared backend resource (None if it was never created)."""
+        with self._shared_lock:
+            return self._shared_resources.pop(name, None)
 
     def translate(
         self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage
@@ -79,6 +168,37 @@ class BaseTranslator(ABC):
             "translate() must be implemented by subclasses of BaseTranslator"
         )
 
+    async def atranslate(
+        self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> str:
+        """Asynchronous counterpart of `translate()`.
+
+        The default implementation runs `translate()` in the default executor so
+        the event loop is never blocked. Engines override it with a native version.
+
+        Args:
+            text (str): The text to translate.
+            source_lang (TypeLanguage): The source language code \
+                (e.g., 'ENGLISH').
+            target_lang (TypeLanguage): The target language code \
+                (e.g., 'PORTUGUESE').
+
+        Returns:
+            str: The translated text.
+        """
+        return await asyncio.to_thread(self.translate, text, source_lang, target_lang)
+
+    async def adetect_language(self, text: str) -> str:
+        """Asynchronous counterpart of `detect_language()`.
+
+        Args:
+            text (str): The text whose language is to be detected.
+
+        Returns:
+            str: The detected language code (e.g., 'en' for English).
+        """
+        return await asyncio.to_thread(self.detect_language, text)
+
     @abstractmethod
     def detect_language(self, text: str) -> str:
         """Detect the language of the input text.
@@ -106,30 +226,570 @@ class BaseTranslator(ABC):
                 BaseTranslator"
         )
 
-    def translate_json(self, json_data: dict[str, Union[str, int]]) -> dict[str, Union[str, int]]:
+    def _resolve_source_lang(
+        self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> TypeLanguage:
+        """Returns `source_lang`, or the detected language of `text` for "auto"."""
+        if source_lang != self.AUTO_LANGUAGE:
+            return source_lang
+        return self._detect_source_langs([text], target_lang)[0][0]
+
+    async def _aresolve_source_lang(
+        self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> TypeLanguage:
+        """Asynchronous counterpart of `_resolve_source_lang()`.
+
+        Scoring and the blocking engine fallback of `detect_language()` run in a
+        worker thread, so the event loop is never held by a detection.
+        """
+        if source_lang != self.AUTO_LANGUAGE:
+            return source_lang
+        return await asyncio.to_thread(self._resolve_source_lang, text, source_lang, target_lang)
+
+    def _detect_source_langs(
+        self, texts: List[str], target_lang: TypeLanguage
+    ) -> List[Tuple[TypeLanguage, bool]]:
+        """
+        Detects the source language of each text for "auto" requests.
+
+        The offline detector decides when it is confident; otherwise (short UI
+        strings such as "Save") the engine's own `detect_language()` is asked, and
+        if it cannot tell either, the offline best guess is kept but flagged as
+        unreliable so callers never skip such a text as already translated.
+
+        Args:
+            texts (List[str]): The texts whose language is to be detected.
+            target_lang (TypeLanguage): The target language code (for metrics).
+
+        Returns:
+            List[Tuple[TypeLanguage, bool]]: The language of each text and whether
+                the detection is reliable, in the same order as `texts`.
+        """
+        detector = get_language_detector()
+        with self._stage("detection", self.AUTO_LANGUAGE, target_lang):
+            classified = detector.classify_many(texts)
+
+        engine_langs: Dict[str, Optional[str]] = {}
+        results = []
+        for text, (lang, margin) in zip(texts, classified):
+            if detector.is_confident(text, margin):
+                results.append((lang, True))
+                continue
+            if text not in engine_langs:
+                engine_langs[text] = self._engine_detect_language(text)
+            engine_lang = engine_langs[text]
+            results.append((engine_lang, True) if engine_lang else (lang, False))
+        return results
+
+    def _engine_detect_language(self, text: str) -> Optional[str]:
+        """Returns the engine's detection of `text`, or None if it cannot tell."""
+        if not text:
+            return None
+        try:
+            lang = self.detect_language(text)
+        except Exception as e:
+            print(f"[ERROR] Language detection failed: {e}")
+            return None
+        if not lang or lang in (UNDETERMINED, self.AUTO_LANGUAGE):
+            return None
+        return lang
+
+    def _translate_with_memory(
+        self,
+        segments: List[str],
+        source_lang: TypeLanguage,
+        target_lang: TypeLanguage,
+        translate_segments: Callable[[List[str]], List[str]],
+    ) -> List[str]:
+        """
+        Translates protected segments, consulting the translation memory first.
+
+        Only segments missing from the memory (deduplicated) are sent to the engine,
+        and their translations are stored for later calls.
+
+        Args:
+            segments (List[str]): The protected segments to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'en').
+            target_lang (TypeLanguage): The target language code (e.g., 'pt').
+            translate_segments (Callable[[List[str]], List[str]]): Engine call that
+                translates a list of segments, preserving their order.
+
+        Returns:
+            List[str]: The translated segments, in the same order as `segments`.
+        """
+        if self.memory is None:
+            return self._call_engine(translate_segments, segments, source_lang, target_lang)
+
+        known = self.memory.get_many(self.ENGINE_NAME, source_lang, target_lang, segments)
+        missing = [segment for segment in dict.fromkeys(segments) if segment not in known]
+        get_metrics().record_cache(self.ENGINE_NAME, source_lang, target_lang, len(known), len(missing))
+        if missing:
+            try:
+                translated = dict(zip(missing, self._call_engine(translate_segments, missing, source_lang, target_lang)))
+            except Exception as e:
+                # Keep the segments the engine did translate before the dispatch failed
+                partial = getattr(e, "translated_segments", None)
+                if partial:
+                    self.memory.set_many(self.ENGINE_NAME, source_lang, target_lang, partial)
+                raise
+            self.memory.set_many(self.ENGINE_NAME, source_lang, target_lang, translated)
+            known.update(translated)
+
+        return [known[segment] for segment in segments]
+
+    async def _atranslate_with_memory(
+        self,
+        segments: List[str],
+        source_lang: TypeLanguage,
+        target_lang: TypeLanguage,
+        translate_segments: Callable[[List[str]], Awaitable[List[str]]],
+    ) -> List[str]:
+        """
+        Asynchronous counterpart of `_translate_with_memory()`.
+
+        Args:
+            segments (List[str]): The protected segments to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'en').
+            target_lang (TypeLanguage): The target language code (e.g., 'pt').
+            translate_segments (Callable[[List[str]], Awaitable[List[str]]]): Engine
+                coroutine that translates a list of segments, preserving their order.
+
+        Returns:
+            List[str]: The translated segments, in the same order as `segments`.
+        """
+        if self.memory is None:
+            return await self._acall_engine(translate_segments, segments, source_lang, target_lang)
+
+        known = await asyncio.to_thread(
+            self.memory.get_many, self.ENGINE_NAME, source_lang, target_lang, segments
+        )
+        missing = [segment for segment in dict.fromkeys(segments) if segment not in known]
+        get_metrics().record_cache(self.ENGINE_NAME, source_lang, target_lang, len(known), len(missing))
+        if missing:
+            translated = dict(zip(
+                missing, await self._acall_engine(translate_segments, missing, source_lang, target_lang)
+            ))
+            await asyncio.to_thread(
+                self.memory.set_many, self.ENGINE_NAME, source_lang, target_lang, translated
+            )
+            known.update(translated)
+
+        return [known[segment] for segment in segments]
+
+    def _stage(self, stage: str, source_lang: TypeLanguage, target_lang: TypeLanguage):
+        """Returns a context manager timing a pipeline stage in the shared metrics."""
+        return get_metrics().stage(stage, self.ENGINE_NAME, source_lang, target_lang)
+
+    def _protect_and_segment(
+        self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> List[str]:
+        """Protects the keywords of a text and splits it into segments."""
+        with self._stage("protection", source_lang, target_lang):
+            protected_text = protect_keywords(text, self.keywords)
+        with self._stage("segmentation", source_lang, target_lang):
+            return segment_text(protected_text, lang=source_lang)
+
+    def _restore(self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage) -> str:
+        """Restores the protected keywords of a translated text."""
+        with self._stage("restore", source_lang, target_lang):
+            return restore_keywords(text, self.keywords)
+
+    def _call_engine(
+        self,
+        translate_segments: Callable[[List[str]], List[str]],
+        segments: List[str],
+        source_lang: TypeLanguage,
+        target_lang: TypeLanguage,
+    ) -> List[str]:
+        """Runs the engine call for `segments`, recording its latency and size."""
+        get_metrics().inc(SEGMENTS, len(segments), engine=self.ENGINE_NAME,
+                          source_lang=str(source_lang), target_lang=str(target_lang))
+        with self._stage("engine", source_lang, target_lang):
+            return translate_segments(segments)
+
+    async def _acall_engine(
+        self,
+        translate_segments: Callable[[List[str]], Awaitable[List[str]]],
+        segments: List[str],
+        source_lang: TypeLanguage,
+        target_lang: TypeLanguage,
+    ) -> List[str]:
+        """Asynchronous counterpart of `_call_engine()`."""
+        get_metrics().inc(SEGMENTS, len(segments), engine=self.ENGINE_NAME,
+                          source_lang=str(source_lang), target_lang=str(target_lang))
+        with self._stage("engine", source_lang, target_lang):
+            return await translate_segments(segments)
+
+    def translate_batch(
+        self, texts: List[str], source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> List[str]:
+        """Translates several texts with a single engine dispatch.
+
+        The segments of every text are flattened into one list, looked up in the
+        translation memory and sent to the engine in one `_translate_segments()`
+        call (one batched decode for Argos, one concurrent fan-out for Google).
+
+        Args:
+            texts (List[str]): The texts to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'en'), or "auto"
+                to detect the language of each text offline and translate per language group.
+            target_lang (TypeLanguage): The target language code (e.g., 'pt').
+
+        Returns:
+            List[str]: The translated texts, in the same order as `texts`.
         """
-        Translates the string values of a JSON-like dictionary in memory.
+        if not source_lang:
+            raise ValueError("The source language cannot be None.")
+        if not target_lang:
+            raise ValueError("The target language cannot be None.")
+        if source_lang == self.AUTO_LANGUAGE:
+            return self._translate_batch_auto(texts, target_lang)
+
+        documents = [
+            self._protect_and_segment(text, source_lang, target_lang) if text else []
+            for text in texts
+        ]
+        flat_segments = [segment for segments in documents for segment in segments]
+        flat_translated = iter(self._translate_with_memory(
+            flat_segments, source_lang, target_lang,
+            lambda missing: self._translate_segments(missing, source_lang, target_lang),
+        ))
+
+        results = []
+        for segments in documents:
+            translated_text = " ".join(next(flat_translated) for _ in segments)
+            results.append(self._restore(translated_text, source_lang, target_lang))
+        return results
+
+    def translate_many(
+        self, texts: List[str], source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> BatchResult:
+        """Translates many (short) texts, reporting failures per item.
+
+        Duplicate inputs are translated once and the segments of all distinct
+        texts go to the engine as one flattened dispatch. If that dispatch fails,
+        only the segments it did not translate are retried, concurrently and one
+        per request, so one bad input (or one failed request) neither sinks the
+        whole batch nor throws away the work that succeeded.
+
+        Args:
+            texts (List[str]): The texts to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'en'), or "auto".
+            target_lang (TypeLanguage): The target language code (e.g., 'pt').
+
+        Returns:
+            BatchResult: The translations in the same order as `texts` (None where the
+                item failed) and the per-index errors.
+
+        Raises:
+            ValueError: If a language code is missing.
+        """
+        if not source_lang:
+            raise ValueError("The source language cannot be None.")
+        if not target_lang:
+            raise ValueError("The target language cannot be None.")
+
+        unique = list(dict.fromkeys(text for text in texts if text))
+        translated: Dict[str, str] = {}
+        failed: Dict[str, Exception] = {}
+        groups: Dict[str, List[str]] = {source_lang: unique}
+        if source_lang == self.AUTO_LANGUAGE:
+            groups = {}
+            for text, (lang, reliable) in zip(unique, self._detect_source_langs(unique, target_lang)):
+                if lang == target_lang and reliable:
+                    translated[text] = text
+                else:
+                    groups.setdefault(lang, []).append(text)
+        for lang, group in groups.items():
+            self._translate_many_group(group, lang, target_lang, translated, failed)
+
+        translations: List[Optional[str]] = []
+        errors: Dict[int, Exception] = {}
+        for index, text in enumerate(texts):
+            if text in failed:
+                errors[index] = failed[text]
+            translations.append(translated.get(text, text if not text else None))
+        return BatchResult(translations, errors)
+
+    def _translate_many_group(
+        self,
+        texts: List[str],
+        source_lang: TypeLanguage,
+        target_lang: TypeLanguage,
+        translated: Dict[str, str],
+        failed: Dict[str, Exception],
+    ) -> None:
+        """Translates distinct texts of one source language for `translate_many()`,
+        filling `translated` and `failed` per text."""
+        documents = {text: self._protect_and_segment(text, source_lang, target_lang) for text in texts}
+        segments = list(dict.fromkeys(segment for document in documents.values() for segment in document))
+
+        def dispatch(missing: List[str]) -> List[str]:
+            return self._translate_segments(missing, source_lang, target_lang)
+
+        def retry(segment: str) -> Tuple[Optional[str], Optional[Exception]]:
+            try:
+                return self._translate_with_memory([segment], source_lang, target_lang, dispatch)[0], None
+            except Exception as e:
+                return None, e
+
+        done: Dict[str, str] = {}
+        errors: Dict[str, Exception] = {}
+        try:
+            done = dict(zip(segments, self._translate_with_memory(segments, source_lang, target_lang, dispatch)))
+        except Exception as e:
+            # Engines attach what they translated before the dispatch failed
+            done = dict(getattr(e, "translated_segments", None) or {})
+            pending = [segment for segment in segments if segment not in done]
+            print(f"[ERROR] Batch of {len(segments)} segment(s) failed ({e}); "
+                  f"retrying {len(pending)} one by one.")
+            workers = min(len(pending), TRANSLATE_FANOUT_WORKERS)
+            if workers <= 1:
+                outcomes = [retry(segment) for segment in pending]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(retry, pending))
+            for segment, (translation, error) in zip(pending, outcomes):
+                if error is None:
+                    done[segment] = translation
+                else:
+                    errors[segment] = error
+
+        for text, document in documents.items():
+            error = next((errors[segment] for segment in document if segment in errors), None)
+            if error is not None:
+                failed[text] = error
+            else:
+                translated[text] = self._restore(" ".join(done[segment] for segment in document), source_lang, target_lang)
+
+    def translate_to_many(
+        self,
+        text: str,
+        source_lang: TypeLanguage,
+        targets: Optional[List[TypeLanguage]] = None,
+    ) -> Dict[str, str]:
+        """Translates one text into several target languages.
+
+        The text is validated, keyword-protected and segmented once; the same
+        segments are then dispatched for every target (concurrently by default,
+        engines may share work between targets, e.g. Argos decodes a common pivot
+        hop once).
 
         Args:
-          json_data (dict[str, [str, int]]): A dictionary with string values to be translated.
+            text (str): The text to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'en'), or "auto".
+            targets (Optional[List[TypeLanguage]]): Target language codes (defaults to
+                every language in `SUPPORTED_LANGUAGES`).
 
         Returns:
-            dict[str, [str, int]]: A dictionary with translated string values.
-        """
-        translated_data = {}
-
-        for key, value in json_data.items():
-            if isinstance(value, str):
-                protected = protect_keywords(value, self.keywords)
-                translated = self.translate(
-                    protected, self.source_lang, self.target_lang
-                )
-                restored = restore_keywords(translated, self.keywords)
-                translated_data[key] = restored
+            Dict[str, str]: The translation per target code, in the order of `targets`;
+                the source language itself maps to the original text.
+        """
+        if not source_lang:
+            raise ValueError("The source language cannot be None.")
+        targets = list(dict.fromkeys(str(target) for target in (targets or SUPPORTED_LANGUAGES)))
+        reliable = True
+        if source_lang == self.AUTO_LANGUAGE:
+            ((source_lang, reliable),) = self._detect_source_langs([text], "*")
+        # A low-confidence detection never turns a target into a no-op
+        pending = [target for target in targets if target != source_lang or not reliable]
+        if not text or not pending:
+            return {target: text for target in targets}
+
+        segments = self._protect_and_segment(text, source_lang, "*")
+        translated = self._translate_to_targets(segments, source_lang, pending)
+
+        results = {}
+        for target in targets:
+            if target in translated:
+                results[target] = self._restore(" ".join(translated[target]), source_lang, target)
             else:
-                translated_data[key] = value  # keep as-is if not string
+                results[target] = text
+        return results
+
+    def _translate_to_targets(
+        self, segments: List[str], source_lang: TypeLanguage, targets: List[TypeLanguage]
+    ) -> Dict[str, List[str]]:
+        """Engine hook translating the same protected segments into every target.
+
+        The default runs one memory-backed dispatch per target on a thread pool
+        (bounded by TRANSLATE_FANOUT_WORKERS), which overlaps network round trips.
+        """
+        def translate_target(target_lang: str) -> List[str]:
+            return self._translate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing: self._translate_segments(missing, source_lang, target_lang),
+            )
+
+        workers = min(len(targets), TRANSLATE_FANOUT_WORKERS)
+        if workers <= 1:
+            return {target: translate_target(target) for target in targets}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(targets, executor.map(translate_target, targets)))
+
+    def _translate_batch_auto(self, texts: List[str], target_lang: TypeLanguage) -> List[str]:
+        """Detects the language of every text and translates each language group with one
+        `translate_batch()` call; texts reliably detected as `target_lang` are kept as-is."""
+        detected = self._detect_source_langs(texts, target_lang)
+
+        groups: Dict[str, List[int]] = {}
+        for index, (text, (lang, reliable)) in enumerate(zip(texts, detected)):
+            if text and (lang != target_lang or not reliable):
+                groups.setdefault(lang, []).append(index)
+
+        results = list(texts)
+        for lang, indexes in groups.items():
+            translated = self.translate_batch([texts[index] for index in indexes], lang, target_lang)
+            for index, text in zip(indexes, translated):
+                results[index] = text
+        return results
 
-        return translated_data
+    def _translate_segments(
+        self, segments: List[str], source_lang: TypeLanguage, target_lang: TypeLanguage
+    ) -> List[str]:
+        """Engine hook translating protected segments, preserving their order.
+
+        Engines override it with their batched or concurrent implementation; the
+        default falls back to one `translate()` call per segment.
+        """
+        return [self.translate(segment, source_lang, target_lang) for segment in segments]
+
+    def translate_json(
+        self,
+        json_data: Union[dict, list],
+        source_lang: Optional[TypeLanguage] = None,
+        target_lang: Optional[TypeLanguage] = None,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+    ) -> Union[dict, list]:
+        """
+        Translates the string values of a (nested) JSON-like structure in memory.
+
+        All unique strings are collected first and translated in one batched
+        engine call; the structure is then rebuilt, reusing every subtree that
+        contains nothing to translate.
+
+        Paths are dot-separated keys and list indexes (e.g., "items.0.title") and
+        patterns use shell-style wildcards (e.g., "*.id", "meta"). A pattern also
+        matches everything below it.
+
+        Args:
+            json_data (Union[dict, list]): The structure with string values to be translated.
+            source_lang (TypeLanguage): The source language code (defaults to `self.source_lang`);
+                "auto" detects the language of each string offline.
+            target_lang (TypeLanguage): The target language code (defaults to `self.target_lang`).
+            include_paths (List[str]): If given, only strings under these paths are translated.
+            exclude_paths (List[str]): Strings under these paths are kept as-is (e.g., IDs, URLs).
+
+        Returns:
+            Union[dict, list]: A structure with translated string values.
+        """
+        source_lang = source_lang or self.source_lang
+        target_lang = target_lang or self.target_lang
+
+        def is_selected(path: str) -> bool:
+            if exclude_paths and _path_matches(path, exclude_paths):
+                return False
+            return not include_paths or _path_matches(path, include_paths)
+
+        unique_strings: Dict[str, None] = {}
+        with self._stage("json_traversal", source_lang, target_lang):
+            for path, value in _iter_json_strings(json_data):
+                if value.strip() and is_selected(path):
+                    unique_strings[value] = None
+
+        if not unique_strings:
+            return json_data
+
+        originals = list(unique_strings)
+        translations = dict(zip(originals, self.translate_batch(originals, source_lang, target_lang)))
+        with self._stage("json_traversal", source_lang, target_lang):
+            return _rebuild_json(json_data, "", translations, is_selected)[0]
+
+    def translate_file(
+        self,
+        input_path: str,
+        output_path: str,
+        source_lang: Optional[TypeLanguage] = None,
+        target_lang: Optional[TypeLanguage] = None,
+        checkpoint_path: Optional[str] = None,
+        chunk_paragraphs: int = FILE_CHUNK_PARAGRAPHS,
+    ) -> int:
+        """
+        Translates a text file into another file, streaming paragraph chunks.
+
+        The input is read incrementally and each translated chunk is appended to
+        the output as soon as it is ready, so memory use does not grow with the
+        file size. Paragraphs longer than `FILE_MAX_PARAGRAPH_CHARS` are translated
+        in pieces and joined back with the line or sentence break they were split
+        at, so the output keeps the input's layout. After every chunk a small checkpoint file records progress; if
+        the job is interrupted, calling this method again with the same arguments
+        resumes from the last completed chunk. The checkpoint is removed when the
+        whole file is done.
+
+        Args:
+            input_path (str): Path to the text file to translate.
+            output_path (str): Path of the translated file.
+            source_lang (TypeLanguage): The source language code (defaults to `self.source_lang`).
+            target_lang (TypeLanguage): The target language code (defaults to `self.target_lang`).
+            checkpoint_path (str): Path of the checkpoint file (defaults to `<output_path>.checkpoint`).
+            chunk_paragraphs (int): Number of paragraphs translated per engine batch.
+
+        Returns:
+            int: Number of paragraphs (or paragraph pieces) translated.
+
+        Raises:
+            FileNotFoundError: If the input file does not exist.
+        """
+        source_lang = source_lang or self.source_lang
+        target_lang = target_lang or self.target_lang
+        checkpoint_path = checkpoint_path or f"{output_path}.checkpoint"
+        job = {
+            "input": os.path.abspath(input_path),
+            "source_lang": str(source_lang),
+            "target_lang": str(target_lang),
+        }
+
+        done, written = 0, 0
+        checkpoint = _read_checkpoint(checkpoint_path)
+        if checkpoint and all(checkpoint.get(key) == value for key, value in job.items()) \
+                and os.path.exists(output_path):
+            done, written = checkpoint["paragraphs"], checkpoint["output_bytes"]
+            print(f"[INFO] Resuming {input_path} after {done} paragraph(s).")
+
+        with open(input_path, "r", encoding="utf-8") as source, \
+                open(output_path, "r+b" if written else "wb") as target:
+            # Drop whatever was written after the last checkpoint
+            target.truncate(written)
+            target.seek(written)
+            paragraphs = iter_paragraphs(source, lang=str(source_lang))
+            # Separator owed before the next piece (the one that followed the previous piece)
+            separator = ""
+            for _, separator in islice(paragraphs, done):
+                pass
+
+            while True:
+                chunk = list(islice(paragraphs, chunk_paragraphs))
+                if not chunk:
+                    break
+                translated = self.translate_batch([piece for piece, _ in chunk], source_lang, target_lang)
+                parts = []
+                for translation, (_, following) in zip(translated, chunk):
+                    parts.append(separator + translation)
+                    separator = following
+                data = "".join(parts)
+                encoded = data.encode("utf-8")
+                target.write(encoded)
+                target.flush()
+                os.fsync(target.fileno())
+
+                done += len(chunk)
+                written += len(encoded)
+                _write_checkpoint(checkpoint_path, {**job, "paragraphs": done, "output_bytes": written})
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return done
 
     def set_keywords_from_text(self, text: str, method: str = "curly") -> None:
         """
@@ -140,3 +800,74 @@ class BaseTranslator(ABC):
             method (str): Extraction method (e.g., 'curly', 'brackets', 'allcaps', etc.).
         """
         self.keywords = extract_keywords(text, method)
+
+
+def _join_path(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def _path_matches(path: str, patterns: List[str]) -> bool:
+    """Checks whether a JSON path is matched by (or lies under) any pattern."""
+    return any(
+        fnmatchcase(path, pattern) or fnmatchcase(path, pattern + ".*")
+        for pattern in patterns
+    )
+
+
+def _iter_json_strings(node: Any, path: str = ""):
+    """Yields (path, value) for every string in a nested dict/list structure."""
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, str):
+            yield path, node
+        elif isinstance(node, dict):
+            stack.extend((_join_path(path, key), value) for key, value in node.items())
+        elif isinstance(node, list):
+            stack.extend((_join_path(path, idx), value) for idx, value in enumerate(node))
+
+
+def _rebuild_json(
+    node: Any, path: str, translations: Dict[str, str], is_selected: Callable[[str], bool]
+) -> Tuple[Any, bool]:
+    """Returns (new_node, changed); unchanged subtrees are returned as-is."""
+    if isinstance(node, str):
+        if node in translations and is_selected(path):
+            return translations[node], True
+        return node, False
+
+    if isinstance(node, dict):
+        items = {}
+        changed = False
+        for key, value in node.items():
+            items[key], child_changed = _rebuild_json(value, _join_path(path, key), translations, is_selected)
+            changed = changed or child_changed
+        return (items, True) if changed else (node, False)
+
+    if isinstance(node, list):
+        items = []
+        changed = False
+        for idx, value in enumerate(node):
+            new_value, child_changed = _rebuild_json(value, _join_path(path, idx), translations, is_selected)
+            items.append(new_value)
+            changed = changed or child_changed
+        return (items, True) if changed else (node, False)
+
+    return node, False
+
+
+def _read_checkpoint(path: str) -> Optional[dict]:
+    """Loads a translate_file() checkpoint, ignoring missing or corrupt files."""
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_checkpoint(path: str, state: dict) -> None:
+    """Atomically replaces a translate_file() checkpoint."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file)
+    os.replace(tmp_path, path)
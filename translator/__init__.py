@@ -1,9 +1,20 @@
 """
 Translator core package.
 Exposes shared configs and factory method.
+
+Backends are imported lazily: `import translator` does not load googletrans,
+argostranslate/ctranslate2 or TextBlob, and each engine is only imported the
+first time it is requested from the factory.
 """
 
 from .config import SUPPORTED_LANGUAGES
-from .translator_factory import get_translator
 
-__all__ = ["SUPPORTED_LANGUAGES", "get_translator"]
+__all__ = ["SUPPORTED_LANGUAGES", "aget_translator", "get_translator"]
+
+
+def __getattr__(name):
+    if name in ("get_translator", "aget_translator"):
+        from . import translator_factory
+
+        return getattr(translator_factory, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
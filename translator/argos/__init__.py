@@ -7,6 +7,7 @@ from translator.utils.argos_installer import (
     install_argos_model,
     uninstall_argos_model,
     install_languages_from_config,
+    install_from_directory,
 )
 from .translator import ArgosTranslator
 
@@ -15,4 +16,5 @@ __all__ = [
     "install_argos_model",
     "uninstall_argos_model",
     "install_languages_from_config",
+    "install_from_directory",
 ]
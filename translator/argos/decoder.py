@@ -0,0 +1,133 @@
+"""
+Batched decoding for Argos Translate models.
+
+`argostranslate` decodes one input text per `translate()` call. Since our
+segments are already split into sentences, this module tokenizes all of them
+with the package tokenizer and sends them to the underlying CTranslate2
+translator in length-sorted batches, returning results in the original order.
+"""
+
+from typing import List
+
+from translator.config import ARGOS_BATCH_SIZE, ARGOS_BEAM_SIZE
+
+
+def unwrap_translation(translation):
+    """
+    Returns the package translation wrapped by Argos (e.g., by `CachedTranslation`).
+
+    Args:
+        translation: An Argos `ITranslation` object.
+
+    Returns:
+        The innermost translation object.
+    """
+    while hasattr(translation, "underlying"):
+        translation = translation.underlying
+    return translation
+
+
+def supports_batching(translation) -> bool:
+    """
+    Checks whether a translation exposes what batched decoding needs
+    (a package with a tokenizer and a CTranslate2 translator slot).
+
+    Args:
+        translation: An Argos `ITranslation` object.
+
+    Returns:
+        bool: True if `translate_batch` can decode it directly.
+    """
+    package_translation = unwrap_translation(translation)
+    pkg = getattr(package_translation, "pkg", None)
+    return getattr(pkg, "tokenizer", None) is not None and hasattr(package_translation, "translator")
+
+
+def load_model(translation, inter_threads: int = 1, intra_threads: int = 0):
+    """
+    Loads (once) the CTranslate2 model behind an Argos translation.
+
+    Args:
+        translation: An Argos `ITranslation` object supporting batching.
+        inter_threads (int): Number of batches decoded in parallel.
+        intra_threads (int): Threads used per batch (0 lets CTranslate2 decide).
+
+    Returns:
+        ctranslate2.Translator: The loaded model.
+    """
+    package_translation = unwrap_translation(translation)
+    if package_translation.translator is None:
+        import ctranslate2
+        from argostranslate import settings
+
+        model_path = str(package_translation.pkg.package_path / "model")
+        package_translation.translator = ctranslate2.Translator(
+            model_path,
+            device=settings.device,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+        )
+    return package_translation.translator
+
+
+def translate_batch(
+    translation,
+    segments: List[str],
+    max_batch_size: int = ARGOS_BATCH_SIZE,
+    beam_size: int = ARGOS_BEAM_SIZE,
+) -> List[str]:
+    """
+    Translates sentence segments with as few decoder invocations as possible.
+
+    Args:
+        translation: An Argos `ITranslation` object for the language pair.
+        segments (List[str]): The segments to translate.
+        max_batch_size (int): Maximum number of segments per decoder call.
+        beam_size (int): Beam size used by the decoder.
+
+    Returns:
+        List[str]: The translated segments, in the same order as `segments`.
+    """
+    if not supports_batching(translation):
+        return [translation.translate(segment) for segment in segments]
+
+    package_translation = unwrap_translation(translation)
+    pkg = package_translation.pkg
+    tokenizer = pkg.tokenizer
+    model = load_model(translation)
+    target_prefix = getattr(pkg, "target_prefix", "") or ""
+
+    results = list(segments)
+    tokenized = {
+        idx: tokenizer.encode(segment)
+        for idx, segment in enumerate(segments)
+        if segment.strip()
+    }
+    # Sorting by length keeps similar sizes together and minimizes padding
+    order = sorted(tokenized, key=lambda idx: len(tokenized[idx]))
+
+    for start in range(0, len(order), max_batch_size):
+        chunk = order[start:start + max_batch_size]
+        options = {}
+        if target_prefix:
+            options["target_prefix"] = [[target_prefix]] * len(chunk)
+        outputs = model.translate_batch(
+            [tokenized[idx] for idx in chunk],
+            beam_size=beam_size,
+            num_hypotheses=1,
+            replace_unknowns=True,
+            length_penalty=0.2,
+            max_batch_size=max_batch_size,
+            **options,
+        )
+        for idx, output in zip(chunk, outputs):
+            tokens = output.hypotheses[0]
+            if target_prefix and tokens and tokens[0] == target_prefix:
+                tokens = tokens[1:]
+            value = tokenizer.decode(tokens)
+            # SentencePiece leaves a leading space on the first token
+            if value.startswith(" "):
+                value = value[1:]
+            results[idx] = value
+
+    return results
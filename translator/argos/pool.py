@@ -0,0 +1,202 @@
+"""
+Multi-process execution engine for Argos Translate.
+
+A pool of worker processes, each with its own CTranslate2 models loaded once
+at startup, lets bulk offline jobs use every core of the machine from a single
+application process. Segments are dispatched in chunks and streamed back in
+their original order.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from translator.config import (
+    ARGOS_POOL_CHUNK_SIZE,
+    ARGOS_POOL_WORKERS,
+    ARGOS_WORKER_INTER_THREADS,
+    ARGOS_WORKER_INTRA_THREADS,
+)
+
+# Thread settings of the current worker process (set by _init_worker)
+_worker_threads = (ARGOS_WORKER_INTER_THREADS, ARGOS_WORKER_INTRA_THREADS)
+
+
+def _init_worker(pairs: Tuple[Tuple[str, str], ...], inter_threads: int, intra_threads: int) -> None:
+    """Loads the requested language pairs once when a worker process starts."""
+    global _worker_threads
+    _worker_threads = (inter_threads, intra_threads)
+    _load_pairs(pairs)
+
+
+def _load_pairs(pairs: Tuple[Tuple[str, str], ...]) -> None:
+    """Loads the models of the given language pairs in the current worker process."""
+    from translator.argos.decoder import load_model, supports_batching
+    from translator.argos.registry import get_language_registry
+
+    registry = get_language_registry()
+    for from_code, to_code in pairs:
+        translation = registry.get_translation(from_code, to_code)
+        if translation is not None and supports_batching(translation):
+            load_model(translation, *_worker_threads)
+
+
+def _translate_chunk(source_lang: str, target_lang: str, segments: List[str]) -> List[str]:
+    """Translates one chunk of segments inside a worker process."""
+    from translator.argos.decoder import load_model, supports_batching, translate_batch
+    from translator.argos.registry import get_language_registry
+
+    translation = get_language_registry().get_translation(source_lang, target_lang)
+    if translation is None:
+        raise ValueError(
+            f"Translation not supported for language pair: {source_lang} → {target_lang}.\n"
+            "Make sure the appropriate Argos model is installed."
+        )
+    if supports_batching(translation):
+        load_model(translation, *_worker_threads)
+    return translate_batch(translation, segments)
+
+
+class ArgosProcessPool:
+    """Process pool that translates segments with models preloaded per worker."""
+
+    def __init__(
+        self,
+        workers: int = ARGOS_POOL_WORKERS,
+        pairs: Optional[Iterable[Tuple[str, str]]] = None,
+        inter_threads: int = ARGOS_WORKER_INTER_THREADS,
+        intra_threads: int = ARGOS_WORKER_INTRA_THREADS,
+        chunk_size: int = ARGOS_POOL_CHUNK_SIZE,
+    ):
+        """
+        Starts the worker processes.
+
+        Args:
+            workers (int): Number of worker processes.
+            pairs (Iterable[Tuple[str, str]]): Language pairs each worker loads at startup.
+                Other pairs are loaded on first use.
+            inter_threads (int): CTranslate2 batches decoded in parallel per worker.
+            intra_threads (int): CTranslate2 threads per batch in each worker.
+            chunk_size (int): Number of segments sent to a worker per task.
+        """
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        preload = tuple(dict.fromkeys((str(src), str(tgt)) for src, tgt in (pairs or ())))
+        self.pairs = set(preload)
+        self._pairs_lock = threading.Lock()
+        # CTranslate2 is not fork-safe once models are loaded in the parent
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(preload, inter_threads, intra_threads),
+        )
+
+    def preload(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        Loads additional language pairs in the running workers.
+
+        One warm-up task per worker is queued for the pairs not loaded yet; it
+        does not wait for them, and a worker that misses one still loads the
+        model on first use.
+
+        Args:
+            pairs (Iterable[Tuple[str, str]]): Language pairs to load.
+        """
+        with self._pairs_lock:
+            new = tuple(dict.fromkeys(
+                pair for pair in ((str(src), str(tgt)) for src, tgt in pairs) if pair not in self.pairs
+            ))
+            if not new:
+                return
+            self.pairs.update(new)
+        for _ in range(self.workers):
+            self._executor.submit(_load_pairs, new)
+
+    def imap_segments(self, segments: List[str], source_lang: str, target_lang: str) -> Iterator[str]:
+        """
+        Translates segments across the workers, yielding results in order as
+        soon as each chunk is done.
+
+        Args:
+            segments (List[str]): The segments to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Yields:
+            str: The translated segments, in the same order as `segments`.
+        """
+        futures = [
+            self._executor.submit(
+                _translate_chunk, str(source_lang), str(target_lang),
+                segments[start:start + self.chunk_size],
+            )
+            for start in range(0, len(segments), self.chunk_size)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def translate_segments(self, segments: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translates segments across the workers.
+
+        Args:
+            segments (List[str]): The segments to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Returns:
+            List[str]: The translated segments, in the same order as `segments`.
+        """
+        return list(self.imap_segments(segments, source_lang, target_lang))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker processes."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+
+_pools: Dict[Tuple[int, int, int], ArgosProcessPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_process_pool(
+    workers: int = ARGOS_POOL_WORKERS,
+    pairs: Optional[Iterable[Tuple[str, str]]] = None,
+    inter_threads: int = ARGOS_WORKER_INTER_THREADS,
+    intra_threads: int = ARGOS_WORKER_INTRA_THREADS,
+) -> ArgosProcessPool:
+    """
+    Returns a process pool shared by every translator with the same settings,
+    so several `ArgosTranslator` instances do not spawn several pools.
+
+    Pairs the shared pool has not preloaded yet are warmed on it (see
+    `ArgosProcessPool.preload()`) rather than starting another pool.
+
+    Args:
+        workers (int): Number of worker processes.
+        pairs (Iterable[Tuple[str, str]]): Language pairs to preload.
+        inter_threads (int): CTranslate2 batches decoded in parallel per worker.
+        intra_threads (int): CTranslate2 threads per batch in each worker.
+
+    Returns:
+        ArgosProcessPool: The shared pool.
+    """
+    key = (workers, inter_threads, intra_threads)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ArgosProcessPool(workers, pairs, inter_threads, intra_threads)
+            return pool
+    pool.preload(pairs or ())
+    return pool
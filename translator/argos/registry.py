@@ -0,0 +1,184 @@
+"""
+Process-wide registry of installed Argos Translate language pairs.
+
+`translate.get_installed_languages()` rescans the package directory and builds
+new (unloaded) translation objects on every call. The registry does it once,
+indexes the translations by `(from_code, to_code)` and hands out the same
+loaded objects to every `ArgosTranslator`. It is invalidated by
+`translator.utils.argos_installer` whenever models are installed or removed.
+
+Only direct (package) translations are indexed. Pairs without a model are
+served by `route()`: the shortest chain of installed pairs, preferring the
+configured pivot language (English), which lets a node ship about 2N models
+(to and from the pivot) instead of N².
+"""
+
+import heapq
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from argostranslate import translate
+from translator.config import ARGOS_MAX_PIVOT_HOPS, ARGOS_PIVOT_LANGUAGE
+
+Pair = Tuple[str, str]
+
+# Extra cost of an intermediate language other than the preferred pivot
+_DETOUR_PENALTY = 0.1
+
+
+class LanguagePairRegistry:
+    """Thread-safe, lazily built index of installed Argos translations."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._languages = None
+        self._pairs: Dict[Tuple[str, str], object] = {}
+        self._registered: Dict[Tuple[str, str], object] = {}
+        self._routes: Dict[Pair, Optional[Tuple[Pair, ...]]] = {}
+
+    def _ensure_loaded(self) -> None:
+        if self._languages is not None:
+            return
+        with self._lock:
+            if self._languages is not None:
+                return
+            languages = translate.get_installed_languages()
+            pairs = {}
+            for from_lang in languages:
+                for translation in from_lang.translations_from:
+                    to_code = translation.to_lang.code
+                    # Argos' own pivots (CompositeTranslation) decode every hypothesis
+                    # of the first hop again; route() replaces them with batched hops
+                    if to_code == from_lang.code or hasattr(translation, "t1"):
+                        continue
+                    # Same precedence as Language.get_translation(): first match wins
+                    pairs.setdefault((from_lang.code, to_code), translation)
+            pairs.update(self._registered)
+            self._pairs = pairs
+            self._languages = languages
+
+    @property
+    def installed_languages(self) -> List:
+        """List of installed Argos `Language` objects."""
+        self._ensure_loaded()
+        return self._languages
+
+    def pairs(self) -> List[Tuple[str, str]]:
+        """
+        Returns every language pair with a direct model (see `route()` for the others).
+
+        Returns:
+            List[Tuple[str, str]]: The `(from_code, to_code)` pairs.
+        """
+        self._ensure_loaded()
+        return list(self._pairs)
+
+    def get_translation(self, from_code: str, to_code: str) -> Optional[object]:
+        """
+        Returns the shared translation object for a language pair.
+
+        Args:
+            from_code (str): The source language code (e.g., 'en').
+            to_code (str): The target language code (e.g., 'pt').
+
+        Returns:
+            Optional[object]: The Argos translation, or None if the pair is not installed.
+        """
+        self._ensure_loaded()
+        return self._pairs.get((str(from_code), str(to_code)))
+
+    def route(self, from_code: str, to_code: str) -> Optional[Tuple[Pair, ...]]:
+        """
+        Returns the cheapest chain of installed pairs translating `from_code` into `to_code`.
+
+        A direct model always wins; otherwise the path with the fewest hops is used,
+        preferring the pivot language (ARGOS_PIVOT_LANGUAGE) as intermediate. Routes
+        are cached until the registry is invalidated.
+
+        Args:
+            from_code (str): The source language code (e.g., 'pt').
+            to_code (str): The target language code (e.g., 'es').
+
+        Returns:
+            Optional[Tuple[Pair, ...]]: The hops, e.g. (('pt', 'en'), ('en', 'es')); an
+                empty tuple when both codes are equal; None if no route exists.
+        """
+        key = (str(from_code), str(to_code))
+        self._ensure_loaded()
+        with self._lock:
+            if key not in self._routes:
+                self._routes[key] = self._shortest_route(*key)
+            return self._routes[key]
+
+    def _shortest_route(self, from_code: str, to_code: str) -> Optional[Tuple[Pair, ...]]:
+        """Dijkstra over the installed pairs (hop cost 1, plus a penalty per non-pivot detour)."""
+        if from_code == to_code:
+            return ()
+        if (from_code, to_code) in self._pairs:
+            return ((from_code, to_code),)
+
+        graph: Dict[str, List[str]] = {}
+        for src, tgt in self._pairs:
+            graph.setdefault(src, []).append(tgt)
+
+        queue = [(0.0, from_code, ())]
+        best = {from_code: 0.0}
+        while queue:
+            cost, node, path = heapq.heappop(queue)
+            if node == to_code:
+                return path
+            if cost > best.get(node, float("inf")) or len(path) >= ARGOS_MAX_PIVOT_HOPS:
+                continue
+            for neighbour in graph.get(node, ()):
+                step = 1.0
+                if neighbour != to_code and neighbour != ARGOS_PIVOT_LANGUAGE:
+                    step += _DETOUR_PENALTY
+                new_cost = cost + step
+                if new_cost < best.get(neighbour, float("inf")):
+                    best[neighbour] = new_cost
+                    heapq.heappush(queue, (new_cost, neighbour, path + ((node, neighbour),)))
+        return None
+
+    def register(self, from_code: str, to_code: str, translation: object) -> None:
+        """
+        Adds a translation that is not an installed package (e.g., a custom or stub
+        model), taking precedence over any installed package for the same pair.
+
+        Args:
+            from_code (str): The source language code (e.g., 'en').
+            to_code (str): The target language code (e.g., 'pt').
+            translation (object): Object exposing `translate(text) -> str`.
+        """
+        with self._lock:
+            self._registered[(str(from_code), str(to_code))] = translation
+            if self._languages is not None:
+                self._pairs[(str(from_code), str(to_code))] = translation
+            self._routes = {}
+
+    def unregister(self, from_code: str, to_code: str) -> None:
+        """Removes a translation added with `register()`."""
+        with self._lock:
+            self._registered.pop((str(from_code), str(to_code)), None)
+            self._languages = None
+            self._pairs = {}
+            self._routes = {}
+
+    def invalidate(self) -> None:
+        """Drops the index so it is rebuilt from the installed packages on next use."""
+        with self._lock:
+            self._languages = None
+            self._pairs = {}
+            self._routes = {}
+
+
+_registry = LanguagePairRegistry()
+
+
+def get_language_registry() -> LanguagePairRegistry:
+    """Returns the process-wide language pair registry."""
+    return _registry
+
+
+def invalidate_language_registry() -> None:
+    """Forces the process-wide registry to reload the installed models."""
+    _registry.invalidate()
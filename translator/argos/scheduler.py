@@ -0,0 +1,207 @@
+"""
+Dynamic micro-batching of concurrent Argos requests.
+
+Each `ArgosTranslator.translate()` call decodes only its own few sentences, so
+under concurrent load the model sees many tiny batches. `MicroBatchScheduler`
+puts the segments of every caller on a queue; a background thread collects
+requests for up to `max_wait` seconds (or until `max_batch_tokens` is
+reached), groups them by language pair, deduplicates the segments, runs one
+batched decode per pair and hands each caller its own slice through a
+`Future`. A few milliseconds of added latency buy much larger batches.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import Callable, Dict, List, Optional, Tuple
+
+from translator.config import ARGOS_MICROBATCH_MAX_TOKENS, ARGOS_MICROBATCH_MAX_WAIT
+
+Decode = Callable[[List[str], str, str], List[str]]
+
+_STOP = object()
+
+
+def estimate_tokens(segment: str) -> int:
+    """Cheap token estimate of a segment (whitespace words, at least 1)."""
+    return max(1, len(segment.split()))
+
+
+def _resolve(future: Future, result=None, error: Optional[BaseException] = None) -> None:
+    """Completes a future unless the caller already cancelled it."""
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _Request:
+    __slots__ = ("segments", "source_lang", "target_lang", "tokens", "future")
+
+    def __init__(self, segments: List[str], source_lang: str, target_lang: str):
+        self.segments = segments
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.tokens = sum(estimate_tokens(segment) for segment in segments)
+        self.future: Future = Future()
+
+
+class MicroBatchScheduler:
+    """Collects segments from concurrent callers and decodes them in shared batches."""
+
+    def __init__(self, decode: Decode, max_wait: float = ARGOS_MICROBATCH_MAX_WAIT,
+                 max_batch_tokens: int = ARGOS_MICROBATCH_MAX_TOKENS):
+        """
+        Starts the scheduler thread.
+
+        Args:
+            decode (Callable[[List[str], str, str], List[str]]): Translates a list of
+                segments for a `(source_lang, target_lang)` pair, preserving order.
+            max_wait (float): Seconds the first request of a batch waits for others.
+            max_batch_tokens (int): Estimated tokens after which a batch is closed early.
+        """
+        self.decode = decode
+        self.max_wait = max_wait
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self.batches = 0
+        self.requests = 0
+        self.segments = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="argos-microbatch", daemon=True)
+        self._thread.start()
+
+    def submit(self, segments: List[str], source_lang: str, target_lang: str) -> Future:
+        """
+        Queues segments for the next batch of their language pair.
+
+        Args:
+            segments (List[str]): The protected segments to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Returns:
+            Future: Resolves to the translated segments, in the same order.
+
+        Raises:
+            RuntimeError: If the scheduler has been closed.
+        """
+        request = _Request(list(segments), str(source_lang), str(target_lang))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The micro-batching scheduler is closed.")
+            self._queue.put(request)
+        return request.future
+
+    def translate(self, segments: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Blocking counterpart of `submit()`."""
+        if not segments:
+            return []
+        return self.submit(segments, source_lang, target_lang).result()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Decodes the requests already queued, then stops the scheduler thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        """Returns the number of batches, requests and segments processed so far."""
+        with self._lock:
+            return {"batches": self.batches, "requests": self.requests, "segments": self.segments}
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        except BaseException as e:
+            # Never leave callers blocked: fail everything still queued
+            print(f"[ERROR] Micro-batching scheduler stopped: {e}")
+            with self._lock:
+                self._closed = True
+            self._fail_pending(e)
+
+    def _fail_pending(self, error: BaseException) -> None:
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if request is not _STOP:
+                _resolve(request.future, error=error)
+
+    def _loop(self) -> None:
+        carry = None
+        stopping = False
+        while not stopping:
+            first = carry if carry is not None else self._queue.get()
+            carry = None
+            if first is _STOP:
+                break
+
+            batch = [first]
+            tokens = first.tokens
+            deadline = time.monotonic() + self.max_wait
+            while tokens < self.max_batch_tokens:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                if tokens + request.tokens > self.max_batch_tokens:
+                    carry = request
+                    break
+                batch.append(request)
+                tokens += request.tokens
+            self._dispatch_safely(batch)
+
+        if carry is not None and carry is not _STOP:
+            self._dispatch_safely([carry])
+
+    def _dispatch_safely(self, batch: List[_Request]) -> None:
+        """Runs `_dispatch()`; an unexpected error fails the batch instead of the thread."""
+        try:
+            self._dispatch(batch)
+        except Exception as e:
+            print(f"[ERROR] Micro-batch dispatch failed: {e}")
+            for request in batch:
+                _resolve(request.future, error=e)
+
+    def _dispatch(self, batch: List[_Request]) -> None:
+        """Runs one decode per language pair and resolves every request's future."""
+        groups: Dict[Tuple[str, str], List[_Request]] = {}
+        for request in batch:
+            groups.setdefault((request.source_lang, request.target_lang), []).append(request)
+
+        for (source_lang, target_lang), requests in groups.items():
+            unique = list(dict.fromkeys(segment for request in requests for segment in request.segments))
+            try:
+                outputs = self.decode(unique, source_lang, target_lang)
+                if len(outputs) != len(unique):
+                    raise RuntimeError(
+                        f"Decoder returned {len(outputs)} translations for {len(unique)} segments."
+                    )
+                translated = dict(zip(unique, outputs))
+                results = [[translated[segment] for segment in request.segments] for request in requests]
+            except Exception as e:
+                for request in requests:
+                    _resolve(request.future, error=e)
+                continue
+            with self._lock:
+                self.batches += 1
+                self.requests += len(requests)
+                self.segments += len(unique)
+            for request, result in zip(requests, results):
+                _resolve(request.future, result)
@@ -4,19 +4,42 @@ This module provides a class for translating text using the Argos Translate
 translation modules that can be found at:
 .
 """
-import re
-from typing import List
+import asyncio
+from typing import Dict, List, Optional, Tuple
 from enum import StrEnum
-from argostranslate import translate
 from translator.BaseTranslator import BaseTranslator
-from textblob import TextBlob
+from translator.argos.decoder import translate_batch
+from translator.argos.pool import get_process_pool
+from translator.argos.registry import get_language_registry
+from translator.argos.scheduler import MicroBatchScheduler
+from translator.config import (
+    ARGOS_MICRO_BATCHING,
+    ARGOS_MICROBATCH_MAX_TOKENS,
+    ARGOS_MICROBATCH_MAX_WAIT,
+    ARGOS_WORKER_INTER_THREADS,
+    ARGOS_WORKER_INTRA_THREADS,
+)
+from translator.utils.langdetect import get_language_detector
 
 
 class ArgosTranslator(BaseTranslator):
     """
     Offline translator using Argos Translate with integrated text handling.
+
+    Args:
+        workers (int): Number of worker processes used for decoding. 0 (default)
+            decodes in the calling process; a positive value uses a shared
+            process pool with models preloaded in every worker.
+        worker_inter_threads (int): CTranslate2 batches decoded in parallel per worker.
+        worker_intra_threads (int): CTranslate2 threads per batch in each worker.
+        micro_batching (bool): Merge the segments of concurrent calls on this
+            instance into shared batched decodes (see `translator.argos.scheduler`).
+        micro_batch_max_wait (float): Seconds a batch waits for more callers.
+        micro_batch_max_tokens (int): Estimated tokens after which a batch is closed.
     """
 
+    ENGINE_NAME = "argos"
+
     class TypeLanguage(StrEnum):
         """Enum for language types.
 
@@ -40,15 +63,32 @@ class ArgosTranslator(BaseTranslator):
             """Returns all supported languages as a list of strings."""
             return [lang.value for lang in cls]
 
-    def __init__(self, source_lang=None, target_lang=None, text=""):
-        super().__init__(source_lang, target_lang, text)
-        self.installed_languages = translate.get_installed_languages()
-        if not self.installed_languages:
+    def __init__(self, source_lang=None, target_lang=None, text="", use_memory=True,
+                 workers: int = 0,
+                 worker_inter_threads: int = ARGOS_WORKER_INTER_THREADS,
+                 worker_intra_threads: int = ARGOS_WORKER_INTRA_THREADS,
+                 micro_batching: bool = ARGOS_MICRO_BATCHING,
+                 micro_batch_max_wait: float = ARGOS_MICROBATCH_MAX_WAIT,
+                 micro_batch_max_tokens: int = ARGOS_MICROBATCH_MAX_TOKENS):
+        super().__init__(source_lang, target_lang, text, use_memory=use_memory)
+        self.registry = get_language_registry()
+        self.workers = workers
+        self.worker_inter_threads = worker_inter_threads
+        self.worker_intra_threads = worker_intra_threads
+        self.micro_batching = micro_batching
+        self.micro_batch_max_wait = micro_batch_max_wait
+        self.micro_batch_max_tokens = micro_batch_max_tokens
+        if not self.registry.pairs():
             raise RuntimeError(
                 "No Argos Translate language packages installed.\n"
                 "Please install a '.argosmodel' file to enable offline translation."
             )
 
+    @property
+    def installed_languages(self) -> list:
+        """Installed Argos languages, shared process-wide through the registry."""
+        return self.registry.installed_languages
+
     def set_keywords(self, keywords: List[str]) -> None:
         """Allows the user to define keywords to protect during translation.
 
@@ -63,98 +103,210 @@ class ArgosTranslator(BaseTranslator):
 
         Args:
             text (str): The text to translate.
-            source_lang (TypeLanguage): The source language code (e.g., 'ENGLISH').
+            source_lang (TypeLanguage): The source language code (e.g., 'ENGLISH'),
+                or "auto" to detect it.
             target_lang (TypeLanguage): The target language code (e.g., 'PORTUGUESE').
 
         Returns:
             str: The translated text.
         """
         try:
-            if not text:
-                raise ValueError("The text to translate cannot be None or empty.")
-            if not source_lang:
-                raise ValueError("The source language cannot be None.")
-            if not target_lang:
-                raise ValueError("The target language cannot be None.")
-
-            self.text = text
-            self.source_lang = source_lang
-            self.target_lang = target_lang
-
-            protected_text = self._protect_keywords(self.text, self.keywords)
-            segments = self._segment_text(protected_text, 100)
-            translated_segments = [self._translate_segment(segment) for segment in segments]
+            source_lang = self._resolve_source_lang(text, source_lang, target_lang)
+            segments = self._prepare(text, source_lang, target_lang)
+            translated_segments = self._translate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing: self._translate_segments(missing, source_lang, target_lang),
+            )
             translated_text = " ".join(translated_segments)
-            self.translated_text = self._restore_keywords(translated_text, self.keywords)
+            self.translated_text = self._restore(translated_text, source_lang, target_lang)
 
             return self.translated_text
 
         except Exception as e:
             self.handle_exceptions(e)
-            return "[ERROR] Translation failed."
+            return self.FAILED_TRANSLATION
 
-    def detect_language(self, text: str) -> str:
-        """Language detection is not supported by Argos Translate."""
-        raise NotImplementedError("Language detection is not supported in Argos Translate.")
+    async def atranslate(self, text: str, source_lang: TypeLanguage,
+                         target_lang: TypeLanguage) -> str:
+        """Asynchronously translates text using Argos Translate.
 
-    def _translate_segment(self, segment: str) -> str:
-        """Translates a single segment of text."""
-        from_lang = next((lang for lang in self.installed_languages if lang.code == self.source_lang), None)
-        to_lang = next((lang for lang in self.installed_languages if lang.code == self.target_lang), None)
+        Decoding is CPU bound, so it is offloaded to the default executor and the
+        event loop stays free while the model runs; so are keyword protection,
+        segmentation and restoration.
 
-        if not from_lang or not to_lang:
-            raise ValueError(
-                f"Translation not supported for language pair: {self.source_lang} → {self.target_lang}.\n"
-                "Make sure the appropriate Argos model is installed."
+        Args:
+            text (str): The text to translate.
+            source_lang (TypeLanguage): The source language code (e.g., 'ENGLISH'),
+                or "auto" to detect it.
+            target_lang (TypeLanguage): The target language code (e.g., 'PORTUGUESE').
+
+        Returns:
+            str: The translated text.
+        """
+        try:
+            source_lang = await self._aresolve_source_lang(text, source_lang, target_lang)
+            segments = await asyncio.to_thread(self._prepare, text, source_lang, target_lang)
+            translated_segments = await self._atranslate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing: asyncio.to_thread(
+                    self._translate_segments, missing, source_lang, target_lang
+                ),
             )
+            translated_text = " ".join(translated_segments)
+            self.translated_text = await asyncio.to_thread(
+                self._restore, translated_text, source_lang, target_lang
+            )
+
+            return self.translated_text
+
+        except Exception as e:
+            self.handle_exceptions(e)
+            return self.FAILED_TRANSLATION
+
+    def _prepare(self, text: str, source_lang: TypeLanguage, target_lang: TypeLanguage) -> List[str]:
+        """Validates a request and returns its protected segments."""
+        if not text:
+            raise ValueError("The text to translate cannot be None or empty.")
+        if not source_lang:
+            raise ValueError("The source language cannot be None.")
+        if not target_lang:
+            raise ValueError("The target language cannot be None.")
+
+        self.text = text
+        self.source_lang = source_lang
+        self.target_lang = target_lang
 
-        translation = from_lang.get_translation(to_lang)
-        return translation.translate(segment)
+        return self._protect_and_segment(text, source_lang, target_lang)
 
-    def _segment_text(self, text: str, max_sentences: int = 100) -> List[str]:
-        """Segments a block of text into a list of sentences.
+    def detect_language(self, text: str) -> str:
+        """Detects the language of the input text with the offline n-gram detector.
 
         Args:
-            text (str): The text to process.
-            max_sentences (int): Maximum number of sentences to segment.
+            text (str): The text whose language is to be detected.
 
         Returns:
-            List[str]: A list of sentences.
+            str: The detected language code (e.g., 'en' for English), or "und" when
+                the text is too short or ambiguous to tell.
         """
-        blob = TextBlob(text)
-        sentences = [str(sentence) for sentence in blob.sentences]
-        return sentences[:max_sentences]
+        return get_language_detector().detect(text)
 
-    def _protect_keywords(self, text: str, keywords: List[str]) -> str:
-        """
-        Replaces each keyword with a numbered placeholder to prevent translation.
+    async def adetect_language(self, text: str) -> str:
+        """Detection is fast and local, so it runs directly on the event loop."""
+        return self.detect_language(text)
 
-        Args:
-            text (str): The text to process.
-            keywords (List[str]): A list of keywords to protect.
+    def _translate_segments(self, segments: List[str], source_lang: TypeLanguage,
+                            target_lang: TypeLanguage) -> List[str]:
+        """Translates a list of segments with batched decoding, preserving order.
 
-        Returns:
-            str: The processed text with keywords replaced by placeholders.
+        Pairs without a direct model are chained through the cheapest pivot route
+        (usually English); every hop decodes the whole list as one batch. With
+        micro-batching, the segments join those of concurrent callers first.
+        """
+        # Resolved up front so unsupported pairs fail before being queued
+        route = self._get_route(source_lang, target_lang)
+        if self.micro_batching and segments:
+            return self._get_scheduler().translate(segments, source_lang, target_lang)
+        return self._translate_route(segments, route)
+
+    def _get_scheduler(self) -> MicroBatchScheduler:
+        """Returns (starting it on first use) the micro-batching scheduler shared by this
+        instance and its spawns."""
+        return self._shared_resource("scheduler", lambda: MicroBatchScheduler(
+            lambda segments, source_lang, target_lang: self._translate_route(
+                segments, self._get_route(source_lang, target_lang)
+            ),
+            self.micro_batch_max_wait,
+            self.micro_batch_max_tokens,
+        ))
+
+    def close(self) -> None:
+        """Stops the micro-batching scheduler, if one was started."""
+        scheduler = self._pop_shared_resource("scheduler")
+        if scheduler is not None:
+            scheduler.close()
+
+    def _translate_to_targets(self, segments: List[str], source_lang: TypeLanguage,
+                              targets: List[TypeLanguage]) -> Dict[str, List[str]]:
+        """Translates the same segments into every target, decoding shared hops once.
+
+        Targets are decoded one after the other (each hop is already one batched,
+        multi-threaded decode); routes that start with the same hop, such as every
+        target reached through the English pivot, reuse its intermediate output.
         """
-        for idx, keyword in enumerate(keywords, start=1):
-            placeholder = f"__{idx}__"
-            text = text.replace(keyword, placeholder)
-        return text
+        intermediates: Dict[Tuple, Dict[str, str]] = {}
+        results = {}
+        for target_lang in targets:
+            route = self._get_route(source_lang, target_lang)
+            results[target_lang] = self._translate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing, route=route: self._translate_route(missing, route, intermediates),
+            )
+        return results
 
-    def _restore_keywords(self, text: str, keywords: List[str]) -> str:
-        """Replaces numbered placeholders with the original keywords.
+    def _translate_route(self, segments: List[str], route: Tuple,
+                         intermediates: Optional[Dict[Tuple, Dict[str, str]]] = None) -> List[str]:
+        """Runs segments through every hop of a route, one batched decode per hop.
 
         Args:
-            text (str): The text to process.
-            keywords (List[str]): A list of keywords to restore.
+            segments (List[str]): The protected segments to translate.
+            route (Tuple): The `(from_code, to_code)` hops returned by the registry.
+            intermediates (Optional[Dict[Tuple, Dict[str, str]]]): Outputs of route
+                prefixes keyed by source segment, shared between calls so a common
+                prefix is decoded once.
 
         Returns:
-            str: The processed text with placeholders replaced by original keywords.
+            List[str]: The translated segments, in the same order as `segments`.
         """
-        for idx, keyword in enumerate(keywords, start=1):
-            pattern = re.compile(rf"__{idx}__")
-            text = pattern.sub(keyword, text)
-        return text
+        intermediates = {} if intermediates is None else intermediates
+        pool = None
+        if self.workers > 0:
+            pool = get_process_pool(
+                self.workers,
+                route,
+                self.worker_inter_threads,
+                self.worker_intra_threads,
+            )
+
+        previous = None
+        for depth, (hop_source, hop_target) in enumerate(route, 1):
+            done = intermediates.setdefault(tuple(route[:depth]), {})
+            missing = [segment for segment in dict.fromkeys(segments) if segment not in done]
+            if missing:
+                inputs = missing if previous is None else [previous[segment] for segment in missing]
+                if pool is not None:
+                    outputs = pool.translate_segments(inputs, hop_source, hop_target)
+                else:
+                    outputs = translate_batch(self._get_translation(hop_source, hop_target), inputs)
+                done.update(zip(missing, outputs))
+            previous = done
+
+        if previous is None:
+            return list(segments)
+        return [previous[segment] for segment in segments]
+
+    def _translate_segment(self, segment: str) -> str:
+        """Translates a single segment of text."""
+        return self._translate_segments([segment], self.source_lang, self.target_lang)[0]
+
+    def _get_route(self, source_lang: TypeLanguage, target_lang: TypeLanguage):
+        """Returns the (cached) chain of installed pairs from `source_lang` to `target_lang`."""
+        route = self.registry.route(source_lang, target_lang)
+        if route is None:
+            raise ValueError(
+                f"Translation not supported for language pair: {source_lang} → {target_lang}.\n"
+                "Make sure the appropriate Argos model is installed."
+            )
+        return route
+
+    def _get_translation(self, source_lang: TypeLanguage, target_lang: TypeLanguage):
+        """Returns the shared Argos translation object for a language pair."""
+        translation = self.registry.get_translation(source_lang, target_lang)
+        if translation is None:
+            raise ValueError(
+                f"Translation not supported for language pair: {source_lang} → {target_lang}.\n"
+                "Make sure the appropriate Argos model is installed."
+            )
+        return translation
 
     def handle_exceptions(self, exception):
         """Handles exceptions raised by Argos Translate.
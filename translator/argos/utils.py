@@ -1,5 +1,6 @@
 import os
 import argostranslate.package
+from translator.argos.registry import invalidate_language_registry
 
 
 def install_model(model_path: str) -> bool:
@@ -7,6 +8,7 @@ def install_model(model_path: str) -> bool:
         raise FileNotFoundError(f"Model file not found: {model_path}")
     try:
         argostranslate.package.install_from_path(model_path)
+        invalidate_language_registry()
         print(f"Model installed from: {model_path}")
         return True
     except Exception as e:
@@ -4,6 +4,8 @@ This file contains settings and constants used throughout the module.
 """
 # translator/config.py
 
+import os
+
 SUPPORTED_LANGUAGES = {
     "en": "English",
     "es": "Spanish",
@@ -11,3 +13,119 @@ SUPPORTED_LANGUAGES = {
     "pt": "Portuguese",
     # Add more languages if needed
 }
+
+# Persistent translation memory (segment-level cache shared by all engines)
+TRANSLATION_MEMORY_ENABLED = os.getenv("HYBRIDTRANS_TM_ENABLED", "1") != "0"
+TRANSLATION_MEMORY_PATH = os.getenv(
+    "HYBRIDTRANS_TM_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "hybridtrans", "translation_memory.sqlite3"),
+)
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv("HYBRIDTRANS_TM_MAX_ENTRIES", "200000"))
+
+# Argos / CTranslate2 decoding
+ARGOS_BATCH_SIZE = int(os.getenv("HYBRIDTRANS_ARGOS_BATCH_SIZE", "32"))
+ARGOS_BEAM_SIZE = int(os.getenv("HYBRIDTRANS_ARGOS_BEAM_SIZE", "4"))
+
+# Google Translate (online)
+GOOGLE_MAX_CONCURRENCY = int(os.getenv("HYBRIDTRANS_GOOGLE_MAX_CONCURRENCY", "8"))
+
+# Argos multi-process execution (bulk offline jobs)
+ARGOS_POOL_WORKERS = int(os.getenv("HYBRIDTRANS_ARGOS_POOL_WORKERS", str(os.cpu_count() or 1)))
+ARGOS_POOL_CHUNK_SIZE = int(os.getenv("HYBRIDTRANS_ARGOS_POOL_CHUNK_SIZE", "64"))
+ARGOS_WORKER_INTER_THREADS = int(os.getenv("HYBRIDTRANS_ARGOS_WORKER_INTER_THREADS", "1"))
+ARGOS_WORKER_INTRA_THREADS = int(os.getenv("HYBRIDTRANS_ARGOS_WORKER_INTRA_THREADS", "1"))
+
+# Sentence segmentation backend: "rules" (built-in, streaming) or "textblob"
+SEGMENTER_BACKEND = os.getenv("HYBRIDTRANS_SEGMENTER", "rules")
+
+# Concurrent targets of translate_to_many()
+TRANSLATE_FANOUT_WORKERS = int(os.getenv("HYBRIDTRANS_FANOUT_WORKERS", "4"))
+
+# Streaming file translation
+FILE_CHUNK_PARAGRAPHS = int(os.getenv("HYBRIDTRANS_FILE_CHUNK_PARAGRAPHS", "32"))
+FILE_MAX_PARAGRAPH_CHARS = int(os.getenv("HYBRIDTRANS_FILE_MAX_PARAGRAPH_CHARS", "20000"))
+
+# Hybrid routing (online first, circuit breaker to offline)
+HYBRID_FAILURE_THRESHOLD = int(os.getenv("HYBRIDTRANS_HYBRID_FAILURE_THRESHOLD", "3"))
+HYBRID_RECOVERY_TIMEOUT = float(os.getenv("HYBRIDTRANS_HYBRID_RECOVERY_TIMEOUT", "30"))
+HYBRID_MAX_ONLINE_LATENCY = float(os.getenv("HYBRIDTRANS_HYBRID_MAX_ONLINE_LATENCY", "5"))
+HYBRID_MAX_ERROR_RATE = float(os.getenv("HYBRIDTRANS_HYBRID_MAX_ERROR_RATE", "0.5"))
+HYBRID_EWMA_ALPHA = float(os.getenv("HYBRIDTRANS_HYBRID_EWMA_ALPHA", "0.2"))
+
+# Connectivity probe used by AUTO mode
+CONNECTIVITY_CHECK_URL = os.getenv("HYBRIDTRANS_CONNECTIVITY_URL", "https://www.google.com")
+CONNECTIVITY_CHECK_TIMEOUT = float(os.getenv("HYBRIDTRANS_CONNECTIVITY_TIMEOUT", "3"))
+CONNECTIVITY_CACHE_TTL = float(os.getenv("HYBRIDTRANS_CONNECTIVITY_TTL", "30"))
+
+# Number of reusable instances kept by get_translator() per mode and settings
+TRANSLATOR_POOL_SIZE = int(os.getenv("HYBRIDTRANS_TRANSLATOR_POOL_SIZE", "1"))
+
+# Translation log sink (background writer)
+LOG_MAX_BYTES = int(os.getenv("HYBRIDTRANS_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("HYBRIDTRANS_LOG_BACKUP_COUNT", "3"))
+LOG_JSON_LINES = os.getenv("HYBRIDTRANS_LOG_JSON", "0") != "0"
+LOG_BATCH_SIZE = int(os.getenv("HYBRIDTRANS_LOG_BATCH_SIZE", "256"))
+LOG_FLUSH_INTERVAL = float(os.getenv("HYBRIDTRANS_LOG_FLUSH_INTERVAL", "0.5"))
+
+# Verbose per-segment output (timings etc.)
+DEBUG = os.getenv("HYBRIDTRANS_DEBUG", "0") != "0"
+
+# Pipeline metrics (stage latency histograms, error and cache counters)
+METRICS_ENABLED = os.getenv("HYBRIDTRANS_METRICS", "1") != "0"
+METRICS_BUCKETS = tuple(
+    float(bound) for bound in os.getenv(
+        "HYBRIDTRANS_METRICS_BUCKETS", "0.0005,0.001,0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10"
+    ).split(",")
+)
+
+# Shared HTTP transport for Google Translate
+GOOGLE_HTTP2 = os.getenv("HYBRIDTRANS_GOOGLE_HTTP2", "1") != "0"
+GOOGLE_MAX_CONNECTIONS = int(os.getenv("HYBRIDTRANS_GOOGLE_MAX_CONNECTIONS", "20"))
+GOOGLE_MAX_KEEPALIVE = int(os.getenv("HYBRIDTRANS_GOOGLE_MAX_KEEPALIVE", "10"))
+GOOGLE_KEEPALIVE_EXPIRY = float(os.getenv("HYBRIDTRANS_GOOGLE_KEEPALIVE_EXPIRY", "30"))
+GOOGLE_REQUEST_TIMEOUT = float(os.getenv("HYBRIDTRANS_GOOGLE_TIMEOUT", "10"))
+GOOGLE_PROXIES = [proxy for proxy in os.getenv("HYBRIDTRANS_GOOGLE_PROXIES", "").split(",") if proxy]
+
+# Adaptive rate limiting of Google requests (token bucket + AIMD, 0 disables limiting)
+GOOGLE_RATE_LIMIT = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE", "10"))
+GOOGLE_RATE_MIN = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE_MIN", "0.5"))
+GOOGLE_RATE_MAX = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE_MAX", "100"))
+GOOGLE_RATE_BURST = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE_BURST", "10"))
+GOOGLE_RATE_INCREASE = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE_INCREASE", "1"))
+GOOGLE_RATE_DECREASE = float(os.getenv("HYBRIDTRANS_GOOGLE_RATE_DECREASE", "0.5"))
+GOOGLE_MAX_RETRIES = int(os.getenv("HYBRIDTRANS_GOOGLE_MAX_RETRIES", "4"))
+GOOGLE_BACKOFF_BASE = float(os.getenv("HYBRIDTRANS_GOOGLE_BACKOFF_BASE", "0.5"))
+GOOGLE_BACKOFF_MAX = float(os.getenv("HYBRIDTRANS_GOOGLE_BACKOFF_MAX", "30"))
+
+# Argos model installer
+ARGOS_INSTALL_WORKERS = int(os.getenv("HYBRIDTRANS_ARGOS_INSTALL_WORKERS", "4"))
+ARGOS_INDEX_MAX_AGE = float(os.getenv("HYBRIDTRANS_ARGOS_INDEX_MAX_AGE", str(24 * 3600)))
+ARGOS_DOWNLOAD_TIMEOUT = float(os.getenv("HYBRIDTRANS_ARGOS_DOWNLOAD_TIMEOUT", "60"))
+
+# Argos pivot routing between installed language pairs
+ARGOS_PIVOT_LANGUAGE = os.getenv("HYBRIDTRANS_ARGOS_PIVOT", "en")
+ARGOS_MAX_PIVOT_HOPS = int(os.getenv("HYBRIDTRANS_ARGOS_MAX_HOPS", "3"))
+
+# Offline language detection (used for source_lang="auto")
+LANGDETECT_DEFAULT = os.getenv("HYBRIDTRANS_LANGDETECT_DEFAULT", "en")
+LANGDETECT_CACHE_SIZE = int(os.getenv("HYBRIDTRANS_LANGDETECT_CACHE_SIZE", "10000"))
+# Below these per-n-gram margins, a detection is not trusted and the engine (or "und")
+# decides; texts of fewer than LANGDETECT_MIN_WORDS words need the short-text margin
+LANGDETECT_MIN_MARGIN = float(os.getenv("HYBRIDTRANS_LANGDETECT_MIN_MARGIN", "0.1"))
+LANGDETECT_SHORT_TEXT_MARGIN = float(os.getenv("HYBRIDTRANS_LANGDETECT_SHORT_TEXT_MARGIN", "0.8"))
+LANGDETECT_MIN_WORDS = int(os.getenv("HYBRIDTRANS_LANGDETECT_MIN_WORDS", "4"))
+
+# HTTP service mode (python -m translator.server)
+SERVER_HOST = os.getenv("HYBRIDTRANS_SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("HYBRIDTRANS_SERVER_PORT", "8080"))
+SERVER_MODE = os.getenv("HYBRIDTRANS_SERVER_MODE", "auto")
+SERVER_MAX_CONCURRENCY = int(os.getenv("HYBRIDTRANS_SERVER_MAX_CONCURRENCY", "16"))
+SERVER_MAX_QUEUE = int(os.getenv("HYBRIDTRANS_SERVER_MAX_QUEUE", "64"))
+SERVER_QUEUE_TIMEOUT = float(os.getenv("HYBRIDTRANS_SERVER_QUEUE_TIMEOUT", "10"))
+SERVER_MAX_BODY_BYTES = int(os.getenv("HYBRIDTRANS_SERVER_MAX_BODY_BYTES", str(8 * 1024 * 1024)))
+SERVER_SHUTDOWN_TIMEOUT = float(os.getenv("HYBRIDTRANS_SERVER_SHUTDOWN_TIMEOUT", "30"))
+
+# Argos micro-batching of concurrent requests (ArgosTranslator(micro_batching=True))
+ARGOS_MICRO_BATCHING = os.getenv("HYBRIDTRANS_ARGOS_MICRO_BATCHING", "0") != "0"
+ARGOS_MICROBATCH_MAX_WAIT = float(os.getenv("HYBRIDTRANS_ARGOS_MICROBATCH_MAX_WAIT", "0.005"))
+ARGOS_MICROBATCH_MAX_TOKENS = int(os.getenv("HYBRIDTRANS_ARGOS_MICROBATCH_MAX_TOKENS", "2048"))
@@ -3,24 +3,57 @@ Main module for Google Translate.
 Provides an implementation of BaseTranslator using googletrans.
 """
 
-from functools import lru_cache
+import asyncio
+import threading
 import time
-from typing import List
-import re
-from textblob import TextBlob
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from googletrans import Translator
 from translator.BaseTranslator import BaseTranslator
+from translator.config import DEBUG, GOOGLE_MAX_CONCURRENCY
+from translator.utils.rate_limiter import AdaptiveRateLimiter, MalformedResponseError, get_rate_limiter
+from translator.googletrans.transport import (
+    SharedTransport,
+    get_request_timeout,
+    get_shared_transport,
+    request_timeout,
+)
 
 
 class GoogleTranslator(BaseTranslator):
     """A translator class that uses the Google Translate API
     Args:
         BaseTranslator (class): Base class for translation
+        max_concurrency (int): Maximum number of segments translated in parallel
+            (1 disables concurrent dispatch).
+        debug (bool): Print per-segment timings.
+        client_factory (Callable[[], Translator]): Builds the googletrans-compatible
+            client used by each thread (e.g., a stand-in for offline benchmarks).
+        transport (SharedTransport): Pooled HTTP clients attached to every googletrans
+            client (defaults to the process-wide transport).
+        request_timeout (Optional[float]): Timeout in seconds of each request (defaults to
+            the transport timeout, or to an enclosing `request_timeout()` context).
+        rate_limiter (AdaptiveRateLimiter): Limiter pacing and retrying requests
+            (defaults to the process-wide Google limiter).
     """
 
-    def __init__(self, source_lang=None, target_lang=None, text=""):
-        super().__init__(source_lang, target_lang, text)
-        self._translator = Translator()
+    ENGINE_NAME = "google"
+
+    def __init__(self, source_lang=None, target_lang=None, text="", use_memory=True,
+                 max_concurrency: int = GOOGLE_MAX_CONCURRENCY, debug: bool = DEBUG,
+                 client_factory: Callable[[], Translator] = Translator,
+                 transport: Optional[SharedTransport] = None,
+                 request_timeout: Optional[float] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        super().__init__(source_lang, target_lang, text, use_memory=use_memory)
+        self.client_factory = client_factory
+        self.transport = transport or get_shared_transport()
+        self.request_timeout = request_timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter("google")
+        self._translator = self._new_client()
+        self.max_concurrency = max(1, max_concurrency)
+        self.debug = debug
+        self._local = threading.local()
 
     def set_keywords(self, keywords: List[str]) -> None:
         """Define keywords to protect during translation.
@@ -30,13 +63,13 @@ class GoogleTranslator(BaseTranslator):
         """
         self.keywords = keywords
 
-    @lru_cache(maxsize=128)
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translates text from source_lang to target_lang.
 
         Args:
             text (str): The text to translate.
-            source_lang (str): The source language code (e.g., 'en').
+            source_lang (str): The source language code (e.g., 'en'), or "auto" to
+                detect it offline.
             target_lang (str): The target language code (e.g., 'pt').
 
         Returns:
@@ -46,110 +79,232 @@ class GoogleTranslator(BaseTranslator):
             ValueError: If the translation fails or returns an empty response.
         """
         try:
-            self.text = text
-            self.source_lang = source_lang
-            self.target_lang = target_lang
-
-            protected_text = self._protect_keywords(text, self.keywords)
-            segments = self._segment_text(protected_text, 100)
-            translated_segments = []
-
-            for segment in segments:
-                # result = self._translator.translate(segment, src=source_lang, dest=target_lang)
-                star_time = time.time()
-                result = self.private_translate(segment, source_lang, target_lang)
-                end_time = time.time()
-                print(f"-> {end_time - star_time:.2f} seconds")
-                if result is None or not hasattr(result, "text"):
-                    raise ValueError("Translation failed: Empty or malformed response.")
-                translated_segments.append(result.text)
+            source_lang = self._resolve_source_lang(text, source_lang, target_lang)
+            segments = self._prepare(text, source_lang, target_lang)
+            translated_segments = self._translate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing: self._translate_segments(missing, source_lang, target_lang),
+            )
 
             translated_text = " ".join(translated_segments)
-            self.translated_text = self._restore_keywords(translated_text, self.keywords)
+            self.translated_text = self._restore(translated_text, source_lang, target_lang)
             return self.translated_text
 
         except Exception as e:
             self.handle_exceptions(e)
-            return "[ERROR] Translation failed."
+            return self.FAILED_TRANSLATION
 
-    @lru_cache(maxsize=128)
-    def private_translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Private method to translate text using Google Translate.
+    async def atranslate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Asynchronously translates text from source_lang to target_lang.
+
+        googletrans only ships a blocking client, so each segment request runs on
+        the bounded worker pool (`max_concurrency`) and is awaited from the event
+        loop, which never blocks on network I/O. Keyword protection, segmentation
+        and restoration run in a worker thread too, so large texts do not hold
+        the loop either.
 
         Args:
             text (str): The text to translate.
-            source_lang (str): The source language code (e.g., 'en').
+            source_lang (str): The source language code (e.g., 'en'), or "auto" to
+                detect it offline.
             target_lang (str): The target language code (e.g., 'pt').
 
         Returns:
             str: The translated text.
+
+        Raises:
+            ValueError: If the translation fails or returns an empty response.
         """
-        return self._translator.translate(text, target_lang, source_lang)
+        try:
+            source_lang = await self._aresolve_source_lang(text, source_lang, target_lang)
+            segments = await asyncio.to_thread(self._prepare, text, source_lang, target_lang)
+            translated_segments = await self._atranslate_with_memory(
+                segments, source_lang, target_lang,
+                lambda missing: self._atranslate_segments(missing, source_lang, target_lang),
+            )
 
-    def detect_language(self, text: str) -> str:
-        """Detects the language of the input text.
+            translated_text = " ".join(translated_segments)
+            self.translated_text = await asyncio.to_thread(
+                self._restore, translated_text, source_lang, target_lang
+            )
+            return self.translated_text
+
+        except Exception as e:
+            self.handle_exceptions(e)
+            return self.FAILED_TRANSLATION
+
+    def _prepare(self, text: str, source_lang: str, target_lang: str) -> List[str]:
+        """Stores the request state and returns its protected segments."""
+        self.text = text
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+
+        return self._protect_and_segment(text, source_lang, target_lang)
+
+    def _translate_segments(self, segments: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates protected segments through Google Translate.
+
+        Segments are sent in parallel, at most `max_concurrency` at a time, so the
+        latency of a long text is bound by its slowest request instead of the sum.
 
         Args:
-            text (str): The text whose language is to be detected.
+            segments (List[str]): The segments to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
 
         Returns:
-            str: The detected language code (e.g., 'en' for English).
+            List[str]: The translated segments, in order.
 
         Raises:
-            ValueError: If the language detection fails or returns an empty response.
+            ValueError: If a segment returns an empty or malformed response. The
+                error carries the segments that did succeed in `translated_segments`.
         """
-        try:
-            result = self._translator.detect(text)
-            return result.lang
-        except Exception as e:
-            self.handle_exceptions(e)
-            return None
+        # Context variables do not follow work into the pool, so pass the timeout along
+        timeout = self._effective_timeout()
+        if self.max_concurrency == 1 or len(segments) <= 1:
+            return [self._translate_one(segment, source_lang, target_lang, timeout) for segment in segments]
 
-    def handle_exceptions(self, exception):
-        """Handles exceptions raised by the Google Translate API."""
-        print(f"An error occurred: {exception}")
-        raise exception
+        executor = self._get_executor()
+        futures = [executor.submit(self._translate_one, segment, source_lang, target_lang, timeout)
+                   for segment in segments]
+        translated: Dict[str, str] = {}
+        error: Optional[Exception] = None
+        for segment, future in zip(segments, futures):
+            try:
+                translated[segment] = future.result()
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            # Callers such as `translate_many()` only retry what is missing
+            error.translated_segments = translated
+            raise error
+        return [translated[segment] for segment in segments]
+
+    async def _atranslate_segments(self, segments: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Asynchronous counterpart of `_translate_segments()`; preserves order."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        timeout = self._effective_timeout()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(executor, self._translate_one, segment, source_lang, target_lang, timeout)
+            for segment in segments
+        )))
+
+    def _effective_timeout(self) -> Optional[float]:
+        """Returns the request timeout of the calling context, else the instance default."""
+        timeout = get_request_timeout()
+        return timeout if timeout is not None else self.request_timeout
+
+    def _translate_one(self, segment: str, source_lang: str, target_lang: str,
+                       timeout: Optional[float] = None) -> str:
+        """Translates a single protected segment and validates the response."""
+        star_time = time.time()
+        with request_timeout(timeout):
+            result = self.private_translate(segment, source_lang, target_lang)
+        if self.debug:
+            print(f"[DEBUG] -> {time.time() - star_time:.2f} seconds")
+        return result.text
 
-    def _segment_text(self, text: str, max_sentences: int = 100) -> List[str]:
-        """Splits the text into sentences for more reliable translation.
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the worker pool used for concurrent segment dispatch."""
+        return self._shared_resource("executor", lambda: ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="googletrans"
+        ))
+
+    def _client(self) -> Translator:
+        """Returns a googletrans client owned by the calling thread."""
+        if threading.current_thread() is threading.main_thread():
+            return self._translator
+        client = getattr(self._local, "translator", None)
+        if client is None:
+            client = self._local.translator = self._new_client()
+        return client
+
+    def _new_client(self) -> Translator:
+        """Builds a googletrans client wired to the shared transport.
+
+        googletrans 4.0.0rc1 checks a misspelled `raise_Exception` attribute on
+        non-200 answers, so both spellings are set: a 429 then raises
+        `Exception('Unexpected status code "429" ...')`, which the rate limiter
+        recognizes as throttling, instead of an `AttributeError`.
+        """
+        client = self.client_factory()
+        if hasattr(client, "client"):
+            client.raise_exception = True
+            client.raise_Exception = True
+            self.transport.attach(client)
+        return client
+
+    def close(self) -> None:
+        """Shuts down the worker pool used for concurrent dispatch."""
+        executor = self._pop_shared_resource("executor")
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def private_translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Private method to translate text using Google Translate.
+
+        The request is paced by the shared rate limiter; throttled, empty or
+        malformed responses lower the rate and are retried with jittered backoff.
+        Other errors (e.g., an invalid language code) are raised right away.
 
         Args:
-            text (str): The text to segment.
-            max_sentences (int): The maximum number of sentences to return.
+            text (str): The text to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
 
         Returns:
-            List[str]: A list of sentences.
+            str: The translated text.
+
+        Raises:
+            MalformedResponseError: If the response is still empty or malformed after
+                the retries (a `ValueError`).
         """
-        blob = TextBlob(text)
-        sentences = [str(sentence) for sentence in blob.sentences]  # virar lista de strings!!!!!!!!!!!!
-        return sentences[:max_sentences]
+        def request():
+            result = self._client().translate(text, target_lang, source_lang)
+            if result is None or not hasattr(result, "text"):
+                raise MalformedResponseError("Translation failed: Empty or malformed response.")
+            return result
+
+        return self.rate_limiter.call(request)
 
-    def _protect_keywords(self, text: str, keywords: List[str]) -> str:
-        """Replaces each keyword with a numbered placeholder.
+    def detect_language(self, text: str) -> str:
+        """Detects the language of the input text.
 
         Args:
-            text (str): The text to process.
-            keywords (List[str]): A list of keywords to protect.
+            text (str): The text whose language is to be detected.
 
         Returns:
-            str: Text with keywords replaced.
+            str: The detected language code (e.g., 'en' for English).
+
+        Raises:
+            ValueError: If the language detection fails or returns an empty response.
         """
-        for idx, keyword in enumerate(keywords, start=1):
-            placeholder = f"__{idx}__"
-            text = text.replace(keyword, placeholder)
-        return text
+        try:
+            def request():
+                result = self._client().detect(text)
+                if result is None or not getattr(result, "lang", None):
+                    raise MalformedResponseError("Language detection failed: Empty or malformed response.")
+                return result
+
+            return self.rate_limiter.call(request).lang
+        except Exception as e:
+            self.handle_exceptions(e)
+            return None
 
-    def _restore_keywords(self, text: str, keywords: List[str]) -> str:
-        """Restores original keywords in place of placeholders.
+    async def adetect_language(self, text: str) -> str:
+        """Asynchronously detects the language of the input text.
 
         Args:
-            text (str): The translated text.
-            keywords (List[str]): The list of original keywords.
+            text (str): The text whose language is to be detected.
 
         Returns:
-            str: The text with keywords restored.
+            str: The detected language code (e.g., 'en' for English).
         """
-        for idx, keyword in enumerate(keywords, start=1):
-            pattern = re.compile(rf"__{idx}__")
-            text = pattern.sub(keyword, text)
-        return text
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), self.detect_language, text)
+
+    def handle_exceptions(self, exception):
+        """Handles exceptions raised by the Google Translate API."""
+        print(f"An error occurred: {exception}")
+        raise exception
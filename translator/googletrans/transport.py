@@ -0,0 +1,208 @@
+"""
+Shared HTTP transport for the Google engine.
+
+googletrans creates a private `httpx.Client` per `Translator`, so every
+instance (and every worker thread) opens its own connections and pays its own
+TLS handshakes. `SharedTransport` owns a small set of pooled keep-alive
+clients (one per configured proxy, used round-robin) that are attached to
+every googletrans `Translator`, with optional HTTP/2 multiplexing and a
+per-request timeout taken from a context variable.
+
+Works with the httpx 0.13 pinned by googletrans (`PoolLimits`) as well as
+newer releases (`Limits`).
+"""
+
+import itertools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+import httpx
+
+from translator.config import (
+    GOOGLE_HTTP2,
+    GOOGLE_KEEPALIVE_EXPIRY,
+    GOOGLE_MAX_CONNECTIONS,
+    GOOGLE_MAX_KEEPALIVE,
+    GOOGLE_PROXIES,
+    GOOGLE_REQUEST_TIMEOUT,
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Referer": "https://translate.google.com",
+}
+
+_request_timeout: ContextVar[Optional[float]] = ContextVar("hybridtrans_request_timeout", default=None)
+
+
+@contextmanager
+def request_timeout(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Overrides the timeout of the requests sent through shared clients in this context.
+
+    Args:
+        seconds (Optional[float]): Timeout in seconds (None keeps the client default).
+    """
+    token = _request_timeout.set(seconds)
+    try:
+        yield
+    finally:
+        _request_timeout.reset(token)
+
+
+def get_request_timeout() -> Optional[float]:
+    """Returns the timeout set by the innermost `request_timeout()` context, if any."""
+    return _request_timeout.get()
+
+
+class _PooledClient(httpx.Client):
+    """`httpx.Client` applying the context-local request timeout."""
+
+    def request(self, method, url, *args, **kwargs):
+        timeout = _request_timeout.get()
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return super().request(method, url, *args, **kwargs)
+
+
+def _pool_limits(max_connections: int, max_keepalive: int, keepalive_expiry: float) -> dict:
+    """Returns the `httpx.Client` pool keyword argument for the installed httpx.
+
+    Only `httpx.Limits` (httpx 0.16+) takes `keepalive_expiry`; the older
+    `PoolLimits` has no such setting, so it is ignored there and httpx keeps
+    its built-in expiry.
+    """
+    if hasattr(httpx, "Limits"):
+        return {"limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )}
+    try:
+        # httpx 0.13 - 0.15
+        return {"pool_limits": httpx.PoolLimits(max_keepalive=max_keepalive, max_connections=max_connections)}
+    except TypeError:
+        # Older releases only know the since-deprecated soft/hard limits
+        return {"pool_limits": httpx.PoolLimits(soft_limit=max_keepalive, hard_limit=max_connections)}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class SharedTransport:
+    """Pooled keep-alive clients shared by every `GoogleTranslator`."""
+
+    def __init__(
+        self,
+        http2: bool = GOOGLE_HTTP2,
+        max_connections: int = GOOGLE_MAX_CONNECTIONS,
+        max_keepalive: int = GOOGLE_MAX_KEEPALIVE,
+        keepalive_expiry: float = GOOGLE_KEEPALIVE_EXPIRY,
+        timeout: float = GOOGLE_REQUEST_TIMEOUT,
+        proxies: Optional[List[str]] = None,
+    ):
+        """
+        Configures the transport; clients are created on first use.
+
+        Args:
+            http2 (bool): Multiplex requests over HTTP/2 (needs the `h2` package).
+            max_connections (int): Maximum number of open connections per client.
+            max_keepalive (int): Maximum number of idle connections kept alive per client.
+            keepalive_expiry (float): Seconds an idle connection is kept (newer httpx only).
+            timeout (float): Default request timeout in seconds.
+            proxies (Optional[List[str]]): Proxy URLs; each gets its own pool and
+                translators are spread over them round-robin.
+        """
+        if http2 and not _http2_available():
+            print("[INFO] HTTP/2 requested but the 'h2' package is missing; using HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.proxies = list(proxies if proxies is not None else GOOGLE_PROXIES) or [None]
+        self._clients: dict = {}
+        self._rotation = itertools.cycle(self.proxies)
+        self._lock = threading.Lock()
+
+    def client(self) -> httpx.Client:
+        """
+        Returns the next pooled client (rotating over the configured proxies).
+
+        Returns:
+            httpx.Client: A shared client.
+        """
+        with self._lock:
+            proxy = next(self._rotation)
+            client = self._clients.get(proxy)
+            if client is None:
+                client = self._clients[proxy] = self._create_client(proxy)
+            return client
+
+    def attach(self, translator):
+        """
+        Makes a googletrans `Translator` send its requests through a shared client.
+
+        Args:
+            translator (googletrans.Translator): The translator to rewire.
+
+        Returns:
+            googletrans.Translator: The same translator.
+        """
+        own_client = getattr(translator, "client", None)
+        shared = self.client()
+        if own_client is not None and own_client is not shared and hasattr(own_client, "close"):
+            own_client.close()
+        translator.client = shared
+        token_acquirer = getattr(translator, "token_acquirer", None)
+        if token_acquirer is not None:
+            token_acquirer.client = shared
+        return translator
+
+    def close(self) -> None:
+        """Closes every pooled client (they are recreated on next use)."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _create_client(self, proxy: Optional[str]) -> httpx.Client:
+        kwargs = dict(
+            http2=self.http2,
+            timeout=self.timeout,
+            headers=DEFAULT_HEADERS,
+            **_pool_limits(self.max_connections, self.max_keepalive, self.keepalive_expiry),
+        )
+        if proxy is None:
+            return _PooledClient(**kwargs)
+        try:
+            return _PooledClient(proxies=proxy, **kwargs)
+        except TypeError:
+            # httpx >= 0.28 replaced `proxies` with `proxy`
+            return _PooledClient(proxy=proxy, **kwargs)
+
+
+_shared_transport: Optional[SharedTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> SharedTransport:
+    """
+    Returns the process-wide transport configured from `translator.config`.
+
+    Returns:
+        SharedTransport: The shared transport.
+    """
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = SharedTransport()
+        return _shared_transport
@@ -1,4 +1,5 @@
 import os
+from translator.utils.log_sink import get_log_sink
 # legacy, no longer used and should be removed in the future
 
 
@@ -28,7 +29,5 @@ def process_keywords(keywords):
 
 def log_translation(input_text, translated_text,
                     log_file="translation_log.txt"):
-    """Logs the original and translated text to a file."""
-    with open(log_file, "a", encoding="utf-8") as file:
-        file.write(
-            f"Original: {input_text}\nTranslated: {translated_text}\n\n")
+    """Logs the original and translated text to a file (through the background log sink)."""
+    get_log_sink(log_file).write(input_text, translated_text)
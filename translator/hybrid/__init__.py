@@ -0,0 +1,13 @@
+"""
+Hybrid translator (online with offline failover).
+Exposes the router class and its health primitives.
+"""
+
+from .health import CircuitBreaker, EngineStats
+from .translator import HybridTranslator
+
+__all__ = [
+    "HybridTranslator",
+    "CircuitBreaker",
+    "EngineStats",
+]
@@ -0,0 +1,126 @@
+"""
+Health tracking used by the hybrid router: EWMA latency/error statistics per
+engine and a circuit breaker guarding the online engine.
+"""
+
+import threading
+import time
+from enum import StrEnum
+from typing import Optional
+
+from translator.config import (
+    HYBRID_EWMA_ALPHA,
+    HYBRID_FAILURE_THRESHOLD,
+    HYBRID_RECOVERY_TIMEOUT,
+)
+
+
+class EngineStats:
+    """Exponentially weighted moving averages of latency and error rate."""
+
+    def __init__(self, alpha: float = HYBRID_EWMA_ALPHA):
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, success: bool) -> None:
+        """
+        Records the outcome of one request.
+
+        Args:
+            latency (float): Duration of the request in seconds.
+            success (bool): Whether the request succeeded.
+        """
+        with self._lock:
+            self.requests += 1
+            if not success:
+                self.failures += 1
+            else:
+                self.latency = latency if self.latency is None else (
+                    self.alpha * latency + (1 - self.alpha) * self.latency
+                )
+            self.error_rate = self.alpha * (0.0 if success else 1.0) + (1 - self.alpha) * self.error_rate
+
+    def as_dict(self) -> dict:
+        """Returns the statistics as a plain dictionary."""
+        return {
+            "latency_ewma": self.latency,
+            "error_rate_ewma": self.error_rate,
+            "requests": self.requests,
+            "failures": self.failures,
+        }
+
+
+class CircuitBreaker:
+    """Classic closed/open/half-open circuit breaker.
+
+    After `failure_threshold` consecutive failures the breaker opens and
+    rejects requests. Once `recovery_timeout` seconds have passed it lets a
+    single probe through (half-open); a successful probe closes it again.
+    """
+
+    class State(StrEnum):
+        """Enum for breaker states."""
+
+        CLOSED = "closed"
+        OPEN = "open"
+        HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = HYBRID_FAILURE_THRESHOLD,
+        recovery_timeout: float = HYBRID_RECOVERY_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.State.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Checks whether a request may be sent to the guarded engine.
+
+        Returns:
+            bool: True when closed, or when this call is the half-open probe.
+        """
+        with self._lock:
+            if self.state == self.State.CLOSED:
+                return True
+            if self.state == self.State.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self.state = self.State.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.State.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Closes the breaker after a successful request."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            self.state = self.State.CLOSED
+
+    def record_failure(self) -> None:
+        """Counts a failure, opening the breaker when the threshold is reached."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.State.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self) -> None:
+        """Opens the breaker immediately (e.g., on a sustained error rate)."""
+        with self._lock:
+            self._probe_in_flight = False
+            self._open()
+
+    def _open(self) -> None:
+        self.state = self.State.OPEN
+        self._opened_at = time.monotonic()
@@ -0,0 +1,263 @@
+"""
+Hybrid translator routing every request between Google Translate (online)
+and Argos Translate (offline).
+
+Requests go online while Google is healthy. Live EWMA latency and error rates
+feed a circuit breaker: slow or failing calls trip it and traffic moves
+offline, then a single probe request is sent online after the recovery timeout
+to find out whether Google has recovered. A request that fails on one engine
+is retried on the other, so upstream degradation does not fail whole batches.
+Caller errors (e.g., a language pair an engine does not support) still fail
+over, but say nothing about the engine's health and are kept out of the
+statistics and the breaker.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from translator.BaseTranslator import BaseTranslator
+from translator.config import HYBRID_MAX_ERROR_RATE, HYBRID_MAX_ONLINE_LATENCY
+from translator.hybrid.health import CircuitBreaker, EngineStats
+from translator.utils.rate_limiter import is_throttling_error
+
+ONLINE = "online"
+OFFLINE = "offline"
+
+
+class HybridTranslator(BaseTranslator):
+    """Translator that picks the engine per request, with automatic failover.
+
+    Args:
+        online (BaseTranslator): Online engine (defaults to a `GoogleTranslator`).
+        offline (BaseTranslator): Offline engine (defaults to an `ArgosTranslator`,
+            created on first use).
+        breaker (CircuitBreaker): Breaker guarding the online engine.
+        max_online_latency (float): EWMA latency in seconds above which online
+            calls count as failures for the breaker.
+        max_error_rate (float): EWMA error rate above which the breaker trips.
+    """
+
+    ENGINE_NAME = "hybrid"
+
+    def __init__(self, source_lang=None, target_lang=None, text="", use_memory=True,
+                 online: Optional[BaseTranslator] = None,
+                 offline: Optional[BaseTranslator] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 max_online_latency: float = HYBRID_MAX_ONLINE_LATENCY,
+                 max_error_rate: float = HYBRID_MAX_ERROR_RATE):
+        # The wrapped engines consult the translation memory themselves
+        super().__init__(source_lang, target_lang, text, use_memory=False)
+        self._use_memory = use_memory
+        self._engines = {ONLINE: online, OFFLINE: offline}
+        self._engines_lock = threading.Lock()
+        self._unavailable = set()
+        # Spawned instances use their own spawns of the shared engines, so the
+        # keywords they hand to an engine never reach another caller
+        self._forks: Optional[dict] = None
+        self.breaker = breaker or CircuitBreaker()
+        self.max_online_latency = max_online_latency
+        self.max_error_rate = max_error_rate
+        self.engine_stats = {ONLINE: EngineStats(), OFFLINE: EngineStats()}
+
+    def spawn(self) -> "HybridTranslator":
+        """Returns a lightweight instance sharing the engines, breaker and statistics.
+
+        Returns:
+            HybridTranslator: The new instance, with its own per-call state.
+        """
+        clone = super().spawn()
+        clone._forks = {}
+        return clone
+
+    def set_keywords(self, keywords: List[str]) -> None:
+        """Define keywords to protect during translation.
+
+        Args:
+            keywords (List[str]): A list of keywords to protect.
+        """
+        self.keywords = keywords
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translates text on the engine currently preferred by the router.
+
+        Args:
+            text (str): The text to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Returns:
+            str: The translated text.
+        """
+        return self._route(lambda engine: engine.translate(text, source_lang, target_lang))
+
+    async def atranslate(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Asynchronous counterpart of `translate()`.
+
+        Args:
+            text (str): The text to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Returns:
+            str: The translated text.
+        """
+        error = None
+        for name in self._candidates():
+            engine = await self._aengine(name)
+            if engine is None:
+                continue
+            engine.keywords = self.keywords
+            start = time.perf_counter()
+            try:
+                result = await engine.atranslate(text, source_lang, target_lang)
+            except Exception as e:
+                self._record_error(name, time.perf_counter() - start, e)
+                error = e
+                continue
+            self._record(name, time.perf_counter() - start, True)
+            return result
+        raise self._no_engine_error(error)
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translates several texts with one batched call on the preferred engine.
+
+        Args:
+            texts (List[str]): The texts to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+
+        Returns:
+            List[str]: The translated texts, in the same order as `texts`.
+        """
+        return self._route(lambda engine: engine.translate_batch(texts, source_lang, target_lang))
+
+    def translate_to_many(self, text: str, source_lang: str,
+                          targets: Optional[List[str]] = None) -> Dict[str, str]:
+        """Translates one text into several target languages on the preferred engine.
+
+        Args:
+            text (str): The text to translate.
+            source_lang (str): The source language code (e.g., 'en').
+            targets (Optional[List[str]]): Target language codes (defaults to
+                every language in `SUPPORTED_LANGUAGES`).
+
+        Returns:
+            Dict[str, str]: The translation per target code.
+        """
+        return self._route(lambda engine: engine.translate_to_many(text, source_lang, targets))
+
+    def detect_language(self, text: str) -> str:
+        """Detects the language of the input text on the first engine supporting it.
+
+        Args:
+            text (str): The text whose language is to be detected.
+
+        Returns:
+            str: The detected language code (e.g., 'en' for English).
+        """
+        return self._route(lambda engine: engine.detect_language(text))
+
+    def stats(self) -> dict:
+        """Returns the breaker state and the live statistics of both engines."""
+        return {
+            "breaker": str(self.breaker.state),
+            ONLINE: self.engine_stats[ONLINE].as_dict(),
+            OFFLINE: self.engine_stats[OFFLINE].as_dict(),
+        }
+
+    def _route(self, call: Callable[[BaseTranslator], Any]) -> Any:
+        """Runs `call` on the preferred engine, failing over to the other one."""
+        error = None
+        for name in self._candidates():
+            engine = self._engine(name)
+            if engine is None:
+                continue
+            engine.keywords = self.keywords
+            start = time.perf_counter()
+            try:
+                result = call(engine)
+            except Exception as e:
+                self._record_error(name, time.perf_counter() - start, e)
+                error = e
+                continue
+            self._record(name, time.perf_counter() - start, True)
+            return result
+        raise self._no_engine_error(error)
+
+    def _candidates(self) -> List[str]:
+        """Returns the engines to try, in order of preference."""
+        if self.breaker.allow_request():
+            return [ONLINE, OFFLINE]
+        # Online stays available as a last resort if the offline engine fails
+        return [OFFLINE, ONLINE]
+
+    def _record(self, name: str, latency: float, success: bool) -> None:
+        """Updates the statistics and, for the online engine, the breaker."""
+        stats = self.engine_stats[name]
+        stats.record(latency, success)
+        if name != ONLINE:
+            return
+        if success and (stats.latency or 0.0) <= self.max_online_latency:
+            self.breaker.record_success()
+            return
+        self.breaker.record_failure()
+        if not success and stats.error_rate > self.max_error_rate:
+            self.breaker.trip()
+
+    def _record_error(self, name: str, latency: float, error: Exception) -> None:
+        """Records a failed call, unless the caller (not the engine) is at fault."""
+        if isinstance(error, (ValueError, TypeError, LookupError)) and not is_throttling_error(error):
+            return
+        self._record(name, latency, False)
+
+    async def _aengine(self, name: str) -> Optional[BaseTranslator]:
+        """Async counterpart of `_engine()`.
+
+        Engines already created are returned directly; creating one (loading
+        models, setting up HTTP clients) runs in a worker thread so the event
+        loop is not blocked.
+        """
+        engine = self._forks.get(name) if self._forks is not None else self._engines[name]
+        if engine is not None:
+            return engine
+        if name in self._unavailable:
+            return None
+        return await asyncio.to_thread(self._engine, name)
+
+    def _engine(self, name: str) -> Optional[BaseTranslator]:
+        """Returns (creating it on first use) the engine called `name`, or None if unavailable.
+
+        Spawned instances get their own `spawn()` of the shared engine.
+        """
+        fork = self._forks.get(name) if self._forks is not None else None
+        if fork is not None:
+            return fork
+        with self._engines_lock:
+            if name in self._unavailable:
+                return None
+            if self._engines[name] is None:
+                try:
+                    if name == ONLINE:
+                        from translator.googletrans.translator import GoogleTranslator
+
+                        self._engines[name] = GoogleTranslator(use_memory=self._use_memory)
+                    else:
+                        from translator.argos.translator import ArgosTranslator
+
+                        self._engines[name] = ArgosTranslator(use_memory=self._use_memory)
+                except Exception as e:
+                    print(f"[ERROR] {name} engine unavailable: {e}")
+                    self._unavailable.add(name)
+                    return None
+            if self._forks is None:
+                return self._engines[name]
+            fork = self._forks[name] = self._engines[name].spawn()
+            return fork
+
+    @staticmethod
+    def _no_engine_error(error: Optional[Exception]) -> Exception:
+        if error is not None:
+            return error
+        return RuntimeError("No translation engine is available.")
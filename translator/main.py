@@ -1,6 +1,6 @@
 import sys
 import asyncio
-from translator.translator_factory import get_translator
+from translator.translator_factory import aget_translator
 
 
 async def main() -> None:
@@ -11,7 +11,7 @@ async def main() -> None:
         text: str - Text to be translated
         source_lang: str - Source language code (e.g., 'en')
         target_lang: str - Target language code (e.g., 'pt')
-        mode: str - Translation mode ('auto', 'online', or 'offline')
+        mode: str - Translation mode ('auto', 'online', 'offline' or 'hybrid')
     
     Example:
         - python -m translator.main "hello world" en pt auto
@@ -28,14 +28,10 @@ async def main() -> None:
     target_lang = sys.argv[3]
     mode = sys.argv[4] if len(sys.argv) > 4 else "auto"
 
-    translator = get_translator(mode=mode)
+    translator = await aget_translator(mode=mode)
 
-    # Suporte tanto para métodos assíncronos quanto síncronos
     try:
-        if hasattr(translator.translate, "__call__") and asyncio.iscoroutinefunction(translator.translate):
-            translated_text = await translator.translate(text, source_lang, target_lang)
-        else:
-            translated_text = translator.translate(text, source_lang, target_lang)
+        translated_text = await translator.atranslate(text, source_lang, target_lang)
 
         print(f"\n[Translated Text]\n{translated_text}")
     except Exception as e:
@@ -0,0 +1,373 @@
+"""
+HTTP service mode: one resident process serving translations to many clients.
+
+Run it with `python -m translator.server [--mode offline] [--port 8080]`. The
+engine is created once at startup (Argos models and Google clients are loaded
+a single time per node) and shared by every request.
+
+Endpoints (JSON in, JSON out):
+    POST /translate  {"text", "source_lang", "target_lang"} or {"text", "source_lang", "targets"}
+    POST /batch      {"texts", "source_lang", "target_lang"}
+    POST /json       {"data", "source_lang", "target_lang", "include_paths", "exclude_paths"}
+    POST /detect     {"text"} or {"texts"}
+    GET  /health     engine, load and draining state
+    GET  /metrics    pipeline metrics in the Prometheus text format
+
+Malformed requests and languages outside `SUPPORTED_LANGUAGES` are answered
+with 400; failures of the engine itself with 502, or 503 and a Retry-After
+header when the upstream service is throttling or unreachable.
+
+At most `max_concurrency` requests run at a time and up to `max_queue` more
+wait for a slot; beyond that, or after waiting `queue_timeout` seconds, the
+server answers 503 with a Retry-After header so clients back off instead of
+piling up. On SIGINT/SIGTERM it stops accepting connections, reports itself as
+draining on /health and lets in-flight requests finish before closing the
+engine.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+from aiohttp import web
+
+from translator.BaseTranslator import BaseTranslator
+from translator.config import (
+    SERVER_HOST,
+    SERVER_MAX_BODY_BYTES,
+    SERVER_MAX_CONCURRENCY,
+    SERVER_MAX_QUEUE,
+    SERVER_MODE,
+    SERVER_PORT,
+    SERVER_QUEUE_TIMEOUT,
+    SERVER_SHUTDOWN_TIMEOUT,
+    SUPPORTED_LANGUAGES,
+)
+from translator.translator_factory import aget_translator
+from translator.utils.metrics import get_metrics
+from translator.utils.rate_limiter import is_throttling_error
+
+# Endpoints answered even when the server is saturated
+_UNLIMITED_PATHS = ("/health", "/metrics")
+
+
+class ServiceUnavailable(Exception):
+    """Raised when a request cannot get an execution slot."""
+
+
+class BadRequest(Exception):
+    """Raised when a request is malformed or asks for an unsupported language."""
+
+
+class EngineError(Exception):
+    """Raised when the engine fails to serve a valid request."""
+
+
+class AdmissionController:
+    """Bounds the requests running at once and the requests waiting for a slot."""
+
+    def __init__(self, max_concurrency: int = SERVER_MAX_CONCURRENCY,
+                 max_queue: int = SERVER_MAX_QUEUE,
+                 queue_timeout: float = SERVER_QUEUE_TIMEOUT):
+        """
+        Args:
+            max_concurrency (int): Requests processed at the same time.
+            max_queue (int): Requests allowed to wait for a slot (0 rejects as soon
+                as every slot is busy).
+            queue_timeout (float): Seconds a request may wait for a slot.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.draining = False
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def acquire(self) -> None:
+        """
+        Waits for an execution slot.
+
+        Raises:
+            ServiceUnavailable: If the server is draining, the queue is full or the
+                wait exceeds `queue_timeout`.
+        """
+        if self.draining:
+            raise self._reject("Server is shutting down.")
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            raise self._reject("Server is at capacity.")
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("Timed out waiting for a free slot.")
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Frees the slot taken by `acquire()`."""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def _reject(self, reason: str) -> ServiceUnavailable:
+        self.rejected += 1
+        return ServiceUnavailable(reason)
+
+    def as_dict(self) -> dict:
+        """Returns the current load."""
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+        }
+
+
+TRANSLATOR_KEY = web.AppKey("translator", BaseTranslator)
+LIMITER_KEY = web.AppKey("limiter", AdmissionController)
+
+
+def _error(status: int, message: str, **headers) -> web.Response:
+    return web.json_response({"error": message}, status=status, headers=headers or None)
+
+
+@web.middleware
+async def _admission_middleware(request: web.Request, handler):
+    """Applies the admission control and maps exceptions to JSON errors."""
+    if request.path in _UNLIMITED_PATHS:
+        return await handler(request)
+    limiter: AdmissionController = request.app[LIMITER_KEY]
+    try:
+        await limiter.acquire()
+    except ServiceUnavailable as e:
+        return _error(503, str(e), **{"Retry-After": "1"})
+    try:
+        return await handler(request)
+    except web.HTTPException:
+        raise
+    except BadRequest as e:
+        return _error(400, str(e))
+    except Exception as e:
+        print(f"[ERROR] {request.method} {request.path} failed: {e}")
+        if is_throttling_error(e) or isinstance(e, ConnectionError):
+            return _error(503, str(e), **{"Retry-After": "1"})
+        return _error(502, str(e))
+    finally:
+        limiter.release()
+
+
+async def _read_json(request: web.Request) -> dict:
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise BadRequest("The request body must be valid JSON.")
+    if not isinstance(payload, dict):
+        raise BadRequest("The request body must be a JSON object.")
+    return payload
+
+
+def _require(payload: dict, *fields: str) -> List:
+    missing = [field for field in fields if payload.get(field) in (None, "")]
+    if missing:
+        raise BadRequest(f"Missing field(s): {', '.join(missing)}.")
+    return [payload[field] for field in fields]
+
+
+def _paths(payload: dict, field: str) -> Optional[List[str]]:
+    """Validates an optional list of path patterns from the request."""
+    value = payload.get(field)
+    if value is None:
+        return None
+    if not isinstance(value, list) or not all(isinstance(path, str) for path in value):
+        raise BadRequest(f"'{field}' must be a list of strings.")
+    return value
+
+
+def _language(value, field: str, allow_auto: bool = False) -> str:
+    """Validates a language code from the request against `SUPPORTED_LANGUAGES`."""
+    if allow_auto and value == BaseTranslator.AUTO_LANGUAGE:
+        return value
+    if not isinstance(value, str) or value not in SUPPORTED_LANGUAGES:
+        raise BadRequest(f"Unsupported language in '{field}': {value!r}.")
+    return value
+
+
+async def handle_translate(request: web.Request) -> web.Response:
+    """Translates one text into one target, or into several with "targets"."""
+    translator = request.app[TRANSLATOR_KEY]
+    payload = await _read_json(request)
+    text, source_lang = _require(payload, "text", "source_lang")
+    source_lang = _language(source_lang, "source_lang", allow_auto=True)
+    if payload.get("targets"):
+        if not isinstance(payload["targets"], list):
+            raise BadRequest("'targets' must be a list of language codes.")
+        targets = [_language(target, "targets") for target in payload["targets"]]
+        translations = await asyncio.to_thread(translator.translate_to_many, text, source_lang, targets)
+        return web.json_response({"translations": translations})
+    (target_lang,) = _require(payload, "target_lang")
+    target_lang = _language(target_lang, "target_lang")
+    translation = await translator.atranslate(text, source_lang, target_lang)
+    if translation == translator.FAILED_TRANSLATION:
+        raise EngineError("The engine failed to translate the text.")
+    return web.json_response({"translation": translation})
+
+
+async def handle_batch(request: web.Request) -> web.Response:
+    """Translates a list of texts with one engine dispatch, reporting failures per item."""
+    translator = request.app[TRANSLATOR_KEY]
+    payload = await _read_json(request)
+    texts, source_lang, target_lang = _require(payload, "texts", "source_lang", "target_lang")
+    if not isinstance(texts, list):
+        raise BadRequest("'texts' must be a list of strings.")
+    source_lang = _language(source_lang, "source_lang", allow_auto=True)
+    target_lang = _language(target_lang, "target_lang")
+    result = await asyncio.to_thread(translator.translate_many, texts, source_lang, target_lang)
+    return web.json_response({
+        "translations": result.translations,
+        "errors": {str(index): str(error) for index, error in result.errors.items()},
+    })
+
+
+async def handle_json(request: web.Request) -> web.Response:
+    """Translates the string values of a JSON document."""
+    translator = request.app[TRANSLATOR_KEY]
+    payload = await _read_json(request)
+    data, source_lang, target_lang = _require(payload, "data", "source_lang", "target_lang")
+    if not isinstance(data, (dict, list)):
+        raise BadRequest("'data' must be a JSON object or array.")
+    source_lang = _language(source_lang, "source_lang", allow_auto=True)
+    target_lang = _language(target_lang, "target_lang")
+    include_paths = _paths(payload, "include_paths")
+    exclude_paths = _paths(payload, "exclude_paths")
+    translated = await asyncio.to_thread(
+        translator.translate_json, data, source_lang, target_lang, include_paths, exclude_paths,
+    )
+    return web.json_response({"data": translated})
+
+
+async def handle_detect(request: web.Request) -> web.Response:
+    """Detects the language of one text ("text") or of several ("texts")."""
+    translator = request.app[TRANSLATOR_KEY]
+    payload = await _read_json(request)
+    if isinstance(payload.get("texts"), list):
+        languages = await asyncio.gather(*(translator.adetect_language(text) for text in payload["texts"]))
+        if None in languages:
+            raise EngineError("The engine failed to detect the language.")
+        return web.json_response({"languages": list(languages)})
+    (text,) = _require(payload, "text")
+    language = await translator.adetect_language(text)
+    if language is None:
+        raise EngineError("The engine failed to detect the language.")
+    return web.json_response({"language": language})
+
+
+async def handle_health(request: web.Request) -> web.Response:
+    """Reports the engine and the current load (503 while draining)."""
+    limiter: AdmissionController = request.app[LIMITER_KEY]
+    translator = request.app.get(TRANSLATOR_KEY)
+    body = {
+        "status": "draining" if limiter.draining else "ok",
+        "engine": getattr(translator, "ENGINE_NAME", None),
+        **limiter.as_dict(),
+    }
+    if hasattr(translator, "stats"):
+        body["engines"] = translator.stats()
+    return web.json_response(body, status=503 if limiter.draining else 200)
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    """Exposes the pipeline metrics in the Prometheus text format."""
+    return web.Response(
+        text=get_metrics().render_prometheus(),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+def create_app(
+    translator: Optional[BaseTranslator] = None,
+    mode: str = SERVER_MODE,
+    max_concurrency: int = SERVER_MAX_CONCURRENCY,
+    max_queue: int = SERVER_MAX_QUEUE,
+    queue_timeout: float = SERVER_QUEUE_TIMEOUT,
+    max_body_bytes: int = SERVER_MAX_BODY_BYTES,
+) -> web.Application:
+    """
+    Builds the aiohttp application.
+
+    Args:
+        translator (Optional[BaseTranslator]): Engine serving the requests; if None,
+            one is created for `mode` when the server starts.
+        mode (str): Translation mode used when no translator is given
+            ('auto', 'online', 'offline' or 'hybrid').
+        max_concurrency (int): Requests processed at the same time.
+        max_queue (int): Requests allowed to wait for a slot before 503 responses.
+        queue_timeout (float): Seconds a request may wait for a slot.
+        max_body_bytes (int): Largest accepted request body.
+
+    Returns:
+        web.Application: The application, ready for `web.run_app()`.
+    """
+    app = web.Application(middlewares=[_admission_middleware], client_max_size=max_body_bytes)
+    app[LIMITER_KEY] = AdmissionController(max_concurrency, max_queue, queue_timeout)
+
+    async def start_engine(app: web.Application) -> None:
+        if translator is not None:
+            app[TRANSLATOR_KEY] = translator
+            return
+        engine = await aget_translator(mode=mode)
+        app[TRANSLATOR_KEY] = engine
+        print(f"[INFO] Serving translations with the {engine.ENGINE_NAME} engine.")
+
+    async def start_draining(app: web.Application) -> None:
+        app[LIMITER_KEY].draining = True
+
+    async def close_engine(app: web.Application) -> None:
+        engine = app.get(TRANSLATOR_KEY)
+        if translator is None and hasattr(engine, "close"):
+            await asyncio.to_thread(engine.close)
+
+    app.on_startup.append(start_engine)
+    app.on_shutdown.append(start_draining)
+    app.on_cleanup.append(close_engine)
+
+    app.router.add_post("/translate", handle_translate)
+    app.router.add_post("/batch", handle_batch)
+    app.router.add_post("/json", handle_json)
+    app.router.add_post("/detect", handle_detect)
+    app.router.add_get("/health", handle_health)
+    app.router.add_get("/metrics", handle_metrics)
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point: `python -m translator.server`."""
+    parser = argparse.ArgumentParser(description="Serve translations over HTTP.")
+    parser.add_argument("--host", default=SERVER_HOST, help="address to bind")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="port to listen on")
+    parser.add_argument("--mode", default=SERVER_MODE, help="auto, online, offline or hybrid")
+    parser.add_argument("--max-concurrency", type=int, default=SERVER_MAX_CONCURRENCY,
+                        help="requests processed at the same time")
+    parser.add_argument("--max-queue", type=int, default=SERVER_MAX_QUEUE,
+                        help="requests waiting for a slot before 503 responses")
+    parser.add_argument("--queue-timeout", type=float, default=SERVER_QUEUE_TIMEOUT,
+                        help="seconds a request may wait for a slot")
+    parser.add_argument("--shutdown-timeout", type=float, default=SERVER_SHUTDOWN_TIMEOUT,
+                        help="seconds granted to in-flight requests on shutdown")
+    args = parser.parse_args(argv)
+
+    app = create_app(
+        mode=args.mode,
+        max_concurrency=args.max_concurrency,
+        max_queue=args.max_queue,
+        queue_timeout=args.queue_timeout,
+    )
+    web.run_app(app, host=args.host, port=args.port, shutdown_timeout=args.shutdown_timeout,
+                print=lambda message: print(f"[INFO] {message}"))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,10 +1,14 @@
 """A factory for creating translator instances based on the selected mode."""
 
+import asyncio
+import importlib
+import itertools
+import threading
 from enum import StrEnum
-from translator.googletrans.translator import GoogleTranslator
-from translator.argos.translator import ArgosTranslator
+from typing import Dict, Iterator, List, Tuple, Type
 from translator.BaseTranslator import BaseTranslator
-from translator.utils.network import is_connected
+from translator.config import TRANSLATOR_POOL_SIZE
+from translator.utils.network import get_connectivity_probe
 
 
 class Typetranslator(StrEnum):
@@ -16,32 +20,102 @@ class Typetranslator(StrEnum):
     - `OFFLINE`: Argos Translate (offline)
     - `AUTO`: Automatically selects the translator based on internet \
         connection status.
+    - `HYBRID`: Routes every request between online and offline, failing \
+        over when Google degrades.
     """
 
     ONLINE = "online"
     OFFLINE = "offline"
     AUTO = "auto"
+    HYBRID = "hybrid"
+
+
+# Engines are imported on first use so each mode only pays for its own backend
+_ENGINES = {
+    Typetranslator.ONLINE: ("translator.googletrans.translator", "GoogleTranslator"),
+    Typetranslator.OFFLINE: ("translator.argos.translator", "ArgosTranslator"),
+    Typetranslator.HYBRID: ("translator.hybrid.translator", "HybridTranslator"),
+}
+
+
+def _load_engine(mode: Typetranslator) -> Type[BaseTranslator]:
+    """Imports and returns the translator class for a (resolved) mode."""
+    module_name, class_name = _ENGINES[mode]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+_pool: Dict[Tuple, Tuple[List[BaseTranslator], Iterator[int]]] = {}
+_pool_lock = threading.Lock()
 
 
 def get_translator(
-        mode: Typetranslator = Typetranslator.AUTO) -> BaseTranslator:
+        mode: Typetranslator = Typetranslator.AUTO,
+        reuse: bool = True,
+        pool_size: int = TRANSLATOR_POOL_SIZE,
+        **settings) -> BaseTranslator:
     """
     Returns a translator instance based on the selected mode.
     - `Typetranslator.ONLINE`: uses Google Translate
     - `Typetranslator.OFFLINE`: uses Argos Translate
     - `Typetranslator.AUT`: checks internet connection and selects accordingly
+    - `Typetranslator.HYBRID`: routes per request with a circuit breaker
+
+    Fully initialized instances are pooled per mode and settings, and every call
+    returns a fresh `spawn()` of one of them (round-robin): a lightweight
+    translator sharing the pooled backend (googletrans clients and transport,
+    worker pools, Argos models) but with its own per-call state, so keywords,
+    texts and languages never leak between callers. In AUTO mode the
+    connectivity check is cached and refreshed in the background
+    (`CONNECTIVITY_CACHE_TTL`), so repeated calls do not touch the network.
+
+    Args:
+        mode (Typetranslator): Translation mode.
+        reuse (bool): Whether to share the pooled backend (False builds a fully
+            independent instance).
+        pool_size (int): Number of instances kept per mode and settings.
+        **settings: Keyword arguments forwarded to the translator constructor
+            (e.g., `max_concurrency=16`, `workers=4`). Unhashable values (such
+            as lists) cannot key the pool, so those calls build an independent
+            instance, as with `reuse=False`.
     """
-    if mode == Typetranslator.ONLINE:
-        return GoogleTranslator()
-    if mode == Typetranslator.OFFLINE:
-        return ArgosTranslator()
+    if mode not in list(Typetranslator):
+        raise ValueError(f"Invalid mode: {mode}")
+
     if mode == Typetranslator.AUTO:
-        if is_connected():
-            print(
-                "[INFO] Internet connection detected. Using GoogleTranslator (online)."
-            )
-            return GoogleTranslator()
-        print("[INFO] No internet connection. Using ArgosTranslator (offline).")
-        return ArgosTranslator()
-
-    raise ValueError(f"Invalid mode: {mode}")
+        connected = get_connectivity_probe().is_connected()
+        mode = Typetranslator.ONLINE if connected else Typetranslator.OFFLINE
+
+    engine = _load_engine(Typetranslator(mode))
+    if not reuse:
+        return engine(**settings)
+
+    key = (engine, tuple(sorted(settings.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable settings (e.g., a list of proxies) cannot key the pool
+        return engine(**settings)
+    with _pool_lock:
+        if key not in _pool:
+            instances = [engine(**settings) for _ in range(max(1, pool_size))]
+            _pool[key] = (instances, itertools.cycle(range(len(instances))))
+        instances, cursor = _pool[key]
+        prototype = instances[next(cursor)]
+    return prototype.spawn()
+
+
+def clear_translator_pool() -> None:
+    """Drops every pooled translator instance."""
+    with _pool_lock:
+        _pool.clear()
+
+
+async def aget_translator(
+        mode: Typetranslator = Typetranslator.AUTO, **kwargs) -> BaseTranslator:
+    """
+    Async-aware version of `get_translator()`.
+
+    The connectivity check and the engine construction (loading Argos models,
+    creating HTTP clients) are blocking, so they run in the default executor.
+    """
+    return await asyncio.to_thread(get_translator, mode, **kwargs)
@@ -12,7 +12,11 @@ from .handletext import (
     define_keywords,
     extract_keywords
 )
-from .network import is_connected
+from .langdetect import UNDETERMINED, LanguageDetector, detect_language, get_language_detector
+from .log_sink import TranslationLogSink, get_log_sink
+from .metrics import MetricsRegistry, get_metrics, start_metrics_server
+from .network import ConnectivityProbe, get_connectivity_probe, is_connected
+from .translation_memory import TranslationMemory, get_translation_memory
 
 __all__ = [
     "read_file",
@@ -21,7 +25,20 @@ __all__ = [
     "restore_keywords",
     "normalize_text",
     "log_translation",
+    "LanguageDetector",
+    "UNDETERMINED",
+    "detect_language",
+    "get_language_detector",
+    "TranslationLogSink",
+    "get_log_sink",
     "is_connected",
+    "ConnectivityProbe",
+    "get_connectivity_probe",
     "define_keywords",
-    "extract_keywords"
+    "extract_keywords",
+    "MetricsRegistry",
+    "get_metrics",
+    "start_metrics_server",
+    "TranslationMemory",
+    "get_translation_memory",
 ]
@@ -1,6 +1,43 @@
+"""
+Installation of Argos Translate models.
+
+Packages are indexed by language pair and diffed against the installed pairs,
+so only what is missing is fetched. Downloads run in parallel, resume from
+partial `.part` files (HTTP Range) and are verified (SHA-256 when the index or a
+`SHA256SUMS` file provides one, and the zip CRCs always) before installation.
+The package index is only refreshed when it is missing or stale, and models can
+be installed from a local directory of `.argosmodel` files on air-gapped nodes.
+"""
+
+import hashlib
+import itertools
+import json
 import os
-from argostranslate import package, translate
-from translator.config import SUPPORTED_LANGUAGES
+import shutil
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from argostranslate import package, settings
+from translator.config import (
+    ARGOS_DOWNLOAD_TIMEOUT,
+    ARGOS_INDEX_MAX_AGE,
+    ARGOS_INSTALL_WORKERS,
+    SUPPORTED_LANGUAGES,
+)
+
+Pair = Tuple[str, str]
+
+
+def _refresh_language_registry() -> None:
+    """Makes running ArgosTranslator instances pick up installed/removed models."""
+    # Imported here: translator.argos imports this module at package load
+    from translator.argos.registry import invalidate_language_registry
+
+    invalidate_language_registry()
 
 
 def install_argos_model(model_path: str) -> bool:
@@ -18,6 +55,7 @@ def install_argos_model(model_path: str) -> bool:
         return False
     try:
         package.install_from_path(model_path)
+        _refresh_language_registry()
         print(f"[INFO] Model installed successfully: {model_path}")
         return True
     except Exception as e:
@@ -37,6 +75,7 @@ def uninstall_argos_model(model_name: str) -> bool:
     """
     try:
         package.uninstall(model_name)
+        _refresh_language_registry()
         print(f"[INFO] Model uninstalled successfully: {model_name}")
         return True
     except Exception as e:
@@ -69,36 +108,358 @@ def update_argos_package_index() -> None:
     package.update_package_index()
 
 
+def _version_key(version: str) -> tuple:
+    return tuple(int(part) if part.isdigit() else 0 for part in str(version or "0").split("."))
+
+
+def _index_is_stale(max_age: float) -> bool:
+    path = str(settings.local_package_index)
+    return not os.path.exists(path) or time.time() - os.path.getmtime(path) > max_age
+
+
+def load_package_index(update: Optional[bool] = None, max_age: float = ARGOS_INDEX_MAX_AGE) -> Dict[Pair, dict]:
+    """
+    Loads the package index keyed by (from_code, to_code), newest version per pair.
+
+    Args:
+        update (Optional[bool]): True forces a refresh of the remote index, False never
+            refreshes, None (default) refreshes only if the cached copy is missing
+            or older than `max_age`.
+        max_age (float): Maximum age in seconds of the cached index.
+
+    Returns:
+        Dict[Pair, dict]: The package metadata (as in the index) for each pair. Sentence
+            boundary ("sbd") packages are keyed by ("sbd", from_code).
+    """
+    if update or (update is None and _index_is_stale(max_age)):
+        print("[INFO] Updating Argos Translate package index...")
+        update_argos_package_index()
+
+    try:
+        with open(settings.local_package_index, encoding="utf-8") as index_file:
+            entries = json.load(index_file)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Argos package index unavailable: {e}")
+        return {}
+
+    index: Dict[Pair, dict] = {}
+    for metadata in entries:
+        pkg_type = metadata.get("type", "translate")
+        if pkg_type == "translate":
+            key = (metadata.get("from_code"), metadata.get("to_code"))
+        elif pkg_type == "sbd":
+            key = ("sbd", metadata.get("from_code"))
+        else:
+            continue
+        current = index.get(key)
+        if current is None or _version_key(metadata.get("package_version")) > _version_key(
+            current.get("package_version")
+        ):
+            index[key] = metadata
+    return index
+
+
+def get_installed_pairs() -> Set[Pair]:
+    """
+    Returns the language pairs of the installed translation packages.
+
+    Returns:
+        Set[Pair]: The installed (from_code, to_code) pairs.
+    """
+    return {
+        (pkg.from_code, pkg.to_code)
+        for pkg in package.get_installed_packages()
+        if getattr(pkg, "type", "translate") == "translate"
+    }
+
+
+def wanted_pairs(languages: Iterable[str]) -> List[Pair]:
+    """
+    Returns every ordered pair of distinct languages.
+
+    Args:
+        languages (Iterable[str]): Language codes (e.g., SUPPORTED_LANGUAGES).
+
+    Returns:
+        List[Pair]: The (from_code, to_code) pairs.
+    """
+    return [(src, tgt) for src, tgt in itertools.permutations(dict.fromkeys(languages), 2)]
+
+
+def plan_installation(
+    languages: Iterable[str], index: Dict[Pair, dict], installed: Optional[Set[Pair]] = None
+) -> List[dict]:
+    """
+    Lists the packages to install so every available pair between `languages` is present.
+
+    Args:
+        languages (Iterable[str]): Language codes to support.
+        index (Dict[Pair, dict]): Package index from `load_package_index()`.
+        installed (Optional[Set[Pair]]): Installed pairs (read from disk if None).
+
+    Returns:
+        List[dict]: Metadata of the missing packages (plus sentence boundary packages
+            when stanza is unavailable and none is installed).
+    """
+    installed = get_installed_pairs() if installed is None else installed
+    plan = [index[pair] for pair in wanted_pairs(languages) if pair in index and pair not in installed]
+
+    if plan and not getattr(settings, "stanza_available", True):
+        has_sbd = any(getattr(pkg, "type", "") == "sbd" for pkg in package.get_installed_packages())
+        if not has_sbd:
+            plan += [metadata for key, metadata in index.items() if key[0] == "sbd"]
+    return plan
+
+
+def package_filename(metadata: dict) -> str:
+    """Returns the argospm file name of a package (e.g., 'translate-en_pt.argosmodel')."""
+    name = metadata.get("type", "translate")
+    if metadata.get("from_code") and metadata.get("to_code"):
+        name += f"-{metadata['from_code']}_{metadata['to_code']}"
+    return name + ".argosmodel"
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def verify_model(path: str, sha256: Optional[str] = None) -> None:
+    """
+    Verifies an .argosmodel file before installation.
+
+    Args:
+        path (str): Path to the file.
+        sha256 (Optional[str]): Expected SHA-256 hex digest, if known.
+
+    Raises:
+        ValueError: If the digest does not match, the archive is corrupt, or it is
+            not an Argos package.
+    """
+    if sha256 and _sha256(path) != sha256.lower():
+        raise ValueError(f"Checksum mismatch for {path}")
+    if not zipfile.is_zipfile(path):
+        raise ValueError(f"Not a valid Argos model (must be a zip archive): {path}")
+    with zipfile.ZipFile(path) as archive:
+        corrupt = archive.testzip()
+        if corrupt is not None:
+            raise ValueError(f"Corrupt member {corrupt} in {path}")
+        if not any(name.endswith("metadata.json") for name in archive.namelist()):
+            raise ValueError(f"No metadata.json in {path}")
+
+
+def read_model_metadata(path: str) -> dict:
+    """
+    Reads the metadata.json of an .argosmodel file without extracting it.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        dict: The package metadata.
+    """
+    with zipfile.ZipFile(path) as archive:
+        name = min(
+            (name for name in archive.namelist() if name.endswith("metadata.json")),
+            key=lambda name: name.count("/"),
+        )
+        return json.loads(archive.read(name))
+
+
+def download_model(
+    metadata: dict,
+    directory: Optional[str] = None,
+    timeout: float = ARGOS_DOWNLOAD_TIMEOUT,
+    chunk_size: int = 1024 * 1024,
+) -> str:
+    """
+    Downloads (resuming any partial download) and verifies a package.
+
+    Args:
+        metadata (dict): Package metadata from the index (uses `links` and an optional
+            `sha256`/`checksum`).
+        directory (Optional[str]): Download directory (defaults to the Argos downloads dir).
+        timeout (float): Socket timeout in seconds.
+        chunk_size (int): Read size in bytes.
+
+    Returns:
+        str: Path to the verified .argosmodel file.
+
+    Raises:
+        ValueError: If no link works or the file fails verification.
+    """
+    directory = str(directory or settings.downloads_dir)
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.join(directory, package_filename(metadata))
+    expected = metadata.get("sha256") or metadata.get("checksum")
+
+    if os.path.exists(target):
+        try:
+            verify_model(target, expected)
+            return target
+        except ValueError:
+            os.remove(target)
+
+    partial = target + ".part"
+    last_error: Optional[Exception] = None
+    for url in metadata.get("links", []):
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as response:
+                # A server ignoring the Range header sends the whole file again
+                mode = "ab" if offset and response.status == 206 else "wb"
+                with open(partial, mode) as file:
+                    shutil.copyfileobj(response, file, chunk_size)
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                # Range not satisfiable: the partial file is already complete
+                break
+            last_error = e
+        except (urllib.error.URLError, OSError) as e:
+            last_error = e
+    else:
+        raise ValueError(f"Download failed for {package_filename(metadata)}: {last_error}")
+
+    try:
+        verify_model(partial, expected)
+    except ValueError:
+        os.remove(partial)
+        raise
+    os.replace(partial, target)
+    return target
+
+
+def install_packages(packages: List[dict], workers: int = ARGOS_INSTALL_WORKERS, keep_downloads: bool = False) -> int:
+    """
+    Downloads and installs packages in parallel.
+
+    Args:
+        packages (List[dict]): Package metadata from the index.
+        workers (int): Number of concurrent downloads.
+        keep_downloads (bool): Keep the downloaded files after installation.
+
+    Returns:
+        int: Number of packages installed.
+    """
+    def fetch_and_install(metadata: dict) -> bool:
+        name = package_filename(metadata)
+        try:
+            path = download_model(metadata)
+            package.install_from_path(path)
+            if not keep_downloads:
+                os.remove(path)
+            print(f"[INFO] Installed model: {metadata.get('from_code')} → {metadata.get('to_code')}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Failed to install {name}: {e}")
+            return False
+
+    if not packages:
+        return 0
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="argos-install") as executor:
+        installed = sum(executor.map(fetch_and_install, packages))
+    if installed:
+        _refresh_language_registry()
+    return installed
+
+
 def install_language_models(
-    supported_languages: dict,
-) -> None:  # wtf is pylance yapping about
-    """Installs Argos Translate language models for the specified language codes.
+    supported_languages: Iterable[str],
+    workers: int = ARGOS_INSTALL_WORKERS,
+    update_index: Optional[bool] = None,
+) -> int:
+    """Installs the missing Argos Translate models between the given languages.
+
+    Args:
+        supported_languages (Iterable[str]): Language codes (a dict of code to name works too).
+        workers (int): Number of concurrent downloads.
+        update_index (Optional[bool]): See `load_package_index()`.
+
+    Returns:
+        int: Number of models installed.
+    """
+    index = load_package_index(update=update_index)
+    return install_packages(plan_installation(list(supported_languages), index), workers=workers)
+
+
+def install_from_directory(
+    directory: str,
+    languages: Optional[Iterable[str]] = None,
+    workers: int = ARGOS_INSTALL_WORKERS,
+) -> int:
+    """
+    Installs the missing models found in a local directory of .argosmodel files
+    (e.g., a mirror copied to an air-gapped node). No network access is needed.
+
+    A `SHA256SUMS` file in the directory (`<digest>  <file name>` lines), if
+    present, is used to verify the files.
+
     Args:
-        supported_languages (dict): A dictionary mapping language codes to language names.
-    """
-    # Update the package index to get the latest models
-    update_argos_package_index()
-    # Get the list of available models
-    available_packages = get_available_argos_models()
-
-    for from_code in supported_languages:
-        for to_code in supported_languages:
-            if from_code != to_code:
-                # Find the package for the specified languages
-                package_to_install = next(
-                    (
-                        pkg
-                        for pkg in available_packages
-                        if pkg.from_code == from_code and pkg.to_code == to_code
-                    ),
-                    None,
-                )
-                if package_to_install:
-                    # Download and install the package
-                    install_argos_model(package_to_install.download())
-                    print(
-                        f"Installed translation model from {supported_languages[from_code]} to {supported_languages[to_code]}"
-                    )
+        directory (str): Directory containing .argosmodel files.
+        languages (Optional[Iterable[str]]): Only install pairs between these
+            languages (all files if None).
+        workers (int): Number of files verified in parallel.
+
+    Returns:
+        int: Number of models installed.
+    """
+    checksums = _read_checksums(os.path.join(directory, "SHA256SUMS"))
+    paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".argosmodel")
+    )
+    allowed = set(wanted_pairs(languages)) if languages is not None else None
+    installed_packages = package.get_installed_packages()
+    installed = {
+        (pkg.from_code, pkg.to_code) for pkg in installed_packages if getattr(pkg, "type", "translate") == "translate"
+    }
+    installed_sbd = {pkg.from_code for pkg in installed_packages if getattr(pkg, "type", "") == "sbd"}
+
+    def check(path: str) -> Optional[str]:
+        try:
+            verify_model(path, checksums.get(os.path.basename(path)))
+            metadata = read_model_metadata(path)
+        except (ValueError, OSError, KeyError) as e:
+            print(f"[ERROR] Skipping {path}: {e}")
+            return None
+        pkg_type = metadata.get("type", "translate")
+        pair = (metadata.get("from_code"), metadata.get("to_code"))
+        if pkg_type == "translate" and (pair in installed or (allowed is not None and pair not in allowed)):
+            return None
+        if pkg_type == "sbd" and metadata.get("from_code") in installed_sbd:
+            return None
+        return path
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="argos-verify") as executor:
+        selected = [path for path in executor.map(check, paths) if path is not None]
+
+    count = 0
+    for path in selected:
+        try:
+            package.install_from_path(path)
+            count += 1
+            print(f"[INFO] Model installed successfully: {path}")
+        except Exception as e:
+            print(f"[ERROR] Failed to install model {path}: {e}")
+    if count:
+        _refresh_language_registry()
+    return count
+
+
+def _read_checksums(path: str) -> Dict[str, str]:
+    if not os.path.exists(path):
+        return {}
+    checksums = {}
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 2:
+                checksums[parts[1].lstrip("*")] = parts[0].lower()
+    return checksums
 
 
 def install_languages_from_config() -> None:
@@ -106,24 +467,36 @@ def install_languages_from_config() -> None:
     Install Argos Translate language models based on the supported languages
     defined in the configuration file.
     """
-    print("Updating Argos Translate package index...")
-    package.update_package_index()
+    total_installed = install_language_models(SUPPORTED_LANGUAGES)
+    if total_installed == 0:
+        print("All required Argos models are already installed.")
+    else:
+        print(f"Installed {total_installed} model(s).")
 
-    available_packages = package.get_available_packages()
-    installed_codes = [lang.code for lang in translate.get_installed_languages()]
-    total_installed = 0
 
-    for pkg in available_packages:
-        from_code = pkg.from_code
-        to_code = pkg.to_code
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: `python -m translator.utils.argos_installer`."""
+    import argparse
 
-        if from_code in SUPPORTED_LANGUAGES and to_code in SUPPORTED_LANGUAGES:
-            if from_code not in installed_codes or to_code not in installed_codes:
-                print(f"Installing model: {from_code} → {to_code}")
-                package.install_from_path(pkg.download())
-                total_installed += 1
+    parser = argparse.ArgumentParser(description="Install the Argos Translate models used by hybridtrans.")
+    parser.add_argument("--from-dir", help="install from a directory of .argosmodel files (offline)")
+    parser.add_argument("--languages", help="comma-separated language codes (default: SUPPORTED_LANGUAGES)")
+    parser.add_argument("--workers", type=int, default=ARGOS_INSTALL_WORKERS, help="parallel downloads")
+    parser.add_argument("--update-index", action="store_true", help="force a package index refresh")
+    args = parser.parse_args(argv)
 
+    languages = args.languages.split(",") if args.languages else list(SUPPORTED_LANGUAGES)
+    if args.from_dir:
+        total_installed = install_from_directory(args.from_dir, languages, workers=args.workers)
+    else:
+        total_installed = install_language_models(
+            languages, workers=args.workers, update_index=True if args.update_index else None
+        )
     if total_installed == 0:
         print("All required Argos models are already installed.")
     else:
         print(f"Installed {total_installed} model(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,13 @@
 
 import json
 import re
-from typing import List, Literal
-from textblob import TextBlob
+import textwrap
+from itertools import islice
+from typing import IO, Iterator, List, Literal, Optional, Tuple
+from translator.config import FILE_MAX_PARAGRAPH_CHARS, SEGMENTER_BACKEND
+from translator.utils.keyword_matcher import get_keyword_matcher
+from translator.utils.log_sink import get_log_sink
+from translator.utils.segmenter import iter_sentences
 
 
 def read_file(file_path: str) -> str:
@@ -20,6 +25,97 @@ def read_file(file_path: str) -> str:
         return file.read()
 
 
+PARAGRAPH_BREAK = "\n\n"
+LINE_BREAK = "\n"
+SENTENCE_BREAK = " "
+
+
+def iter_paragraphs(
+    file: IO[str], max_chars: int = FILE_MAX_PARAGRAPH_CHARS, lang: str = "en"
+) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily reads blank-line separated paragraphs from an open text file.
+
+    Only one paragraph is held in memory at a time; paragraphs longer than
+    `max_chars` are split at line boundaries, and single lines longer than
+    `max_chars` at sentence boundaries, so memory stays bounded. Each piece
+    comes with the separator that followed it in the input, so joining
+    `piece + separator` rebuilds the original layout instead of turning every
+    split into a paragraph break.
+
+    Args:
+        file (IO[str]): File opened in text mode.
+        max_chars (int): Maximum size of a yielded piece.
+        lang (str): Language code used to split long lines into sentences.
+    Yields:
+        Tuple[str, str]: The piece, without surrounding blank lines, and its
+            separator: `PARAGRAPH_BREAK` when it ends a paragraph, `LINE_BREAK`
+            when the paragraph continues on the next line, or `SENTENCE_BREAK`
+            when it continues on the same line.
+    """
+    pending: Optional[Tuple[str, str]] = None
+    for piece in _iter_pieces(file, max_chars, lang):
+        if piece is None:
+            if pending:
+                yield pending[0], PARAGRAPH_BREAK
+            pending = None
+            continue
+        if pending:
+            yield pending
+        pending = piece
+    if pending:
+        yield pending[0], PARAGRAPH_BREAK
+
+
+def _iter_pieces(file: IO[str], max_chars: int, lang: str) -> Iterator[Optional[Tuple[str, str]]]:
+    """Yields (piece, separator) pairs, and None wherever a paragraph ends."""
+    lines: List[str] = []
+    size = 0
+    for line in file:
+        if not line.strip():
+            if lines:
+                yield "".join(lines).rstrip("\n"), LINE_BREAK
+                lines, size = [], 0
+            yield None
+            continue
+        if len(line) > max_chars:
+            if lines:
+                yield "".join(lines).rstrip("\n"), LINE_BREAK
+                lines, size = [], 0
+            pieces = _split_long_line(line.strip(), max_chars, lang)
+            for piece in pieces[:-1]:
+                yield piece, SENTENCE_BREAK
+            yield pieces[-1], LINE_BREAK
+            continue
+        lines.append(line)
+        size += len(line)
+        if size >= max_chars:
+            yield "".join(lines).rstrip("\n"), LINE_BREAK
+            lines, size = [], 0
+    if lines:
+        yield "".join(lines).rstrip("\n"), LINE_BREAK
+
+
+def _split_long_line(line: str, max_chars: int, lang: str) -> List[str]:
+    """Packs the sentences of a line into pieces of at most `max_chars` characters."""
+    pieces: List[str] = []
+    current = ""
+    for sentence in iter_sentences(line, lang):
+        # A single sentence over the limit falls back to word boundaries
+        parts = textwrap.wrap(sentence, max_chars, break_on_hyphens=False) \
+            if len(sentence) > max_chars else [sentence]
+        for part in parts:
+            if current and len(current) + 1 + len(part) <= max_chars:
+                current = f"{current} {part}"
+            else:
+                if current:
+                    pieces.append(current)
+                current = part
+    if current:
+        pieces.append(current)
+    return pieces or [line]
+
+
 # averiguar max_sentences, multithreading em menos sentencas, return com joins
 
 
@@ -41,18 +137,34 @@ def define_keywords(text: str, pattern: str) -> List[str]:
     return list(dict.fromkeys(matches))
 
 
-def segment_text(text: str, max_sentences: int = 100) -> List[str]:
+def segment_text(
+    text: str,
+    max_sentences: Optional[int] = None,
+    lang: str = "en",
+    backend: Literal["rules", "textblob"] = SEGMENTER_BACKEND,
+) -> List[str]:
     """
-    Segments a block of text into a list of sentences using TextBlob.
+    Segments a block of text into a list of sentences.
     Args:
         text (str): Text to be segmented.
-        max_sentences (int): Maximum number of sentences to return.
+        max_sentences (Optional[int]): Maximum number of sentences to return
+            (None, the default, keeps every sentence).
+        lang (str): Language code used for abbreviation handling (e.g., 'en').
+        backend (str): "rules" for the built-in streaming segmenter, or
+            "textblob" to use TextBlob (requires the NLTK punkt corpora).
+            Defaults to `SEGMENTER_BACKEND` from the config.
     Returns:
         List[str]: List of sentences.
     """
-    blob = TextBlob(text)
-    sentences = [str(sentence) for sentence in blob.sentences]
-    return sentences[:max_sentences]
+    if backend == "textblob":
+        from textblob import TextBlob
+
+        sentences = (str(sentence) for sentence in TextBlob(text).sentences)
+    elif backend == "rules":
+        sentences = iter_sentences(text, lang)
+    else:
+        raise ValueError(f"Invalid segmentation backend: {backend}")
+    return list(islice(sentences, max_sentences))
 
 
 # mais liberdade keyword {[]}
@@ -63,6 +175,9 @@ def protect_keywords(text: str, keywords: List[str]) -> str:
     Replaces each keyword with a numbered placeholder: __1__, __2__, etc.
     This prevents them from being translated.
 
+    The text is scanned once with a compiled matcher cached per keyword set;
+    where keywords overlap, the longest one wins.
+
     Args:
         text (str): Original text.
         keywords (List[str]): List of keywords to protect.
@@ -70,10 +185,7 @@ def protect_keywords(text: str, keywords: List[str]) -> str:
     Returns:
         str: Text with protected placeholders.
     """
-    for idx, keyword in enumerate(keywords, start=1):
-        placeholder = f"__{idx}__"
-        text = text.replace(keyword, placeholder)
-    return text
+    return get_keyword_matcher(keywords).protect(text)
 
 
 def restore_keywords(text: str, keywords: List[str]) -> str:
@@ -88,10 +200,7 @@ def restore_keywords(text: str, keywords: List[str]) -> str:
     Returns:
         str: Text with keywords restored.
     """
-    for idx, keyword in enumerate(keywords, start=1):
-        pattern = re.compile(rf"__{idx}__")
-        text = pattern.sub(keyword, text)
-    return text
+    return get_keyword_matcher(keywords).restore(text)
 
 
 # elborar
@@ -114,19 +223,17 @@ def log_translation(
     """
     Appends original and translated text to a log file.
 
+    The record is queued on the shared background sink for `log_path`, which
+    batches, rotates and flushes the file off the calling thread.
+
     Args:
         original_text (str): The original source text.
         translated_text (str): The translated output.
         log_path (str): Path to the log file (default: 'translation_log.txt').
     Returns:
         None
-    Raises:
-        IOError: If there is an issue writing to the log file.
     """
-    with open(log_path, "a", encoding="utf-8") as log_file:
-        log_file.write("Original:\n" + original_text + "\n")
-        log_file.write("Translated:\n" + translated_text + "\n")
-        log_file.write("-" * 40 + "\n")
+    get_log_sink(log_path).write(original_text, translated_text)
 
 
 def json_to_dict(json_string: str) -> dict:
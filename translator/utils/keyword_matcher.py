@@ -0,0 +1,113 @@
+"""
+Compiled keyword matcher used to protect and restore keywords.
+
+All keywords are merged into a single trie-shaped regular expression that is
+built once per keyword set and cached, so protecting a text is one pass over it
+regardless of the glossary size. Optional groups are greedy, which gives
+longest-match semantics: with ["admin", "admin panel"], "admin panel" wins.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+_PLACEHOLDER = re.compile(r"__(\d+)__")
+
+
+def _build_trie(words: Iterable[str]) -> dict:
+    """Builds a character trie; the empty key marks the end of a word."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_pattern(node: dict) -> str:
+    """Converts a trie node into an equivalent regular expression."""
+    branches = [
+        re.escape(char) + _trie_to_pattern(child)
+        for char, child in sorted(node.items())
+        if char != ""
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        return "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    """Protects keywords with numbered placeholders (__1__, __2__, ...) and restores them."""
+
+    def __init__(self, keywords: Tuple[str, ...]):
+        """
+        Compiles the matcher for a keyword set.
+
+        Args:
+            keywords (Tuple[str, ...]): Keywords in order; keyword N is protected as __N__.
+        """
+        self.keywords = keywords
+        self._index: Dict[str, int] = {}
+        for idx, keyword in enumerate(keywords, start=1):
+            if keyword:
+                self._index.setdefault(keyword, idx)
+        self._pattern: Optional[re.Pattern] = (
+            re.compile(_trie_to_pattern(_build_trie(self._index))) if self._index else None
+        )
+
+    def protect(self, text: str) -> str:
+        """
+        Replaces every keyword with its placeholder in a single pass.
+
+        Args:
+            text (str): Original text.
+
+        Returns:
+            str: Text with protected placeholders.
+        """
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(lambda match: f"__{self._index[match.group()]}__", text)
+
+    def restore(self, text: str) -> str:
+        """
+        Replaces every known placeholder with its keyword in a single pass.
+
+        Args:
+            text (str): Text after translation.
+
+        Returns:
+            str: Text with keywords restored. Unknown placeholders are left as-is.
+        """
+        if not self.keywords:
+            return text
+
+        def _replace(match: re.Match) -> str:
+            idx = int(match.group(1))
+            if 1 <= idx <= len(self.keywords):
+                return self.keywords[idx - 1]
+            return match.group()
+
+        return _PLACEHOLDER.sub(_replace, text)
+
+
+@lru_cache(maxsize=64)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    Returns the compiled matcher for a keyword set, building it only once.
+
+    Args:
+        keywords (Iterable[str]): Keywords in order.
+
+    Returns:
+        KeywordMatcher: The cached matcher.
+    """
+    return _cached_matcher(tuple(keywords or ()))
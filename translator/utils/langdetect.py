@@ -0,0 +1,263 @@
+"""
+Offline language detection with character n-gram profiles.
+
+Each supported language has an n-gram profile (`langprofiles.PROFILES`, the
+counts of 1- to 3-grams in Wikipedia text; words are padded with spaces, so
+prefixes and suffixes such as " th", "ção" or "ent " weigh in). Scoring a
+text is a handful of dictionary lookups per character, with no model to
+download and no network round trip.
+
+Short strings are a different matter: a single UI word such as "Save" or
+"Cancel" shares most of its n-grams with several languages. `classify()`
+therefore reports, next to the best guess, its margin over the runner-up:
+the log-likelihood gap divided by the number of n-grams, so a longer text
+does not look more certain just because it has more n-grams. `detect()` only
+trusts a guess whose margin reaches `min_margin`, or `short_text_margin` for
+texts of fewer than `min_words` words, and reports `UNDETERMINED` ("und")
+otherwise, so callers can fall back to the engine.
+
+`detect_many()` deduplicates its inputs and serves repeated strings from an
+LRU cache, so mixed-language batches cost one scoring pass per distinct text.
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from translator.config import (
+    LANGDETECT_CACHE_SIZE,
+    LANGDETECT_DEFAULT,
+    LANGDETECT_MIN_MARGIN,
+    LANGDETECT_MIN_WORDS,
+    LANGDETECT_SHORT_TEXT_MARGIN,
+    SUPPORTED_LANGUAGES,
+)
+from translator.utils.langprofiles import PROFILES
+
+# Reported by `detect()` when no language can be trusted (ISO 639-2 "undetermined")
+UNDETERMINED = "und"
+
+# Probability floor added to every n-gram, so unseen n-grams do not veto a language
+_SMOOTHING = 5e-6
+
+_NGRAM_ORDERS = (1, 2, 3)
+_WORDS = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    """Yields the character n-grams of every word of `text`, padded with spaces."""
+    for word in _WORDS.findall(text.lower()):
+        padded = f" {word} "
+        for order in _NGRAM_ORDERS:
+            for start in range(len(padded) - order + 1):
+                gram = padded[start:start + order]
+                if gram != " ":
+                    yield gram
+
+
+class LanguageDetector:
+    """Naive Bayes language identifier over character n-grams, with a result cache."""
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, dict]] = None,
+        languages: Optional[Iterable[str]] = None,
+        default: str = LANGDETECT_DEFAULT,
+        cache_size: int = LANGDETECT_CACHE_SIZE,
+        min_margin: float = LANGDETECT_MIN_MARGIN,
+        short_text_margin: float = LANGDETECT_SHORT_TEXT_MARGIN,
+        min_words: int = LANGDETECT_MIN_WORDS,
+    ):
+        """
+        Builds the language models.
+
+        Args:
+            profiles (Optional[Dict[str, dict]]): N-gram profile per language code, with
+                "totals" (number of 1-, 2- and 3-grams) and "counts" (occurrences per
+                n-gram); defaults to the built-in `PROFILES`.
+            languages (Optional[Iterable[str]]): Languages to consider (defaults to
+                `SUPPORTED_LANGUAGES`); codes without a profile are ignored.
+            default (str): Best guess reported by `classify()` for texts without any letter.
+            cache_size (int): Number of detection results kept (0 disables the cache).
+            min_margin (float): Smallest per-n-gram log-likelihood gap between the best
+                and the second best language for a detection to be trusted.
+            short_text_margin (float): The gap required instead for texts of fewer
+                than `min_words` words.
+            min_words (int): Texts with fewer words are held to `short_text_margin`.
+        """
+        profiles = PROFILES if profiles is None else profiles
+        wanted = list(languages if languages is not None else SUPPORTED_LANGUAGES)
+        self.languages = [lang for lang in wanted if lang in profiles]
+        if not self.languages:
+            raise ValueError("No n-gram profile available for the requested languages.")
+        self.default = default
+        self.cache_size = cache_size
+        self.min_margin = min_margin
+        self.short_text_margin = short_text_margin
+        self.min_words = min_words
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._unseen: Dict[str, float] = {}
+        self._log_probs: Dict[str, Dict[str, float]] = {}
+        for lang in self.languages:
+            totals = profiles[lang]["totals"]
+            self._unseen[lang] = math.log(_SMOOTHING)
+            self._log_probs[lang] = {
+                gram: math.log(_SMOOTHING + count / totals[len(gram) - 1])
+                for gram, count in profiles[lang]["counts"].items()
+            }
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """
+        Returns the log-likelihood of `text` under each language profile.
+
+        Args:
+            text (str): The text to score.
+
+        Returns:
+            Dict[str, float]: Score per language code (higher is more likely); all
+                zero when the text has no letters.
+        """
+        return self._score(list(_ngrams(text)))
+
+    def _score(self, grams: List[str]) -> Dict[str, float]:
+        totals = dict.fromkeys(self.languages, 0.0)
+        for gram in grams:
+            for lang in self.languages:
+                totals[lang] += self._log_probs[lang].get(gram, self._unseen[lang])
+        return totals
+
+    def detect(self, text: str) -> str:
+        """
+        Detects the language of a text.
+
+        Args:
+            text (str): The text whose language is to be detected.
+
+        Returns:
+            str: The detected language code (e.g., 'en'), or `UNDETERMINED` when
+                the detection is not confident (see `is_confident()`).
+        """
+        return self.detect_many([text])[0]
+
+    def detect_many(self, texts: List[str]) -> List[str]:
+        """
+        Detects the language of several texts, scoring each distinct text once.
+
+        Args:
+            texts (List[str]): The texts whose language is to be detected.
+
+        Returns:
+            List[str]: The detected language codes (or `UNDETERMINED`), in the same
+                order as `texts`.
+        """
+        return [
+            lang if self.is_confident(text, margin) else UNDETERMINED
+            for text, (lang, margin) in zip(texts, self.classify_many(texts))
+        ]
+
+    def classify(self, text: str) -> Tuple[str, float]:
+        """
+        Returns the most likely language of a text and how far ahead of the runner-up it is.
+
+        Args:
+            text (str): The text to classify.
+
+        Returns:
+            Tuple[str, float]: The best guess and its margin (log-likelihood gap to
+                the second best language per n-gram). For texts without letters the
+                guess is `default` and the margin 0.0.
+        """
+        return self.classify_many([text])[0]
+
+    def classify_many(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Classifies several texts, scoring each distinct text once.
+
+        Args:
+            texts (List[str]): The texts to classify.
+
+        Returns:
+            List[Tuple[str, float]]: The best guess and its margin per text, in the
+                same order as `texts`.
+        """
+        results: Dict[str, Tuple[str, float]] = {}
+        missing = []
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                cached = self._cache.get(text)
+                if cached is None:
+                    missing.append(text)
+                else:
+                    self._cache.move_to_end(text)
+                    results[text] = cached
+
+        for text in missing:
+            results[text] = self._classify(text)
+
+        if missing and self.cache_size > 0:
+            with self._lock:
+                for text in missing:
+                    self._cache[text] = results[text]
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [results[text] for text in texts]
+
+    def is_confident(self, text: str, margin: float) -> bool:
+        """Whether the margin `classify()` returned for `text` is large enough to trust the guess."""
+        required = self.min_margin
+        if len(_WORDS.findall(text)) < self.min_words:
+            required = max(required, self.short_text_margin)
+        return margin > 0.0 and margin >= required
+
+    def _classify(self, text: str) -> Tuple[str, float]:
+        grams = list(_ngrams(text))
+        if not grams:
+            return self.default, 0.0
+        scores = self._score(grams)
+        ranked = sorted(scores.values(), reverse=True)
+        best = max(scores, key=scores.get)
+        if len(ranked) < 2:
+            return best, 0.0
+        return best, (ranked[0] - ranked[1]) / len(grams)
+
+    def clear_cache(self) -> None:
+        """Drops every cached detection result."""
+        with self._lock:
+            self._cache.clear()
+
+
+_detector: Optional[LanguageDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_language_detector() -> LanguageDetector:
+    """
+    Returns the process-wide detector for `SUPPORTED_LANGUAGES`, built on first use.
+
+    Returns:
+        LanguageDetector: The shared detector.
+    """
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = LanguageDetector()
+        return _detector
+
+
+def detect_language(text: str) -> str:
+    """
+    Detects the language of a text with the shared offline detector.
+
+    Args:
+        text (str): The text whose language is to be detected.
+
+    Returns:
+        str: The detected language code (e.g., 'en'), or `UNDETERMINED` when the
+            detection is not confident.
+    """
+    return get_language_detector().detect(text)
@@ -0,0 +1,1308 @@
+"""
+Character n-gram profiles used by `translator.utils.langdetect`.
+
+Derived from the language profiles shipped with langdetect 1.0.9
+(https://github.com/Mimino666/langdetect, Apache License 2.0; originally
+from Nakatani Shuyo's language-detection project), which count the 1- to
+3-grams of Wikipedia abstracts. The counts were lower-cased and merged, and
+n-grams containing characters outside the Latin alphabet were dropped.
+
+For each language, `totals` holds the number of 1-, 2- and 3-grams in the
+source text and `counts` the occurrences of each n-gram (words are padded
+with spaces, so " th" is a word start and "he " a word end).
+"""
+
+from typing import Dict
+
+PROFILES: Dict[str, dict] = {
+    "en": {
+        "totals": (260942223, 308553243, 224934017),
+        "counts": {
+            "e": 28408543, "a": 24830692, "i": 21548863, "t": 20811019, "n": 20378815,
+            "o": 19067938, "s": 17634074, "r": 17581629, "l": 11319228, "h": 10816526, "d": 9392030,
+            "c": 9339783, "m": 7230354, "u": 7018449, "f": 5846380, "p": 5502369, "g": 4964793,
+            "b": 4586005, "y": 4255469, "w": 3868204, "v": 2531998, "k": 2002239, "j": 733809,
+            "x": 477455, "z": 470992, "q": 222793, "é": 58984, "e ": 8530361, "s ": 7301357,
+            " a": 6669656, " t": 6395005, "n ": 6374219, "th": 5632896, "in": 5131137,
+            "he": 5060829, "an": 4975347, " i": 4807079, "d ": 4739509, "er": 4179896,
+            " s": 3884597, " o": 3782053, "t ": 3499138, "on": 3473068, "is": 3310051,
+            "a ": 3150736, "r ": 3107908, " c": 3105507, "y ": 3097451, "or": 3013205,
+            "re": 2798037, "te": 2747782, "at": 2700219, "nd": 2690580, "ar": 2625112,
+            "st": 2616733, "al": 2603374, "en": 2552993, " b": 2507280, "es": 2395636,
+            "ti": 2394958, " w": 2386321, "of": 2379880, " p": 2365340, "ed": 2327485,
+            "f ": 2316051, " f": 2314143, "as": 2274746, "it": 2233274, "ri": 2101192,
+            " m": 2067856, "l ": 1968872, "ic": 1849130, "nt": 1825754, "ro": 1759128,
+            "ng": 1746068, "ra": 1740271, "co": 1678791, "le": 1661956, "se": 1627579,
+            " r": 1610920, "to": 1609067, "io": 1592954, "me": 1581618, "la": 1569190,
+            "o ": 1564544, "li": 1544829, " d": 1541539, "h ": 1529402, "de": 1494813,
+            " h": 1467497, "ne": 1453779, " l": 1377094, "ma": 1374409, "ch": 1364900,
+            "ca": 1362838, "ea": 1330395, "na": 1303849, "ou": 1258409, "ta": 1254490,
+            "ve": 1248419, " e": 1234278, " n": 1216414, "g ": 1213593, "el": 1190378,
+            "si": 1189480, "om": 1179222, "ia": 1169835, "un": 1164604, "wa": 1148638,
+            "ni": 1147365, "ce": 1147268, "hi": 1144996, "ha": 1140108, "ll": 1129598,
+            "am": 1080386, "il": 1065515, "di": 1043210, "fo": 1026854, "m ": 1021219, " g": 990884,
+            "tr": 977378, "be": 975633, "us": 972501, "ur": 968763, "ol": 959290, "ho": 901067,
+            "rt": 886247, "lo": 883926, "pe": 874235, "so": 861381, "ge": 855527, "pr": 848876,
+            "ns": 843426, "ec": 841985, "no": 823544, "sh": 821215, "ct": 817847, "et": 814658,
+            "pa": 811502, "ie": 800933, "ac": 764285, "rs": 761380, "nc": 750937, "ci": 750151,
+            "mi": 742920, "ly": 725738, "em": 706297, "ir": 701096, "ad": 687604, "po": 687039,
+            " u": 681751, "vi": 681705, "ba": 657060, "rn": 650417, "mo": 650327, "ss": 646227,
+            "ut": 635083, "ai": 621371, "fi": 604287, "bo": 584596, "iv": 578092, "ty": 567576,
+            "ow": 555778, "oc": 554855, "ry": 553810, " k": 552014, "ot": 549343, "k ": 547843,
+            "c ": 544458, " j": 538504, "fr": 532197, "ee": 528675, "wi": 528662, "by": 527627,
+            "ts": 524135, "we": 509912, "ig": 507511, "op": 505111, "da": 499264, "os": 498414,
+            "id": 496380, "tu": 483444, " v": 468423, "mp": 468344, "rd": 466156, "ul": 459768,
+            "ay": 450984, "ga": 443980, "su": 437894, "rm": 435749, "ov": 435331, "pl": 434963,
+            "ag": 433896, "i ": 431254, "wh": 426928, "oo": 421044, "mb": 416311, "gi": 406912,
+            "gr": 406032, "br": 404750, "um": 403450, "sc": 399809, "fe": 398750, "sp": 395519,
+            "im": 394260, "sa": 387809, "ap": 386854, "ke": 374938, "bu": 372203, "au": 367472,
+            "gh": 367310, "bl": 365220, "od": 362363, "ev": 357914, "p ": 352477, "wo": 351699,
+            "ld": 351541, "pi": 346686, "du": 342409, "ua": 340676, "do": 339218, "mu": 333106,
+            "ep": 332185, "ab": 325448, "ru": 324527, "tt": 322006, "cr": 320365, "va": 314126,
+            "lu": 313491, "cl": 312733, "ck": 305854, "w ": 304612, "pu": 301974, "rc": 300833,
+            "gu": 296454, "fa": 295959, "ls": 295312, "eg": 294475, "uc": 282987, "cu": 282472,
+            "ue": 281220, "rl": 279627, "wn": 279417, "rg": 276649, "ei": 272994, "bi": 271289,
+            "ip": 270764, "rr": 265014, "nn": 264870, "ub": 264839, "mm": 262444, "rk": 261286,
+            "ph": 254782, "go": 251269, "ew": 250035, "og": 247625, "ki": 245569, "av": 238618,
+            "ug": 230153, "lt": 228186, "ex": 221189, "ey": 221145, "if": 219645, "hu": 218420,
+            "nu": 217006, "ud": 207254, " y": 206278, "ja": 205284, "up": 204022, "tl": 201040,
+            "ak": 197752, "ds": 196380, "ef": 194847, "qu": 194832, "ht": 193546, "ui": 189592,
+            "gl": 188283, "ye": 187250, "eo": 187165, "ka": 184043, "ff": 180681, "ny": 179007,
+            "tw": 175696, "oa": 174782, "ob": 174628, "dr": 173949, "pp": 173102, "jo": 171533,
+            "hr": 171058, "b ": 163007, "ju": 161139, "ib": 159645, "af": 158711, "rv": 158410,
+            "pt": 158295, "ys": 153061, "eb": 152577, "ft": 147685, "sl": 145841, "kn": 143680,
+            "oi": 135962, "ms": 133483, "ok": 132945, "sy": 132620, "iz": 128734, "gn": 127025,
+            "ae": 126319, "x ": 126181, "yo": 125865, "fl": 121629, "eu": 119094, "aw": 117859,
+            "u ": 116514, "lm": 115044, "sm": 113246, "cc": 111912, "nk": 109355, "vo": 108876,
+            "sk": 108573, "ks": 106786, "lb": 105992, "je": 102995, "ze": 102677, "wr": 100589,
+            "rb": 95933, "ya": 95795, "ps": 94491, "cs": 93807, "hn": 92044, "ko": 91735,
+            "nl": 88734, "rp": 87486, "nf": 87191, "ah": 83166, "fu": 82822, "za": 82368,
+            "hy": 82019, "ym": 80995, "gs": 80931, "tb": 79573, "ik": 78883, " q": 76964,
+            "oy": 75842, "yl": 75727, "dy": 74747, "gy": 74018, "az": 72598, "cy": 71900,
+            "oh": 71587, "nv": 69977, "oe": 69809, "xi": 69443, "ws": 68714, " z": 67911,
+            "nm": 67028, "tc": 66980, "lv": 66473, "rf": 65494, "iu": 65009, "dd": 64948,
+            "sw": 64318, "ek": 64162, "v ": 62164, "my": 62036, "yp": 60686, "yn": 59856,
+            "lf": 59414, "bs": 58904, "zi": 58211, "xt": 57882, "z ": 53637, "dl": 51794,
+            "dg": 51752, "tm": 51220, "aj": 50310, "ix": 50259, "xp": 49241, "eh": 48317,
+            "hl": 46194, "hw": 45980, "ox": 44665, "yi": 42920, "yc": 42157, "lk": 42132,
+            "eq": 41573, "sn": 41499, "ii": 40680, "dm": 40343, "xa": 40308, "rw": 40021,
+            "gt": 38716, "lp": 38509, "nh": 37213, "yr": 36606, "lw": 35880, "bb": 35633,
+            "lg": 35629, "dw": 35481, "ax": 35262, "sb": 34898, "uk": 33957, "kl": 33919,
+            "xe": 33587, "uf": 33361, "km": 32936, "rh": 32041, "gd": 31577, "ky": 30837,
+            "nr": 30719, "hm": 30448, "nz": 30433, "yt": 30002, "gg": 29821, "yd": 28943,
+            "vy": 28150, "nb": 27967, "zo": 27033, "dv": 26927, "kh": 26225, " th": 4477146,
+            "the": 4156312, "he ": 3893624, " in": 2376864, " of": 2275616, "of ": 2204484,
+            "in ": 2079254, " an": 2021056, "ed ": 1971122, "nd ": 1932876, "and": 1922995,
+            "is ": 1834908, "on ": 1693252, " a ": 1688653, "er ": 1640997, " is": 1595518,
+            "an ": 1345264, "ion": 1320795, "as ": 1288188, " co": 1248824, "es ": 1236398,
+            "ing": 1178957, "ng ": 1115424, "al ": 1032287, "tio": 971575, "ent": 917089,
+            " wa": 909788, "or ": 897485, " to": 884667, " fo": 852098, "ati": 841381,
+            "ter": 809390, "st ": 788491, "ate": 773247, " re": 765927, " ma": 738960,
+            "for": 736821, "to ": 731436, "was": 721522, " pr": 652710, "th ": 648546,
+            " st": 643450, "ted": 637757, "re ": 634483, "ly ": 633235, " se": 593547,
+            "nt ": 574346, "ist": 561559, " on": 545832, " de": 538693, " ca": 538072,
+            "by ": 517575, "en ": 515700, "at ": 514237, " it": 514086, "ry ": 509562,
+            "ty ": 506251, " as": 493401, "sta": 492234, " be": 489732, "ce ": 489631,
+            " by": 488337, " fr": 481702, "ne ": 474805, "ica": 469571, "it ": 467501,
+            "all": 466989, "ts ": 465295, "le ": 464484, "com": 458793, " pa": 457743,
+            "ers": 454490, " ar": 448286, "ch ": 441284, "ame": 435298, " so": 430945,
+            "pro": 421294, " wh": 420613, " wi": 420306, " ch": 418921, "ver": 416461,
+            "est": 416254, "ive": 414501, " no": 412359, " al": 412295, " he": 412002,
+            " ba": 409297, " bo": 407634, "ian": 404233, "lan": 403965, "con": 402452,
+            "ic ": 400287, "her": 400084, "ber": 399303, " di": 397647, " fi": 396695,
+            " or": 385222, "str": 385166, "oun": 383251, "te ": 378459, "ric": 377068,
+            " mo": 376785, "uni": 376015, " ha": 373642, "rom": 372562, "rs ": 371607,
+            "eri": 370698, " un": 369897, "ia ": 367003, " la": 363308, " po": 363291,
+            "ons": 362489, "nal": 361592, "nce": 360792, "res": 357790, "ine": 357110,
+            "om ": 355568, "man": 354732, "men": 353373, "ns ": 352877, "art": 349130,
+            "ish": 348637, " me": 348105, "ll ": 345769, "tra": 341376, "ste": 335272,
+            "rn ": 330287, " li": 327819, "ort": 324283, "se ": 323378, " lo": 319032,
+            "cal": 318677, " na": 316583, "ity": 314774, "par": 312885, "iti": 312557,
+            " si": 308825, " te": 308573, "mer": 308315, "ies": 307456, "ect": 304913,
+            "tor": 304450, "me ": 304088, "can": 302866, " hi": 300928, "are": 299717,
+            "fro": 298934, " at": 298192, " ne": 297963, "ern": 296552, "ona": 295881,
+            "ve ": 294814, "tat": 294451, "ali": 291050, "ge ": 289041, "ith": 287933,
+            "ar ": 287761, " su": 287531, "ite": 286513, " s ": 285424, "per": 282682,
+            "nte": 282517, "ast": 279617, "der": 278249, "int": 277835, "tic": 276929,
+            "ere": 274035, "own": 272385, " br": 272067, "ove": 271311, " we": 270781,
+            "us ": 269807, " mi": 269431, " sp": 269270, "nat": 269174, " le": 266516,
+            "out": 265981, " ro": 265748, "ran": 265077, "ral": 264928, "nde": 264119,
+            "ain": 263108, "era": 262856, "cti": 262008, "sh ": 261718, "his": 261454,
+            "rat": 260279, "eas": 259494, "cha": 256479, "rin": 255678, " en": 255080,
+            "tin": 255051, "wit": 254528, "lis": 254417, "und": 253741, "cat": 253423,
+            "ill": 253039, "sed": 251715, " tr": 251635, " gr": 251013, "ess": 250577,
+            "mbe": 250295, "rit": 248352, "rea": 244476, "ay ": 243951, "mar": 243355,
+            " pe": 241408, "pla": 240458, "tha": 240340, "ele": 239396, "ear": 238611,
+            " ho": 237762, "ser": 237193, " sh": 237161, " sc": 237087, " wo": 234453,
+            "orn": 233282, "emb": 232607, "rt ": 230530, " pl": 230129, "lle": 228951,
+            "de ": 228034, " fa": 227643, " ra": 227384, "one": 226758, "ary": 226746,
+            "ld ": 226258, " ge": 225655, "wn ": 223496, "lin": 223316, "ari": 222546,
+            "ich": 222330, "tri": 221592, "lit": 221318, "hat": 219394, "tur": 219279,
+            "inc": 218718, "rd ": 218199, " sa": 218002, "ant": 217929, " mu": 217553,
+            "igh": 217420, "nit": 215552, "omp": 213665, "orm": 213505, "son": 213206,
+            "ani": 212965, "age": 211927, "pre": 211725, "bor": 211694, "ide": 209151,
+            "lat": 207187, "nor": 206635, "red": 206208, "dis": 204159, "anc": 203858,
+            "cou": 203659, "cia": 202890, "sti": 202749, "unt": 202586, "ass": 202222,
+            "eve": 202090, "ase": 201692, "ina": 201512, "ard": 199526, "min": 198743,
+            "ust": 198208, " am": 198040, "ind": 197596, "uth": 195687, " au": 195628,
+            "enc": 194004, "ren": 193932, "wor": 193825, "tes": 193644, " bu": 192904,
+            "ial": 191889, "rou": 191436, "eat": 190659, "rth": 190521, "use": 190347,
+            "nti": 190207, "ese": 189976, "lea": 187295, "sio": 187210, "ord": 187024,
+            "sin": 187018, " vi": 186762, "ss ": 186657, "our": 185741, "chi": 185671,
+            " ac": 185601, "hic": 185273, "ey ": 184413, "el ": 184102, "et ": 183510,
+            " ce": 182737, "tiv": 181662, "rie": 181610, "ong": 180887, "cen": 180260,
+            " da": 179910, "ori": 179394, "ssi": 178639, "lia": 177899, " cr": 177825,
+            "les": 177287, "pri": 177286, "act": 176914, "een": 176170, "il ": 176048,
+            "har": 176038, "ure": 175159, "sou": 174088, " ri": 173638, "ell": 173610,
+            "ici": 172909, "ree": 171216, "gen": 170687, "din": 170282, "ct ": 169935,
+            "ana": 169898, "ome": 169344, "oli": 168296, "gra": 167638, "nes": 167423,
+            " cl": 167046, "thi": 166927, "nta": 166897, "mon": 166835, "shi": 166608,
+            "ire": 165519, "she": 165048, "ds ": 164811, "omm": 164677, "rch": 164110,
+            "ris": 163763, "now": 162156, "war": 161806, "whi": 161339, "ore": 161271,
+            "ria": 159780, "sto": 159447, "oca": 158968, "tal": 158887, "ght": 158712,
+            "ous": 158478, " ga": 158198, "am ": 158006, "cor": 157398, "ict": 157327,
+            "als": 156873, "ita": 156620, "who": 156434, " fe": 156215, "ger": 156180,
+            "ntr": 155494, "lly": 155319, "den": 154840, "new": 154783, "des": 154773,
+            "spe": 154402, "tar": 154358, "ten": 154275, " ja": 154158, "ang": 153929,
+            "ces": 153825, "ngl": 153748, "bli": 153281, "eng": 153034, "sit": 152904,
+            "oll": 152650, " ea": 152373, "ew ": 152274, "ut ": 151960, "ont": 151478,
+            "mil": 151172, "ope": 150764, "ton": 150493, "col": 150345, "eco": 150097,
+            "ho ": 150031, "rec": 149809, "ini": 149339, "lic": 149255, " ju": 148829,
+            "tan": 148320, "loc": 148176, "ndi": 147835, "ck ": 147449, "ls ": 147230,
+            " us": 147156, "por": 147134, "nis": 146601, "mat": 146584, "rel": 146404,
+            " pu": 146344, "ny ": 146188, "um ": 146010, "cie": 145817, "lar": 145329,
+            "rma": 145311, "dia": 144125, "ice": 143792, "lay": 143764, "na ": 142173,
+            "ded": 141601, "end": 141343, "rk ": 140894, "nam": 140852, " ci": 140679,
+            "hin": 140164, "ven": 139602, "tis": 139521, "ace": 139311, "med": 139063,
+            "che": 138582, "nia": 137970, "ula": 137681, "ner": 137621, "ork": 137621,
+            "pol": 137588, "cto": 137353, "han": 137177, " go": 136420, "ad ": 136134,
+            "ami": 135603, "tho": 134583, "ost": 134462, " ta": 134239, "kno": 134011,
+            "ans": 132995, " jo": 132560, "rst": 132558, "oth": 132550, "erm": 132045,
+            "nic": 132031, " du": 131898, "sch": 131824, "fic": 131579, "olo": 130918,
+            "ade": 130763, " el": 130561, "adi": 130468, "ara": 130356, "rac": 129420,
+            " kn": 129366, "car": 129327, "erv": 128955, "nin": 128702, " do": 128693,
+            "bri": 128346, "ene": 128335, "nge": 128219, "vel": 128051, "ins": 127823,
+            "irs": 127746, "rti": 127728, "usi": 127657, "pec": 127586, "kin": 126589,
+            " ap": 126256, "duc": 125723, "ond": 125458, "ubl": 124785, "tem": 124758,
+            "cho": 124613, "pan": 124559, "lli": 124524, "uri": 124329, "ir ": 124191,
+            "tro": 123988, "gin": 123942, "ath": 123599, "fou": 123314, "lon": 122985,
+            "arc": 122863, "tte": 122526, "ime": 121995, "eci": 121874, "wer": 121358,
+            "ue ": 120838, "lla": 120635, "has": 120534, "wes": 120480, "edi": 120330,
+            " ex": 119951, "ert": 119791, "uar": 119614, "arl": 119272, "fir": 119031,
+            "ens": 118987, "lec": 118736, "rna": 118629, "so ": 118506, " cu": 118265,
+            "nts": 118194, " ti": 118157, "ron": 118148, "rme": 117007, "ned": 116572,
+            "rig": 116494, "bas": 116354, "any": 116307, "ach": 115898, "tre": 115840,
+            "ose": 115458, "mun": 115137, "gh ": 114066, "ovi": 113638, "nst": 113470,
+            "gre": 113078, "eme": 113005, "esi": 112993, "egi": 112559, "bal": 111539,
+            "sic": 111518, " ru": 111199, "sea": 111064, "ht ": 111042, "lso": 110778,
+            "sen": 110589, "ugh": 110128, " bi": 109630, "ol ": 109628, "ail": 109529,
+            "rop": 109260, "isi": 109243, "ee ": 109231, "ete": 109151, "vin": 109107,
+            "hor": 109022, "mes": 108882, "tit": 108778, "mus": 108706, "ble": 108674,
+            "ra ": 108610, "mic": 108317, "ms ": 108315, "ili": 107918, "ple": 105992,
+            "rep": 105691, "ale": 104464, "ily": 104441, "hed": 104387, "ivi": 104219,
+            "ow ": 104160, "log": 104122, " ki": 104054, "rad": 103893, "ban": 103832,
+            "pen": 103684, "hou": 103224, " ad": 102643, "cit": 102620, "ien": 102314,
+            "vis": 102225, "sse": 101933, "its": 101906, "fer": 101678, "pub": 101611,
+            "rge": 101036, "aus": 101021, " va": 100825, " af": 100745, "las": 100146, "oug": 99629,
+            "up ": 99562, "hoo": 99559, "ora": 99397, "rov": 99028, "ool": 97648, "ea ": 97410,
+            "fam": 97344, "rre": 97252, "hil": 96538, "ur ": 96286, "led": 96172, "evi": 96051,
+            "vil": 95978, "rsi": 95891, "nne": 95671, "sco": 95592, "abl": 95465, "hea": 95197,
+            "tle": 95143, "ave": 94995, "umb": 94738, "ead": 94691, "ela": 94480, "pos": 94042,
+            "io ": 93766, "tel": 93554, "gan": 93331, " ph": 93208, "ack": 93180, "ign": 93132,
+            "tai": 93008, "ock": 92930, "hip": 92853, "ory": 92826, "ta ": 92521, "ean": 92098,
+            "cs ": 92018, "amp": 91990, "cte": 91935, "eti": 91823, "nci": 91672, "sla": 91489,
+            "nov": 91333, "ham": 91101, "mal": 90910, "riv": 90723, "od ": 90721, "nsi": 90541,
+            "sid": 90354, "ics": 90231, "ark": 89799, "clu": 89562, "cre": 89454, "oma": 89149,
+            " ve": 88846, "ual": 88610, "nch": 88213, "eld": 88206, "ute": 88005, "thr": 87801,
+            "ile": 87652, "rod": 87645, "aye": 87163, "mpi": 86987, "bra": 86981, "id ": 86767,
+            " fl": 86765, "da ": 86635, "be ": 86424, "oni": 86395, "reg": 86193, "low": 85754,
+            "la ": 85626, "wri": 85490, "fre": 85226, "met": 85213, " ed": 85082, "iat": 85021,
+            "sho": 85008, " pi": 84639, " sy": 84626, "lac": 84352, "oci": 84252, "nto": 84185,
+            "iss": 83951, "org": 83794, "ook": 83743, "ke ": 83682, "rai": 83507, "ann": 83296,
+            "ala": 82861, "nda": 82618, "hen": 82591, "ult": 82523, "but": 82424, "nty": 82414,
+            "sso": 82323, "arr": 82306, "omi": 82283, "ece": 81981, "etw": 81955, "niv": 81629,
+            "itu": 81601, " op": 81547, "att": 81527, "odu": 81510, "atu": 81250, "tim": 81225,
+            "hes": 81158, "itt": 81137, "two": 81070, "rde": 80880, "sia": 80711, "oot": 80611,
+            "ram": 80300, "app": 80291, "tia": 79923, " dr": 79730, "fil": 79707, "rio": 79616,
+            "ake": 79597, "way": 79562, " wr": 78668, "ida": 78657, "mpa": 78503, "elo": 78428,
+            "gro": 78380, " hu": 78294, "orl": 77957, "bro": 77936, "ks ": 77920, "ode": 77618,
+            "ick": 77376, "eli": 77371, "ip ": 77179, " gu": 77041, "ima": 76627, "bet": 76601,
+            "ars": 76523, "hig": 76172, "wee": 76113, "uti": 76065, "igi": 75927, "err": 75913,
+            "not": 75828, "win": 75777, "air": 75684, "hei": 75673, "ot ": 75528, "ler": 75366,
+            "rld": 75350, "cip": 75068, "ato": 75056, "ane": 74984, "dit": 74391, "old": 74258,
+            "vid": 74216, "bou": 74106, "cur": 73843, "ved": 73656, "fte": 73646, "rm ": 73619,
+            "udi": 73540, " ka": 73450, "abo": 73249, "tba": 73096, "ura": 72791, "ogr": 72732,
+            "ses": 72706, "ote": 72682, "ept": 72575, "urn": 72450, "nad": 72347, "hel": 72126,
+            "tow": 72085, "hol": 72031, "eal": 72020, "llo": 71927, "unc": 71870, "anu": 71865,
+            "hir": 71717, "san": 71670, " yo": 71619, "mem": 71604, "gio": 71590, "tea": 71475,
+            "nds": 71457, "ca ": 71415, "twe": 71315, "gue": 71236, "cer": 71180, "emi": 71126,
+            "isl": 71084, " ai": 71071, " ab": 70854, "ilm": 70454, "tie": 69965, " tw": 69959,
+            "pul": 69919, "pop": 69835, "sig": 69827, "eir": 69644, "uct": 69612, "rri": 69478,
+            "lev": 69397, "urr": 69334, "owe": 69263, "cul": 69156, "ves": 68869, "ges": 68825,
+            "ise": 68787, "mmu": 68704, "sis": 68592, "pal": 68434, "spa": 68387, "ifi": 68240,
+            "ett": 68152, "cri": 68130, "ie ": 67990, "mos": 67786, " bl": 67754, "lif": 67751,
+            "eam": 67571, "leg": 67495, "off": 67447, "oup": 67359, "mpe": 67319, "arm": 67268,
+            "une": 67239, "ae ": 67161, "ced": 67120, "efe": 67003, "roc": 66994, "ude": 66964,
+            "ndo": 66887, "mme": 66787, "cke": 66684, "try": 66671, "obe": 66424, "rte": 66419,
+            "ipa": 66227, " qu": 66206, "alt": 66067, "ors": 65851, "arg": 65842, "soc": 65715,
+            "ffi": 65666, "ril": 65623, "whe": 65586, "rly": 65353, "em ": 65326, "ncl": 65296,
+            "ngs": 65275, "mpl": 65250, "ied": 65179, "rve": 65133, "die": 65117, "rol": 65046,
+            "sec": 65010, "ood": 64494, "aft": 64376, "len": 64181, "lie": 64153, "alb": 63960,
+            "vic": 63884, "tud": 63876, "opu": 63831, "lbu": 63795, "tly": 63791, "pic": 63629,
+            "pea": 63524, "lag": 63397, "don": 63380, "ret": 62986, "pe ": 62967, "rof": 62861,
+            "rga": 62829, "ier": 62637, "eni": 62631, "rni": 62594, "rvi": 62552, "lm ": 62508,
+            "sha": 62499, "gs ": 62491, "net": 62476, "aro": 62443, "ket": 62341, "mor": 62243,
+            "dur": 62131, "ref": 62077, "fra": 61982, "nua": 61979, "bum": 61942, "rus": 61735,
+            "sma": 61408, "rne": 61259, "lt ": 61158, "hro": 61086, "lud": 61069, "rds": 61017,
+            "nni": 61016, "wo ": 61016, "tab": 60969, "pte": 60939, "spo": 60807, "rid": 60669,
+            "avi": 60667, "hum": 60594, "rib": 60454, "ada": 60436, "rse": 60300, "aut": 60210,
+            "cla": 60174, "ama": 60146, "ero": 60052, " ye": 60017, "que": 60004, "ein": 59892,
+            "mpo": 59756, "oad": 59707, "rts": 59598, "yst": 59562, "let": 59346, "ebr": 59143,
+            "isc": 59122, "otb": 59122, "rce": 59020, "rot": 58999, "gy ": 58853, "dy ": 58601,
+            "ctu": 58584, "ntu": 58438, "ely": 58392, "ata": 58365, "ros": 58364, "ok ": 58105,
+            "hav": 58023, "dio": 57931, "vem": 57889, "ema": 57740, "rdi": 57659, "os ": 57513,
+            "agu": 57502, "gle": 57486, "gla": 57467, "ech": 57443, "eth": 57374, "eac": 57373,
+            "mai": 57333, "ole": 57272, "aso": 57197, "ild": 57179, " gi": 57155, "ono": 57151,
+            "ps ": 57068, "enn": 56995, "uce": 56991, "ma ": 56941, "fin": 56926, "rap": 56827,
+            "set": 56749, "ize": 56700, "ppe": 56579, "cle": 56340, " ev": 56247, "sub": 56163,
+            "gli": 56142, " em": 56030, "iel": 55976, "tch": 55824, "ugu": 55721, "thu": 55673,
+            "bel": 55314, "nio": 55312, "yea": 55238, "roa": 55237, "val": 55056, "rem": 55031,
+            "rty": 55015, "lop": 54959, "fes": 54841, "iam": 54702, "op ": 54660, "ank": 54539,
+            "sts": 54520, "cas": 54417, "nly": 54407, "qua": 54197, "erg": 54150, "ede": 54090,
+            "dic": 54056, "uch": 53880, "bee": 53796, "apa": 53686, "pet": 53680, " ot": 53672,
+            "til": 53505, "nme": 53495, "ery": 53481, "fie": 53477, "stu": 53381, "ena": 53361,
+            " ir": 53197, "tru": 53183, "nsh": 53144, "hem": 53106, " oc": 53053, "jan": 53046,
+            "eta": 52929, "bur": 52830, "foo": 52751, "rim": 52709, "etr": 52595, "sel": 52566,
+            "nth": 52495, "lor": 52442, "sur": 52388, "ffe": 52374, "aga": 52212, "yer": 52194,
+            " je": 52048, "erl": 52014, "ngu": 51932, "del": 51924, "oss": 51862, "co ": 51753,
+            "olu": 51650, "rli": 51474, "eig": 51339, "dev": 51103, "ege": 50969, "mou": 50940,
+            "ila": 50860, "eer": 50775, "dat": 50729, "van": 50667, "iet": 50527, "inn": 50515,
+            "yed": 50493, "ley": 50488, "dep": 50458, "onl": 50368, "may": 50344, "uil": 50329,
+            "ano": 50033, "emo": 49872, " ke": 49770, "nse": 49755, "mmo": 49689, "eag": 49669,
+            " fu": 49639, "cy ": 49469, " es": 49439, "urc": 49405, "epr": 49381, "cem": 49322,
+            "tec": 49230, "rog": 49055, "ker": 49025, "sor": 49003, "nsu": 48967, "joh": 48960,
+            "tob": 48945, "suc": 48817, "hos": 48768, "eor": 48705, "nea": 48684, "aci": 48413,
+            "gus": 48388, "ola": 48347, "ega": 48293, "iva": 48200, "rta": 48186, "mit": 48071,
+            "wel": 48031, "ino": 47946, "gam": 47831, "imp": 47812, "mis": 47781, "ws ": 47661,
+            "ury": 47606, "no ": 47600, "yor": 47584, " im": 47481, "oin": 47463, "var": 47368,
+            "hey": 47349, "jun": 47295, "ota": 47221, "ogy": 47192, "ro ": 47142, " ol": 47101,
+            "ntl": 47080, "dir": 47066, "ibe": 47065, "som": 46889, "vat": 46841, "iou": 46819,
+            "phi": 46768, "hur": 46747, "wil": 46697, "gar": 46583, "los": 46581, "rke": 46561,
+            "pin": 46550, "jul": 46542, "iza": 46289, "nar": 46225, "ofe": 46203, "ume": 46174,
+            "nus": 46108, "ys ": 46066, " nu": 46047, "dec": 45892, "dge": 45767, "lem": 45662,
+            "ash": 45659, " ag": 45613, "hom": 45604, "ung": 45523, "mot": 45357, "nco": 45249,
+            "dom": 45245, "sep": 45219, " ko": 45184, "ngi": 45147, "fac": 45076, "nk ": 44974,
+            "hre": 44973, "awa": 44906, "nom": 44734, "aug": 44651, "ito": 44622, "my ": 44622,
+            "ogi": 44598, "lig": 44454, "ssa": 44414, "opo": 44332, "alo": 44306, "day": 44277,
+            "hit": 44255, "aph": 44106, "ohn": 44056, "epa": 43995, "niz": 43878, "uss": 43860,
+            "gua": 43805, "abi": 43800, "uro": 43771, "emp": 43662, "amo": 43526, "boo": 43455,
+            " ov": 43302, "ape": 43062, "ras": 43044, " ni": 43042, "rpo": 42976, "oct": 42904,
+            "cra": 42776, "cts": 42767, "oro": 42745, "lus": 42702, "erf": 42571, "liv": 42501,
+            "ext": 42471, "dae": 42405, "dem": 42344, "vie": 42322, "uat": 42205, "rev": 42186,
+            "hal": 42170, "bar": 42165, "ott": 42106, "hri": 42093, "ues": 42067, " eu": 42050,
+            "uen": 42045, "urt": 42019, " sm": 42001, "ft ": 41960, "ri ": 41893, "row": 41881,
+            "tua": 41791, "dar": 41780, "cro": 41753, "ka ": 41749, "pon": 41677, "pio": 41668,
+            "imi": 41657, "bec": 41647, "scr": 41549, "ttl": 41524, "num": 41405, "asi": 41320,
+            " up": 41302, "enu": 41299, "ub ": 41295, "nan": 41261, "ul ": 41234, "equ": 41108,
+            "els": 41004, "bru": 40872, "orc": 40804, "fol": 40754, "uly": 40527, "non": 40510,
+            "mb ": 40338, "apr": 40277, "cin": 40251, "opl": 40248, "eop": 40243, "erc": 40232,
+            " vo": 40129, "nga": 40074, "sol": 40004, "exp": 39847, "urg": 39826, "ium": 39769,
+            "orp": 39756, "cot": 39747, "oft": 39655, "run": 39647, "ndu": 39629, "gis": 39618,
+            "omo": 39559, "vol": 39542, "hn ": 39410, "phy": 39410, "oto": 39358, "pai": 39322,
+            "eet": 39266, "eek": 39188, "gne": 39182, "bes": 39082, "oce": 39082, "how": 39080,
+            "cam": 39022, "sci": 38993, "rua": 38894, "acc": 38863, "ays": 38857, "iso": 38810,
+            "fri": 38796, "esc": 38776, "qui": 38739, "bre": 38618, "ifo": 38546, "bui": 38535,
+            "had": 38461, "go ": 38352, "feb": 38336, "sys": 38243, "dre": 38221, "put": 38175,
+            "ped": 38131, "lub": 38036, "cil": 38009, "inf": 38004, "eed": 37937, "ctr": 37744,
+            "osi": 37738, "oti": 37576, "onc": 37498, "ife": 37449, "mmi": 37447, "cce": 37436,
+            "sus": 37393, "ngt": 37246, "uit": 37221, "ava": 37165, "jap": 37112, " sw": 37042,
+            "ymp": 36974, "tee": 36958, "lde": 36942, "esp": 36940, "div": 36865, "mas": 36713,
+            "bia": 36531, "lf ": 36467, "im ": 36451, "pli": 36447, "edu": 36419, "tut": 36373,
+            " ou": 36365, "zat": 36341, "sev": 36211, "lti": 36200, "mod": 36169, "lab": 36068,
+            "aki": 36034, "rg ": 35933, " tu": 35914, "chr": 35874, "rso": 35794, "ruc": 35769,
+            "nel": 35766, "arn": 35663, "tme": 35635, "yin": 35501, "ico": 35459, "sem": 35416,
+            "ek ": 35390, "dra": 35355, "atr": 35326, "phe": 35230, "exi": 35172, "uca": 35169,
+            "rar": 34987, "mbi": 34922, "azi": 34919, "rnm": 34849, "exa": 34847, "gov": 34838,
+            "ago": 34773, "cov": 34759, "oph": 34738, "do ": 34660, "ecu": 34646, "rag": 34608,
+            "dea": 34588, "ppo": 34542, "eca": 34537, "epe": 34508, "lum": 34502, "hon": 34484,
+            "lym": 34483, "eur": 34468, "tti": 34349, "bil": 34265, "pti": 34138, "erb": 34102,
+            "jec": 34085, "pit": 34080, "lve": 34044, "umm": 33986, "ti ": 33930, "ird": 33893,
+            "amm": 33827, "geo": 33733, "pho": 33690, "wal": 33670, "fe ": 33600, "ism": 33565,
+            "sup": 33543, "ull": 33469, "ilt": 33467, "nag": 33449, "mad": 33441, "rks": 33396,
+            "eno": 33355, "bot": 33326, "ams": 33255, "rgi": 33226, "ndr": 33212, "uis": 33184,
+            "cap": 33144, "pat": 33109, "mea": 33106, "nve": 33106, "aw ": 33098, "rro": 33066,
+            "omb": 33063, "ni ": 33062, "lls": 32993, "ado": 32963, "amb": 32800, "onn": 32769,
+            "rmi": 32749, "chn": 32667, "nai": 32626, "ncy": 32567, "cel": 32556, "ysi": 32556,
+            "ews": 32501, "mpu": 32461, "un ": 32424, "mag": 32391, "icu": 32368, "ior": 32367,
+            "ule": 32343, "bin": 32338, "gia": 32230, "uag": 32210, "lo ": 32182, "lwa": 32178,
+            "bus": 32037, "uma": 31954, "nct": 31942, "hy ": 31885, "fea": 31829, "iff": 31829,
+            "epu": 31828, "spi": 31807, "ike": 31715, " lu": 31698, "iga": 31696, "ii ": 31692,
+            "ilo": 31568, "lai": 31387, "typ": 31249, "pac": 31182, "llu": 31038, "tag": 31026,
+            "lue": 31016, "oul": 30838, "dan": 30719, "ney": 30714, "nen": 30704, "key": 30606,
+            "owi": 30580, "urs": 30553, "mov": 30527, "itl": 30516, "ony": 30391, "rum": 30319,
+            "ows": 30274, "ful": 30197, "rra": 30166, "mul": 30159, "coa": 30142, "nee": 30138,
+            "inv": 30106, "dal": 30100, "mma": 30077, "lth": 30060, "gic": 30033, "gui": 30022,
+            "tom": 29936, "dle": 29935, "tla": 29767, "tak": 29757, "tta": 29674, "ask": 29635,
+            "law": 29496, "li ": 29468, "cco": 29437, "ex ": 29419, "occ": 29313, "ibu": 29254,
+            "via": 29199, "zed": 29181, "top": 29122, "gal": 29045, "ff ": 28943, "rfo": 28887,
+            "hai": 28881, "ldi": 28865, "afr": 28749, "oly": 28739, "upp": 28633, "wed": 28630,
+            " ow": 28576, "gn ": 28550, " ii": 28541, "gat": 28511, "jor": 28420, "ngd": 28313,
+            " km": 28301, "rsh": 28300, "cus": 28281, "cis": 28214, "chu": 28019, "ilw": 27998,
+            "efo": 27942, "sm ": 27910, "onf": 27843, "aff": 27842, "rle": 27840, "nol": 27739,
+            "abe": 27729, "orr": 27698, "ix ": 27697, "gas": 27663, "ajo": 27606, "ged": 27606,
+            "bit": 27600, "mol": 27569, "nna": 27532, "liz": 27437, "hie": 27426, "nfo": 27425,
+            "ety": 27383, "gdo": 27360, "peo": 27260, "heo": 27238, " sn": 27188, "bac": 27179,
+            "bly": 27084, "clo": 27081, "rva": 27044, "too": 27044, "ael": 26991, "rtm": 26912,
+            "irc": 26906, "ibl": 26901, "stl": 26896, "def": 26810, " ty": 26790, "aly": 26784,
+            "roo": 26751, "cad": 26654, "mbl": 26607, "pur": 26601, "sul": 26601, "opi": 26584,
+            "ha ": 26541, "cea": 26454, "ai ": 26417, "sim": 26375, "plo": 26352, "ype": 26271,
+            "idi": 26260, "rab": 26255, "sna": 26235, "dif": 26218, "aba": 26164,
+        },
+    },
+    "es": {
+        "totals": (70286890, 82926999, 60413548),
+        "counts": {
+            "e": 9171379, "a": 8186047, "o": 5508586, "n": 5279363, "i": 4955525, "s": 4452815,
+            "r": 4448177, "l": 4088147, "d": 3993726, "t": 3240454, "c": 3236912, "u": 2687481,
+            "m": 1931201, "p": 1763102, "g": 990212, "b": 979848, "f": 730212, "y": 655464,
+            "v": 615609, "h": 559553, "ó": 542725, "q": 298726, "í": 298098, "j": 281158,
+            "z": 272798, "á": 250565, "é": 232623, "k": 153494, "x": 145511, "ñ": 141698,
+            "ú": 87005, "w": 82687, "è": 9587, "e ": 2824316, "a ": 2823508, " d": 2218023,
+            "de": 2170137, "s ": 1984228, " e": 1966982, "o ": 1816298, "n ": 1645057,
+            "en": 1475643, "es": 1362415, " l": 1157875, " c": 1149923, "la": 1149890,
+            "l ": 1070460, " p": 976350, "el": 917493, " a": 864601, "er": 848036, "an": 834405,
+            "ci": 795318, " s": 794062, "nt": 779819, "co": 772123, "ra": 749482, "re": 736360,
+            "ar": 730640, "un": 728751, "al": 711148, "na": 709674, "or": 706641, "os": 699509,
+            "on": 689571, "te": 684069, "ta": 653737, "ad": 631439, "ri": 607019, "ca": 606505,
+            "st": 585737, "as": 581355, "do": 570361, " u": 567374, " m": 564786, "in": 552867,
+            "ue": 529325, "ic": 527484, "to": 511733, "ro": 505140, "r ": 505089, "y ": 494983,
+            "da": 479776, " f": 467696, "ia": 458387, "lo": 439835, " y": 428286, "ti": 416763,
+            "ma": 409459, "po": 398150, "no": 392193, " t": 385882, "pa": 385311, "ac": 383404,
+            "ón": 382883, "se": 380067, "li": 378702, "tr": 375523, "is": 375228, "le": 369297,
+            "io": 362002, " r": 361610, "me": 360496, "id": 350652, "ie": 349344, "di": 348812,
+            "si": 337939, "om": 334368, "ió": 324878, "ne": 323110, "ni": 320081, "it": 317793,
+            "am": 311482, "qu": 294844, "nc": 291584, "pe": 283783, " o": 279717, "nd": 277346,
+            " i": 273843, " b": 269642, "pr": 264785, "sa": 264583, "rt": 263306, "mi": 262080,
+            "ec": 261065, " n": 260220, "ce": 246226, " g": 243819, "mo": 243286, "il": 242265,
+            " h": 231540, "ol": 230551, "vi": 219739, "at": 218597, "br": 202207, " q": 200864,
+            "so": 199864, "su": 199709, "ur": 196055, "ll": 193235, "d ": 191946, " v": 189341,
+            "tu": 185604, "em": 183658, "oc": 180019, "ba": 179452, "cu": 172124, "eg": 169863,
+            "ch": 160686, "ha": 157663, "ua": 157161, "ed": 155081, "im": 150543, "ve": 148124,
+            "sp": 146933, "fu": 146907, "ga": 145865, "bi": 145291, "mu": 144430, "ab": 144055,
+            "mb": 142619, "ns": 140899, "gu": 139527, "gi": 137372, "us": 135539, " j": 135456,
+            "ct": 134054, "et": 133793, "va": 132868, "rr": 132506, "mp": 132049, "ig": 130847,
+            "ul": 130016, "go": 129310, "ea": 126973, "ob": 123195, "pi": 122266, "gr": 119361,
+            "ir": 119098, "rm": 118903, "fi": 118308, "bl": 117456, "iv": 114899, "ep": 114508,
+            "ge": 113712, "za": 111482, "fr": 108332, "ng": 105777, "sc": 105315, "ía": 105050,
+            "ui": 101034, "añ": 100385, "hi": 99684, "u ": 97650, "t ": 94930, "cr": 93933,
+            "ot": 93533, "od": 93463, "he": 93253, "i ": 92849, "fe": 92412, "ru": 91673,
+            "be": 91654, "bo": 91345, "lu": 91305, "au": 91102, "fo": 90909, "ip": 90246,
+            "pu": 90129, "rc": 86488, "rd": 86475, "uc": 86063, "ov": 85328, "ag": 85149,
+            "rg": 83834, "ud": 82055, "fa": 81194, "ju": 79303, "pl": 78772, "ho": 77439,
+            "op": 77349, "iz": 77284, "ap": 77232, "rs": 76964, "ño": 76416, "ut": 75455,
+            "du": 74032, "rn": 71986, "ó ": 71778, "ub": 69875, "jo": 66714, "ev": 65967,
+            "vo": 65147, "má": 63634, "bu": 63352, "eo": 63152, "um": 62826, "án": 62336,
+            "ex": 62245, "tó": 61297, "rí": 60498, "ai": 60480, "ja": 60182, "ay": 59587,
+            "lt": 59369, "ib": 58759, "cl": 57907, "og": 57063, "ña": 56328, "z ": 55163,
+            "én": 55163, "if": 53944, " k": 53916, "ou": 52929, "m ": 52750, "és": 52145,
+            "th": 52141, "dr": 51266, "aj": 50703, "gl": 50338, "je": 50074, "eb": 49402,
+            "ás": 49088, "av": 48388, "lí": 47975, "lm": 47465, "up": 46545, "nu": 46011,
+            "ez": 45865, "cc": 44533, "tá": 43968, "ae": 43681, "iu": 42028, "xi": 40771,
+            "of": 39013, "ei": 38528, "ug": 37794, "eu": 37403, "zo": 36191, "yo": 35768,
+            "sm": 35452, "c ": 35245, " á": 35081, "ér": 34634, "ef": 34480, "hu": 34278,
+            "ís": 34065, " w": 33301, "ín": 33019, "k ": 32633, "nf": 32397, "ié": 32355,
+            "ej": 32037, "x ": 31660, "nz": 31492, "g ": 31294, "h ": 31038, "pt": 30720,
+            "az": 30061, "tí": 29392, "uy": 29308, "rá": 28876, "ya": 28514, "ít": 28434,
+            "rl": 28428, "mé": 27934, "ss": 27514, "á ": 27321, "rb": 27212, "eñ": 26834,
+            "ey": 26516, "dí": 25020, "oe": 24400, "oi": 24324, "gn": 24260, "nn": 24107,
+            "rv": 23971, " z": 23746, "ye": 23683, "lb": 23157, "sl": 23077, "ld": 22533,
+            "ró": 22130, "gé": 21878, "ck": 21843, "ún": 21741, "sd": 21641, "wa": 21505,
+            "af": 21278, "lé": 20848, "xt": 20556, "ka": 20367, "ál": 20287, "oy": 19941,
+            "lg": 19778, "ló": 19506, "ee": 18956, "eq": 18834, "nv": 18820, " x": 18791,
+            "ii": 18780, "rz": 18465, "té": 18357, "íc": 18334, "rq": 18301, "tt": 18266,
+            "fl": 18249, "oa": 18159, "aí": 17948, "b ": 16974, "sh": 16915, "ío": 16786,
+            "é ": 16494, "ár": 16431, "át": 16282, "rp": 16192, "cé": 16005, "oo": 15677,
+            "lc": 15579, "ác": 15525, "lv": 15446, "f ": 15176, "ke": 14800, "uv": 14743,
+            "km": 14607, "tb": 14576, "lá": 14567, "ki": 14501, "í ": 14487, "ól": 14360,
+            "gí": 14289, "ry": 14114, "ór": 13833, "rf": 13796, "mú": 13777, "sí": 13754,
+            "ls": 13390, "ah": 13118, "p ": 13048, "ij": 12968, "pú": 12838, "cí": 12742,
+            "úb": 12720, "ús": 12464, "ph": 12436, "xp": 12413, "dé": 12258, "ní": 12258,
+            "oj": 12159, "nó": 12071, "ét": 12035, "ak": 11907, "tl": 11756, "mó": 11660,
+            "ts": 11628, "rk": 11610, "óm": 11589, " é": 11575, "óg": 11484, "éc": 11450,
+            "él": 11392, "nj": 11352, "uz": 11349, "nq": 11336, "oz": 11222, "éx": 11216,
+            " ú": 11089, "oh": 10801, "uí": 10738, "eó": 10608, "ím": 10418, "ow": 10366,
+            "có": 10267, "uj": 10219, "lf": 10189, "lp": 10103, "ué": 9949, "né": 9922, "uo": 9672,
+            "aq": 9531, "wi": 9415, "gh": 9410, "ox": 9374, "fí": 9213, "ps": 9053, "sé": 9023,
+            "ly": 9017, "zó": 8970, "pó": 8915, "ik": 8874, "ny": 8769, "íf": 8702, "mm": 8572,
+            "zu": 8538, "út": 8499, "ód": 8472, "ré": 8377, "v ": 8314, "nk": 8262, "sk": 8256,
+            "nm": 8232, "ht": 8163, "ao": 8102, "áf": 8040, "dm": 7851, "ux": 7768, "cá": 7737,
+            "w ": 7730, "zi": 7657, "íd": 7650, "mí": 7526, "ú ": 7505, "nú": 7450, "hr": 7436,
+            "bs": 7367, "úl": 7364, "ná": 7351, "gú": 7200, "só": 7077, "gó": 7060, " de": 1908160,
+            "de ": 1556339, "es ": 739276, " la": 738145, "el ": 700754, "la ": 689149,
+            " en": 643157, " es": 638473, "en ": 628833, "os ": 567590, " co": 543165,
+            " un": 506592, " el": 480319, "ent": 408861, " y ": 406137, "as ": 405615,
+            "na ": 398062, "ón ": 361830, "do ": 341916, "ue ": 294774, "nte": 292971,
+            "ión": 292845, "te ": 284941, "con": 276234, "al ": 274116, "ado": 272062,
+            " po": 269810, "una": 267868, "to ": 261732, "ia ": 260890, "or ": 251715,
+            " ca": 245436, " se": 240401, "ra ": 231606, " lo": 230374, "del": 228490,
+            "que": 227040, "aci": 224093, "est": 222608, " re": 217604, "un ": 217532,
+            "ica": 217183, " pr": 213922, "da ": 212873, "ció": 209489, "ant": 205661,
+            "com": 201989, " qu": 199439, " pa": 195719, "on ": 190943, "los": 189540,
+            "sta": 179440, "ta ": 179252, "par": 178848, "ist": 177840, " su": 176032,
+            "por": 173351, " ma": 171131, " di": 171058, " al": 167670, "men": 167009,
+            "se ": 160923, "no ": 158177, "re ": 155218, "ada": 154737, "cia": 152068,
+            " a ": 151113, "io ": 149275, " in": 148282, "nci": 146898, "ro ": 146408,
+            "ran": 146320, "ca ": 145181, "ida": 143468, "dad": 141389, "res": 140547,
+            " fu": 139539, " pe": 139305, "ien": 137287, "nto": 136463, "co ": 135190,
+            "las": 134442, "era": 127455, "ter": 127000, " si": 125887, "pro": 125542,
+            "ico": 124072, "per": 122987, "esp": 122227, "ion": 119701, "art": 119072,
+            "str": 118933, "mo ": 116388, "tra": 116327, "ido": 115195, "ad ": 111062,
+            "fue": 109766, " no": 109372, "ero": 107826, "ici": 106469, "can": 105784,
+            "bre": 105758, "ina": 105516, "an ": 104955, "ona": 104550, "cio": 103441,
+            "nta": 102723, "anc": 101262, "ar ": 100623, "ito": 98982, "er ": 98611, "and": 97693,
+            "ali": 96797, "dos": 96466, " ba": 95673, "ara": 95441, "tor": 94895, "ene": 94564,
+            "ntr": 93850, "lo ": 93016, "uni": 92597, " sa": 92146, "ale": 91936, " fr": 91821,
+            " me": 91648, "mun": 91641, "les": 91476, "des": 90830, "ita": 90631, " ha": 90411,
+            "ía ": 90214, "eci": 89707, "ame": 88516, "ste": 88396, "cie": 87706, "rit": 87431,
+            "tic": 87300, "sa ": 86942, "den": 85908, "eri": 85302, " so": 85041, "rte": 83807,
+            "ari": 83070, "omo": 82407, "rio": 82353, " te": 81897, "tri": 81313, "dis": 80875,
+            "nes": 80792, " ar": 79804, " tr": 79532, "ano": 79509, "esa": 79475, "tam": 79203,
+            "tad": 77862, "enc": 77537, "mar": 76161, " an": 75125, "lla": 74669, " mu": 74505,
+            "one": 74442, "man": 74261, " mi": 74096, "ria": 74022, " cu": 73969, "lia": 73957,
+            "tal": 73680, "ili": 73439, "fra": 73425, "tro": 72914, "ma ": 72422, " ci": 71589,
+            "ces": 71319, "mbr": 71287, "int": 71197, " o ": 71023, " mo": 70982, "ana": 70957,
+            "nal": 70953, "cid": 70600, "su ": 70334, "inc": 70215, "nic": 69869, "lan": 69592,
+            "sti": 69501, "rta": 69414, " gr": 68881, "reg": 68764, " or": 67743, "ura": 67622,
+            "nti": 67583, "tan": 67218, " na": 66712, "egi": 66647, "ori": 66357, "ten": 66323,
+            "pre": 66234, " ju": 66181, "tes": 66100, "nda": 66093, "ort": 65622, "ndo": 65513,
+            "ner": 65372, " vi": 65236, "orm": 64912, "lac": 64631, " fa": 64459, "car": 63288,
+            "ert": 62557, "spa": 61850, "ill": 61746, "nce": 61430, "cal": 61056, "rma": 60914,
+            "mer": 60276, "año": 60064, "rad": 60032, "for": 59914, "pri": 59772, "ont": 59611,
+            "pañ": 59522, " ta": 59484, "le ": 58880, "tre": 58815, "omu": 58045, "fic": 57976,
+            "pec": 57888, "ami": 57872, "nac": 57739, " ch": 57666, "ovi": 57483, "itu": 57305,
+            "gra": 57286, "ne ": 57285, "gen": 57105, "ide": 56950, "oci": 56829, "iza": 56748,
+            "ial": 56085, "cas": 55460, "tos": 55424, "rec": 55408, "nde": 54981, " le": 54935,
+            " ac": 54882, "gió": 54574, "tua": 54339, "mil": 54218, "ier": 54165, "dor": 54124,
+            "ric": 53993, "err": 53481, "go ": 53446, " li": 53184, "ral": 52901, "ono": 52521,
+            "ian": 52472, "ino": 52448, "ers": 52410, "bla": 52392, "cad": 51771, "spe": 51710,
+            "ren": 51706, "end": 51128, "nid": 51044, "min": 50965, "dep": 50829, "edi": 50600,
+            "obl": 50514, "ons": 50424, "ras": 50104, "der": 49978, " pu": 49871, " ro": 49841,
+            "sto": 49757, " do": 49684, " ve": 49351, " to": 49269, "nom": 49236, "us ": 49172,
+            "ast": 48943, "und": 48857, "arr": 48459, "lic": 48449, "ore": 48358, "ros": 47929,
+            "sit": 47886, "qui": 47867, "dic": 47817, "son": 47400, " ce": 47352, "epa": 47324,
+            "ani": 47254, "ula": 47246, "lle": 47097, "ens": 46652, "uer": 46622, "tiv": 46603,
+            "esi": 46520, "ie ": 46477, "ora": 46259, " fo": 46106, "esc": 45995, "és ": 45633,
+            "ing": 45586, "cip": 45552, "tur": 45480, "omb": 45255, "tin": 45124, "ect": 45028,
+            "so ": 44831, "cto": 44819, "is ": 44742, "rin": 44691, " fi": 44655, " au": 44606,
+            "ern": 44545, "ios": 44527, "ama": 44395, " va": 44301, "nor": 44189, "rti": 44079,
+            " cr": 43959, " ti": 43866, "ele": 43829, "mad": 43781, "pob": 43702, "tón": 43482,
+            "rac": 43442, "ña ": 43408, "san": 43357, "rea": 43224, "ron": 42744, "mbi": 42599,
+            "ver": 42481, "nos": 42446, " hi": 42129, "ser": 42063, "cha": 41996, "act": 41870,
+            "iem": 41853, "emb": 41784, "tar": 41661, "ena": 41586, "ual": 41530, "lar": 41436,
+            "oca": 41229, " fe": 41228, "amb": 41071, "ela": 41071, "omp": 41070, "rov": 41024,
+            "ell": 40806, "cen": 40750, "ás ": 40719, "cul": 40621, "ati": 40488, "rie": 40300,
+            " pi": 39950, "ime": 39882, "mie": 39274, "po ": 39204, " bo": 38985, "ol ": 38964,
+            "ndi": 38911, "mon": 38830, "olo": 38775, "cci": 38750, "tas": 38619, "noc": 38585,
+            "uen": 38522, " ex": 38515, "uad": 38503, "lid": 38365, "fam": 38352, "all": 38280,
+            "más": 38263, "ond": 38242, "tie": 38174, "pla": 38138, " as": 38048, "ere": 38036,
+            "ata": 37974, " pl": 37733, "uda": 37565, "alm": 37560, "vin": 37424, "ber": 37267,
+            "rim": 37251, "eno": 37094, "ntó": 37020, " ge": 37009, "cor": 36858, "rra": 36840,
+            " má": 36795, "ini": 36645, "das": 36381, "chi": 36290, "cos": 36158, "ues": 36069,
+            "col": 36057, "sid": 35818, "dio": 35658, "aba": 35637, "ce ": 35472, "eta": 35458,
+            " br": 35387, "nas": 35377, "nad": 35305, "dia": 35235, "ede": 34956, "aña": 34948,
+            "lme": 34946, "gue": 34894, " ga": 34691, "za ": 34624, "zad": 34608, "are": 34407,
+            "emp": 34242, " gu": 33845, "ema": 33787, "ine": 33717, "ctu": 33625, "pos": 33566,
+            "oma": 33534, " he": 33500, "cua": 33441, "med": 33366, "vo ": 33305, " ho": 33155,
+            "arg": 33152, "sic": 33044, "fer": 33018, "liz": 32987, "mpo": 32948, "cue": 32934,
+            "arc": 32672, "rig": 32503, "tem": 32370, "oni": 32298, "rop": 32071, "ece": 32005,
+            "ala": 31798, "rre": 31796, "llo": 31751, "ost": 31662, "nia": 31660, "ate": 31650,
+            "cri": 31616, "erc": 31567, "va ": 31522, "rat": 31492, "ato": 31490, "cam": 31472,
+            "sió": 31343, "ard": 31172, "ade": 31132, "iud": 31065, "ola": 30987, "pue": 30894,
+            "ace": 30766, "in ": 30692, "nst": 30664, "len": 30658, "bar": 30534, " ra": 30528,
+            " lu": 30330, "ga ": 30329, "ord": 30127, "cer": 30048, "iva": 29645, "ias": 29422,
+            "rde": 29313, "isi": 29089, "il ": 29082, "lis": 29055, "ese": 28957, "ind": 28933,
+            "nis": 28903, "én ": 28809, "hab": 28769, "ría": 28707, "ago": 28675, "ima": 28669,
+            "nec": 28654, "sen": 28636, "til": 28629, "rro": 28597, " am": 28502, "uel": 28446,
+            "ven": 28441, " du": 28411, "ble": 28350, " añ": 28328, "ivi": 28311, "jo ": 28253,
+            "ae ": 28175, "ñol": 28121, "ego": 28111, "ea ": 28070, "rna": 28042, "val": 27829,
+            "ivo": 27807, "gua": 27766, "ién": 27517, "imi": 27512, "sig": 27477, "bri": 27454,
+            "nar": 27443, "ió ": 27428, "gar": 27398, "án ": 27367, "uno": 27366, "pol": 27348,
+            "duc": 27199, "ez ": 27186, "igi": 27180, "bli": 27042, "ban": 26993, "loc": 26941,
+            "ive": 26878, "ism": 26830, "ciu": 26750, " da": 26743, "lec": 26734, "erm": 26731,
+            "nsi": 26727, "nse": 26710, "bra": 26651, "odo": 26635, " ja": 26613, " cl": 26527,
+            "ño ": 26522, "sis": 26321, "lem": 26257, "ris": 26175, "abi": 26160, "ust": 26126,
+            "rri": 26111, "amp": 25988, "vil": 25935, "rca": 25800, " th": 25725, "oli": 25682,
+            "omi": 25678, "obr": 25648, "ur ": 25587, "uci": 25554, "bié": 25416, "vis": 25393,
+            "igu": 25326, "ayo": 25160, "scr": 25119, "rid": 24912, " oc": 24698, "cre": 24696,
+            "sco": 24677, "ile": 24670, "tid": 24642, "lat": 24612, "lam": 24610, "pio": 24607,
+            "rge": 24597, "lad": 24486, "egu": 24464, "nt ": 24387, "alt": 24308, "unt": 24294,
+            " ll": 24228, "smo": 24196, "rme": 24156, " ap": 24125, " be": 23973, "he ": 23960,
+            "vid": 23929, "gan": 23906, " go": 23880, "tel": 23707, "mas": 23691, "eni": 23612,
+            "ret": 23611, "tac": 23593, "mpl": 23586, "pal": 23552, "rep": 23426, "lon": 23409,
+            "log": 23375, "ir ": 23370, "rga": 23318, "rso": 23313, "ipi": 23278, "lit": 23261,
+            "onc": 23216, "the": 23183, "sur": 23147, "lor": 23128, "ite": 23119, "lin": 23082,
+            "gos": 23034, "ha ": 23020, "bit": 22599, "abr": 22582, "ega": 22427, "rto": 22364,
+            " ne": 22331, "asi": 22274, "mit": 22265, "sus": 22170, "stá": 22167, "fun": 22112,
+            "ngl": 22080, " jo": 22025, "ipa": 22022, "ifi": 21950, "cho": 21852, "vie": 21693,
+            "roc": 21679, "eco": 21596, "evi": 21593, " bi": 21521, " ab": 21502, " ed": 21462,
+            "ult": 21405, "ire": 21390, "osa": 21383, "mpe": 21376, "imo": 21293, "uan": 21270,
+            "sal": 21262, "eda": 21258, "rod": 21257, " nu": 21249, "sar": 21220, "mic": 21219,
+            "ram": 21212, "sia": 21182, "nat": 21175, "ome": 21150, "elo": 21079, "org": 21075,
+            "jun": 20993, "mis": 20947, "um ": 20862, " em": 20859, "íti": 20855, "rmi": 20846,
+            " is": 20813, "éne": 20764, "may": 20759, "asa": 20743, "bol": 20729, "gun": 20675,
+            "rol": 20667, "eo ": 20655, "var": 20642, " ob": 20507, "nio": 20490, "ton": 20463,
+            "cti": 20454, "eso": 20238, "nza": 20160, "eva": 20123, "esd": 20115, "adi": 20049,
+            "sde": 20004, "gén": 19973, "che": 19885, "ba ": 19878, "uro": 19849, "uri": 19845,
+            "eli": 19783, " ag": 19771, "eal": 19761, "fin": 19583, "ang": 19562, "rab": 19532,
+            "ies": 19531, "tán": 19529, "mes": 19527, "ain": 19507, "rel": 19501, " ni": 19437,
+            "dur": 19421, "olí": 19344, "rup": 19339, "nov": 19327, "orr": 19323, "rci": 19308,
+            "imp": 19247, "apa": 19232, "aro": 19229, "ota": 19189, "ete": 19089, "ebr": 19067,
+            "ueg": 19032, "ey ": 19031, "cel": 19017, "don": 18997, "ich": 18974, "ogr": 18966,
+            "ril": 18939, "sio": 18884, "ech": 18820, "dir": 18800, "isc": 18799, "aut": 18769,
+            "osi": 18739, " gé": 18729, "equ": 18716, "abl": 18696, "sin": 18695, " hu": 18662,
+            "uto": 18658, "ng ": 18654, "eme": 18576, "ubi": 18564, "nue": 18527, "día": 18502,
+            "pel": 18436, "iri": 18435, "mat": 18421, "odu": 18410, "etr": 18301, "rer": 18242,
+            "tit": 18235, "rqu": 18224, "ños": 18182, "anz": 18126, "atr": 18116, "ext": 18108,
+            " ru": 18029, " ad": 18011, "yo ": 17934, "uli": 17880, "sla": 17876, "oll": 17825,
+            "zo ": 17792, "nco": 17791, "baj": 17768, "erv": 17764, "ulo": 17762, "ane": 17755,
+            "lio": 17662, "aje": 17588, "gru": 17556, "xic": 17547, "mos": 17488, "ole": 17479,
+            "ans": 17426, " ot": 17424, "tig": 17405, "otr": 17397, "stu": 17380, "ho ": 17368,
+            "emi": 17348, "udi": 17314, "seg": 17308, "tá ": 17299, "oce": 17267, "tod": 17241,
+            "tud": 17240, "pon": 17239, "ipo": 17187, "upo": 17158, "cin": 17134, "ila": 17117,
+            "ira": 17066, "his": 17036, "adr": 17031, " im": 16980, "ove": 16922, "met": 16848,
+            "igl": 16846, "tru": 16821, "rib": 16779, "has": 16766, "atu": 16694, "cac": 16670,
+            "bie": 16653, "ajo": 16624, "her": 16542, "ya ": 16470, "ept": 16454, "mpa": 16447,
+            "áni": 16413, "sob": 16402, "ncu": 16386, "cea": 16334, "rsi": 16295, "bas": 16282,
+            "ase": 16265, "lít": 16259, "uti": 16202, "hil": 16082, "ín ": 16078, " bu": 16073,
+            "rgo": 16017, "ued": 16010, "aca": 16009, "rce": 15953, "scu": 15948, "ior": 15897,
+            "niv": 15892, "exi": 15850, "ins": 15850, " at": 15816, "gin": 15815, "ead": 15707,
+            "rom": 15707, "upe": 15682, "efe": 15631, "lev": 15617, "uga": 15579, "sad": 15576,
+            "ses": 15571, "uev": 15569, " of": 15543, "ose": 15508, "tio": 15498, "glo": 15485,
+            "rot": 15483, " tu": 15477, "ifo": 15425, "ple": 15398, "bro": 15368, "red": 15261,
+            "emá": 15175, "ler": 15144, "rar": 15085, "lta": 15082, "bic": 15037, "ngu": 15031,
+            "ve ": 15016, "usi": 15007, "gad": 14992, "vel": 14981, "emo": 14924, "ja ": 14889,
+            "die": 14888, "pa ": 14872, "ecu": 14868, " er": 14855, "opi": 14838, "sca": 14799,
+            "rem": 14749, "pen": 14739, " st": 14732, "ua ": 14731, "oso": 14720, "oun": 14708,
+            "leg": 14703, "aís": 14636, "ode": 14611, "iti": 14600, "clu": 14576, "mpr": 14573,
+            "tab": 14559, "oto": 14558, "cap": 14546, "cat": 14539, "niz": 14512, "erí": 14511,
+            "sup": 14503, "ave": 14502, "nd ": 14500, "iad": 14476, "spo": 14448, "abe": 14437,
+            "ícu": 14416, "cla": 14341, "ein": 14332, "gui": 14307, "erd": 14302, "ote": 14228,
+            "áti": 14202, " ri": 14181, "dif": 14152, "dae": 14141, "tim": 14112, " km": 14107,
+            "pti": 14042, "oro": 14041, "sep": 14018, "div": 13995, "arl": 13962, "lli": 13816,
+            "rno": 13811, "gía": 13787, "ay ": 13782, "tec": 13760, "ns ": 13747, "eto": 13724,
+            "nge": 13697, "rdo": 13679, "arí": 13656, "edo": 13652, "mac": 13622, "fre": 13616,
+            "ign": 13613, "eti": 13610, "orn": 13575, "éri": 13573, "abo": 13547, "nim": 13518,
+            "alo": 13492, "rse": 13455, "hac": 13453, "inf": 13445, "eña": 13429, "uar": 13380,
+            "uid": 13351, "ope": 13312, "dri": 13291, "har": 13249, "ref": 13241, "ck ": 13234,
+            "iga": 13218, "lés": 13215, " ub": 13189, "uit": 13101, "ume": 13099, "je ": 13092,
+            "aso": 13076, "usa": 13025, "rtu": 12987, "dan": 12985, "ii ": 12947, "uie": 12890,
+            "soc": 12868, "sos": 12831, "me ": 12825, "eas": 12813, "sol": 12812, "obi": 12794,
+            "ilo": 12791, "rne": 12661, "via": 12659, "uch": 12624, "et ": 12616, "pac": 12615,
+            "ndr": 12605, "oct": 12604, "ejo": 12599, "nca": 12577, "lti": 12566, "tbo": 12533,
+            "luc": 12530, "pit": 12508, "id ": 12492, "agu": 12491, "lbu": 12473, "pin": 12467,
+            "rag": 12449, "eño": 12432, "amo": 12426, "óni": 12420, "ubr": 12417, "nea": 12399,
+            "ís ": 12371, " us": 12351, "úbl": 12344, "glé": 12339, "uta": 12332, "ecc": 12316,
+            "ugu": 12215, "uct": 12213, "mal": 12192, "ige": 12181, "oes": 12161, "nan": 12157,
+            "tis": 12154, "bum": 12078, "avi": 12074, " it": 12073, "ubl": 12045, "gio": 12026,
+            "isp": 12009, " eu": 11992, "din": 11969, "dou": 11963, "ibu": 11957, "rd ": 11954,
+            "mor": 11861, "urg": 11824, "nen": 11810, "hin": 11792, "sas": 11791, "api": 11786,
+            "olu": 11781, "ibe": 11766, "yor": 11730, "neo": 11720, "idi": 11705, "dem": 11684,
+            "sai": 11675, "pan": 11657, "let": 11653, "arq": 11629, "pul": 11629, " ál": 11624,
+            "rzo": 11621, "ogí": 11606, "rt ": 11603, "púb": 11593, "odi": 11580, "aja": 11561,
+            "lib": 11554, "pic": 11535, "pas": 11530, "rs ": 11514, "lto": 11513, "elí": 11498,
+            "bia": 11473, "apo": 11441, "rof": 11386, "vad": 11386, "aga": 11365, "ong": 11339,
+            "dre": 11310, "zac": 11303, "jue": 11292, "álb": 11283, "tia": 11282, "han": 11281,
+            "nqu": 11277, "ún ": 11275, "ice": 11245, "lab": 11220, "did": 11186, "arz": 11183,
+            "be ": 11171, "éxi": 11167, "pli": 11132, "ch ": 11118, "nsa": 11053, "bor": 11023,
+            "erg": 11010, "ge ": 11010, "ibr": 11003, "uis": 11000, " té": 10997, "ío ": 10995,
+            "líc": 10958, "sor": 10955, "gid": 10945, "ied": 10903, "eve": 10842, " mé": 10807,
+            "aza": 10801, "alg": 10767, "exp": 10760, "aco": 10755, "tip": 10749, "ncl": 10729,
+            " fl": 10710, "mán": 10709, "eae": 10702, "gle": 10695, "nif": 10693, "ll ": 10675,
+            "cta": 10659, "lom": 10655, "our": 10655, "rev": 10637, "rus": 10637, "cur": 10605,
+            "asc": 10580, "nve": 10579, "opa": 10564, "sil": 10556, "lig": 10555, "nne": 10554,
+            "isl": 10534, "cab": 10529, "sim": 10529, "unc": 10467, "fes": 10458, "riz": 10435,
+            "ise": 10419, "st ": 10396, "sie": 10373, "ach": 10349, "vol": 10345, "ed ": 10329,
+            "gri": 10321, "río": 10310, "sel": 10295, "tub": 10280, "rvi": 10259, " e ": 10258,
+            "pes": 10236, "iar": 10235, "mod": 10208, "anu": 10190, "eng": 10179, "bal": 10177,
+            "mba": 10176, "pub": 10168, "gic": 10164, "evo": 10163, "mpu": 10144, "tom": 10133,
+            "nfo": 10116, "iac": 10109, "sec": 10078, "dam": 10048, "cés": 10035, "acc": 10027,
+            "zar": 10021, "uma": 10015, "egr": 10013, "dal": 9998, "paí": 9997, "íst": 9984,
+            "ava": 9975, "epr": 9962, "nie": 9958, "dro": 9953, "ctr": 9939, "uye": 9933,
+            "opu": 9913, "ry ": 9879, "rdi": 9872, " ár": 9835, "cte": 9828, "dec": 9801,
+            "vas": 9770, " vo": 9768, "ife": 9766, "rog": 9763, "nch": 9730, "ars": 9729,
+            "ict": 9719, "uso": 9699, "nso": 9665, "cil": 9620, " ut": 9609, "erf": 9607,
+            "gon": 9593, "dra": 9547, "eos": 9539, "ieg": 9534, "enz": 9528, "alu": 9523,
+            "ncé": 9514, "dar": 9501, "aur": 9494, "fil": 9492, " mú": 9473, "mér": 9468,
+            "ltu": 9464, "ofe": 9434, "ruc": 9429, "deo": 9414, "ves": 9401, "teg": 9394,
+            "sub": 9390, "gre": 9359, "cis": 9341, "cim": 9340, "tul": 9339, " wi": 9336,
+            "tea": 9283, "iod": 9277, "arm": 9270, "eur": 9266, "jul": 9258, "onf": 9258,
+            "efi": 9256, "ald": 9255, "opo": 9237, "tir": 9162, "fec": 9155, "edr": 9154,
+            "vic": 9152, "zon": 9132, "van": 9128, "jos": 9116, "orí": 9114, "rón": 9102,
+            "ocu": 9100, "dit": 9088, "epe": 9088, " lí": 9079, "plo": 9048, "oco": 9047,
+            "gal": 9045, " ai": 9020, "oda": 9018, "iel": 8991, "une": 8988, "mát": 8971,
+            "ock": 8945, "cit": 8942, "feb": 8937, "aqu": 8935, "erp": 8929, "tér": 8916,
+            "ure": 8908, "méx": 8860, " je": 8808, "am ": 8792, "ogo": 8779, "spu": 8777,
+            "mús": 8775, "cro": 8764, " id": 8758, "úsi": 8717, "rla": 8699, "ueb": 8677,
+            "pie": 8675, "uin": 8672, "lus": 8634, "vos": 8624, "hum": 8623, "ías": 8590,
+            "bio": 8582, "rni": 8562, "tug": 8561, " gi": 8540, "nit": 8537, "obe": 8533,
+            "naj": 8529, "cir": 8507, " eq": 8506, "ibl": 8505, "ueñ": 8502, "mpi": 8494,
+            "ud ": 8479, "rva": 8468, "érm": 8428, "lea": 8424, "señ": 8377, "deb": 8351,
+            " wa": 8349, "lim": 8340, "uy ": 8325, "och": 8312, "iso": 8290, "lva": 8274,
+            "blo": 8255, "lín": 8248, "hom": 8228, "nam": 8218, "ucc": 8218, "uip": 8207,
+            "ham": 8200, "eza": 8196, "nga": 8189, " ka": 8187, "rda": 8172, "ibi": 8164,
+            "lie": 8152, "mus": 8143, " ej": 8137, "net": 8127, "ger": 8119, "rfi": 8102,
+            "quí": 8097, "rav": 8075, "epo": 8010, "oba": 8003, "gas": 7988, "cuy": 7974,
+            "ngo": 7965, "tat": 7964, "uil": 7952, "útb": 7936, "uat": 7912, "aus": 7903,
+            "jer": 7889, "ced": 7879, "gla": 7868, "gni": 7865, "sul": 7853, "eca": 7852,
+            "aya": 7832, "at ": 7824, "hor": 7815, "rtí": 7814, "ólo": 7805, "flo": 7804,
+            "epú": 7797, "use": 7793, "ni ": 7789, "igo": 7750, "cep": 7727, "def": 7698,
+            "alc": 7683, "uca": 7683, "viv": 7676, "ic ": 7674, "ués": 7665, "eon": 7647,
+            "of ": 7638, "sí ": 7618, "lgu": 7617, "eor": 7614, "adu": 7585, "ann": 7583,
+            "iet": 7563, "eja": 7548, "inv": 7546, "tag": 7515, "ofi": 7512, "éti": 7504,
+            "erb": 7502, "ape": 7495, "pe ": 7492, "lag": 7484, "pop": 7479, "eje": 7469,
+            "xim": 7461, "íne": 7430, "put": 7419, "uce": 7415, "eat": 7412, "gur": 7400,
+            "nez": 7381, "rch": 7367, "lug": 7366, "tín": 7356, "pod": 7343, "rei": 7333,
+            "raf": 7329, " tí": 7323, "arn": 7316, "fri": 7302, "ndu": 7292, "onv": 7285,
+            "rís": 7245, "hos": 7240, "apr": 7236, "ais": 7210, "th ": 7178, "peo": 7168,
+            "bil": 7159, "aun": 7152, "bur": 7145, "doc": 7141, " sc": 7137, "zan": 7115,
+            "ri ": 7113, "gún": 7107, "onj": 7098, "gob": 7093, "nía": 7088, "iam": 7087,
+            "bo ": 7079, "mex": 7078, "ntu": 7064, "ógi": 7057, "sem": 7053,
+        },
+    },
+    "fr": {
+        "totals": (66338594, 78580813, 56850284),
+        "counts": {
+            "e": 9326986, "a": 5398999, "n": 5169182, "i": 4911957, "s": 4718793, "t": 4521195,
+            "r": 4337267, "l": 3881348, "o": 3591209, "u": 3580896, "d": 2920311, "c": 2157999,
+            "m": 1922368, "é": 1796379, "p": 1754140, "g": 953241, "h": 781993, "b": 752762,
+            "f": 747216, "v": 733139, "q": 443292, "y": 327707, "à": 277569, "j": 225896,
+            "x": 220419, "è": 218696, "k": 195131, "w": 107135, "ç": 101170, "z": 101123,
+            "ê": 38749, "ô": 30698, "î": 22540, "â": 19710, "ï": 13787, "û": 11801, "œ": 8733,
+            "ù": 7682, "e ": 4165476, " d": 2102580, "s ": 1924423, "t ": 1634972, " l": 1567634,
+            "es": 1480277, " e": 1334802, "de": 1310308, "n ": 1301691, "le": 1162780,
+            "en": 1031949, "an": 1015681, "on": 985177, " p": 911850, " a": 911770, " c": 860121,
+            " s": 830663, "re": 782842, "nt": 781378, "st": 774684, "la": 745191, "a ": 730589,
+            "is": 664170, "un": 663749, "ne": 660958, "ti": 619397, "r ": 618020, "in": 617805,
+            "te": 616068, "ar": 607657, "l ": 583658, " u": 582086, "er": 561408, "it": 521303,
+            "ra": 520072, "ur": 515467, " m": 514580, "u ": 509520, "ou": 502745, "ri": 498942,
+            "ie": 498651, "ai": 491839, "et": 487438, "al": 474519, "co": 463135, " f": 455227,
+            "me": 443229, "qu": 434608, "se": 429641, "io": 414857, "at": 409476, "or": 409450,
+            "ue": 407659, "ns": 405957, " r": 403997, "pa": 398882, "li": 390974, "il": 380980,
+            "ro": 377104, "é ": 372600, "d ": 364389, "ll": 348027, "si": 340960, "ta": 340864,
+            "tr": 337045, "au": 333437, " n": 327780, "ma": 325718, " t": 324168, "eu": 323149,
+            "om": 320717, "ce": 314433, " i": 305826, "em": 298038, "el": 294172, "rt": 289803,
+            " b": 285845, " o": 283026, "ch": 279692, "à ": 276969, " à": 274935, "du": 274586,
+            "da": 272987, "na": 270359, "ni": 263517, "i ": 262092, "po": 261113, "ré": 256769,
+            "pr": 255679, " é": 254086, "nd": 247872, "so": 246528, "ve": 244805, " g": 235204,
+            "di": 232077, "ée": 230327, "ui": 230155, "ca": 229906, "ic": 228813, "us": 227928,
+            "nc": 212957, "ir": 210609, "ss": 210582, "vi": 209807, "lo": 209564, "dé": 209539,
+            "no": 208900, "mi": 208724, "pe": 206857, "ci": 199625, " v": 196041, "nn": 194465,
+            "ut": 191898, "to": 190852, "té": 190035, "iq": 189141, "sa": 188383, "am": 183953,
+            "oi": 182944, "ol": 182032, " h": 179981, "mo": 179083, "né": 177701, "as": 175555,
+            " j": 174720, "ér": 173640, "ha": 173465, "rs": 168244, "ge": 167884, "tu": 167178,
+            "ét": 167174, "su": 167099, "fr": 163240, "ct": 159489, "ac": 155600, "he": 155596,
+            " q": 151953, "mm": 149391, "gi": 147857, "ec": 142148, "br": 137620, "ba": 134802,
+            "ag": 129146, "ia": 126735, "o ": 123736, "ng": 123325, "mp": 121199, "x ": 120860,
+            "os": 119510, "hi": 119086, "fo": 119066, "th": 118967, "ul": 117513, "iv": 116504,
+            "gr": 115614, "lu": 115476, "pl": 113774, "oc": 112798, "mu": 112240, "ap": 112014,
+            "ig": 111904, "éc": 110985, "va": 108801, "do": 108648, "c ": 108134, "fi": 108098,
+            "és": 107336, "ts": 102393, "av": 102326, "mb": 101583, "m ": 101180, "ég": 99948,
+            "ux": 99749, "ga": 99428, "y ": 99277, "cr": 97683, "rd": 96680, "ho": 95989,
+            "be": 94907, "nç": 94772, "ad": 94574, "op": 94277, "ot": 93297, "ué": 92385,
+            "mé": 91911, "rm": 89580, "ça": 89329, "id": 89273, "pi": 88679, "sé": 88528,
+            "gn": 87721, "bl": 87344, "im": 87035, "ép": 86639, "fa": 86157, "sp": 85355,
+            "ea": 84524, "rn": 84154, "rr": 83294, "bo": 80011, "ph": 79868, "ab": 78438,
+            "gu": 78155, "tt": 77237, "um": 73719, "ru": 72237, "uv": 71595, "rc": 70956,
+            "sc": 70192, "éd": 70000, "og": 68867, "if": 68146, "pp": 68088, "bi": 67469,
+            "iè": 67396, "èr": 67257, "lé": 66665, "rg": 66626, "ei": 65911, "pu": 65796,
+            "up": 64955, "ep": 62933, "jo": 61593, "cl": 61085, "ip": 60451, "od": 60253,
+            " k": 59312, "ud": 59261, "cu": 58711, "uc": 57765, "vo": 57579, "ov": 56208,
+            "én": 55491, "ex": 53989, "pé": 53976, "je": 53824, "go": 53722, "fe": 53138,
+            "dr": 52545, "bu": 52541, "év": 51715, "ua": 51699, "él": 51000, "ub": 50581,
+            "pt": 48826, " w": 48714, "nu": 48492, "ay": 48306, "ob": 47107, "g ": 46447,
+            "cé": 45974, "ja": 45682, "f ": 44719, "ju": 44451, "ém": 44293, "ff": 44067,
+            "vr": 43893, "h ": 43257, "gé": 41926, "k ": 41221, "hé": 40769, "ié": 40043,
+            "gl": 38751, "ib": 37956, "éa": 37956, "ys": 37929, "lt": 35681, "ls": 35163,
+            "rè": 35139, "ès": 34878, "ev": 34640, "of": 34594, "fu": 33433, "rl": 33141,
+            "hu": 32067, "fé": 31064, "ck": 30588, "oo": 30133, "nv": 29268, "ug": 28998,
+            "ka": 28775, "rb": 28741, "éo": 28234, "ed": 28114, "ya": 27740, "èm": 27722,
+            "rv": 27573, "sh": 27561, "cc": 27518, "wa": 27420, "èc": 26515, "oy": 26184,
+            "nf": 26140, " y": 24928, "ae": 24602, "ey": 24158, "sy": 23798, "ef": 23663,
+            "ke": 23430, "b ": 23149, "lm": 23015, "éb": 22743, "eg": 22246, "xi": 22025,
+            "pè": 21910, "fl": 21397, "ix": 21397, "p ": 21047, "z ": 20913, "ry": 20802,
+            "ly": 20798, "wi": 20655, "nr": 20379, "êt": 20220, "éf": 19719, "lb": 19702,
+            "sm": 19680, "ty": 19621, "ps": 19103, "af": 19038, "ki": 18400, "lg": 18291,
+            "hr": 18002, "yo": 17801, "vé": 17663, "sq": 17522, "ld": 17364, "xe": 16992,
+            "gh": 16776, "ym": 16691, "ye": 16656, "rk": 16207, "èt": 16045, "ny": 16039,
+            "ak": 16011, "v ": 15982, "tè": 15940, "yr": 15599, "ao": 15479, "éé": 15388,
+            "rp": 15297, "hy": 15296, "eb": 15026, "ee": 14949, "lè": 14938, "we": 14707,
+            "az": 14616, "yn": 14467, "éq": 14455, "hn": 14386, "yp": 14150, "ds": 13995,
+            "w ": 13938, "ht": 13842, "eo": 13735, "lp": 13659, "bé": 13640, "tb": 13422,
+            "ew": 13282, " z": 13187, "aq": 13150, "ah": 12966, "xp": 12895, "yc": 12861,
+            "sk": 12848, "yl": 12792, "ii": 12760, " x": 12755, "rf": 12647, "za": 12596,
+            "ôt": 12300, "êm": 12225, "sl": 12189, "ez": 12097, "cy": 11950, "ow": 11940,
+            "dm": 11618, "tc": 11543, "èn": 11542, "iu": 11403, "ât": 11174, "mt": 11044,
+            "by": 10945, "xt": 10929, "zo": 10854, "zi": 10741, "ik": 10626, "oh": 10520,
+            "ze": 10497, "mè": 10378, "ms": 10324, "mê": 10277, "nq": 10241, "ko": 10158,
+            "èg": 9962, "aî": 9959, "îl": 9937, " î": 9932, "ût": 9917, "sn": 9845, "aj": 9782,
+            "rq": 9625, "oû": 9564, "oa": 9189, "nk": 9186, "cè": 9053, "bs": 8710, "tl": 8663,
+            "iz": 8646, "ok": 8561, "ço": 8440, "aï": 8404, "hè": 8383, "rê": 8320, "uj": 8246,
+            "ax": 8225, " ê": 8160, "uf": 8137, "cq": 7986, "yt": 7956, "lv": 7890, "cs": 7871,
+            "œu": 7751, "ù ": 7557, "où": 7384, "nz": 7383, "my": 7264, "hl": 7215, "rô": 7192,
+            "oe": 7051, "ox": 6981, "xa": 6853, "vu": 6788, "oq": 6742, "èv": 6684, "lf": 6672,
+            " de": 1141532, "de ": 945562, "es ": 856843, "le ": 735946, " le": 599819,
+            " un": 545112, " la": 517628, "ne ": 496030, "est": 489584, " es": 486570,
+            "la ": 474589, "st ": 465410, "nt ": 427954, "on ": 413868, "re ": 401675,
+            "et ": 392437, "ent": 371396, "ion": 363871, "en ": 363690, " co": 355380,
+            " en": 347030, " et": 342046, "un ": 288242, " à ": 274908, "ns ": 274209,
+            "une": 273015, "que": 267169, " pa": 266491, " l ": 265107, "par": 264306,
+            "ur ": 263487, "ue ": 252733, "tio": 235114, " du": 231621, "des": 229646,
+            "te ": 229351, "lle": 228673, "les": 223508, "du ": 216503, "is ": 216454,
+            "ans": 198981, "ant": 198270, " d ": 197071, " pr": 195988, "ati": 192812,
+            "men": 192406, "ran": 191224, "iqu": 188846, " au": 188058, " da": 187862,
+            "dan": 186874, "se ": 185840, "eur": 185150, "er ": 177809, " ma": 174621,
+            "ée ": 173192, "ie ": 169464, " po": 165879, "com": 165860, "ais": 165056,
+            " so": 161812, "ce ": 152975, " qu": 150006, "eme": 149235, " fr": 147314,
+            " dé": 147001, "our": 142367, "me ": 138747, "ien": 138676, "con": 136604,
+            "ill": 136561, "art": 134713, " su": 134698, "fra": 130024, " mo": 127427,
+            "ain": 126816, " ré": 126408, "ist": 125656, " no": 124388, " ch": 123859,
+            "it ": 122098, " se": 121560, "ell": 121056, "in ": 120797, "té ": 120644,
+            "omm": 120540, "ire": 120253, "ar ": 120208, "au ": 118568, "tre": 117480,
+            " ca": 116964, "il ": 116863, "ont": 114426, " si": 112762, " in": 112263,
+            "son": 112159, "res": 111968, " an": 111932, " ét": 110545, "rs ": 108005,
+            "ale": 107350, "nce": 105515, "ine": 105011, "ons": 103783, "ise": 101298,
+            "ali": 100273, " sa": 100063, "qui": 99689, " re": 99203, "nte": 98733, "and": 98722,
+            "ort": 98537, " il": 97822, "us ": 97767, "anc": 97402, "sit": 96579, "nne": 96393,
+            "ts ": 96064, " di": 96035, " ou": 94224, "pro": 93964, "onn": 93395, "ier": 92906,
+            "anç": 91515, "ux ": 89405, " né": 88113, "itu": 87676, "nça": 87637, "ui ": 87556,
+            " vi": 86893, "çai": 86644, " fo": 86387, "ste": 86262, "rie": 84165, " ce": 83814,
+            "éri": 83768, "al ": 83242, "né ": 83238, "ter": 82954, "rti": 82832, "ou ": 81997,
+            "cha": 81977, " tr": 80305, " al": 79763, " ba": 79642, "tra": 79361, " pe": 78190,
+            "ers": 78150, "che": 76684, "an ": 76640, " ar": 75960, "int": 75915, "éta": 75333,
+            "lis": 75238, "teu": 75009, "sur": 74845, "lan": 74603, " li": 74523, "bre": 74429,
+            "sse": 73979, " gr": 73265, "tai": 73243, "mun": 72605, "rte": 72339, "air": 72297,
+            "ge ": 72294, "ntr": 72123, " ro": 71308, "tem": 70682, " pl": 70372, "ait": 69408,
+            "pou": 69236, "ita": 69211, " fa": 69072, "mar": 68065, "man": 67711, " lo": 67387,
+            "ois": 67090, "rt ": 67054, "ère": 67047, "lie": 66363, "ica": 66266, "tan": 65935,
+            "mmu": 65417, "tué": 65263, "ssi": 65158, "ues": 65033, "str": 64918, "ond": 64776,
+            "ric": 64397, "all": 64288, "ver": 63394, "égi": 62907, "uni": 62457, "ari": 62241,
+            "tiq": 62118, "ure": 61643, "ris": 61412, " do": 61324, "rat": 61280, "iti": 60924,
+            "nis": 60898, "mme": 60859, "ité": 60635, "rég": 60534, "aut": 60224, "nom": 60135,
+            "cti": 59878, " mi": 59032, "ut ": 58626, "el ": 58534, "ite": 57973, "ess": 57266,
+            "gio": 57044, "lit": 56867, " or": 56862, "mon": 56845, "tes": 56728, "rou": 56658,
+            " av": 56190, " fi": 56182, "nde": 56096, "ive": 55895, "ang": 55515, "age": 55470,
+            "cie": 55297, " te": 54979, "lem": 54863, "nal": 54750, "enn": 54421, " a ": 54049,
+            "dép": 53945, "emb": 53506, "gra": 53124, "ouv": 52919, " me": 52667, "uée": 52636,
+            "for": 52564, "he ": 52407, "ori": 52286, "ect": 52251, "mbr": 52251, "tat": 51850,
+            "née": 51678, "ass": 51465, "urs": 51288, "sti": 51286, "épa": 51263, " th": 51211,
+            "aux": 51164, "nd ": 51106, "nes": 51020, "pe ": 50543, " ha": 50411, "tal": 50318,
+            "gne": 50271, "iss": 50166, "ren": 49926, "rd ": 49795, "rit": 49518, "nat": 48959,
+            "uve": 48851, " am": 48692, "ens": 48323, "tie": 47885, " jo": 47761, " ap": 47388,
+            "omp": 47351, " el": 47136, "sio": 46892, "éra": 46783, " br": 46607, "ona": 46449,
+            "nti": 46425, " bo": 46421, " to": 46290, "tri": 46224, "lus": 46191, "err": 46160,
+            "és ": 45990, "oir": 45748, "ani": 45704, " cr": 45240, "ron": 45128, "ili": 45030,
+            "ins": 44722, "ate": 44406, "ous": 44108, "act": 43926, "cou": 43920, "nie": 43637,
+            "ieu": 43579, "ord": 43495, "nci": 43333, "por": 43095, "uis": 42982, "ern": 42947,
+            "mil": 42847, "ées": 42716, "mat": 42658, "per": 42656, "ral": 42593, " ju": 42405,
+            "rés": 42404, "enc": 42120, "app": 42097, " na": 41944, "nta": 41915, "pre": 41906,
+            "eau": 41781, "ign": 41717, "mai": 41522, " ac": 41475, "inc": 41459, "rem": 41279,
+            "plu": 41224, "nts": 41197, "tro": 41105, "ini": 40626, "san": 40605, "pos": 40507,
+            "orm": 40453, "ave": 40354, "tit": 40283, " be": 40208, "pré": 40058, "lai": 40035,
+            " ho": 39898, "sta": 39894, "été": 39872, "ièr": 39842, " st": 39763, "chi": 39738,
+            "min": 39720, "olo": 39631, "ec ": 39615, "ve ": 39545, "tur": 39432, "pri": 39208,
+            "eux": 38960, " ja": 38703, "sou": 38682, "end": 38663, "vil": 38576, "ert": 38461,
+            "ten": 37907, "mér": 37720, "gue": 37672, "rai": 37514, "sai": 37467, " ra": 37449,
+            "ann": 37434, "nda": 37414, "ici": 37411, "oli": 37368, "ami": 37168, "as ": 37163,
+            "ute": 37011, "isé": 36821, "ett": 36757, "don": 36748, "at ": 36684, "ble": 36471,
+            " je": 36439, "col": 36430, "ina": 36398, "ces": 36299, " mu": 35971, "tte": 35818,
+            "déc": 35759, "rre": 35748, "can": 35679, "ard": 35646, "nor": 35486, "oup": 35466,
+            "ial": 35445, "jou": 35022, "log": 34746, "ing": 34736, "uit": 34639, "mor": 34638,
+            "upe": 34564, " ga": 34472, "ton": 34164, "ndi": 34156, "ir ": 34075, "cal": 33785,
+            " ex": 33671, " éc": 33500, "lon": 33452, "ser": 33436, "sé ": 33254, " pi": 33203,
+            "esp": 33176, "uti": 33117, "roi": 33087, "rme": 33077, "tin": 33045, "ven": 32893,
+            "ara": 32792, "om ": 32719, "rin": 32694, "cai": 32564, "car": 32394, "ses": 32384,
+            "agn": 32293, "cri": 32184, " ve": 31969, "eu ": 31850, " cl": 31790, "ès ": 31596,
+            "emi": 31587, "tou": 31577, "sen": 31564, "uel": 31495, "ide": 31414, " ge": 31409,
+            "dit": 31296, "cen": 31125, "out": 30934, "lla": 30932, "pol": 30878, "nse": 30814,
+            "lat": 30778, "rig": 30515, "ana": 30499, "cte": 30379, "cia": 30366, "rop": 30358,
+            "tiv": 30333, "bli": 30327, "nai": 30209, " sc": 30204, "leu": 30125, "usi": 30125,
+            "cor": 29928, "bas": 29923, "erm": 29874, " va": 29872, "nst": 29806, "mes": 29770,
+            "ovi": 29641, "dis": 29420, "ind": 29304, " as": 29235, "rec": 29178, "die": 29137,
+            "uss": 29122, "han": 29050, "ber": 29012, "ési": 28918, "vin": 28833, "nna": 28812,
+            "mpo": 28665, "gro": 28558, "vec": 28438, "isi": 28415, "ace": 28163, "isa": 28074,
+            "rma": 27965, "oma": 27935, "the": 27812, "amé": 27799, "édi": 27690, "ème": 27688,
+            " ne": 27531, "réa": 27396, "cul": 27372, "her": 27331, "ls ": 27190, " sp": 27108,
+            "fon": 27020, "cat": 26927, "ice": 26902, "rna": 26829, "gen": 26739, "rne": 26551,
+            "ti ": 26511, "ppe": 26475, "ng ": 26468, " ci": 26401, " fu": 26386, "arc": 26378,
+            "har": 26334, "éné": 26266, "fam": 26250, "nan": 26247, " on": 26242, "oci": 26047,
+            "pla": 26028, " pu": 26022, " ta": 25963, "tor": 25952, "sto": 25947, "ivi": 25932,
+            "niq": 25898, "vie": 25896, "sée": 25892, "rch": 25796, "onc": 25758, "ubl": 25725,
+            "lli": 25721, "ssa": 25709, "tic": 25452, "ll ": 25434, "rov": 25371, "emp": 25298,
+            "fil": 25221, " hi": 25171, "oue": 24956, " gu": 24827, "vis": 24817, " ph": 24793,
+            "lin": 24717, "cré": 24660, "den": 24656, "let": 24641, "édé": 24476, "ava": 24401,
+            "fic": 24328, " ri": 24282, "qua": 24258, "bou": 24248, " s ": 23984, "ule": 23978,
+            "sem": 23920, " bi": 23904, "ein": 23896, "ogi": 23895, "rès": 23870, "val": 23845,
+            "ué ": 23787, "ése": 23781, "éco": 23770, "cip": 23717, "oni": 23679, "oit": 23632,
+            "ich": 23588, "vel": 23577, "bal": 23571, "si ": 23508, "van": 23469, "nné": 23464,
+            "ian": 23438, "ats": 23409, "sie": 23358, "riq": 23356, "ham": 23355, "amp": 23230,
+            "ust": 23088, "pui": 23064, "use": 23041, " mé": 23004, "rap": 22951, "mie": 22944,
+            "fai": 22917, "nsi": 22894, "écr": 22748, "ud ": 22607, "soc": 22585, "iel": 22526,
+            "ra ": 22507, "tif": 22436, "ifi": 22387, " eu": 22299, "ast": 22288, "gie": 22112,
+            "ia ": 21961, "adi": 21924, "èce": 21913, "igi": 21897, "ula": 21824, "are": 21800,
+            "voi": 21769, "dre": 21768, "toi": 21756, "phi": 21732, "fut": 21703, "tér": 21675,
+            "um ": 21626, "rta": 21499, " fe": 21496, "pag": 21493, "ong": 21441, "vai": 21124,
+            "elo": 21097, "ema": 21014, "ura": 21007, "ngl": 20995, "ail": 20993, "omb": 20959,
+            " gé": 20899, "sig": 20886, "pub": 20867, "der": 20812, " oc": 20805, "sin": 20761,
+            "iva": 20746, "gin": 20723, "ndr": 20713, "ena": 20675, "pel": 20669, "ala": 20659,
+            " it": 20598, "arr": 20556, "lor": 20550, "til": 20545, "éal": 20524, "ole": 20481,
+            "dér": 20431, " at": 20374, "sa ": 20364, "os ": 20357, "ult": 20316, "rom": 20207,
+            "tis": 20099, "ctu": 20091, "sso": 20070, "fin": 20051, "org": 20050, "uil": 20013,
+            "rge": 19992, " lu": 19981, "erv": 19978, "abl": 19961, " go": 19885, "ora": 19855,
+            " sé": 19742, "aus": 19732, " vo": 19720, " he": 19697, "sat": 19662, "hau": 19654,
+            "uct": 19646, "sor": 19583, "rel": 19572, "ept": 19543, "iso": 19540, "jui": 19529,
+            "liq": 19529, "jeu": 19460, "ges": 19429, "oul": 19390, "his": 19375, "vri": 19364,
+            "deu": 19332, "bel": 19265, "riv": 19174, "ret": 19172, "erc": 19130, "rod": 19072,
+            "sud": 19063, "ile": 18930, "nnu": 18917, "qu ": 18907, "nto": 18893, "nvi": 18890,
+            "one": 18885, "iné": 18867, "gén": 18856, "pte": 18796, "omi": 18767, "ipa": 18735,
+            "dé ": 18734, "cet": 18714, "ode": 18688, "enr": 18661, "rep": 18635, "lec": 18621,
+            "nge": 18618, "seu": 18614, "tue": 18585, "mpl": 18530, "ono": 18517, "vol": 18467,
+            "ime": 18408, "ré ": 18385, "eil": 18380, "pen": 18365, " bu": 18348, "pal": 18293,
+            "pon": 18257, "niv": 18250, "dia": 18227, "hom": 18219, "na ": 18193, "lac": 18171,
+            "mis": 18157, "roc": 18144, "nel": 18137, "oll": 18132, "spè": 18097, "loi": 18096,
+            "cto": 18088, "uri": 18044, "pèc": 18042, "rac": 18041, " él": 18021, "ict": 17983,
+            "mer": 17959, "ria": 17879, "io ": 17855, "odu": 17793, "urn": 17785, "rad": 17757,
+            "ey ": 17748, "ogr": 17742, "ngu": 17741, "ath": 17738, "pér": 17722, " of": 17687,
+            "ors": 17665, "ore": 17630, "lic": 17589, "squ": 17455, " ad": 17435, "eri": 17387,
+            "nem": 17361, "mpi": 17291, "las": 17285, " im": 17160, "vem": 17149, "ndé": 17148,
+            "prè": 17131, "mus": 17057, "amm": 17042, "cer": 17030, "gan": 17016, "cin": 16999,
+            "thé": 16932, "ars": 16927, "utr": 16881, "ean": 16858, "att": 16852, "olu": 16814,
+            "oin": 16797, " fé": 16770, "céd": 16748, "ai ": 16674, "ies": 16655, "rsi": 16639,
+            "ach": 16602, "ae ": 16557, "bri": 16551, "ix ": 16528, "ost": 16493, "ume": 16466,
+            "éro": 16442, "gal": 16426, "éti": 16412, "ple": 16401, "nté": 16371, "epr": 16261,
+            "ys ": 16246, "if ": 16206, "imp": 16150, "éci": 16144, "uer": 16125, "nni": 16118,
+            "pas": 16097, "duc": 16031, "or ": 16010, "ima": 15975, "rso": 15966, "gla": 15951,
+            " ai": 15942, "nco": 15938, "spa": 15911, "ove": 15893, "tru": 15862, "tés": 15841,
+            "ppa": 15829, "nit": 15799, "rri": 15769, "dés": 15740, "ade": 15733, "met": 15733,
+            "sei": 15724, "nér": 15715, "peu": 15687, " ru": 15648, "urg": 15629, "iat": 15622,
+            "abi": 15595, "vre": 15576, "aph": 15548, "ose": 15543, "bar": 15521, "uro": 15520,
+            "sep": 15495, "non": 15485, "ame": 15452, "uin": 15450, "atr": 15439, " év": 15420,
+            "spo": 15398, "reu": 15390, "ome": 15382, "nic": 15379, "atu": 15332, " sy": 15329,
+            "réé": 15299, "nu ": 15262, "ays": 15243, "idé": 15214, "hum": 15199, "arl": 15187,
+            "élé": 15180, "oph": 15160, "rée": 15149, "ueu": 15091, "ler": 15063, "hin": 15050,
+            "cle": 15005, "ram": 14978, "pti": 14976, "ck ": 14947, "nch": 14886, "ta ": 14870,
+            "eus": 14865, "da ": 14864, "uan": 14849, "ch ": 14828, "uli": 14760, "ger": 14731,
+            "ièm": 14714, "rav": 14677, "era": 14672, "uto": 14655, "ner": 14652, "eco": 14578,
+            " ti": 14570, "ril": 14567, "rni": 14539, "ama": 14537, " fl": 14505, "équ": 14445,
+            "aro": 14440, "div": 14424, "cla": 14396, "tho": 14369, "rga": 14359, "lia": 14317,
+            "ilm": 14297, "rce": 14227, "sme": 14217, "mag": 14210, "dif": 14101, "cel": 14093,
+            "opp": 14092, "neu": 14088, "ban": 14082, "ane": 14041, "epu": 14012, "iff": 14012,
+            "osi": 13992, "ota": 13987, "lée": 13954, "nre": 13930, "ipe": 13929, "sid": 13927,
+            "ism": 13926, "llo": 13913, "pho": 13907, "ida": 13896, " bl": 13887, "ry ": 13884,
+            "ére": 13799, "ude": 13798, "mpa": 13773, "eli": 13751, "lop": 13744, "écé": 13741,
+            " ut": 13716, "hie": 13715, " is": 13697, "éga": 13682, "ech": 13667, "tud": 13647,
+            "erg": 13600, "iét": 13514, "éce": 13512, "oot": 13483, "évo": 13471, "dir": 13444,
+            "oss": 13431, "sui": 13416, "bit": 13396, " éd": 13385, "ata": 13379, "hil": 13377,
+            "hon": 13352, "lig": 13313, "rot": 13239, "rra": 13162, "jea": 13129, "tel": 13125,
+            "dro": 13106, "oct": 13097, "tar": 13094, "dep": 13089, "avi": 13083, "oca": 13060,
+            "ada": 13056, "siq": 13014, "ino": 12991, "nau": 12991, "pes": 12928, "lm ": 12927,
+            "ano": 12803, "dai": 12767, "rio": 12752, "émi": 12731, "to ": 12714, "nue": 12712,
+            "lé ": 12711, "nar": 12696, "éle": 12690, "rag": 12671, "icu": 12669, "eti": 12647,
+            "méd": 12609, "but": 12601, "aqu": 12595, "tba": 12570, "fes": 12569, " ép": 12565,
+            "uté": 12504, "fér": 12432, "imi": 12406, "ock": 12402, "alb": 12381, "nad": 12377,
+            "foi": 12370, "hab": 12359, "alo": 12342, "mbl": 12331, "not": 12329, "iro": 12325,
+            "ié ": 12315, "ro ": 12314, "dui": 12311, "rdi": 12299, "am ": 12290, "ato": 12284,
+            "rse": 12239, "len": 12174, "ême": 12159, "ros": 12152, "itr": 12118, "otb": 12106,
+            "ves": 12081, "apo": 12040, "arg": 12036, "ic ": 12032, "oto": 12004, "vit": 11987,
+            "sér": 11984, "dio": 11927, "miè": 11922, "tec": 11914, "thu": 11875, "ot ": 11871,
+            "éve": 11864, "elé": 11860, "hes": 11848, " ég": 11829, "ni ": 11818, "umb": 11805,
+            "no ": 11795, "igu": 11721, "ctr": 11700, "exp": 11699, "dat": 11688, "lbu": 11677,
+            "be ": 11661, "uvr": 11649, "ds ": 11646, "ffi": 11627, "ase": 11574, "arm": 11551,
+            "oi ": 11549, "noi": 11530, "ma ": 11524, "oya": 11498, "vid": 11495, "lag": 11480,
+            "sci": 11470, " dr": 11453, "foo": 11436, " c ": 11416, "rof": 11414, "ène": 11368,
+            "aur": 11354, "réc": 11353, " ag": 11352, "sel": 11350, " éq": 11336, " hu": 11315,
+            "bum": 11288, "cem": 11283, "ela": 11282, " af": 11272, " wi": 11260, "nov": 11258,
+            "urt": 11255, "sis": 11253, "orn": 11249, "ico": 11245, "ils": 11236, "sec": 11236,
+            "udi": 11213, "spé": 11204, "inf": 11189, "éma": 11177, "tob": 11135, "och": 11107,
+            "ul ": 11106, "rde": 11104, " ni": 11097, "bor": 11093, "tée": 11073, "uch": 11064,
+            "tag": 11022, "opé": 11013, "mét": 11009, " wa": 11001, "ri ": 10992, " ka": 10962,
+            "lar": 10935, "ito": 10908, "of ": 10906, "tta": 10904, "étr": 10893, "péc": 10887,
+            "ilo": 10879, "itt": 10859, "siè": 10850, "una": 10830, "mou": 10824, "giq": 10802,
+            "yst": 10800, "rus": 10779, "obr": 10777, " té": 10776, "ote": 10769, "ndu": 10752,
+            "ol ": 10751, "vir": 10748, "opo": 10738, "els": 10727, "rle": 10727, "gle": 10717,
+            "th ": 10711, "mal": 10704, "nag": 10703, "ps ": 10703, "eut": 10699, "jan": 10693,
+            "pio": 10675, " ab": 10657, "ola": 10628, "omt": 10618, "rg ": 10612, "moi": 10596,
+            "gre": 10583, "its": 10569, "exi": 10548, "idi": 10544, "stè": 10526, "dic": 10492,
+            "rmé": 10475, "dév": 10462, "cho": 10460, "uat": 10437, "ay ": 10427, "avo": 10413,
+            "ras": 10406, "épu": 10400, "lié": 10397, "mit": 10387, "uéb": 10376, "gis": 10364,
+            "dée": 10321, "api": 10314, "cié": 10273, " mê": 10232, "émo": 10213, "mem": 10190,
+            "hol": 10188, "ndo": 10176, "êtr": 10139, "din": 10138, "ere": 10113, "cro": 10112,
+            "eve": 10111, "dmi": 10099, "tél": 10092, "oui": 10077, " ob": 10074, "gni": 10059,
+            " n ": 10043, "acc": 10028, "anv": 10025, "aci": 10019, "pul": 10006, "ed ": 9999,
+            "gar": 9985, "mb ": 9981, "nol": 9967, "rid": 9964, "tré": 9963, "loc": 9951,
+            "miq": 9951, "tab": 9930, "évi": 9923, "erb": 9918, "mot": 9918, "ète": 9916,
+            " îl": 9913, "rvi": 9893, "co ": 9868, "lo ": 9843, "adm": 9823, "uen": 9815,
+            "aul": 9810, "omo": 9810, "phe": 9797, "igh": 9785, "mêm": 9754, "nio": 9717,
+            "île": 9715, "rk ": 9714, "bie": 9676, "reg": 9663, "di ": 9657, "osé": 9652,
+            "tim": 9651, "ruc": 9646, "elg": 9644, "agi": 9624, " op": 9623, "mé ": 9595,
+            "avr": 9575, "amb": 9570, "qué": 9551, "rqu": 9541, "tom": 9528, "ssu": 9524,
+            "rro": 9520, "ofe": 9519, "oût": 9507, "orr": 9505, "ext": 9480, "sup": 9440,
+            "cit": 9428, "abo": 9408, "mée": 9397, "eni": 9389, "bil": 9380, "vic": 9378,
+            "abe": 9364, "dém": 9364, "rth": 9356, "clu": 9348, "apr": 9346, "ez ": 9334,
+            "gno": 9326, "pay": 9300, "sil": 9278, "env": 9265, "rla": 9260, "éni": 9260,
+            "ila": 9244, " cu": 9192, "nso": 9167, "sco": 9152, "lom": 9149, "uip": 9137,
+            "rim": 9133, "nct": 9124, "pat": 9116, "nou": 9106, "aud": 9105, "pli": 9068,
+            "tam": 9043, "évr": 9038, "tch": 9033, "ût ": 9033, "off": 9016, "mod": 8999,
+            "éna": 8958, "tia": 8957, "déf": 8940, "éli": 8934, " yo": 8931, "yan": 8923,
+            "opu": 8920, "dae": 8896, "uar": 8894, "lou": 8888, "gna": 8886, "rmi": 8879,
+            "enu": 8876, "mma": 8876, "sol": 8864, "occ": 8851, "dom": 8813, "aya": 8788,
+            "fév": 8788, "sea": 8788, "ope": 8783, "erl": 8779, "ght": 8779, "ché": 8767,
+            "ac ": 8751, "ibl": 8749, "lut": 8740, "ppo": 8721, " pé": 8718, "hel": 8715,
+            "pop": 8694, "ira": 8690, "bat": 8684, "lab": 8668, "plo": 8634, "rog": 8618,
+            "isc": 8611, " ao": 8597, "rab": 8579, "sic": 8539, "cap": 8531, "nim": 8520,
+            "ew ": 8505, "nfo": 8493, "ht ": 8492, "abr": 8483, "tir": 8477, "sla": 8458,
+            "ef ": 8454, "gou": 8451, "hor": 8438, "poi": 8423, "pet": 8398, "pie": 8398,
+            "by ": 8395, "rts": 8395, "éré": 8391, "arn": 8384, "aoû": 8368, "irc": 8347,
+            "aie": 8332, "net": 8307, "ele": 8299, "iri": 8297, "éme": 8284, "rco": 8273,
+            "tut": 8273, "cra": 8267, "pit": 8267, "nin": 8256, "do ": 8222, " em": 8216,
+            "rto": 8213, "uma": 8198, "scr": 8195, "aff": 8179, "ôte": 8179, "rip": 8171,
+            " gi": 8161, " êt": 8158, "éen": 8156, "lib": 8142, "rib": 8141, "eta": 8136,
+            "arb": 8126, "ii ": 8125, "li ": 8120, "jet": 8119, "lub": 8118, "lue": 8111,
+            " sh": 8106, "cke": 8035, "pée": 8023, "pha": 8008, "dou": 8007, "ld ": 8004,
+            "mpr": 7983, "evi": 7979, "rép": 7979, "onf": 7947, "ct ": 7934, "eig": 7921,
+            "mic": 7917, "fer": 7877, "lui": 7872, "héo": 7867, "rol": 7836, "new": 7835,
+            "pan": 7834, "sul": 7775, "ffe": 7771, "réf": 7765, "del": 7755, "aum": 7753,
+            "éte": 7748, "nif": 7747, "gui": 7723, "ete": 7713, "go ": 7689, "hef": 7684,
+            "ogn": 7673, "liv": 7668, "mas": 7661, "nve": 7658, "lif": 7647, "rét": 7637,
+            "fri": 7633, "pir": 7633, "orc": 7615, "éé ": 7606, "bra": 7577, "los": 7562,
+            "vra": 7557, "alt": 7552, "oti": 7550, "ago": 7536, "ms ": 7519, "soi": 7516,
+            "mi ": 7506, "cs ": 7503, "sys": 7499, "eva": 7495, "écu": 7487, "asi": 7486,
+            "nga": 7486, "eul": 7484, "oye": 7463, "lég": 7457, "épo": 7454, "aga": 7441,
+            "ero": 7440, "cid": 7429, "isp": 7420, "ado": 7415, "cqu": 7392, "cad": 7391,
+            "mps": 7384, "où ": 7381, "tèr": 7376, "mba": 7370, "dev": 7361, "ouc": 7361,
+            " où": 7340, "rea": 7335, "rbe": 7330, "rve": 7324, " lé": 7304, "rén": 7293,
+            "tèm": 7268, "tiè": 7263, "fus": 7249, "lio": 7237, "riè": 7237, "aru": 7211,
+            "ty ": 7203, "rtu": 7199, "mbo": 7187, "yen": 7179, "cir": 7170, "ca ": 7169,
+            "cis": 7169, "sca": 7156, "déb": 7151, "ibu": 7144, "ny ": 7135, "chn": 7132,
+            "dur": 7123, "ony": 7110, "bec": 7102, "acé": 7099, "obi": 7081, "jus": 7076,
+            "cée": 7075, "cci": 7074, "ub ": 7072, "mul": 7053, "éo ": 6991, "cea": 6989,
+            "llé": 6984, "var": 6981, "mpt": 6961, "doc": 6954, "ttr": 6953, "hiq": 6944,
+            "typ": 6932, "nqu": 6929, "phy": 6923, "rer": 6909, "oug": 6908, "eff": 6903,
+            "ébe": 6903, "ga ": 6882, "nen": 6872, "étu": 6864, "fac": 6862, "ene": 6850,
+            "ffé": 6845, "lti": 6832, "dra": 6827, "sac": 6821, "mmé": 6819, "spe": 6813,
+            "ork": 6806, "euv": 6803, "esc": 6799, "lim": 6784, "rgi": 6778, "nsu": 6773,
+            "arq": 6770, "éfi": 6764, "até": 6761, "iol": 6761, "omé": 6755, " we": 6753,
+            "lév": 6751, "ège": 6746, "ick": 6729, "gli": 6716, "vea": 6695, "dri": 6694,
+            "auc": 6672, "lam": 6667, "ith": 6663, "ige": 6657, " cy": 6653, "nsc": 6653,
+        },
+    },
+    "pt": {
+        "totals": (49778514, 58587553, 42469388),
+        "counts": {
+            "a": 6117472, "e": 5571751, "o": 4796327, "i": 3558567, "d": 3208970, "s": 3145540,
+            "r": 3138112, "n": 2908340, "t": 2350637, "m": 2267644, "c": 1966384, "u": 1953446,
+            "l": 1648187, "p": 1273669, "g": 738926, "b": 654328, "h": 543411, "f": 521897,
+            "v": 517904, "é": 465585, "ã": 317848, "ç": 214936, "í": 209507, "q": 198922,
+            "á": 197351, "k": 191624, "z": 184813, "j": 160935, "ó": 129413, "x": 127257,
+            "y": 102887, "w": 74269, "ê": 67610, "ú": 40758, "â": 37738, "õ": 33734, "à": 26465,
+            "ô": 23605, "ü": 5538, "è": 5136, "a ": 2260289, "o ": 2059879, "e ": 2023378,
+            " d": 1715378, "de": 1407786, "s ": 1160128, " c": 849927, " e": 808473, " a": 786217,
+            " p": 739852, "do": 682344, "es": 681007, "da": 661653, "en": 622116, "m ": 610401,
+            "ra": 605786, "co": 598739, "an": 579808, "te": 577078, "ad": 561485, "ma": 557186,
+            " s": 541147, "nt": 522402, " u": 522008, "os": 516596, "re": 513407, "er": 508227,
+            "or": 499167, "um": 498811, "ta": 467419, "st": 463948, "na": 453562, "as": 453313,
+            "al": 452732, " n": 445659, "ri": 429011, " o": 417639, "in": 416875, "ar": 416596,
+            "ia": 390572, "ca": 389505, " m": 383704, "no": 375333, "ro": 364608, " f": 361304,
+            "om": 360608, "on": 341990, "to": 338832, "ci": 337098, "ic": 326922, "is": 322059,
+            "é ": 320207, "se": 320193, "po": 319710, "em": 310590, "ão": 308442, "id": 307392,
+            "r ": 303972, "me": 302969, " é": 301262, "nd": 299787, "l ": 281164, "li": 276014,
+            "tr": 273063, " r": 271388, "ti": 264437, "it": 260738, "pa": 256432, "la": 254524,
+            " t": 251660, "am": 249014, "si": 239610, "ni": 231765, "ce": 228102, "un": 227564,
+            "el": 226990, "io": 223313, "ha": 222893, "di": 220596, " l": 219087, "pe": 213501,
+            " b": 213090, "at": 203146, "pr": 199237, "lo": 196919, "qu": 195513, "rt": 193480,
+            "nc": 193122, "le": 190989, "ns": 188107, " h": 185719, "i ": 181130, " i": 179754,
+            "ir": 178791, "ei": 173784, "sa": 172443, "ue": 171782, " g": 167672, "il": 161901,
+            "eg": 161615, "mi": 158130, "mo": 155710, "ol": 150712, "so": 149848, "ve": 145208,
+            "ab": 144175, "fo": 142393, "tu": 138782, "ai": 134662, "gu": 133580, "ss": 133040,
+            "br": 131825, "ua": 131657, "çã": 131394, "u ": 130375, "ne": 129286, " v": 128411,
+            "ul": 126725, "ou": 126561, " q": 126273, "mu": 125997, "ur": 125836, "su": 124151,
+            "va": 123440, "gi": 122134, "et": 118849, " k": 116574, "iv": 114919, "im": 114838,
+            "ec": 114155, "vi": 114091, "n ": 112737, "oi": 109737, " j": 109227, "ea": 109055,
+            "ba": 108448, "bi": 107281, "aç": 106998, "ac": 105791, "oc": 103353, "ho": 98930,
+            "ui": 98859, "ga": 98597, "ut": 96190, "nh": 95890, "mp": 92721, "ch": 88993,
+            "km": 88160, "us": 87304, "ár": 84913, "pi": 84689, "he": 84507, "go": 83938,
+            "fi": 83533, "ng": 82893, "ge": 82813, "gr": 81072, "od": 80574, "iz": 80563,
+            "za": 80538, "ed": 78916, "sc": 78411, "fr": 77828, "ov": 77341, "ig": 76460,
+            "ie": 76108, " á": 75675, "sp": 74972, "rr": 74864, "mb": 74173, "rm": 73617,
+            "t ": 66931, "be": 66741, "lh": 65430, "iã": 65284, "fe": 65061, "au": 64923,
+            "ep": 64753, "ag": 64378, "op": 64022, "bo": 63154, "cr": 60543, "ap": 60289,
+            "eu": 60088, "vo": 58913, "cu": 58647, "fa": 56978, "ex": 56960, "ip": 55696,
+            "sã": 55380, "rn": 53960, "rd": 53701, "lu": 52334, "og": 52000, "rc": 51264,
+            "b ": 50847, "hi": 50479, "av": 49201, "d ": 49042, "ot": 49005, "du": 48733,
+            "ll": 48668, "ru": 48286, "rg": 47427, "ja": 46690, "ev": 46416, "jo": 45513,
+            "pu": 45299, "y ": 44219, "rs": 43158, "cl": 42031, "ub": 41087, "ró": 40309,
+            "ob": 40172, "ça": 38992, "lt": 38629, "ín": 37401, "dm": 36748, "pl": 36594,
+            "nç": 36309, "bu": 35814, "th": 35769, "ug": 35554, "fu": 34678, "lm": 34639,
+            "ju": 34402, "õe": 33653, "ên": 31853, "ct": 31468, "éc": 31275, "ao": 31258,
+            "ói": 30866, "ér": 30738, "ân": 30468, "dr": 29810, "rí": 29707, " w": 28455,
+            "c ": 28382, "z ": 28371, "eo": 27810, "rb": 27665, "eb": 27192, "of": 27077,
+            "if": 27051, "ud": 26863, "tó": 26791, "ês": 26627, "g ": 26553, "lí": 26351,
+            "up": 26206, "iç": 26049, " à": 25954, "cí": 25911, "xi": 25832, "ze": 25298,
+            "ez": 25288, "á ": 25281, "ae": 25110, "nu": 24993, "ví": 24973, "ib": 24713,
+            "ém": 24476, "íp": 23888, "ór": 23808, "uc": 23327, "sm": 23244, "pé": 22989,
+            "tá": 22795, "bl": 22439, "ef": 22289, "à ": 22252, "h ": 22234, "íl": 22187,
+            "mí": 22028, "ís": 21982, "çõ": 21574, "gn": 21302, "oa": 21115, "ço": 21084,
+            "lv": 20781, "k ": 20205, "sh": 19545, "sé": 18935, "az": 18902, "té": 18873,
+            "rá": 18536, "ío": 18396, "gl": 18191, "rv": 18129, "ít": 18007, "wa": 17979,
+            "je": 17921, "ld": 17597, "ix": 17582, "nf": 17343, "nv": 17155, "rq": 17132,
+            "bé": 16913, "uí": 16711, "xc": 16696, "ón": 16555, "oe": 16285, "rl": 15891,
+            "íd": 15269, "x ": 15240, "ál": 15193, "mé": 15139, "ck": 15123, "nn": 15103,
+            "tt": 15069, "fl": 15028, "ka": 15008, "eq": 14954, "uz": 14799, "ló": 14756,
+            "zi": 14725, "p ": 14523, "wi": 14446, "lb": 14242, "lg": 14230, "ôn": 14217,
+            "af": 14102, "xa": 14045, "tí": 13967, "ay": 13866, "aí": 13564, "hu": 13446,
+            "lá": 12510, "iu": 12350, "ej": 12312, "gê": 12280, "ki": 12050, "ee": 12045,
+            "tâ": 11963, "íc": 11953, "oo": 11470, "ow": 11301, "rç": 11146, "ke": 10814,
+            "rp": 10793, "nã": 10618, "tã": 10541, "xt": 10508, "át": 10444, "ls": 10434,
+            "ná": 10363, "zo": 10261, "ús": 10148, "uê": 10113, "ré": 9925, "f ": 9921, "vr": 9835,
+            " x": 9721, "ey": 9665, "ry": 9625, "pt": 9571, "ét": 9564, "tl": 9288, "lé": 9270,
+            "ph": 9247, "mã": 9155, "ás": 9114, " z": 9058, "xe": 8953, "ím": 8935, "eç": 8830,
+            "ii": 8816, "uç": 8683, "sk": 8628, "ak": 8531, "rã": 8523, "cç": 8441, "óp": 8429,
+            "xo": 8355, "rê": 8332, "ts": 8324, "ól": 8310, "és": 8228, "má": 8216, "úb": 7903,
+            "né": 7825, "ah": 7769, "sl": 7670, "ós": 7667, "ny": 7562, "éd": 7542, "w ": 7530,
+            "él": 7493, " y": 7429, "aq": 7417, "gh": 7414, "sb": 7374, "oj": 7341, "xp": 7291,
+            "rk": 7248, "ní": 7223, "bs": 7191, "lc": 7172, "yr": 7114, "pú": 7028, "áx": 6998,
+            "ác": 6980, "mú": 6929, "áv": 6927, "nj": 6755, "lê": 6741, "ps": 6678, "sd": 6659,
+            "rf": 6634, "ly": 6623, "ya": 6552, "aj": 6551, "sq": 6495, "ód": 6423, "iá": 6420,
+            "dé": 6382, "ht": 6380, "én": 6312, "âm": 6223, "ds": 6146, "nk": 6105, "óg": 6061,
+            "lp": 6052, "v ": 6036, " ú": 5989, "ív": 5979, "nz": 5976, "ã ": 5975, "pó": 5919,
+            "ik": 5904, "uv": 5858, "gc": 5835, "ko": 5815, "ox": 5797, "lf": 5772, "fí": 5753,
+            "ys": 5731, "oz": 5717, "mm": 5698, "dê": 5692, "ún": 5650, "sá": 5639, "íf": 5629,
+            "sí": 5599, "ew": 5596, "uj": 5584, "ôm": 5559, "ux": 5541, "cê": 5480, "vá": 5473,
+            "tê": 5442, "oh": 5263, "dá": 5256, "gé": 5229, "ty": 5162, "êm": 5074, "ád": 5021,
+            "de ": 1113463, " de": 1044429, "do ": 499886, " um": 450455, " co": 445292,
+            "os ": 402922, "da ": 386105, "ma ": 312319, "ão ": 306157, " é ": 296573,
+            "com": 273904, "as ": 272706, "uma": 271540, " da": 268462, "ent": 263509,
+            " do": 249013, " e ": 241281, "na ": 240257, "ia ": 236755, "es ": 232451,
+            " po": 228499, " se": 220941, " no": 220596, "nte": 218759, "ado": 217915,
+            " a ": 216213, "no ": 209889, " es": 205816, "um ": 201899, "em ": 191083,
+            "to ": 188185, "te ": 182044, "al ": 180975, "ra ": 178784, "est": 174602,
+            "ida": 173600, "dad": 172007, " re": 169853, " o ": 166851, " na": 160391,
+            " pr": 158384, "or ": 155288, " em": 154252, "ro ": 148425, "ade": 147619,
+            "ica": 143651, " pa": 142048, "con": 139589, " ma": 139109, "ant": 137680,
+            "ist": 137228, " pe": 137074, "men": 135706, " ca": 132124, "ção": 131304,
+            "por": 131137, "om ": 129315, " qu": 125308, " fo": 124017, "par": 123828,
+            "que": 121041, "ada": 120249, "ste": 119936, "sta": 117494, "ita": 115808,
+            "io ": 111339, "ens": 111144, " di": 109657, "ter": 108700, "ta ": 108579,
+            " ha": 107513, "nto": 104039, "dos": 101787, "str": 101454, "ran": 101236,
+            "tra": 100699, "ue ": 100430, "ca ": 99422, "se ": 99012, "is ": 98587, "eir": 97869,
+            "mun": 96027, "ndo": 94739, "hab": 92261, " in": 90676, "ame": 89963, "res": 88172,
+            "cen": 87955, " km": 87834, "ali": 86609, "açã": 84894, "cia": 84536, "cid": 84373,
+            "tes": 82988, " su": 81178, "nci": 80668, "reg": 80521, "pro": 80231, " te": 79230,
+            "oi ": 78403, "foi": 77878, "per": 77721, "co ": 77432, "nde": 77208, "sa ": 76681,
+            "art": 76275, "ou ": 76190, "ico": 76077, "and": 76029, " as": 75523, "den": 75164,
+            "tan": 74838, "ano": 74765, " an": 74441, "min": 74204, "ria": 73821, "ten": 72655,
+            "ara": 72529, "ort": 72366, "tad": 72109, "mo ": 71790, " ci": 71361, "und": 70729,
+            "end": 70599, " ce": 69801, "nce": 69648, "ina": 69514, "bit": 68890, "la ": 68801,
+            " ba": 68766, " fr": 68614, "iza": 68411, " lo": 68185, " al": 68014, "egi": 67782,
+            "ito": 67486, "rea": 66834, "ati": 65753, "ião": 65139, "ras": 65057, "er ": 64588,
+            "ntr": 64145, "iro": 63701, "uni": 63662, "tiv": 62127, "omu": 62085, "ona": 61961,
+            "des": 61760, "nda": 61455, "ric": 60975, " ou": 60851, "giã": 60677, "tri": 60532,
+            "lo ": 60493, "ais": 60324, " os": 60097, " br": 60044, "cal": 59848, "va ": 59685,
+            "ar ": 59582, "sid": 59438, " me": 58702, "ido": 58535, "egu": 58530, "liz": 58462,
+            "era": 58345, "tam": 58144, "anc": 58051, "re ": 57889, "ela": 57757, "esp": 57679,
+            "rte": 57600, "ea ": 57325, "esa": 56958, "rio": 56653, "tal": 56545, " mu": 56349,
+            "bra": 55967, "ura": 55930, "abi": 55871, "int": 55713, "nsi": 55540, "ide": 55475,
+            "são": 55304, "ha ": 54934, "ver": 54544, "ion": 54065, "tic": 53927, " ár": 53832,
+            "dia": 53753, "nic": 53412, "pos": 53260, "eri": 53238, "ini": 53005, "nta": 52915,
+            "can": 52806, "oca": 52787, "rat": 52626, "iva": 52169, "pel": 52058, "áre": 51471,
+            "fra": 51393, "zad": 51320, "ast": 51032, " en": 50972, "das": 50851, "nal": 50464,
+            "una": 50258, " sa": 49693, "mar": 49315, "ua ": 49107, "rta": 49041, "ont": 48875,
+            "tro": 48136, "nis": 48078, "ira": 48023, "tor": 47860, "pri": 47853, "omo": 47819,
+            " mo": 47797, " or": 47520, " mi": 47420, "ces": 47284, "lia": 47125, "rit": 46897,
+            "man": 46837, " si": 46663, "gun": 46422, "nos": 46255, " tr": 46157, "for": 46002,
+            " gr": 45951, "seg": 45509, "cio": 45369, " fa": 44916, "ora": 44778, "loc": 44637,
+            "ula": 44299, "nha": 43874, "ici": 43382, " ex": 43118, "ana": 43001, "ond": 42834,
+            " ar": 42825, " li": 42694, " vi": 42502, "pre": 42479, "rad": 42430, " ad": 42206,
+            " la": 41905, "tur": 41731, "gra": 41161, "sil": 41142, "mai": 41100, " at": 40661,
+            "ho ": 40610, "tos": 40605, "ab ": 40485, "rin": 40225, "dis": 39920, " am": 39836,
+            "asi": 39800, " so": 39676, "sti": 39339, "tem": 39133, "dep": 38994, "ime": 38876,
+            " fi": 38426, " ch": 38312, " jo": 38224, "oss": 38213, "lan": 37678, "ele": 37347,
+            "ons": 37243, " ve": 37183, "orm": 37181, "nso": 37106, "car": 36654, "dor": 36541,
+            "ian": 36430, "ias": 36377, "ess": 36172, "dmi": 36030, "epa": 35649, "nor": 35618,
+            "ome": 35533, "elo": 35477, "adm": 35408, "on ": 35303, "nas": 35071, "eci": 35040,
+            "sos": 34321, "sen": 34160, " ta": 34053, "qui": 34023, "rma": 34000, "mer": 33993,
+            "inc": 33960, " ro": 33940, "ale": 33348, "ari": 33288, "so ": 33266, "aci": 33260,
+            "enc": 33249, "am ": 33009, "ros": 32986, "pal": 32921, "ões": 32837, "ing": 32761,
+            "cas": 32708, "ert": 32707, "nti": 32354, "cip": 32198, "bro": 31772, "lei": 31609,
+            "tre": 31460, "lho": 31407, "anh": 31372, " fu": 31350, "us ": 31309, " fe": 31286,
+            " to": 31266, "go ": 31208, "fic": 31195, "ore": 31129, " le": 31097, "rov": 31049,
+            "ers": 31036, " cr": 30860, "sso": 30852, "cor": 30819, "ral": 30318, "me ": 30188,
+            "ssu": 30134, "pol": 30065, "le ": 30025, "eu ": 29870, "omp": 29869, "ipa": 29796,
+            " ja": 29677, "ui ": 29672, "ori": 29601, "nom": 29572, "err": 29563, " sã": 29491,
+            "odo": 29483, "emb": 29421, "gue": 29368, "eró": 29181, "cha": 29161, "ial": 29154,
+            "nia": 29100, "rói": 28842, " el": 28792, "il ": 28740, "ese": 28703, "ram": 28519,
+            " ao": 28506, "lme": 28363, "óid": 28287, "ero": 27972, "rec": 27943, "ndi": 27820,
+            "ári": 27812, "nid": 27726, " ju": 27715, "ie ": 27537, "lin": 27495, " ho": 27480,
+            "lic": 27450, "ern": 27425, "rei": 27335, "el ": 27319, "ile": 27199, "ena": 27141,
+            "esc": 27105, "sui": 27030, "cri": 27018, "rti": 26907, " ri": 26689, "qua": 26640,
+            "der": 26564, "tin": 26516, "ama": 26496, "ês ": 26475, "mbr": 26443, " ge": 26253,
+            "ere": 26129, "ass": 26073, "pul": 26066, "mpo": 26049, "cul": 25961, "ost": 25890,
+            " au": 25830, "rtu": 25752, "esi": 25700, "ema": 25633, "erc": 25527, " ga": 25420,
+            "nst": 25404, "ser": 25139, "ao ": 25066, "amb": 25048, "ili": 24989, "sto": 24915,
+            "anç": 24866, "lha": 24850, "nad": 24850, " un": 24753, "onh": 24723, "cie": 24606,
+            "nça": 24469, "ren": 24469, "nhe": 24382, "rim": 24339, "ne ": 24199, "cam": 24160,
+            "opu": 24150, "ulo": 24134, "cad": 24057, "cin": 23953, " bo": 23942, "ínc": 23886,
+            "pop": 23863, "itu": 23834, "rra": 23654, "ind": 23589, "ual": 23558, " be": 23545,
+            "are": 23525, "rna": 23454, "alm": 23414, "an ": 23333, "ata": 23226, "tua": 23176,
+            "ues": 23125, "nho": 23066, "cos": 23065, "tug": 23030, "ssi": 23013, "ino": 22963,
+            "pio": 22913, "sua": 22858, "ire": 22818, "hec": 22728, " pi": 22665, "ede": 22533,
+            "uto": 22443, " ap": 22430, "ém ": 22415, "oma": 22403, "tar": 22207, "oví": 22195,
+            "vín": 22165, "tel": 22078, "rre": 21970, " à ": 21932, "col": 21925, "ane": 21736,
+            "íli": 21725, "laç": 21723, "lis": 21665, "ato": 21654, "ípi": 21652, "eve": 21643,
+            "cer": 21587, "çõe": 21567, "mei": 21546, "eta": 21527, "éri": 21433, "tas": 21431,
+            "ner": 21401, "ard": 21302, "ove": 21270, "ani": 21090, "san": 21076, "cíp": 21053,
+            "ios": 21003, "les": 20832, "icí": 20778, "po ": 20718, "fam": 20697, "ive": 20602,
+            "seu": 20458, "amp": 20451, "lar": 20429, "nov": 20408, "gos": 20347, " cl": 20303,
+            "ode": 20265, "mon": 20257, "ns ": 20234, "ior": 20141, "rca": 20138, "asc": 20114,
+            " ac": 20083, "olo": 20061, "emp": 20050, " va": 19862, "gen": 19808, "erí": 19798,
+            " ne": 19797, "edi": 19796, "ivo": 19750, "pan": 19668, "ete": 19661, "éci": 19647,
+            "las": 19631, "en ": 19630, "ugu": 19601, "ça ": 19591, "mas": 19571, "erm": 19525,
+            "ima": 19294, "aio": 19228, "ga ": 19137, "inh": 19122, "ntu": 19077, "elh": 19021,
+            "amí": 18994, "ilh": 18906, " gu": 18898, "etr": 18837, "mad": 18812, " cu": 18765,
+            "ber": 18628, "ine": 18603, "atu": 18602, "ris": 18600, "míl": 18580, "ssa": 18526,
+            "ill": 18435, "lem": 18432, "ret": 18367, "iad": 18351, "ate": 18241, "vo ": 18229,
+            "eto": 18111, "vid": 18086, "sic": 18066, " ab": 18052, "nse": 18037, "nei": 17925,
+            "ava": 17923, "ven": 17920, "age": 17901, "rig": 17891, "vis": 17869, "orr": 17850,
+            "rie": 17826, "sul": 17811, "ola": 17798, "río": 17761, "ord": 17760, " ra": 17731,
+            "íod": 17716, "ala": 17691, "âni": 17684, "sco": 17645, "sit": 17633, "eit": 17574,
+            "ce ": 17573, " hi": 17554, "lac": 17518, "bri": 17515, "out": 17508, "los": 17433,
+            "fer": 17361, "val": 17282, "mic": 17167, "rqu": 17086, "eno": 17065, " th": 17039,
+            " go": 17023, "içã": 16989, "ger": 16831, "spé": 16790, "gem": 16786, "ul ": 16765,
+            "arr": 16718, "ae ": 16585, "ênc": 16544, "óri": 16535, "atr": 16524, "rbi": 16469,
+            "péc": 16451, "exc": 16402, "sse": 16316, "oli": 16249, "bar": 16230, "raç": 16220,
+            "in ": 16212, "onc": 16183, "mes": 16176, "he ": 16106, "aut": 16096, "bol": 16054,
+            "ogo": 16032, " lu": 16015, "spa": 15990, "rop": 15939, "ban": 15903, "dio": 15896,
+            "bai": 15882, "mbé": 15876, "bli": 15859, "met": 15815, "rde": 15782, "im ": 15779,
+            "alt": 15767, "bém": 15726, "pes": 15522, "sia": 15495, "vil": 15495, "orb": 15491,
+            "gal": 15478, "vel": 15436, "xce": 15412, "mpe": 15384, "dir": 15370, " du": 15330,
+            "ins": 15328, "smo": 15213, "fun": 15140, " ag": 15129, "ol ": 15035, "lit": 15034,
+            "ect": 14984, " ti": 14982, "obr": 14956, "pon": 14947, "che": 14945, "ute": 14945,
+            "jan": 14942, "ve ": 14933, " pl": 14913, "iss": 14904, "ng ": 14902, "jog": 14899,
+            "chi": 14835, "rro": 14834, "nco": 14783, "gua": 14762, "ign": 14724, "uit": 14697,
+            "oci": 14692, "ust": 14662, "ron": 14637, "nat": 14635, "til": 14634, "orn": 14580,
+            "spo": 14510, "the": 14460, "ir ": 14429, "ago": 14405, "scr": 14392, "ain": 14382,
+            "rto": 14307, "ite": 14296, "ece": 14294, "rod": 14281, " ua": 14219, "rmi": 14095,
+            "rel": 14080, "ien": 14065, "iga": 14060, "cel": 14050, "equ": 14020, "rso": 14017,
+            "log": 14014, "hor": 13996, "vol": 13908, "sin": 13902, "sis": 13892, "ang": 13849,
+            "igi": 13843, "fil": 13806, "son": 13806, "ivi": 13782, "ham": 13772, "dic": 13696,
+            "mpr": 13673, " bi": 13544, " sé": 13507, "ans": 13455, "rid": 13442, "sig": 13420,
+            "tór": 13405, "ult": 13394, "lid": 13334, "uro": 13305, "lat": 13280, "gre": 13275,
+            "evi": 13265, "bre": 13206, "rom": 13204, "ço ": 13183, "uer": 13174, "lle": 13121,
+            "ebo": 13090, "tim": 13089, "tid": 12974, "íti": 12961, "ngu": 12950, "spe": 12903,
+            "aul": 12887, "gia": 12807, "rai": 12729, "imo": 12687, "açõ": 12626, "uta": 12601,
+            "ngl": 12535, "eti": 12522, "imp": 12501, "org": 12371, "ifi": 12350, "omi": 12319,
+            "cat": 12310, "teb": 12305, "arc": 12276, "ova": 12269, "one": 12259, "pod": 12218,
+            "ell": 12189, "pen": 12180, "ein": 12110, "olí": 12107, "gên": 12105, "tit": 12090,
+            "sce": 12058, "uad": 12055, "odu": 11939, "efe": 11937, "ila": 11890, "ega": 11879,
+            "nes": 11864, "eal": 11859, "oni": 11825, "roc": 11812, "tân": 11804, "nt ": 11783,
+            "len": 11746, "fre": 11644, "gan": 11614, "rno": 11572, " er": 11510, "rac": 11489,
+            "za ": 11487, "erv": 11462, "uas": 11459, "ôni": 11441, " it": 11439, "jun": 11429,
+            "rav": 11402, "div": 11366, "mat": 11364, "eco": 11351, " im": 11343, "aco": 11338,
+            "uan": 11328, "sub": 11326, "mil": 11247, "cap": 11240, "utr": 11202, "eme": 11201,
+            "usa": 11181, "ogr": 11168, "alh": 11152, "ace": 11134, " vo": 11121, "ene": 11086,
+            "ono": 11037, "ovi": 11009, "let": 10999, "ave": 10994, "pla": 10972, "lor": 10947,
+            "apa": 10937, "ois": 10929, "mor": 10927, "nge": 10906, "et ": 10811, "nd ": 10811,
+            "lad": 10810, "stá": 10797, "uti": 10782, "ton": 10767, "enh": 10752, "mpl": 10714,
+            "via": 10682, " st": 10640, "mos": 10632, " he": 10614, "eli": 10608, "ja ": 10608,
+            "rme": 10601, "pau": 10573, "eus": 10550, "lta": 10527, "êne": 10481, "har": 10472,
+            "eze": 10386, "rdi": 10382, "aba": 10377, "ole": 10370, "naç": 10350, "gar": 10290,
+            "fin": 10276, "lon": 10273, "utu": 10263, "abr": 10253, "ril": 10251, "dem": 10237,
+            "uga": 10215, "his": 10200, "çad": 10194, "sob": 10181, "lít": 10135, "eis": 10113,
+            "não": 10106, "isc": 10067, "act": 10015, "unt": 10008, "rem": 9993, "upo": 9984,
+            "avi": 9973, "ses": 9941, "set": 9939, "emi": 9916, "vad": 9906, "ase": 9902,
+            " nã": 9894, " ob": 9893, "rup": 9891, "gad": 9856, "bas": 9817, "aix": 9798,
+            "ism": 9783, "rce": 9738, "sas": 9730, "sem": 9716, "dur": 9714, "sad": 9694,
+            "our": 9672, "tru": 9663, " of": 9658, " gê": 9642, "gin": 9613, "erg": 9605,
+            "gna": 9579, "ofi": 9565, "abe": 9561, "adi": 9559, "api": 9537, "tod": 9530,
+            "arq": 9519, "dec": 9473, "ota": 9466, "nio": 9439, "uen": 9436, "tig": 9433,
+            "taç": 9386, "ach": 9385, "adu": 9382, "sed": 9373, "ogi": 9366, "tão": 9310,
+            "ext": 9301, " us": 9297, "rof": 9288, "ndr": 9286, "pec": 9282, "rri": 9266,
+            "iti": 9264, "nac": 9251, "pit": 9245, "urg": 9235, "té ": 9213, "aís": 9202,
+            "osi": 9200, "tio": 9200, "rga": 9198, "clu": 9168, "ulh": 9149, "soc": 9148,
+            "her": 9140, "mit": 9135, "osa": 9113, "caç": 9087, "unh": 9065, "bal": 9064,
+            "fut": 9060, "rge": 9033, "pic": 9020, "íci": 9019, "rev": 9016, "vem": 8996,
+            "ope": 8960, "del": 8957, "eja": 8929, "red": 8922, "lla": 8917, "mpa": 8900,
+            "áti": 8887, "inu": 8866, "be ": 8829, "has": 8814, "sio": 8799, "ref": 8795,
+            "cre": 8780, " ol": 8779, "rd ": 8761, "edo": 8760, "rot": 8757, "emo": 8721,
+            "dae": 8716, "sci": 8690, "ote": 8672, "ge ": 8655, "oto": 8649, "dei": 8639,
+            "ape": 8629, "até": 8607, "env": 8603, "sim": 8594, "rne": 8579, "sor": 8549,
+            "rep": 8548, "oso": 8522, "igo": 8521, "lbu": 8512, "pa ": 8506, "air": 8502,
+            "isp": 8481, "erd": 8470, "put": 8461, "oló": 8455, "nar": 8444, "all": 8441,
+            "olv": 8428, "oa ": 8425, "ong": 8421, "gru": 8390, "aro": 8382, "nçã": 8381,
+            "uin": 8363, "adr": 8357, "eda": 8333, "lev": 8296, "lli": 8289, "ez ": 8287,
+            "alá": 8272, " on": 8262, "idi": 8244, "niv": 8244, "cli": 8238, "ego": 8230,
+            "oce": 8227, "sca": 8201, "hin": 8200, "ei ": 8171, "uar": 8119, "rab": 8082,
+            "rmo": 8053, "hos": 8051, "tec": 8043, "amo": 8042, "tón": 8038, "cçã": 8036,
+            "nim": 8021, "riz": 8006, "egr": 7999, "nvo": 7994, "oco": 7976, "ich": 7968,
+            "spi": 7965, "isã": 7956, "mpi": 7951, "inf": 7949, "mel": 7946, "ck ": 7938,
+            "rgo": 7927, "cla": 7926, "tis": 7919, "uíd": 7919, " ál": 7915, "óni": 7908,
+            "esm": 7907, "cta": 7890, "aca": 7889, "uri": 7874, "tud": 7868, "uês": 7863,
+            "stó": 7858, "apr": 7853, "did": 7827, "oga": 7825, " ed": 7807, "ume": 7805,
+            "rog": 7781, "nsã": 7776, "ice": 7761, "rib": 7744, "gas": 7737, "oro": 7726,
+            "cei": 7700, "liv": 7687, "lig": 7684, "tub": 7669, "dan": 7654, "sér": 7647,
+            "rt ": 7638, "mba": 7627, "bum": 7625, " il": 7613, "álb": 7607, "alg": 7598,
+            "pin": 7594, "ier": 7590, "ple": 7590, "tei": 7527, "arg": 7520, " oc": 7515,
+            "din": 7506, "omb": 7493, "imi": 7471, "zem": 7471, "nag": 7446, "uis": 7425,
+            "ecl": 7415, " eu": 7403, "nch": 7394, "ll ": 7390, "ube": 7379, "ubr": 7378,
+            "opo": 7367, "stu": 7367, "ch ": 7362, "uel": 7358, "rço": 7357, "eni": 7335,
+            " wi": 7332, "dua": 7331, "nam": 7322, "udo": 7316, " bu": 7302, "ilo": 7283,
+            "gic": 7282, "pir": 7271, "tá ": 7267, "cur": 7265, "úbl": 7260, "rão": 7259,
+            "hum": 7243, "rsi": 7243, "uçã": 7240, "guê": 7234, "mis": 7225, "han": 7220,
+            "ixa": 7209, "aqu": 7206, "arl": 7205, "ubl": 7183, "rci": 7180, " ut": 7175,
+            "ba ": 7163, "rag": 7162, "med": 7143, "upe": 7143, " pu": 7134, "exi": 7134,
+            "uzi": 7134, "ves": 7125, "édi": 7117, "cea": 7114, "mod": 7097, "irr": 7079,
+            "dri": 7071, "ipo": 7067, "usi": 7047, "arç": 7034, "zaç": 7006, "apo": 6995,
+            "gui": 6993, "alo": 6981, "isa": 6981, " wa": 6979, "duz": 6967, "rol": 6958,
+            "aga": 6957, "enç": 6954, "áxi": 6942, "ami": 6934, "eia": 6927, "rdo": 6927,
+            "ey ": 6913, " et": 6896, "km ": 6889, "lvi": 6861, "lub": 6858, "dre": 6857,
+            " mú": 6854, "utó": 6849, "iri": 6848, "dit": 6840, "bor": 6814, "paí": 6811,
+            "lti": 6810, "fei": 6807, "lto": 6807, "nut": 6804, "ecç": 6791, "rvi": 6787,
+            "mbi": 6786, "nan": 6772, "dro": 6768, " ni": 6760, "ovo": 6748, "lec": 6739,
+            "íst": 6738, "pas": 6728, "púb": 6723, "nai": 6712, "ís ": 6687, "tir": 6653,
+            "rda": 6649, "óno": 6648, "rgi": 6642, "odi": 6628, "rg ": 6617, "vos": 6610,
+            "ead": 6607, "iaç": 6604, "rs ": 6575, "úsi": 6572, "dez": 6564, "olu": 6559,
+            "var": 6549, "arm": 6518, "rar": 6504, "ltu": 6502, "ure": 6495, "ry ": 6483,
+            "mús": 6480, "squ": 6464, "nne": 6439, "pet": 6411, "uil": 6385, "xia": 6380,
+            " tu": 6372, "maç": 6372, "dif": 6362, "niz": 6361, "ipe": 6360, "jet": 6359,
+            "mui": 6353, "uss": 6347, "gio": 6344, "mem": 6344, "mér": 6337, "exp": 6312,
+            "ife": 6300, " sc": 6287, "uli": 6278, " ka": 6274, "ii ": 6274, "ivr": 6273,
+            "mão": 6273, "cro": 6255, "sup": 6250, "ki ": 6235, "tár": 6234, "ibu": 6231,
+            "bel": 6221, "sol": 6214, "pe ": 6181, "cim": 6171, "bur": 6170, " nu": 6152,
+            "écu": 6135, "uda": 6128, "diç": 6127, "mal": 6120, "opa": 6108, "xim": 6106,
+            "eo ": 6077, "iu ": 6072, "leg": 6064, "epr": 6051, "asa": 6049, " lí": 6039,
+            "cto": 6036, "vei": 6022, "lim": 6007, "aus": 5992, " fl": 5988, "ied": 5977,
+            "ald": 5965, "net": 5963, "vez": 5961, "tom": 5946, "xa ": 5938, "nve": 5937,
+            "ude": 5928, "tip": 5927, "fes": 5911, " op": 5907, "bo ": 5900, "vas": 5897,
+            "anu": 5896, "ige": 5893, "ies": 5878, "eio": 5873, "láx": 5857, "bil": 5849,
+            "hei": 5849, "mul": 5806, "eur": 5804, "nen": 5777, "rou": 5772, "nga": 5764,
+            "use": 5760, "cis": 5750, "ler": 5749, "iam": 5743, "gc ": 5727, "jos": 5715,
+            "ur ": 5714, "sel": 5712, " ng": 5699, "oda": 5699, "ny ": 5694, "nár": 5684,
+            "ous": 5680, "eva": 5679, "igu": 5678, "ngc": 5668, "tai": 5662, "nin": 5656,
+            "st ": 5646, "lva": 5641, "ngo": 5638, "tat": 5635, "áli": 5630, "pac": 5622,
+            "oes": 5612, "rus": 5606, "lgu": 5605, "sde": 5601, "ibe": 5599, "don": 5597,
+            "pub": 5596, "itâ": 5590, "van": 5589, " sh": 5584, "soa": 5579, "ean": 5576,
+            "nca": 5561, "vim": 5528, "tul": 5524, "uia": 5524, "tia": 5519, " gi": 5513,
+            "dra": 5496, "séc": 5490, "íde": 5475, "ri ": 5474, "uip": 5474, "not": 5470,
+            "esd": 5456, "fis": 5455, "rva": 5441, "iz ": 5440, "ai ": 5437, "ssã": 5427,
+            "num": 5422, "íng": 5418, "oje": 5415, "lhe": 5407, "abo": 5404, "ilm": 5403,
+            "sar": 5392, "sai": 5389, "lam": 5387, "ni ": 5382, "uca": 5380, "tou": 5354,
+            "aia": 5333, "plo": 5321, "éti": 5315, "eon": 5303, "uai": 5297, "ecu": 5255,
+            "nsa": 5243, "jul": 5237, "hom": 5231, "mbo": 5222, "lio": 5219, "icu": 5216,
+            "lag": 5216, "iai": 5206, "mia": 5205, "ise": 5201, " je": 5193, "th ": 5190,
+            "róp": 5175, "stã": 5171, "of ": 5154, "ld ": 5145, "ató": 5142, "tui": 5138,
+            "gov": 5137, "rba": 5129, "sur": 5128, "dam": 5121, "áve": 5112, "lve": 5109,
+            "zon": 5106, " av": 5103, "tus": 5101, "amé": 5088, "def": 5074, "ceu": 5073,
+            "cti": 5064, "raf": 5059, "dal": 5052, "lês": 5033, "scu": 5033, "ncl": 5010,
+            "teg": 5010, "arn": 4993, "eat": 4993,
+        },
+    },
+}
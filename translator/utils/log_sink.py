@@ -0,0 +1,227 @@
+"""
+Background sink for translation logs.
+
+Callers only enqueue records; a daemon thread drains the queue in batches,
+writes them through a long-lived file handle, rotates the file by size and
+flushes it whenever the queue goes idle. Pending records are flushed at
+interpreter exit, so logging never does file I/O in the request path.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+from translator.config import (
+    LOG_BACKUP_COUNT,
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL,
+    LOG_JSON_LINES,
+    LOG_MAX_BYTES,
+)
+
+_STOP = object()
+
+
+class TranslationLogSink:
+    """Queue-backed, size-rotated writer for translation log records."""
+
+    def __init__(
+        self,
+        path: str = "translation_log.txt",
+        max_bytes: int = LOG_MAX_BYTES,
+        backup_count: int = LOG_BACKUP_COUNT,
+        json_lines: bool = LOG_JSON_LINES,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ):
+        """
+        Creates a sink; the writer thread starts on the first record.
+
+        Args:
+            path (str): Path to the log file.
+            max_bytes (int): Size above which the file is rotated (0 disables rotation).
+            backup_count (int): Number of rotated files kept (path.1, path.2, ...).
+            json_lines (bool): Write one JSON object per line instead of the text format.
+            batch_size (int): Maximum number of records written per batch.
+            flush_interval (float): Idle time in seconds after which buffered data is flushed.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.json_lines = json_lines
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def write(self, original_text: str, translated_text: str, **fields) -> None:
+        """
+        Enqueues one translation record; never blocks on file I/O.
+
+        Args:
+            original_text (str): The original source text.
+            translated_text (str): The translated output.
+            **fields: Extra values stored with the record in JSON mode
+                (e.g., engine, source_lang, target_lang).
+        """
+        self._ensure_started()
+        self._queue.put({"time": time.time(), "original": original_text,
+                         "translated": translated_text, **fields})
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every record enqueued so far is written and flushed.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the records were flushed within the timeout.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Flushes pending records and stops the writer thread.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait for the writer in seconds.
+        """
+        with self._thread_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="translation-log-sink", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Writer loop: drains the queue in batches until stopped."""
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_file()
+                continue
+
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [entry for entry in batch if isinstance(entry, dict)]
+            if records:
+                self._write_records(records)
+
+            markers = [entry for entry in batch if not isinstance(entry, dict)]
+            if markers:
+                self._flush_file()
+                for marker in markers:
+                    if isinstance(marker, threading.Event):
+                        marker.set()
+                if _STOP in markers:
+                    self._close_file()
+                    return
+
+    def _write_records(self, records: List[Dict]) -> None:
+        data = "".join(self._format(record) for record in records)
+        try:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            # max_bytes is a size on disk, so count encoded bytes rather than characters
+            size = len(data.encode("utf-8"))
+            if self.max_bytes > 0 and self._file.tell() > 0 and self._file.tell() + size > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+        except OSError as e:
+            self.dropped += len(records)
+            print(f"[ERROR] Failed to write translation log {self.path}: {e}")
+            self._close_file()
+
+    def _format(self, record: Dict) -> str:
+        if self.json_lines:
+            return json.dumps(record, ensure_ascii=False) + "\n"
+        return (
+            "Original:\n" + record["original"] + "\n" +
+            "Translated:\n" + record["translated"] + "\n" +
+            "-" * 40 + "\n"
+        )
+
+    def _rotate(self) -> None:
+        """Shifts path -> path.1 -> path.2 ... and reopens an empty file."""
+        self._close_file()
+        if self.backup_count > 0:
+            for idx in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{idx}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{idx + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
+
+    def _flush_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError as e:
+                print(f"[ERROR] Failed to flush translation log {self.path}: {e}")
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+_sinks: Dict[str, TranslationLogSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_log_sink(path: str = "translation_log.txt") -> TranslationLogSink:
+    """
+    Returns the shared sink for a log file, creating it on first use.
+
+    Args:
+        path (str): Path to the log file.
+
+    Returns:
+        TranslationLogSink: The sink writing to `path`.
+    """
+    key = os.path.abspath(path)
+    with _sinks_lock:
+        sink = _sinks.get(key)
+        if sink is None:
+            sink = _sinks[key] = TranslationLogSink(path)
+        return sink
+
+
+@atexit.register
+def close_log_sinks() -> None:
+    """Flushes and stops every shared sink (registered to run at exit)."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.close()
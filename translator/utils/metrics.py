@@ -0,0 +1,329 @@
+"""
+In-process metrics for the translation pipeline.
+
+Stage latencies (segmentation, keyword protection, engine call, restore, JSON
+traversal) are recorded as histograms, and errors and translation memory
+lookups as counters, all labelled by engine and language pair. Every recorded
+value is also passed to the registered hooks (e.g., to forward it to StatsD or
+OpenTelemetry), and the registry renders itself in the Prometheus text format,
+optionally served by a small built-in HTTP endpoint.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from translator.config import METRICS_BUCKETS, METRICS_ENABLED
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Hook signature: hook(kind, name, value, labels) with kind "counter" or "histogram"
+MetricsHook = Callable[[str, str, float, Dict[str, str]], None]
+
+STAGE_SECONDS = "hybridtrans_stage_seconds"
+STAGE_ERRORS = "hybridtrans_stage_errors_total"
+CACHE_LOOKUPS = "hybridtrans_cache_lookups_total"
+SEGMENTS = "hybridtrans_segments_total"
+
+_HELP = {
+    STAGE_SECONDS: "Time spent in each translation pipeline stage.",
+    STAGE_ERRORS: "Errors raised by each translation pipeline stage.",
+    CACHE_LOOKUPS: "Translation memory lookups by result (hit or miss).",
+    SEGMENTS: "Segments sent to the translation engine.",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus (cumulative) semantics."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Returns (upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip(list(self.buckets) + [float("inf")], self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else _format_value(bound), total))
+        return result
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters and histograms with pluggable hooks."""
+
+    def __init__(self, buckets: Tuple[float, ...] = METRICS_BUCKETS, enabled: bool = METRICS_ENABLED):
+        """
+        Creates an empty registry.
+
+        Args:
+            buckets (Tuple[float, ...]): Upper bounds (seconds) of the latency histograms.
+            enabled (bool): When False, `stage()` is a no-op and nothing is recorded.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.enabled = enabled
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._hooks: List[MetricsHook] = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: MetricsHook) -> None:
+        """
+        Registers a callable receiving every recorded value.
+
+        Args:
+            hook (MetricsHook): Called as hook(kind, name, value, labels).
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: MetricsHook) -> None:
+        """Unregisters a hook added with `add_hook()`."""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Increments a counter.
+
+        Args:
+            name (str): Metric name.
+            value (float): Amount to add.
+            **labels (str): Label values (e.g., engine="google").
+        """
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+            hooks = list(self._hooks)
+        self._notify(hooks, "counter", name, value, labels)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Records a value (in seconds) in a histogram.
+
+        Args:
+            name (str): Metric name.
+            value (float): Observed value.
+            **labels (str): Label values (e.g., engine="google").
+        """
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+            hooks = list(self._hooks)
+        self._notify(hooks, "histogram", name, value, labels)
+
+    def stage(self, stage: str, engine: str, source_lang: str = "", target_lang: str = "") -> ContextManager:
+        """
+        Times a pipeline stage, counting an error if it raises.
+
+        Args:
+            stage (str): Stage name (e.g., 'segmentation', 'engine').
+            engine (str): Engine name (e.g., 'google').
+            source_lang (str): The source language code.
+            target_lang (str): The target language code.
+
+        Returns:
+            ContextManager: Context manager wrapping the stage.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._timed_stage(stage, engine, str(source_lang or ""), str(target_lang or ""))
+
+    @contextmanager
+    def _timed_stage(self, stage: str, engine: str, source_lang: str, target_lang: str) -> Iterator[None]:
+        labels = {"stage": stage, "engine": engine, "source_lang": source_lang, "target_lang": target_lang}
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(STAGE_ERRORS, **labels)
+            raise
+        finally:
+            self.observe(STAGE_SECONDS, time.perf_counter() - start, **labels)
+
+    def record_cache(self, engine: str, source_lang: str, target_lang: str, hits: int, misses: int) -> None:
+        """
+        Counts translation memory hits and misses.
+
+        Args:
+            engine (str): Engine name (e.g., 'google').
+            source_lang (str): The source language code.
+            target_lang (str): The target language code.
+            hits (int): Segments found in the memory.
+            misses (int): Segments sent to the engine.
+        """
+        labels = {"engine": engine, "source_lang": str(source_lang), "target_lang": str(target_lang)}
+        if hits:
+            self.inc(CACHE_LOOKUPS, hits, result="hit", **labels)
+        if misses:
+            self.inc(CACHE_LOOKUPS, misses, result="miss", **labels)
+
+    def cache_hit_rate(self, engine: Optional[str] = None) -> Optional[float]:
+        """
+        Returns the translation memory hit rate, optionally for one engine.
+
+        Args:
+            engine (Optional[str]): Restrict to this engine (all engines if None).
+
+        Returns:
+            Optional[float]: Hits / lookups, or None if there were no lookups.
+        """
+        hits = misses = 0
+        with self._lock:
+            for key, value in self._counters.get(CACHE_LOOKUPS, {}).items():
+                labels = dict(key)
+                if engine is not None and labels.get("engine") != engine:
+                    continue
+                if labels.get("result") == "hit":
+                    hits += value
+                else:
+                    misses += value
+        total = hits + misses
+        return hits / total if total else None
+
+    def snapshot(self) -> dict:
+        """Returns a plain-dict copy of every counter and histogram."""
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "histograms": {
+                    name: [
+                        {"labels": dict(key), "count": hist.count, "sum": hist.sum}
+                        for key, hist in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (0.0.4).
+
+        Returns:
+            str: The exposition text.
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name in sorted(self._histograms):
+                lines.append(f"# HELP {name} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(self._histograms[name].items()):
+                    for bound, count in hist.cumulative():
+                        lines.append(f"{name}_bucket{_format_labels(key + (('le', bound),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(hist.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drops every recorded value (hooks are kept)."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def _notify(hooks: List[MetricsHook], kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        for hook in hooks:
+            try:
+                hook(kind, name, value, labels)
+            except Exception as e:
+                print(f"[ERROR] Metrics hook failed: {e}")
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in key) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Returns the process-wide metrics registry used by every translator.
+
+    Returns:
+        MetricsRegistry: The shared registry.
+    """
+    return _default_registry
+
+
+def start_metrics_server(
+    port: int = 9464, host: str = "127.0.0.1", registry: Optional[MetricsRegistry] = None
+) -> "ThreadingHTTPServer":
+    """
+    Serves the registry at /metrics from a daemon thread (standard library only).
+
+    Args:
+        port (int): Port to listen on (0 picks a free port).
+        host (str): Address to bind.
+        registry (Optional[MetricsRegistry]): Registry to expose (defaults to the shared one).
+
+    Returns:
+        ThreadingHTTPServer: The running server; call `shutdown()` to stop it.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = registry or get_metrics()
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -1,11 +1,20 @@
-import requests
+import threading
+import time
+from typing import Optional
 
+from translator.config import (
+    CONNECTIVITY_CACHE_TTL,
+    CONNECTIVITY_CHECK_TIMEOUT,
+    CONNECTIVITY_CHECK_URL,
+)
 
-def is_connected(timeout=3) -> bool:
+
+def is_connected(timeout=CONNECTIVITY_CHECK_TIMEOUT, url: str = CONNECTIVITY_CHECK_URL) -> bool:
     """Checks internet connection.
     Args:
         timeout (int): Timeout in seconds for the connection check.
-            Default is 3 seconds.
+            Default is `CONNECTIVITY_CHECK_TIMEOUT` (3 seconds).
+        url (str): Endpoint used for the check (default `CONNECTIVITY_CHECK_URL`).
     Returns: bool:
         - True if connected,
         - False otherwise.
@@ -17,8 +26,82 @@ def is_connected(timeout=3) -> bool:
         >>> is_connected(timeout=9999)
             False
     """
+    import requests
+
     try:
-        requests.get("https://www.google.com", timeout=timeout)  # hardcoded, virar variavel global
+        requests.head(url, timeout=timeout, allow_redirects=False)
         return True
     except requests.RequestException:
         return False
+
+
+class ConnectivityProbe:
+    """Connectivity check cached for `ttl` seconds.
+
+    Only the very first call blocks. Once the cached result expires it is still
+    returned while a background thread refreshes it, so callers never wait on
+    the network after the first check.
+    """
+
+    def __init__(
+        self,
+        url: str = CONNECTIVITY_CHECK_URL,
+        timeout: float = CONNECTIVITY_CHECK_TIMEOUT,
+        ttl: float = CONNECTIVITY_CACHE_TTL,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.ttl = ttl
+        self._result: Optional[bool] = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def is_connected(self) -> bool:
+        """
+        Returns the cached connectivity status, refreshing it when stale.
+
+        Returns:
+            bool: True if the endpoint was reachable on the last check.
+        """
+        with self._lock:
+            result = self._result
+            stale = time.monotonic() - self._checked_at >= self.ttl
+            if result is not None and stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self.refresh, name="connectivity-probe", daemon=True).start()
+        if result is None:
+            return self.refresh()
+        return result
+
+    def refresh(self) -> bool:
+        """
+        Checks the endpoint now and caches the result.
+
+        Returns:
+            bool: True if connected.
+        """
+        result = None
+        try:
+            result = is_connected(self.timeout, self.url)
+        finally:
+            # An unexpected error keeps the previous result but must not block later refreshes
+            with self._lock:
+                if result is not None:
+                    self._result = result
+                    self._checked_at = time.monotonic()
+                self._refreshing = False
+        return result
+
+    def invalidate(self) -> None:
+        """Forgets the cached status so the next call checks synchronously."""
+        with self._lock:
+            self._result = None
+
+
+_probe = ConnectivityProbe()
+
+
+def get_connectivity_probe() -> ConnectivityProbe:
+    """Returns the process-wide connectivity probe."""
+    return _probe
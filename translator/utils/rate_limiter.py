@@ -0,0 +1,265 @@
+"""
+Adaptive client-side rate limiting for online engines.
+
+`AdaptiveRateLimiter` is a token bucket shared by every thread and task that
+talks to the same service. Its rate follows AIMD: every successful request
+raises it additively, and every throttling signal (HTTP 429/503, timeouts,
+empty or malformed responses) cuts it multiplicatively and retries the request
+after an exponential backoff with full jitter. It therefore converges on the
+highest rate the service currently sustains instead of a hand-tuned sleep.
+Any other error (invalid arguments, bugs) fails immediately without a retry.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, TypeVar
+
+from translator.config import (
+    GOOGLE_BACKOFF_BASE,
+    GOOGLE_BACKOFF_MAX,
+    GOOGLE_MAX_RETRIES,
+    GOOGLE_RATE_BURST,
+    GOOGLE_RATE_DECREASE,
+    GOOGLE_RATE_INCREASE,
+    GOOGLE_RATE_LIMIT,
+    GOOGLE_RATE_MAX,
+    GOOGLE_RATE_MIN,
+)
+
+T = TypeVar("T")
+
+_THROTTLE_STATUS = (429, 503)
+# googletrans only reports the status code in the message of a bare Exception
+_THROTTLE_MESSAGE = re.compile(r"\b(429|503)\b|too many requests|timed? ?out", re.IGNORECASE)
+
+
+class MalformedResponseError(ValueError):
+    """Raised when a service answers with an empty or malformed payload, which is
+    what Google sends back when it starts throttling."""
+
+
+def is_throttling_error(exception: BaseException) -> bool:
+    """
+    Checks whether an exception signals throttling or overload (and is worth retrying).
+
+    Caller and programming errors (e.g., an invalid language code) are not
+    throttling: they fail immediately, without retry or rate decrease.
+
+    Args:
+        exception (BaseException): The exception raised by a request.
+
+    Returns:
+        bool: True for HTTP 429/503, a Retry-After header, timeouts and
+            `MalformedResponseError`.
+    """
+    if isinstance(exception, (MalformedResponseError, TimeoutError)):
+        return True
+    if any(cls.__name__.endswith("Timeout") or cls.__name__ == "TimeoutException"
+           for cls in type(exception).__mro__):
+        # httpx.TimeoutException and its subclasses (ReadTimeout, ConnectTimeout, ...)
+        return True
+    response = getattr(exception, "response", None)
+    if response is not None:
+        if getattr(response, "status_code", None) in _THROTTLE_STATUS:
+            return True
+        headers = getattr(response, "headers", None)
+        if isinstance(headers, Mapping) and headers.get("Retry-After") is not None:
+            return True
+    if type(exception) is Exception:
+        return bool(_THROTTLE_MESSAGE.search(str(exception)))
+    return False
+
+
+class AdaptiveRateLimiter:
+    """Thread- and task-safe token bucket with AIMD rate control and jittered retries."""
+
+    def __init__(
+        self,
+        rate: float = GOOGLE_RATE_LIMIT,
+        burst: float = GOOGLE_RATE_BURST,
+        min_rate: float = GOOGLE_RATE_MIN,
+        max_rate: float = GOOGLE_RATE_MAX,
+        increase: float = GOOGLE_RATE_INCREASE,
+        decrease: float = GOOGLE_RATE_DECREASE,
+        max_retries: int = GOOGLE_MAX_RETRIES,
+        backoff_base: float = GOOGLE_BACKOFF_BASE,
+        backoff_max: float = GOOGLE_BACKOFF_MAX,
+        is_throttle: Callable[[BaseException], bool] = is_throttling_error,
+    ):
+        """
+        Creates a limiter with a full bucket.
+
+        Args:
+            rate (float): Initial rate in requests per second (0 disables limiting,
+                retries still apply).
+            burst (float): Bucket capacity, i.e. requests allowed back to back.
+            min_rate (float): Lower bound of the rate after decreases.
+            max_rate (float): Upper bound of the rate after increases.
+            increase (float): Additive increase, in requests per second gained per
+                second of successful traffic.
+            decrease (float): Multiplicative factor applied to the rate on throttling.
+            max_retries (int): Retries of a throttled request before giving up.
+            backoff_base (float): First backoff ceiling in seconds (doubles per retry).
+            backoff_max (float): Maximum backoff ceiling in seconds.
+            is_throttle (Callable[[BaseException], bool]): Classifies retryable errors.
+        """
+        self.enabled = rate > 0
+        self.rate = min(max(rate, min_rate), max_rate) if self.enabled else 0.0
+        self.burst = max(1.0, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.is_throttle = is_throttle
+        self.throttled = 0
+        self.retries = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._random = random.Random()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token (possibly going into debt) and returns how long to wait for it."""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """Waits, without blocking the event loop, until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Additive increase: about `increase` req/s more per second of successful traffic."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease, at most once per refill interval so a burst of
+        concurrent failures counts as a single congestion signal."""
+        with self._lock:
+            self.throttled += 1
+            if not self.enabled:
+                return
+            now = time.monotonic()
+            if now - self._last_decrease < 1.0 / self.rate:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            # Drop the burst allowance so the lower rate applies immediately
+            self._tokens = min(self._tokens, 0.0)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before retry number `attempt` (full jitter).
+
+        Args:
+            attempt (int): Zero-based retry number.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return self._random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def call(self, func: Callable[[], T]) -> T:
+        """
+        Runs `func` under the limiter, retrying throttled attempts with backoff.
+
+        Args:
+            func (Callable[[], T]): The request to send.
+
+        Returns:
+            T: The value returned by `func`.
+
+        Raises:
+            Exception: The last error if retries are exhausted, or any non-throttling error.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire()
+            try:
+                result = func()
+            except Exception as e:
+                if not self.is_throttle(e) or attempt == self.max_retries:
+                    raise
+                self.on_throttle()
+                with self._lock:
+                    self.retries += 1
+                time.sleep(self.backoff(attempt))
+                continue
+            self.on_success()
+            return result
+        raise RuntimeError("unreachable")
+
+    async def acall(self, func: Callable[[], "asyncio.Future"]):
+        """
+        Asynchronous counterpart of `call()` for coroutine functions.
+
+        Args:
+            func (Callable[[], Awaitable]): Returns a new awaitable for each attempt.
+
+        Returns:
+            The value produced by the awaitable.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire()
+            try:
+                result = await func()
+            except Exception as e:
+                if not self.is_throttle(e) or attempt == self.max_retries:
+                    raise
+                self.on_throttle()
+                with self._lock:
+                    self.retries += 1
+                await asyncio.sleep(self.backoff(attempt))
+                continue
+            self.on_success()
+            return result
+        raise RuntimeError("unreachable")
+
+    def stats(self) -> dict:
+        """Returns the current rate and the throttling counters."""
+        with self._lock:
+            return {"rate": self.rate, "throttled": self.throttled, "retries": self.retries}
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str = "google") -> AdaptiveRateLimiter:
+    """
+    Returns the process-wide limiter for a service, shared by all its translators.
+
+    Args:
+        service (str): Service name (e.g., 'google').
+
+    Returns:
+        AdaptiveRateLimiter: The shared limiter.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(service)
+        if limiter is None:
+            limiter = _limiters[service] = AdaptiveRateLimiter()
+        return limiter
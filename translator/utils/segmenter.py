@@ -0,0 +1,149 @@
+"""
+Lightweight rule-based sentence segmenter.
+
+Splits text on sentence-final punctuation while skipping known abbreviations
+(per language), initials and decimal numbers. Abbreviations that are also
+ordinary words ("no", "est", "mar", "set", "out", ...) and single capital
+letters ("vitamin C.") only hold a sentence together when the context says so:
+a following number or lowercase word, or, for initials, a neighbouring name
+or initial ("John F. Kennedy", "J. K. Rowling"). Sentences are produced lazily by
+a generator, so arbitrarily long inputs are handled without materializing or
+truncating them, and there is no model to load on first use.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterator
+
+ABBREVIATIONS: Dict[str, FrozenSet[str]] = {
+    "en": frozenset({
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "vs", "etc", "e.g", "i.e",
+        "inc", "ltd", "corp", "dept", "approx", "vol",
+        "jan", "feb", "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec",
+        "a.m", "p.m", "u.s", "u.k",
+    }),
+    "pt": frozenset({
+        "sr", "sra", "srs", "dr", "dra", "prof", "profa", "eng", "av", "r", "etc",
+        "pág", "págs", "p", "n", "nº", "núm", "tel", "lda", "ltda", "cia", "dep", "aprox",
+        "jan", "fev", "abr", "mai", "jun", "jul", "ago", "nov", "dez",
+    }),
+    "es": frozenset({
+        "sr", "sra", "srta", "sres", "dr", "dra", "prof", "lic", "ing", "ud", "uds", "vd",
+        "vds", "etc", "ej", "pág", "págs", "p", "núm", "n", "nº", "av", "avda", "cía",
+        "aprox", "dpto", "tel", "ene", "feb", "abr", "may", "jun", "jul", "ago",
+        "sept", "oct", "nov", "dic",
+    }),
+    "fr": frozenset({
+        "m", "mm", "mme", "mmes", "mlle", "mlles", "dr", "pr", "etc", "cf",
+        "p", "env", "av", "bd", "st", "ste", "cie", "tél", "n", "nº", "janv", "févr",
+        "avr", "juil", "sept", "oct", "nov", "déc",
+    }),
+}
+
+# Abbreviations that are also common words: they only suppress a split when
+# the next token is a number or starts in lowercase ("No. 5", "est. 1990")
+AMBIGUOUS_ABBREVIATIONS: Dict[str, FrozenSet[str]] = {
+    "en": frozenset({"no", "est", "co", "ed", "fig", "mar"}),
+    "pt": frozenset({"mar", "set", "out", "ex"}),
+    "es": frozenset({"mar"}),
+    "fr": frozenset({"me", "ex"}),
+}
+
+# Sentence-final punctuation, optional closing quotes/brackets, then whitespace
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’»)\]]*(?=\s)")
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_NEXT_TOKEN = re.compile(r"\s+(\S+)")
+
+
+def _clean(token: str) -> str:
+    return token.lstrip("\"'“‘«([").rstrip(".")
+
+
+def _is_initial(word: str) -> bool:
+    return len(word) == 1 and word.isalpha() and word.isupper()
+
+
+def _is_abbreviation(token: str, previous: str, following: str, lang: str) -> bool:
+    """
+    Checks whether the period ending `token` belongs to an abbreviation.
+
+    Args:
+        token (str): The token right before the period (the period included).
+        previous (str): The token before it ("" at the start of the sentence).
+        following (str): The token after it ("" at the end of the paragraph).
+        lang (str): Language code of the abbreviation tables.
+    """
+    word = _clean(token)
+    if not word:
+        return False
+    lowered = word.lower()
+    if lowered in ABBREVIATIONS.get(lang, ()):
+        return True
+    next_word = _clean(following)
+    continues = bool(next_word) and (next_word[0].isdigit() or next_word[0].islower())
+    if lowered in AMBIGUOUS_ABBREVIATIONS.get(lang, ()):
+        return continues
+    parts = word.split(".")
+    if len(parts) > 1:
+        # Dotted initials such as "J.R.R."
+        return all(len(part) == 1 and part.isalpha() for part in parts)
+    if not _is_initial(word):
+        return False
+    # A lone capital letter is an initial next to a name or another initial
+    # ("John F. Kennedy", "J. K. Rowling"), not in "Take vitamin C. It helps."
+    previous_word = _clean(previous)
+    if continues or _is_initial(next_word):
+        return True
+    return bool(previous_word) and previous_word[0].isupper() and previous_word.isalpha()
+
+
+def iter_sentences(text: str, lang: str = "en") -> Iterator[str]:
+    """
+    Lazily splits text into sentences.
+
+    Args:
+        text (str): The text to segment.
+        lang (str): Language code used to pick the abbreviation table (e.g., 'en').
+
+    Yields:
+        str: The sentences, stripped of surrounding whitespace.
+    """
+    lang = str(lang).split("-")[0].lower()
+    if lang not in ABBREVIATIONS:
+        lang = "en"
+
+    for paragraph_start, paragraph_end in _iter_paragraph_spans(text):
+        start = paragraph_start
+        for match in _BOUNDARY.finditer(text, paragraph_start, paragraph_end):
+            end = match.end()
+            punctuation = match.group().rstrip("\"'”’»)]")
+            following = _NEXT_TOKEN.match(text, end, paragraph_end)
+
+            if punctuation == ".":
+                # The last two tokens are enough (bounded window, not the whole sentence)
+                before = text[max(start, match.start() - 200):match.start() + 1].split()
+                token = before[-1] if before else ""
+                previous = before[-2] if len(before) > 1 else ""
+                if _is_abbreviation(token, previous, following.group(1) if following else "", lang):
+                    continue
+            if set(punctuation) <= {".", "…"}:
+                # A lowercase continuation almost never starts a new sentence
+                if following and following.group(1)[0].islower():
+                    continue
+
+            sentence = text[start:end].strip()
+            if sentence:
+                yield sentence
+            start = end
+
+        sentence = text[start:paragraph_end].strip()
+        if sentence:
+            yield sentence
+
+
+def _iter_paragraph_spans(text: str) -> Iterator[tuple]:
+    """Yields (start, end) offsets of the paragraphs (blank-line separated) of a text."""
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(text)
@@ -0,0 +1,255 @@
+"""
+Persistent segment-level translation memory.
+
+Translations are stored in a SQLite database (WAL mode) keyed by engine,
+source language, target language and a hash of the protected segment, so a
+warm store survives process restarts and is shared by every translator.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from translator.config import (
+    TRANSLATION_MEMORY_ENABLED,
+    TRANSLATION_MEMORY_MAX_ENTRIES,
+    TRANSLATION_MEMORY_PATH,
+)
+
+
+class TranslationMemory:
+    """SQLite-backed translation memory with LRU eviction and hit/miss counters."""
+
+    def __init__(
+        self,
+        path: str = TRANSLATION_MEMORY_PATH,
+        max_entries: int = TRANSLATION_MEMORY_MAX_ENTRIES,
+    ):
+        """
+        Opens (or creates) the translation memory database.
+
+        Args:
+            path (str): Path to the SQLite file (use ':memory:' for a throwaway store).
+            max_entries (int): Maximum number of segments kept before the least
+                recently used ones are evicted.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS segments ("
+            " engine TEXT NOT NULL,"
+            " source_lang TEXT NOT NULL,"
+            " target_lang TEXT NOT NULL,"
+            " segment_hash TEXT NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " PRIMARY KEY (engine, source_lang, target_lang, segment_hash)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_segments_last_used ON segments (last_used)"
+        )
+        self._size = self._count()
+
+    @staticmethod
+    def hash_segment(segment: str) -> str:
+        """Returns the stable hash used as key for a protected segment."""
+        return hashlib.sha256(segment.encode("utf-8")).hexdigest()
+
+    def get(self, engine: str, source_lang: str, target_lang: str, segment: str) -> Optional[str]:
+        """
+        Looks up the translation of a single segment.
+
+        Args:
+            engine (str): Engine name (e.g., 'google', 'argos').
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+            segment (str): The protected segment.
+
+        Returns:
+            Optional[str]: The stored translation, or None on a miss.
+        """
+        return self.get_many(engine, source_lang, target_lang, [segment]).get(segment)
+
+    def get_many(
+        self, engine: str, source_lang: str, target_lang: str, segments: Iterable[str]
+    ) -> Dict[str, str]:
+        """
+        Looks up several segments of the same language pair at once.
+
+        Args:
+            engine (str): Engine name (e.g., 'google', 'argos').
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+            segments (Iterable[str]): The protected segments.
+
+        Returns:
+            Dict[str, str]: Mapping of segment to stored translation for every hit.
+        """
+        by_hash = {self.hash_segment(segment): segment for segment in segments}
+        if not by_hash:
+            return {}
+
+        found = {}
+        hashes = list(by_hash)
+        with self._lock:
+            # SQLite limits the number of bound parameters per statement
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT segment_hash, translation FROM segments"
+                    " WHERE engine = ? AND source_lang = ? AND target_lang = ?"
+                    f" AND segment_hash IN ({placeholders})",
+                    (engine, str(source_lang), str(target_lang), *chunk),
+                ).fetchall()
+                for segment_hash, translation in rows:
+                    found[segment_hash] = translation
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE segments SET last_used = ?"
+                    " WHERE engine = ? AND source_lang = ? AND target_lang = ? AND segment_hash = ?",
+                    [(now, engine, str(source_lang), str(target_lang), h) for h in found],
+                )
+            self.hits += len(found)
+            self.misses += len(by_hash) - len(found)
+
+        return {by_hash[h]: translation for h, translation in found.items()}
+
+    def set(self, engine: str, source_lang: str, target_lang: str, segment: str, translation: str) -> None:
+        """
+        Stores the translation of a single segment.
+
+        Args:
+            engine (str): Engine name (e.g., 'google', 'argos').
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+            segment (str): The protected segment.
+            translation (str): The translated segment.
+        """
+        self.set_many(engine, source_lang, target_lang, {segment: translation})
+
+    def set_many(self, engine: str, source_lang: str, target_lang: str, translations: Dict[str, str]) -> None:
+        """
+        Stores several translations of the same language pair in one transaction.
+
+        Args:
+            engine (str): Engine name (e.g., 'google', 'argos').
+            source_lang (str): The source language code (e.g., 'en').
+            target_lang (str): The target language code (e.g., 'pt').
+            translations (Dict[str, str]): Mapping of protected segment to translation.
+        """
+        if not translations:
+            return
+        now = time.time()
+        rows = [
+            (engine, str(source_lang), str(target_lang), self.hash_segment(segment), translation, now)
+            for segment, translation in translations.items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO segments"
+                    " (engine, source_lang, target_lang, segment_hash, translation, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._size += len(rows)
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Drops the least recently used segments. Caller must hold the lock."""
+        # Other processes may share the file, so recount before deleting
+        self._size = self._count()
+        overflow = self._size - self.max_entries
+        if overflow <= 0:
+            return
+        # Evict an extra 10% so that we do not evict on every insert
+        to_delete = overflow + self.max_entries // 10
+        self._conn.execute(
+            "DELETE FROM segments WHERE (engine, source_lang, target_lang, segment_hash) IN ("
+            " SELECT engine, source_lang, target_lang, segment_hash FROM segments"
+            " ORDER BY last_used LIMIT ?)",
+            (to_delete,),
+        )
+        self._size = self._count()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def clear(self) -> None:
+        """Removes every stored translation and resets the counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM segments")
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns usage statistics of the translation memory.
+
+        Returns:
+            Dict[str, float]: entries, hits, misses and hit_rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_memory: Optional[TranslationMemory] = None
+_default_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """
+    Returns the process-wide translation memory shared by all translators.
+
+    Returns:
+        Optional[TranslationMemory]: The shared memory, or None if disabled in the config
+            or if the database cannot be opened.
+    """
+    global _default_memory
+    if not TRANSLATION_MEMORY_ENABLED:
+        return None
+    with _default_memory_lock:
+        if _default_memory is None:
+            try:
+                _default_memory = TranslationMemory()
+            except (OSError, sqlite3.Error) as e:
+                print(f"[ERROR] Translation memory disabled: {e}")
+                return None
+        return _default_memory